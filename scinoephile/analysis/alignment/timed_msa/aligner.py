@@ -5,9 +5,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
-from itertools import permutations
+from dataclasses import dataclass, replace
+from itertools import combinations, permutations
+from math import isfinite
 
+import numba as nb
 import numpy as np
 
 from .alignment import Alignment
@@ -23,24 +25,36 @@ _STATE_GAP_IN_SEQUENCE = 1
 _STATE_GAP_IN_PROFILE = 2
 _STATE_NONE = 255
 
+_PRUNING_TOLERANCE = 1e-9
+"""Relative margin by which an order's score bound must trail the best score."""
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Settings:
     """Affine-gap settings for progressive multiple alignment."""
 
+    band_seconds: float | None = 10.0
+    """Greatest start-time distance between an aligned column and token, if any."""
     exhaustive_order_source_limit: int = 4
     """Largest source count for which every progressive order is evaluated."""
     gap_extend_score: float = -1.0
     """Score for extending an existing gap by one column."""
     gap_open_score: float = -4.0
     """Score for opening a new gap."""
+    prune_orders: bool = False
+    """Whether to abandon orders whose score bound cannot exceed the best so far."""
 
     def __post_init__(self):
         """Validate alignment search and scoring settings.
 
         Raises:
-            ValueError: if the source limit is too small or a gap score is positive
+            ValueError: if the band is not positive, the source limit is too small,
+              or a gap score is positive
         """
+        if self.band_seconds is not None and (
+            not isfinite(self.band_seconds) or self.band_seconds <= 0.0
+        ):
+            raise ValueError("Timed alignment band must be finite and positive.")
         if self.exhaustive_order_source_limit < 2:
             raise ValueError(
                 "Exhaustive alignment order source limit must be at least two."
@@ -50,7 +64,13 @@ class Settings:
 
 
 class Aligner:
-    """Align timestamped sequences using progressive affine-gap alignment."""
+    """Align timestamped sequences using progressive affine-gap alignment.
+
+    Dynamic programming is restricted to a band of sequence tokens whose start
+    times lie near each profile column, and is filled by a compiled kernel from
+    substitution scores gathered in bulk. Scores of token pairs are computed once
+    per alignment and shared by every progressive order considered.
+    """
 
     def __init__(self, similarity: _TokenSimilarity, settings: Settings | None = None):
         """Initialize.
@@ -74,6 +94,11 @@ class Aligner:
         source sets use pairwise affinity guide orders, avoiding factorial growth
         while continuing to consider every source as an initial anchor.
 
+        Orders that share a prefix share its progressive alignment. Orders may be
+        abandoned once an upper bound of their score falls below the best so far,
+        which does not change the alignment retained, the first order with the
+        greatest score.
+
         Arguments:
             sequences: named timestamped character sequences
         Returns:
@@ -87,21 +112,21 @@ class Aligner:
         if len(set(source_names)) != len(source_names):
             raise ValueError("Multiple alignment sequence names must be unique.")
 
-        best_alignment = None
-        best_score = float("-inf")
+        similarities = _SimilarityMatrices(self.similarity)
         if len(sequences) <= self.settings.exhaustive_order_source_limit:
-            ordered_sequence_candidates = permutations(sequences)
+            orders = tuple(permutations(sequences))
         else:
-            ordered_sequence_candidates = self._get_guide_orders(sequences)
-        for ordered_sequences in ordered_sequence_candidates:
-            candidate = self._align_in_order(ordered_sequences)
-            candidate = self._get_reordered(candidate, source_names)
-            candidate_score = self._get_sum_of_pairs_score(candidate)
-            if candidate_score > best_score:
-                best_alignment = candidate
-                best_score = candidate_score
-        assert best_alignment is not None
-        return best_alignment
+            orders = self._get_guide_orders(sequences, similarities)
+        pair_bounds = None
+        if self.settings.prune_orders:
+            pair_bounds = self._get_pair_bounds(sequences, similarities)
+
+        return self._search_orders(
+            orders,
+            source_names=source_names,
+            similarities=similarities,
+            pair_bounds=pair_bounds,
+        )
 
     def add_sequence(
         self, alignment: Alignment, sequence: AlignmentSequence
@@ -123,13 +148,18 @@ class Aligner:
             raise ValueError("Added alignment sequence name must be unique.")
         if any(column.is_marker or column.is_pause for column in alignment.columns):
             raise ValueError("Additional sequences must be aligned before annotations.")
-        return self._align_profile_to_sequence(alignment, sequence)
+        return self._align_profile_to_sequence(
+            alignment, sequence, _SimilarityMatrices(self.similarity)
+        )
 
-    def _align_in_order(self, sequences: Sequence[AlignmentSequence]) -> Alignment:
+    def _align_in_order(
+        self, sequences: Sequence[AlignmentSequence], similarities: _SimilarityMatrices
+    ) -> Alignment:
         """Progressively align sequences in one specified order.
 
         Arguments:
             sequences: timestamped character sequences in progressive order
+            similarities: token substitution scores shared across orders
         Returns:
             multiple alignment in the specified row order
         """
@@ -139,152 +169,91 @@ class Aligner:
             columns=tuple(Column((token,)) for token in first.tokens),
         )
         for sequence in sequences[1:]:
-            alignment = self._align_profile_to_sequence(alignment, sequence)
+            alignment = self._align_profile_to_sequence(
+                alignment, sequence, similarities
+            )
         return alignment
 
-    def _align_profile_to_sequence(  # noqa: PLR0912, PLR0915
-        self, profile: Alignment, sequence: AlignmentSequence
+    def _align_profile_to_sequence(
+        self,
+        profile: Alignment,
+        sequence: AlignmentSequence,
+        similarities: _SimilarityMatrices,
     ) -> Alignment:
         """Align one existing profile to one additional sequence.
 
         Arguments:
             profile: existing multiple-sequence alignment
             sequence: additional timestamped character sequence
+            similarities: token substitution scores shared across orders
         Returns:
             alignment with the additional sequence appended as its final row
         Raises:
             RuntimeError: if the dynamic-programming backtrace is incomplete
         """
-        profile_length = len(profile.columns)
-        sequence_length = len(sequence.tokens)
-        shape = (profile_length + 1, sequence_length + 1)
-        match_scores = np.full(shape, float("-inf"), dtype=np.float64)
-        gap_in_sequence_scores = np.full(shape, float("-inf"), dtype=np.float64)
-        gap_in_profile_scores = np.full(shape, float("-inf"), dtype=np.float64)
-        match_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
-        gap_in_sequence_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
-        gap_in_profile_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
-        match_scores[0, 0] = 0.0
-
-        for profile_idx in range(1, profile_length + 1):
-            gap_in_sequence_scores[profile_idx, 0] = (
-                self.settings.gap_open_score
-                + (profile_idx - 1) * self.settings.gap_extend_score
-            )
-            if profile_idx == 1:
-                gap_in_sequence_backpointers[profile_idx, 0] = _STATE_MATCH
-            else:
-                gap_in_sequence_backpointers[profile_idx, 0] = _STATE_GAP_IN_SEQUENCE
-        for sequence_idx in range(1, sequence_length + 1):
-            gap_in_profile_scores[0, sequence_idx] = (
-                self.settings.gap_open_score
-                + (sequence_idx - 1) * self.settings.gap_extend_score
-            )
-            if sequence_idx == 1:
-                gap_in_profile_backpointers[0, sequence_idx] = _STATE_MATCH
-            else:
-                gap_in_profile_backpointers[0, sequence_idx] = _STATE_GAP_IN_PROFILE
-
-        for profile_idx, column in enumerate(profile.columns, 1):
-            for sequence_idx, token in enumerate(sequence.tokens, 1):
-                previous_match_scores = (
-                    match_scores[profile_idx - 1, sequence_idx - 1],
-                    gap_in_sequence_scores[profile_idx - 1, sequence_idx - 1],
-                    gap_in_profile_scores[profile_idx - 1, sequence_idx - 1],
-                )
-                previous_match_state = int(np.argmax(previous_match_scores))
-                match_scores[profile_idx, sequence_idx] = previous_match_scores[
-                    previous_match_state
-                ] + self._get_profile_similarity(column, token)
-                match_backpointers[profile_idx, sequence_idx] = previous_match_state
-
-                previous_gap_in_sequence_scores = (
-                    match_scores[profile_idx - 1, sequence_idx]
-                    + self.settings.gap_open_score,
-                    gap_in_sequence_scores[profile_idx - 1, sequence_idx]
-                    + self.settings.gap_extend_score,
-                    gap_in_profile_scores[profile_idx - 1, sequence_idx]
-                    + self.settings.gap_open_score,
-                )
-                previous_gap_in_sequence_state = int(
-                    np.argmax(previous_gap_in_sequence_scores)
-                )
-                gap_in_sequence_scores[profile_idx, sequence_idx] = (
-                    previous_gap_in_sequence_scores[previous_gap_in_sequence_state]
-                )
-                gap_in_sequence_backpointers[profile_idx, sequence_idx] = (
-                    previous_gap_in_sequence_state
-                )
-
-                previous_gap_in_profile_scores = (
-                    match_scores[profile_idx, sequence_idx - 1]
-                    + self.settings.gap_open_score,
-                    gap_in_sequence_scores[profile_idx, sequence_idx - 1]
-                    + self.settings.gap_open_score,
-                    gap_in_profile_scores[profile_idx, sequence_idx - 1]
-                    + self.settings.gap_extend_score,
-                )
-                previous_gap_in_profile_state = int(
-                    np.argmax(previous_gap_in_profile_scores)
-                )
-                gap_in_profile_scores[profile_idx, sequence_idx] = (
-                    previous_gap_in_profile_scores[previous_gap_in_profile_state]
-                )
-                gap_in_profile_backpointers[profile_idx, sequence_idx] = (
-                    previous_gap_in_profile_state
-                )
-
-        final_scores = (
-            match_scores[profile_length, sequence_length],
-            gap_in_sequence_scores[profile_length, sequence_length],
-            gap_in_profile_scores[profile_length, sequence_length],
+        match_starts, match_ends = self._get_match_windows(profile, sequence)
+        band_starts, band_ends = _get_band(
+            match_starts, match_ends, len(sequence.tokens)
+        )
+        profile_similarities = self._get_profile_similarities(
+            profile,
+            sequence,
+            similarities,
+            band_starts,
+            band_ends,
+            match_starts,
+            match_ends,
         )
-        state = int(np.argmax(final_scores))
-        profile_idx = profile_length
-        sequence_idx = sequence_length
+        states = _get_banded_alignment_path(
+            profile_similarities,
+            band_starts,
+            band_ends,
+            self.settings.gap_open_score,
+            self.settings.gap_extend_score,
+        )
+
+        profile_idx = 0
+        sequence_idx = 0
         columns = []
-        while profile_idx > 0 or sequence_idx > 0:
+        for state in states:
             if state == _STATE_MATCH:
                 columns.append(
                     Column(
                         (
-                            *profile.columns[profile_idx - 1].tokens,
-                            sequence.tokens[sequence_idx - 1],
+                            *profile.columns[profile_idx].tokens,
+                            sequence.tokens[sequence_idx],
                         )
                     )
                 )
-                state = int(match_backpointers[profile_idx, sequence_idx])
-                profile_idx -= 1
-                sequence_idx -= 1
+                profile_idx += 1
+                sequence_idx += 1
             elif state == _STATE_GAP_IN_SEQUENCE:
-                columns.append(Column((*profile.columns[profile_idx - 1].tokens, None)))
-                state = int(gap_in_sequence_backpointers[profile_idx, sequence_idx])
-                profile_idx -= 1
+                columns.append(Column((*profile.columns[profile_idx].tokens, None)))
+                profile_idx += 1
             elif state == _STATE_GAP_IN_PROFILE:
                 columns.append(
                     Column(
                         (
                             *(None for _ in profile.source_names),
-                            sequence.tokens[sequence_idx - 1],
+                            sequence.tokens[sequence_idx],
                         )
                     )
                 )
-                state = int(gap_in_profile_backpointers[profile_idx, sequence_idx])
-                sequence_idx -= 1
+                sequence_idx += 1
             else:
                 raise RuntimeError("Timed multiple alignment backtrace is incomplete.")
-        columns.reverse()
         return Alignment(
             source_names=(*profile.source_names, sequence.name), columns=tuple(columns)
         )
 
     def _get_guide_orders(
-        self, sequences: Sequence[AlignmentSequence]
+        self, sequences: Sequence[AlignmentSequence], similarities: _SimilarityMatrices
     ) -> tuple[tuple[AlignmentSequence, ...], ...]:
         """Get pairwise-affinity progressive orders for a large source set.
 
         Arguments:
             sequences: timestamped character sequences to order
+            similarities: token substitution scores shared across orders
         Returns:
             candidate progressive sequence orders
         """
@@ -292,11 +261,12 @@ class Aligner:
         for one_idx in range(len(sequences) - 1):
             for two_idx in range(one_idx + 1, len(sequences)):
                 pairwise_alignment = self._align_in_order(
-                    (sequences[one_idx], sequences[two_idx])
+                    (sequences[one_idx], sequences[two_idx]), similarities
                 )
                 column_count = max(len(pairwise_alignment.columns), 1)
                 pairwise_scores[(one_idx, two_idx)] = (
-                    self._get_sum_of_pairs_score(pairwise_alignment) / column_count
+                    self._get_sum_of_pairs_score(pairwise_alignment, similarities)
+                    / column_count
                 )
 
         orders = []
@@ -324,21 +294,114 @@ class Aligner:
             orders.append(tuple(sequences[idx] for idx in order))
         return tuple(orders)
 
-    def _get_profile_similarity(self, column: Column, token: Token) -> float:
-        """Get mean similarity between a profile column and one token.
+    def _get_match_windows(
+        self, profile: Alignment, sequence: AlignmentSequence
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the sequence positions at which each profile column may be matched.
+
+        A column may be matched to sequence tokens starting within the configured
+        band of the column start; a match at sequence position j consumes token
+        j - 1.
 
         Arguments:
-            column: existing lexical alignment column
-            token: token from the sequence being added
+            profile: existing multiple-sequence alignment
+            sequence: additional timestamped character sequence
         Returns:
-            mean substitution score across populated column tokens
+            first and last sequence position at which each column may be matched
         """
-        similarities = [
-            self.similarity(profile_token, token)
-            for profile_token in column.tokens
-            if profile_token is not None
-        ]
-        return sum(similarities) / len(similarities)
+        profile_length = len(profile.columns)
+        sequence_length = len(sequence.tokens)
+        if self.settings.band_seconds is None:
+            return (
+                np.ones(profile_length, dtype=np.int64),
+                np.full(profile_length, sequence_length, dtype=np.int64),
+            )
+
+        column_starts = np.array(
+            [column.start_seconds for column in profile.columns], dtype=np.float64
+        )
+        token_starts = np.array(
+            [token.start_seconds for token in sequence.tokens], dtype=np.float64
+        )
+        match_starts = np.searchsorted(
+            token_starts, column_starts - self.settings.band_seconds, side="left"
+        )
+        match_ends = np.searchsorted(
+            token_starts, column_starts + self.settings.band_seconds, side="right"
+        )
+        return match_starts.astype(np.int64) + 1, match_ends.astype(np.int64)
+
+    def _get_pair_bounds(
+        self, sequences: Sequence[AlignmentSequence], similarities: _SimilarityMatrices
+    ) -> dict[tuple[str, str], float]:
+        """Get upper bounds of the score of each source pair in any alignment.
+
+        A pair's rows in a multiple alignment form one pairwise alignment, so
+        their score cannot exceed that of their optimal unbanded pairwise
+        alignment.
+
+        Arguments:
+            sequences: timestamped character sequences in input order
+            similarities: token substitution scores shared across orders
+        Returns:
+            greatest pairwise score by source names in input order
+        """
+        unbanded = Aligner(self.similarity, replace(self.settings, band_seconds=None))
+        return {
+            (one.name, two.name): self._get_sum_of_pairs_score(
+                unbanded._align_in_order((one, two), similarities), similarities
+            )
+            for one, two in combinations(sequences, 2)
+        }
+
+    def _get_profile_similarities(
+        self,
+        profile: Alignment,
+        sequence: AlignmentSequence,
+        similarities: _SimilarityMatrices,
+        band_starts: np.ndarray,
+        band_ends: np.ndarray,
+        match_starts: np.ndarray,
+        match_ends: np.ndarray,
+    ) -> np.ndarray:
+        """Get mean similarities between profile columns and banded sequence tokens.
+
+        Arguments:
+            profile: existing multiple-sequence alignment
+            sequence: additional timestamped character sequence
+            similarities: token substitution scores shared across orders
+            band_starts: first sequence position allowed for each profile position
+            band_ends: last sequence position allowed for each profile position
+            match_starts: first sequence position at which each column may be matched
+            match_ends: last sequence position at which each column may be matched
+        Returns:
+            mean substitution scores across populated column tokens, by profile
+            column and offset of the sequence position from the band start, or
+            -inf where the column may not be matched
+        """
+        band_width = int(np.max(band_ends - band_starts)) + 1
+        sequence_positions = band_starts[1:, None] + np.arange(band_width)
+        matchable = (sequence_positions >= match_starts[:, None]) & (
+            sequence_positions <= match_ends[:, None]
+        )
+        totals = np.zeros(sequence_positions.shape, dtype=np.float64)
+        counts = np.zeros(len(profile.columns), dtype=np.int64)
+        for row_idx, source_name in enumerate(profile.source_names):
+            row_tokens, token_indexes = _get_row(profile, row_idx)
+            populated = token_indexes >= 0
+            counts += populated
+            column_idxs, offsets = np.nonzero(matchable & populated[:, None])
+            totals[column_idxs, offsets] += similarities.get(
+                source_name,
+                row_tokens,
+                sequence.name,
+                sequence.tokens,
+                token_indexes[column_idxs],
+                sequence_positions[column_idxs, offsets] - 1,
+            )
+        profile_similarities = totals / np.maximum(counts, 1)[:, None]
+        profile_similarities[~matchable] = -np.inf
+        return profile_similarities
 
     def _get_reordered(
         self, alignment: Alignment, source_names: tuple[str, ...]
@@ -360,17 +423,68 @@ class Aligner:
             ),
         )
 
-    def _get_sum_of_pairs_score(self, alignment: Alignment) -> float:
+    def _get_score_bound(
+        self,
+        alignment: Alignment,
+        source_names: tuple[str, ...],
+        similarities: _SimilarityMatrices,
+        pair_bounds: dict[tuple[str, str], float],
+    ) -> float:
+        """Get an upper bound of the score of any completion of a partial alignment.
+
+        Aligning further sources does not change the score of pairs already
+        aligned, so the bound is their score plus the bounds of remaining pairs.
+
+        Arguments:
+            alignment: partial progressive alignment
+            source_names: source names in input order
+            similarities: token substitution scores shared across orders
+            pair_bounds: greatest pairwise score by source names in input order
+        Returns:
+            upper bound of the source-pair score of any completion
+        """
+        aligned_names = tuple(
+            name for name in source_names if name in alignment.source_names
+        )
+        bound = self._get_sum_of_pairs_score(
+            self._get_reordered(alignment, aligned_names), similarities
+        )
+        for pair, pair_bound in pair_bounds.items():
+            if pair[0] not in aligned_names or pair[1] not in aligned_names:
+                bound += pair_bound
+        return bound
+
+    def _get_sum_of_pairs_score(
+        self, alignment: Alignment, similarities: _SimilarityMatrices
+    ) -> float:
         """Score a completed alignment across every projected source pair.
 
         Arguments:
             alignment: completed multiple-sequence alignment
+            similarities: token substitution scores shared across orders
         Returns:
             sum of substitution and affine-gap scores across source pairs
         """
+        rows = [
+            _get_row(alignment, row_idx)
+            for row_idx in range(len(alignment.source_names))
+        ]
         score = 0.0
         for one_idx in range(len(alignment.source_names) - 1):
+            one_tokens, one_indexes = rows[one_idx]
             for two_idx in range(one_idx + 1, len(alignment.source_names)):
+                two_tokens, two_indexes = rows[two_idx]
+                matched = (one_indexes >= 0) & (two_indexes >= 0)
+                pair_similarities = iter(
+                    similarities.get(
+                        alignment.source_names[one_idx],
+                        one_tokens,
+                        alignment.source_names[two_idx],
+                        two_tokens,
+                        one_indexes[matched],
+                        two_indexes[matched],
+                    ).tolist()
+                )
                 gap_state = None
                 for column in alignment.columns:
                     one = column.tokens[one_idx]
@@ -378,7 +492,7 @@ class Aligner:
                     if one is None and two is None:
                         continue
                     if one is not None and two is not None:
-                        score += self.similarity(one, two)
+                        score += next(pair_similarities)
                         gap_state = None
                         continue
                     current_gap_state = one is None
@@ -388,3 +502,350 @@ class Aligner:
                         score += self.settings.gap_open_score
                     gap_state = current_gap_state
         return score
+
+    def _search_orders(
+        self,
+        orders: Sequence[tuple[AlignmentSequence, ...]],
+        *,
+        source_names: tuple[str, ...],
+        similarities: _SimilarityMatrices,
+        pair_bounds: dict[tuple[str, str], float] | None,
+    ) -> Alignment:
+        """Find the best of several progressive orders.
+
+        Arguments:
+            orders: progressive orders
+            source_names: source names in input order
+            similarities: token substitution scores shared across orders
+            pair_bounds: greatest pairwise score by source names, to abandon orders
+              whose score bound cannot exceed the best so far, if any
+        Returns:
+            alignment of the first order with the greatest source-pair score, in
+            input row order
+        """
+        alignments: dict[tuple[str, ...], Alignment | None] = {}
+        best: tuple[float, Alignment] | None = None
+        for order in orders:
+            alignment = None
+            for length in range(1, len(order) + 1):
+                prefix = tuple(sequence.name for sequence in order[:length])
+                if prefix in alignments:
+                    alignment = alignments[prefix]
+                elif length == 1:
+                    alignment = Alignment(
+                        source_names=prefix,
+                        columns=tuple(Column((token,)) for token in order[0].tokens),
+                    )
+                    alignments[prefix] = alignment
+                else:
+                    alignment = self._align_profile_to_sequence(
+                        alignment, order[length - 1], similarities
+                    )
+                    if (
+                        pair_bounds is not None
+                        and best is not None
+                        and length < len(order)
+                    ):
+                        bound = self._get_score_bound(
+                            alignment, source_names, similarities, pair_bounds
+                        )
+                        margin = _PRUNING_TOLERANCE * max(1.0, abs(best[0]))
+                        if bound < best[0] - margin:
+                            alignment = None
+                    alignments[prefix] = alignment
+                if alignment is None:
+                    break
+            if alignment is None:
+                continue
+
+            candidate = self._get_reordered(alignment, source_names)
+            candidate_score = self._get_sum_of_pairs_score(candidate, similarities)
+            if best is None or candidate_score > best[0]:
+                best = (candidate_score, candidate)
+        assert best is not None
+        return best[1]
+
+
+class _SimilarityMatrices:
+    """Token substitution scores by source pair, computed as first requested."""
+
+    def __init__(self, similarity: _TokenSimilarity):
+        """Initialize.
+
+        Arguments:
+            similarity: timestamp-aware token substitution scoring function
+        """
+        self.similarity = similarity
+        """Timestamp-aware token substitution scoring function."""
+        self._matrices: dict[tuple[str, str], np.ndarray] = {}
+        """Scores by source names, with NaN for pairs not yet scored."""
+
+    def get(
+        self,
+        one_name: str,
+        one_tokens: Sequence[Token],
+        two_name: str,
+        two_tokens: Sequence[Token],
+        one_indexes: np.ndarray,
+        two_indexes: np.ndarray,
+    ) -> np.ndarray:
+        """Get substitution scores for pairs of tokens from two sources.
+
+        Arguments:
+            one_name: name of first source
+            one_tokens: tokens of first source
+            two_name: name of second source
+            two_tokens: tokens of second source
+            one_indexes: indexes of first tokens
+            two_indexes: indexes of second tokens, paired with first indexes
+        Returns:
+            substitution score of each token pair
+        """
+        matrix = self._matrices.get((one_name, two_name))
+        if matrix is None:
+            matrix = self._matrices.setdefault(
+                (one_name, two_name),
+                np.full((len(one_tokens), len(two_tokens)), np.nan),
+            )
+        scores = matrix[one_indexes, two_indexes]
+        missing = np.flatnonzero(np.isnan(scores))
+        if missing.size > 0:
+            one_missing = one_indexes[missing]
+            two_missing = two_indexes[missing]
+            scores[missing] = [
+                self.similarity(one_tokens[one_idx], two_tokens[two_idx])
+                for one_idx, two_idx in zip(
+                    one_missing.tolist(), two_missing.tolist(), strict=True
+                )
+            ]
+            matrix[one_missing, two_missing] = scores[missing]
+        return scores
+
+
+def _get_band(
+    match_starts: np.ndarray, match_ends: np.ndarray, sequence_length: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the sequence positions considered for each profile position.
+
+    Each profile position is allowed the sequence positions from which its column
+    may be matched. Bounds are then made monotonic and overlapping, so that the
+    band always contains a complete alignment path.
+
+    Arguments:
+        match_starts: first sequence position at which each column may be matched
+        match_ends: last sequence position at which each column may be matched
+        sequence_length: number of sequence tokens
+    Returns:
+        first and last sequence position allowed for each profile position,
+        including the initial position preceding every column
+    """
+    profile_length = len(match_starts)
+    band_starts = np.zeros(profile_length + 1, dtype=np.int64)
+    band_ends = np.full(profile_length + 1, sequence_length, dtype=np.int64)
+    if profile_length == 0:
+        return band_starts, band_ends
+
+    band_starts[1:] = np.minimum.accumulate((match_starts - 1)[::-1])[::-1]
+    band_ends[1:] = np.maximum.accumulate(match_ends)
+    band_ends[0] = band_ends[1]
+    band_ends[-1] = sequence_length
+    band_ends[:-1] = np.maximum(band_ends[:-1], band_starts[1:])
+    return band_starts, band_ends
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _get_banded_alignment_path(  # noqa: PLR0912, PLR0915
+    similarities: np.ndarray,
+    band_starts: np.ndarray,
+    band_ends: np.ndarray,
+    gap_open_score: float,
+    gap_extend_score: float,
+) -> np.ndarray:
+    """Fill banded affine-gap tables and backtrace the best alignment path.
+
+    Positions outside the band are treated as unreachable. Ties between
+    predecessor states are resolved in favor of match, then gap in sequence, then
+    gap in profile.
+
+    Arguments:
+        similarities: profile and sequence substitution scores within the band
+        band_starts: first sequence position allowed for each profile position
+        band_ends: last sequence position allowed for each profile position
+        gap_open_score: score for opening a new gap
+        gap_extend_score: score for extending an existing gap by one column
+    Returns:
+        alignment states from the first column to the last, ending with the
+        unset state if the backtrace is incomplete
+    """
+    # Allocate banded score and backpointer tables
+    profile_length = len(band_starts) - 1
+    sequence_length = band_ends[profile_length]
+    band_width = 1
+    for profile_idx in range(profile_length + 1):
+        band_width = max(
+            band_width, band_ends[profile_idx] - band_starts[profile_idx] + 1
+        )
+    shape = (profile_length + 1, band_width)
+    match_scores = np.full(shape, -np.inf)
+    gap_in_sequence_scores = np.full(shape, -np.inf)
+    gap_in_profile_scores = np.full(shape, -np.inf)
+    match_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
+    gap_in_sequence_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
+    gap_in_profile_backpointers = np.full(shape, _STATE_NONE, dtype=np.uint8)
+
+    # Seed the first row with gaps in the profile
+    match_scores[0, 0] = 0.0
+    for sequence_idx in range(1, band_ends[0] + 1):
+        gap_in_profile_scores[0, sequence_idx] = (
+            gap_open_score + (sequence_idx - 1) * gap_extend_score
+        )
+        if sequence_idx == 1:
+            gap_in_profile_backpointers[0, sequence_idx] = _STATE_MATCH
+        else:
+            gap_in_profile_backpointers[0, sequence_idx] = _STATE_GAP_IN_PROFILE
+
+    # Fill each banded row
+    for profile_idx in range(1, profile_length + 1):
+        band_start = band_starts[profile_idx]
+        previous_band_start = band_starts[profile_idx - 1]
+        previous_band_end = band_ends[profile_idx - 1]
+        for sequence_idx in range(band_start, band_ends[profile_idx] + 1):
+            offset = sequence_idx - band_start
+
+            # Seed the first column with gaps in the sequence
+            if sequence_idx == 0:
+                gap_in_sequence_scores[profile_idx, 0] = (
+                    gap_open_score + (profile_idx - 1) * gap_extend_score
+                )
+                if profile_idx == 1:
+                    gap_in_sequence_backpointers[profile_idx, 0] = _STATE_MATCH
+                else:
+                    gap_in_sequence_backpointers[profile_idx, 0] = (
+                        _STATE_GAP_IN_SEQUENCE
+                    )
+                continue
+
+            # Choose the predecessor of a match
+            if previous_band_start <= sequence_idx - 1 <= previous_band_end:
+                previous_offset = sequence_idx - 1 - previous_band_start
+                best_score = match_scores[profile_idx - 1, previous_offset]
+                best_state = _STATE_MATCH
+                score = gap_in_sequence_scores[profile_idx - 1, previous_offset]
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_SEQUENCE
+                score = gap_in_profile_scores[profile_idx - 1, previous_offset]
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_PROFILE
+            else:
+                best_score = -np.inf
+                best_state = _STATE_MATCH
+            match_scores[profile_idx, offset] = (
+                best_score + similarities[profile_idx - 1, offset]
+            )
+            match_backpointers[profile_idx, offset] = best_state
+
+            # Choose the predecessor of a gap in the sequence
+            if previous_band_start <= sequence_idx <= previous_band_end:
+                previous_offset = sequence_idx - previous_band_start
+                best_score = (
+                    match_scores[profile_idx - 1, previous_offset] + gap_open_score
+                )
+                best_state = _STATE_MATCH
+                score = (
+                    gap_in_sequence_scores[profile_idx - 1, previous_offset]
+                    + gap_extend_score
+                )
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_SEQUENCE
+                score = (
+                    gap_in_profile_scores[profile_idx - 1, previous_offset]
+                    + gap_open_score
+                )
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_PROFILE
+            else:
+                best_score = -np.inf
+                best_state = _STATE_MATCH
+            gap_in_sequence_scores[profile_idx, offset] = best_score
+            gap_in_sequence_backpointers[profile_idx, offset] = best_state
+
+            # Choose the predecessor of a gap in the profile
+            if sequence_idx - 1 >= band_start:
+                best_score = match_scores[profile_idx, offset - 1] + gap_open_score
+                best_state = _STATE_MATCH
+                score = gap_in_sequence_scores[profile_idx, offset - 1] + gap_open_score
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_SEQUENCE
+                score = (
+                    gap_in_profile_scores[profile_idx, offset - 1] + gap_extend_score
+                )
+                if score > best_score:
+                    best_score = score
+                    best_state = _STATE_GAP_IN_PROFILE
+            else:
+                best_score = -np.inf
+                best_state = _STATE_MATCH
+            gap_in_profile_scores[profile_idx, offset] = best_score
+            gap_in_profile_backpointers[profile_idx, offset] = best_state
+
+    # Choose the final state
+    offset = sequence_length - band_starts[profile_length]
+    state = _STATE_MATCH
+    best_score = match_scores[profile_length, offset]
+    if gap_in_sequence_scores[profile_length, offset] > best_score:
+        best_score = gap_in_sequence_scores[profile_length, offset]
+        state = _STATE_GAP_IN_SEQUENCE
+    if gap_in_profile_scores[profile_length, offset] > best_score:
+        state = _STATE_GAP_IN_PROFILE
+
+    # Backtrace from the final position
+    states = np.empty(profile_length + sequence_length + 1, dtype=np.uint8)
+    state_count = 0
+    profile_idx = profile_length
+    sequence_idx = sequence_length
+    while profile_idx > 0 or sequence_idx > 0:
+        band_start = band_starts[profile_idx]
+        if not band_start <= sequence_idx <= band_ends[profile_idx]:
+            state = _STATE_NONE
+        states[state_count] = state
+        state_count += 1
+        offset = sequence_idx - band_start
+        if state == _STATE_MATCH:
+            state = match_backpointers[profile_idx, offset]
+            profile_idx -= 1
+            sequence_idx -= 1
+        elif state == _STATE_GAP_IN_SEQUENCE:
+            state = gap_in_sequence_backpointers[profile_idx, offset]
+            profile_idx -= 1
+        elif state == _STATE_GAP_IN_PROFILE:
+            state = gap_in_profile_backpointers[profile_idx, offset]
+            sequence_idx -= 1
+        else:
+            break
+    return states[:state_count][::-1].copy()
+
+
+def _get_row(
+    alignment: Alignment, row_idx: int
+) -> tuple[tuple[Token, ...], np.ndarray]:
+    """Get the tokens of one alignment row and their positions by column.
+
+    Arguments:
+        alignment: multiple-sequence alignment
+        row_idx: index of row
+    Returns:
+        row tokens in order, and index of each column's token among them or -1
+    """
+    tokens = []
+    token_indexes = np.full(len(alignment.columns), -1, dtype=np.int64)
+    for column_idx, column in enumerate(alignment.columns):
+        token = column.tokens[row_idx]
+        if token is not None:
+            token_indexes[column_idx] = len(tokens)
+            tokens.append(token)
+    return tuple(tokens), token_indexes
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 from logging import getLogger
 from pathlib import Path
@@ -16,6 +15,7 @@ from pydub.exceptions import CouldntDecodeError, CouldntEncodeError
 from scinoephile.audio.cache_namespace import AudioCacheNamespace
 from scinoephile.common.validation import val_output_dir_path
 from scinoephile.core.cache.artifact import remove_cache_artifact
+from scinoephile.core.cache.audio_fingerprint import get_audio_hash
 from scinoephile.core.cache.identity import CacheIdentity
 from scinoephile.core.cache.runtime import get_distribution_identity
 from scinoephile.core.exceptions import ScinoephileError
@@ -80,7 +80,7 @@ class DemucsCache:
         Returns:
             cache path
         """
-        cache_hash = hashlib.sha256(audio.raw_data)
+        cache_hash = get_audio_hash(audio)
         cache_hash.update(b"\0")
         cache_hash.update(
             json.dumps(
@@ -16,6 +16,7 @@ from scinoephile.audio.transcription import (
     get_segment_merged,
     get_segment_split_at_idx,
 )
+from scinoephile.audio.view import AudioView
 
 from .series import AudioSeries
 from .subtitle import AudioSubtitle
@@ -31,13 +32,13 @@ __all__ = [
 
 
 def get_series_from_segments(
-    segments: list[TranscribedSegment], audio: AudioSegment, offset: int = 0
+    segments: list[TranscribedSegment], audio: AudioSegment | AudioView, offset: int = 0
 ) -> AudioSeries:
     """Compile transcribed segments to a subtitle series.
 
     Arguments:
         segments: transcribed segments to compile
-        audio: series audio
+        audio: series audio, or view of audio
         offset: time offset to apply
     Returns:
         compiled subtitle series
@@ -70,7 +71,7 @@ def get_series_with_sub_split_at_idx(
     sub = series.events[sub_idx]
     one, two = get_sub_split_at_idx(sub, char_idx)
     return AudioSeries(
-        audio=series.audio,
+        audio=series.audio_view,
         events=series.events[:sub_idx] + [one, two] + series.events[sub_idx + 1 :],
     )
 
@@ -16,6 +16,7 @@ from pydub import AudioSegment
 from pydub.exceptions import PydubException
 
 from scinoephile.audio.segment import load_audio_segment
+from scinoephile.audio.view import AudioView, get_audio_view
 from scinoephile.common.validation import (
     val_input_dir_path,
     val_input_path,
@@ -41,7 +42,11 @@ class AudioSeriesLoadKwargs(TypedDict, total=False):
 
 
 class AudioSeries(Series):
-    """Series of subtitles with audio."""
+    """Series of subtitles with audio.
+
+    Audio is held as a view, so that blocks, clips, and slices of a series share its
+    decoded data; an AudioSegment is materialized only when one is requested.
+    """
 
     event_class = AudioSubtitle
     """Class of individual subtitle events."""
@@ -57,17 +62,19 @@ class AudioSeries(Series):
     """Pattern for subtitle audio files."""
 
     @override
-    def __init__(self, audio: AudioSegment, events: list[AudioSubtitle] | None = None):
+    def __init__(
+        self, audio: AudioSegment | AudioView, events: list[AudioSubtitle] | None = None
+    ):
         """Initialize.
 
         Arguments:
-            audio: Series audio
+            audio: Series audio, or view of audio
             events: individual subtitle events
         """
         if audio is None:
             raise ValueError("AudioSeries requires audio")
         super().__init__()
-        self._audio = audio
+        self._audio = get_audio_view(audio)
         if events is not None:
             self.events = events
         self._blocks: list[AudioSeries] | None = None
@@ -77,17 +84,22 @@ class AudioSeries(Series):
 
     @property
     def audio(self) -> AudioSegment:
-        """Audio of series."""
-        return self._audio
+        """Audio of series, materialized from its view."""
+        return self._audio.to_audio_segment()
 
     @audio.setter
-    def audio(self, audio: AudioSegment):
+    def audio(self, audio: AudioSegment | AudioView):
         """Set audio of series.
 
         Arguments:
-            audio: Audio of series
+            audio: Audio of series, or view of audio
         """
-        self._audio = audio
+        self._audio = get_audio_view(audio)
+
+    @property
+    def audio_view(self) -> AudioView:
+        """View of audio of series."""
+        return self._audio
 
     @property
     @override
@@ -97,7 +109,8 @@ class AudioSeries(Series):
         For AudioSeries, each returned AudioSeries block includes:
         - buffered_start: Start time of buffered audio (extends before subtitles)
         - buffered_end: End time of buffered audio (extends after subtitles)
-        - audio: Buffered audio segment (includes audio beyond subtitle times)
+        - audio: Buffered audio (includes audio beyond subtitle times), viewing the
+          audio of this series
 
         The buffering provides context audio around subtitle boundaries.
         """
@@ -275,6 +288,7 @@ class AudioSeries(Series):
         """
         series = cls(audio=full_audio)
         series.format = "wav"
+        full_audio_view = series.audio_view
 
         events = []
         for i, event in enumerate(text_series, 1):
@@ -302,7 +316,7 @@ class AudioSeries(Series):
                 end_time = min(len(full_audio), original_end + buffer)
 
             logger.debug(f"Slicing audio for subtitle {i} ({start_time} - {end_time})")
-            clip = full_audio[start_time:end_time]
+            clip = full_audio_view[start_time:end_time]
             events.append(
                 cls.event_class(
                     start=original_start, end=original_end, audio=clip, text=event.text
@@ -328,9 +342,9 @@ class AudioSeries(Series):
             audio_events.append(deepcopy(event))
 
         if events:
-            audio = self.audio[events[0].start : events[-1].end]
+            audio = self.audio_view[events[0].start : events[-1].end]
         else:
-            audio = self.audio[0:0]
+            audio = self.audio_view[0:0]
         copied = type(self)(audio=audio, events=audio_events)
         self._copy_metadata_to(copied)
         return copied
@@ -361,14 +375,14 @@ class AudioSeries(Series):
                 min_unbuffered_start = (block_end_time + next_start) // 2
                 buffered_end = min(block_end_time + 1000, min_unbuffered_start)
             else:
-                buffered_end = min(len(self.audio), block_end_time + 1000)
+                buffered_end = min(len(self.audio_view), block_end_time + 1000)
 
             # Slice audio
             logger.debug(
                 f"Slicing audio for block {block_start_time}-{block_end_time} "
                 f"({buffered_start} - {buffered_end})"
             )
-            block_audio = self.audio[buffered_start:buffered_end]
+            block_audio = self.audio_view[buffered_start:buffered_end]
 
             # Create AudioSeries block
             block = self.slice(start_idx, end_idx)
@@ -10,25 +10,30 @@ from typing import Unpack, cast, override
 from pydub import AudioSegment
 
 from scinoephile.audio.transcription import TranscribedSegment
+from scinoephile.audio.view import AudioView, get_audio_view
 from scinoephile.core.subtitles import Subtitle, SubtitleKwargs
 
 __all__ = ["AudioSubtitle"]
 
 
 class AudioSubtitle(Subtitle):
-    """Individual subtitle with audio."""
+    """Individual subtitle with audio.
+
+    Audio is held as a view, so that clips sliced from a series share its decoded
+    data rather than each holding a copy.
+    """
 
     @override
     def __init__(
         self,
-        audio: AudioSegment | None = None,
+        audio: AudioSegment | AudioView | None = None,
         segment: TranscribedSegment | None = None,
         **kwargs: Unpack[SubtitleKwargs],
     ):
         """Initialize.
 
         Arguments:
-            audio: Audio
+            audio: Audio, or view of audio
             segment: Transcribed segment
             **kwargs: Additional keyword arguments
         """
@@ -38,23 +43,28 @@ class AudioSubtitle(Subtitle):
         )
         super().__init__(**super_kwargs)
 
-        self._audio = audio
+        self._audio = get_audio_view(audio) if audio is not None else None
         self._segment = segment
 
     @property
     def audio(self) -> AudioSegment:
-        """Audio of subtitle."""
-        assert self._audio is not None
-        return self._audio
+        """Audio of subtitle, materialized from its view."""
+        return self.audio_view.to_audio_segment()
 
     @audio.setter
-    def audio(self, audio: AudioSegment):
+    def audio(self, audio: AudioSegment | AudioView):
         """Set audio of subtitle.
 
         Arguments:
-            audio: Audio of subtitle
+            audio: Audio of subtitle, or view of audio
         """
-        self._audio = audio
+        self._audio = get_audio_view(audio)
+
+    @property
+    def audio_view(self) -> AudioView:
+        """View of audio of subtitle."""
+        assert self._audio is not None
+        return self._audio
 
     @property
     def segment(self) -> TranscribedSegment:
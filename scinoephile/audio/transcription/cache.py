@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 from collections.abc import Mapping, Sequence
 from logging import getLogger
@@ -15,6 +14,7 @@ from scinoephile.audio.cache_namespace import AudioCacheNamespace
 from scinoephile.common.file import open_atomic_text_file
 from scinoephile.common.validation import val_output_dir_path
 from scinoephile.core.cache.artifact import remove_cache_artifact
+from scinoephile.core.cache.audio_fingerprint import get_audio_hash
 from scinoephile.core.cache.identity import CacheIdentity
 from scinoephile.core.paths import get_runtime_cache_root_path
 
@@ -78,7 +78,7 @@ class TranscriptionCache:
         Returns:
             cache path
         """
-        cache_hash = hashlib.sha256(audio.raw_data)
+        cache_hash = get_audio_hash(audio)
         cache_hash.update(b"\0")
         cache_hash.update(
             json.dumps(
@@ -4,10 +4,16 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import OrderedDict
 from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
+import numba as nb
 import numpy as np
 from opencc import OpenCC
 from pydub import AudioSegment
@@ -15,6 +21,7 @@ from pydub import AudioSegment
 from scinoephile.audio.cache_namespace import AudioCacheNamespace
 from scinoephile.audio.waveform import to_mono_int16
 from scinoephile.core import Language
+from scinoephile.core.cache.audio_fingerprint import get_audio_hash
 from scinoephile.core.cache.identity import CacheIdentity
 from scinoephile.core.cache.runtime import get_distribution_identity
 from scinoephile.core.dependencies.transcription import (
@@ -60,9 +67,12 @@ _SCRIPT_CONVERSION_CONFIGS = {
 }
 """OpenCC configurations keyed by transcription language and CTC model name."""
 
-_ALIGNMENT_VERSION = 1
+_ALIGNMENT_VERSION = 2
 """Version of the CTC forced-alignment algorithm and output shaping."""
 
+_BATCH_LENGTH_RATIO = 1.25
+"""Greatest ratio of the longest to the shortest audio inferred in one batch."""
+
 
 class CtcAligner:
     """Aligns transcription text to audio using a CTC model."""
@@ -82,6 +92,11 @@ class CtcAligner:
         model_revision: str | None = None,
         cache_root_path: Path | None = None,
         overwrite_cache: bool = False,
+        band_seconds: float | None = 60.0,
+        workers: int = 1,
+        batch_size: int = 8,
+        inference_threads: int | None = None,
+        emission_cache_size: int = 32,
     ):
         """Initialize.
 
@@ -92,9 +107,29 @@ class CtcAligner:
             model_revision: optional immutable Hugging Face model revision
             cache_root_path: root directory beneath which to cache
             overwrite_cache: whether to replace matching cache files
+            band_seconds: greatest distance of any token from its time under
+              uniform speech, or None to consider every time
+            workers: maximum number of chunks between pauses to align at once
+            batch_size: maximum number of audio segments inferred in one batch, if
+              the processor returns an attention mask over padding
+            inference_threads: number of threads used by Torch for inference, or
+              None for its default
+            emission_cache_size: maximum number of audio segments whose CTC
+              emissions to memoize
         Raises:
-            ValueError: if no default model is available for the language
+            ValueError: if no default model is available for the language, the
+              band is not positive, or a count is out of range
         """
+        if band_seconds is not None and not band_seconds > 0.0:
+            raise ValueError("CTC alignment band must be positive.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if inference_threads is not None and inference_threads < 1:
+            raise ValueError("inference_threads must be at least 1.")
+        if emission_cache_size < 0:
+            raise ValueError("emission_cache_size must be at least 0.")
         self.language = language
         """Transcription language."""
 
@@ -139,16 +174,45 @@ class CtcAligner:
         self._model_dir_path: Path | None = None
         """Resolved local model directory path, or None before loading."""
 
-    def __call__(self, audio: AudioSegment, text: str) -> list[TranscribedSegment]:
+        self.band_seconds = band_seconds
+        """Greatest distance of any token from its time under uniform speech."""
+
+        self.workers = workers
+        """Maximum number of chunks between pauses to align at once."""
+
+        self.batch_size = batch_size
+        """Maximum number of audio segments inferred in one batch."""
+
+        self.inference_threads = inference_threads
+        """Number of threads used by Torch for inference, or None for its default."""
+
+        self.emission_cache_size = emission_cache_size
+        """Maximum number of audio segments whose CTC emissions to memoize."""
+
+        self._emissions: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        """Memoized CTC log probabilities keyed by audio format and digest."""
+
+        self._emissions_lock = Lock()
+        """Lock guarding memoized CTC log probabilities."""
+
+    def __call__(
+        self,
+        audio: AudioSegment,
+        text: str,
+        *,
+        pauses: Sequence[tuple[int, float]] = (),
+    ) -> list[TranscribedSegment]:
         """Align transcript text to source audio.
 
         Arguments:
             audio: source audio to align against
             text: transcription text
+            pauses: text indexes and audio times in seconds of known pauses, at
+              which alignment may be divided into independent chunks
         Returns:
             timestamped transcription segments
         """
-        return self.align(audio, text)
+        return self.align(audio, text, pauses=pauses)
 
     @property
     def model(self) -> CtcModel:
@@ -196,12 +260,20 @@ class CtcAligner:
             self._processors[processor_key] = processor
         return self._processor
 
-    def align(self, audio: AudioSegment, text: str) -> list[TranscribedSegment]:
+    def align(
+        self,
+        audio: AudioSegment,
+        text: str,
+        *,
+        pauses: Sequence[tuple[int, float]] = (),
+    ) -> list[TranscribedSegment]:
         """Align transcript text to source audio.
 
         Arguments:
             audio: source audio to align against
             text: transcription text
+            pauses: text indexes and audio times in seconds of known pauses, at
+              which alignment may be divided into independent chunks
         Returns:
             timestamped transcription segments
         Raises:
@@ -211,7 +283,7 @@ class CtcAligner:
         transcript_text = text
         if not transcript_text.strip():
             raise TranscriptionAlignmentError("Cannot align empty transcript.")
-        cache_identity = self._get_cache_identity(transcript_text)
+        cache_identity = self._get_cache_identity(transcript_text, pauses)
         cached = self.cache.load(audio, cache_identity)
         if cached is not None:
             return cached[1]
@@ -227,7 +299,21 @@ class CtcAligner:
 
             # Find frame timings for supported characters
             if token_ids:
-                path = self._get_best_path(log_probs, token_ids, blank_token_id)
+                frame_rate = log_probs.shape[0] / duration_seconds
+                band_frames = None
+                if self.band_seconds is not None:
+                    band_frames = ceil(self.band_seconds * frame_rate)
+                anchors = self._get_anchors(
+                    pauses, char_indices, frame_rate, log_probs.shape[0]
+                )
+                path = self._get_best_path(
+                    log_probs,
+                    token_ids,
+                    blank_token_id,
+                    band_frames=band_frames,
+                    anchors=anchors,
+                    workers=self.workers,
+                )
                 timed_chars = self._get_character_timings(
                     path, char_indices, log_probs.shape[0], duration_seconds
                 )
@@ -261,6 +347,41 @@ class CtcAligner:
                 f"Unable to run CTC transcription alignment: {exc}"
             ) from exc
 
+    def load_emissions(self, pairs: Sequence[tuple[AudioSegment, str]]):
+        """Infer and memoize CTC emissions for many alignments at once.
+
+        Audio whose alignment to its text is already cached is skipped, and the
+        remaining audio is inferred in batches of similar length. Subsequent
+        alignments of the same audio, against any text, reuse the emissions while
+        they remain memoized.
+
+        Arguments:
+            pairs: audio and transcription text to be aligned
+        Raises:
+            TranscriptionAlignmentError: if the CTC model cannot be run
+        """
+        audios = [
+            audio
+            for audio, text in pairs
+            if text.strip()
+            and (
+                self.cache.overwrite
+                or not self.cache.get_path(
+                    audio, self._get_cache_identity(text)
+                ).is_file()
+            )
+        ]
+        if not audios:
+            return
+        try:
+            self._get_emissions(audios)
+        except TranscriptionAlignmentError:
+            raise
+        except (ImportError, OSError, RuntimeError, ValueError) as exc:
+            raise TranscriptionAlignmentError(
+                f"Unable to run CTC transcription alignment: {exc}"
+            ) from exc
+
     def _get_alignment_inputs(
         self, audio: AudioSegment, text: str
     ) -> tuple[np.ndarray, list[int], list[int], int]:
@@ -275,30 +396,7 @@ class CtcAligner:
             ImportError: if CTC dependencies are unavailable
             TranscriptionAlignmentError: if transcript tokens cannot be prepared
         """
-        # Prepare the audio and model inputs
-        processor = self.processor
-        feature_extractor = getattr(processor, "feature_extractor", None)
-        sampling_rate = getattr(feature_extractor, "sampling_rate", None)
-        if not isinstance(sampling_rate, int) or sampling_rate <= 0:
-            raise TranscriptionAlignmentError(
-                "CTC aligner processor did not expose a valid sampling rate."
-            )
-        samples = self._get_audio_samples(audio, sampling_rate)
-        processor_callable = cast(Callable[..., Mapping[str, Any]], processor)
-        inputs = processor_callable(
-            samples, sampling_rate=sampling_rate, return_tensors="pt"
-        )
-        if self.device != "cpu":
-            inputs = {key: value.to(self.device) for key, value in inputs.items()}
-
-        # Run CTC inference and normalize output for the alignment algorithm
-        torch = import_torch()
-        model_callable = cast(Callable[..., Any], self.model)
-        with torch.no_grad():
-            output = model_callable(**inputs)
-            logits = output.logits[0]
-            log_probs = logits.log_softmax(dim=-1).detach().cpu().numpy()
-
+        log_probs = self._get_emissions([audio])[0]
         blank_token_id = self._get_blank_token_id()
         token_ids, char_indices = self._get_token_ids(text)
         return log_probs, token_ids, char_indices, blank_token_id
@@ -325,6 +423,148 @@ class CtcAligner:
             "CTC aligner did not expose a blank token ID."
         )
 
+    def _get_emissions(self, audios: Sequence[AudioSegment]) -> list[np.ndarray]:
+        """Get CTC log probabilities of audio, inferring those not memoized.
+
+        Arguments:
+            audios: audio segments
+        Returns:
+            frame-by-token log probabilities of each audio segment
+        Raises:
+            ImportError: if CTC dependencies are unavailable
+            TranscriptionAlignmentError: if audio cannot be prepared for inference
+        """
+        # Look up memoized emissions
+        keys = [
+            (
+                audio.channels,
+                audio.frame_rate,
+                audio.sample_width,
+                get_audio_hash(audio).hexdigest(),
+            )
+            for audio in audios
+        ]
+        emissions: dict[tuple, np.ndarray] = {}
+        with self._emissions_lock:
+            for key in keys:
+                if key in self._emissions:
+                    self._emissions.move_to_end(key)
+                    emissions[key] = self._emissions[key]
+        missing = {
+            key: audio
+            for key, audio in zip(keys, audios, strict=True)
+            if key not in emissions
+        }
+        if not missing:
+            return [emissions[key] for key in keys]
+
+        # Prepare the audio
+        feature_extractor = getattr(self.processor, "feature_extractor", None)
+        sampling_rate = getattr(feature_extractor, "sampling_rate", None)
+        if not isinstance(sampling_rate, int) or sampling_rate <= 0:
+            raise TranscriptionAlignmentError(
+                "CTC aligner processor did not expose a valid sampling rate."
+            )
+        samples = {
+            key: self._get_audio_samples(audio, sampling_rate)
+            for key, audio in missing.items()
+        }
+
+        # Infer emissions in batches of audio of similar length, only if the model
+        # is masked from padding; otherwise padding alters each segment's emissions
+        batchable = getattr(feature_extractor, "return_attention_mask", False) is True
+        batches: list[list[tuple]] = []
+        for key in sorted(samples, key=lambda key: samples[key].size):
+            if (
+                batchable
+                and batches
+                and len(batches[-1]) < self.batch_size
+                and samples[key].size
+                <= samples[batches[-1][0]].size * _BATCH_LENGTH_RATIO
+                and self._get_frame_count(samples[key].size) is not None
+            ):
+                batches[-1].append(key)
+            else:
+                batches.append([key])
+        torch = import_torch()
+        default_threads = torch.get_num_threads()
+        if self.inference_threads is not None:
+            torch.set_num_threads(self.inference_threads)
+        try:
+            for batch in batches:
+                batch_log_probs = self._get_batch_emissions(
+                    [samples[key] for key in batch], sampling_rate
+                )
+                emissions.update(zip(batch, batch_log_probs, strict=True))
+        finally:
+            torch.set_num_threads(default_threads)
+
+        # Memoize the new emissions
+        with self._emissions_lock:
+            for key in missing:
+                self._emissions[key] = emissions[key]
+            while len(self._emissions) > self.emission_cache_size:
+                self._emissions.popitem(last=False)
+        return [emissions[key] for key in keys]
+
+    def _get_batch_emissions(
+        self, samples: Sequence[np.ndarray], sampling_rate: int
+    ) -> list[np.ndarray]:
+        """Infer CTC log probabilities of one batch of audio samples.
+
+        Arguments:
+            samples: mono float32 samples of each audio segment
+            sampling_rate: sample rate of the samples
+        Returns:
+            frame-by-token log probabilities of each audio segment, excluding
+              frames of padding
+        Raises:
+            ImportError: if CTC dependencies are unavailable
+        """
+        # The processor returns an attention mask over the padding if its feature
+        # extractor is configured to; batches are only formed if it is
+        processor_callable = cast(Callable[..., Mapping[str, Any]], self.processor)
+        inputs = processor_callable(
+            list(samples),
+            sampling_rate=sampling_rate,
+            return_tensors="pt",
+            padding=True,
+        )
+        if self.device != "cpu":
+            inputs = {key: value.to(self.device) for key, value in inputs.items()}
+
+        # Run CTC inference and normalize output for the alignment algorithm
+        torch = import_torch()
+        model_callable = cast(Callable[..., Any], self.model)
+        with torch.inference_mode():
+            output = model_callable(**inputs)
+            log_probs = output.logits.log_softmax(dim=-1).detach().cpu().numpy()
+        if len(samples) == 1:
+            return [log_probs[0]]
+        return [
+            log_probs[sample_idx, : self._get_frame_count(sample.size)]
+            for sample_idx, sample in enumerate(samples)
+        ]
+
+    def _get_frame_count(self, sample_count: int) -> int | None:
+        """Get the number of CTC frames the model emits for audio samples.
+
+        Arguments:
+            sample_count: number of audio samples
+        Returns:
+            number of frames, or None if the model does not describe its
+              convolutional feature encoder
+        """
+        config = getattr(self.model, "config", None)
+        kernels = getattr(config, "conv_kernel", None)
+        strides = getattr(config, "conv_stride", None)
+        if not isinstance(kernels, Sequence) or not isinstance(strides, Sequence):
+            return None
+        frame_count = sample_count
+        for kernel, stride in zip(kernels, strides, strict=True):
+            frame_count = (frame_count - kernel) // stride + 1
+        return frame_count
+
     def _get_model_dir_path(self) -> Path:
         """Resolve the model to a local directory.
 
@@ -343,20 +583,25 @@ class CtcAligner:
             )
         return self._model_dir_path
 
-    def _get_cache_identity(self, text: str) -> CacheIdentity:
+    def _get_cache_identity(
+        self, text: str, pauses: Sequence[tuple[int, float]] = ()
+    ) -> CacheIdentity:
         """Get the configuration identifying reusable forced alignment.
 
         Arguments:
             text: transcription text aligned to the audio
+            pauses: text indexes and audio times of known pauses
         Returns:
             complete CTC alignment identity
         """
         return {
             "alignment_version": _ALIGNMENT_VERSION,
+            "band_seconds": self.band_seconds,
             "device": self.device,
             "language": self.language.code,
             "model_name": self.model_name,
             "model_revision": self.model_revision,
+            "pauses": [[text_idx, time] for text_idx, time in pauses],
             "runtime": {
                 "torch": get_distribution_identity("torch"),
                 "transformers": get_distribution_identity("transformers"),
@@ -443,6 +688,37 @@ class CtcAligner:
             return run_text
         return None
 
+    @staticmethod
+    def _get_anchors(
+        pauses: Sequence[tuple[int, float]],
+        char_indices: Sequence[int],
+        frame_rate: float,
+        frame_count: int,
+    ) -> list[tuple[int, int]]:
+        """Get the transcript token and frame boundaries of known pauses.
+
+        Pauses that do not fall strictly between tokens and frames, or that do not
+        follow all preceding pauses in both text and time, are disregarded.
+
+        Arguments:
+            pauses: text indexes and audio times in seconds of known pauses
+            char_indices: original text indices for path token indices
+            frame_rate: CTC frames per second of audio
+            frame_count: number of audio frames represented by the CTC output
+        Returns:
+            index of first token and first frame following each pause
+        """
+        anchors: list[tuple[int, int]] = []
+        for text_idx, time in sorted(pauses):
+            token_idx = bisect_left(char_indices, text_idx)
+            frame_idx = round(time * frame_rate)
+            if not 0 < token_idx < len(char_indices) or not 0 < frame_idx < frame_count:
+                continue
+            if anchors and (token_idx <= anchors[-1][0] or frame_idx <= anchors[-1][1]):
+                continue
+            anchors.append((token_idx, frame_idx))
+        return anchors
+
     @staticmethod
     def _get_audio_samples(audio: AudioSegment, sampling_rate: int) -> np.ndarray:
         """Get audio samples for CTC alignment.
@@ -461,16 +737,154 @@ class CtcAligner:
             raise TranscriptionAlignmentError("CTC alignment received empty audio.")
         return samples
 
+    @staticmethod
+    def _get_band(
+        log_probs: np.ndarray,
+        blank_token_id: int,
+        alignment_token_count: int,
+        band_frames: int | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the band of alignment tokens considered at each trellis frame.
+
+        Speech is assumed to span from the first to the last frame at which a
+        token other than blank is most probable, and to emit tokens uniformly
+        between them. Each token is considered at frames within the band of its
+        frame under that assumption, and at no frame before it could be reached.
+
+        Arguments:
+            log_probs: frame-by-token log probabilities
+            blank_token_id: model blank token ID
+            alignment_token_count: number of target tokens with inserted blanks
+            band_frames: greatest distance in frames of any token from its frame
+              under uniform speech, or None for no limit
+        Returns:
+            first and last alignment token considered at each trellis frame
+        """
+        frame_count = log_probs.shape[0]
+        frame_idxs = np.arange(frame_count + 1, dtype=np.int64)
+        reachable_ends = np.minimum(frame_idxs, alignment_token_count)
+        if band_frames is None:
+            return np.zeros(frame_count + 1, dtype=np.int64), reachable_ends
+
+        speech_frame_idxs = np.flatnonzero(
+            np.argmax(log_probs, axis=1) != blank_token_id
+        )
+        speech_start = 0
+        speech_frame_count = frame_count
+        if speech_frame_idxs.size > 0:
+            speech_start = int(speech_frame_idxs[0])
+            speech_frame_count = int(speech_frame_idxs[-1]) + 1 - speech_start
+        band_starts = np.clip(
+            -(
+                (band_frames + speech_start - frame_idxs)
+                * alignment_token_count
+                // speech_frame_count
+            ),
+            0,
+            alignment_token_count,
+        )
+        band_ends = np.minimum(
+            (frame_idxs + band_frames - speech_start)
+            * alignment_token_count
+            // speech_frame_count,
+            reachable_ends,
+        )
+        return band_starts, np.maximum(band_ends, band_starts)
+
     @staticmethod
     def _get_best_path(
-        log_probs: np.ndarray, token_ids: Sequence[int], blank_token_id: int
+        log_probs: np.ndarray,
+        token_ids: Sequence[int],
+        blank_token_id: int,
+        *,
+        band_frames: int | None = None,
+        anchors: Sequence[tuple[int, int]] = (),
+        workers: int = 1,
     ) -> list[tuple[int, int, float]]:
         """Get the best CTC path through a transcript-token trellis.
 
+        Each chunk of the transcript between anchors is aligned independently to
+        the corresponding chunk of frames.
+
+        Arguments:
+            log_probs: frame-by-token log probabilities
+            token_ids: target token IDs
+            blank_token_id: model blank token ID
+            band_frames: greatest distance in frames of any token from its frame
+              under uniform speech within its chunk, or None for no limit
+            anchors: index of first token and first frame of each chunk after the
+              first, in increasing order
+            workers: maximum number of chunks to align at once
+        Returns:
+            path entries as transcript token index, frame index, and probability
+        Raises:
+            TranscriptionAlignmentError: if no complete path can be found
+        """
+        frame_count = CtcAligner._validate_best_path_inputs(
+            log_probs, token_ids, blank_token_id
+        )
+        boundaries = [(0, 0), *anchors, (len(token_ids), frame_count)]
+        chunks = [
+            (
+                log_probs[start_frame_idx:end_frame_idx],
+                token_ids[start_token_idx:end_token_idx],
+            )
+            for (start_token_idx, start_frame_idx), (
+                end_token_idx,
+                end_frame_idx,
+            ) in zip(boundaries, boundaries[1:], strict=False)
+        ]
+
+        def get_chunk_path(
+            chunk: tuple[np.ndarray, Sequence[int]],
+        ) -> list[tuple[int, int, float]]:
+            """Get the best path through one chunk.
+
+            Arguments:
+                chunk: chunk log probabilities and token IDs
+            Returns:
+                path entries relative to the chunk
+            """
+            return CtcAligner._get_chunk_best_path(
+                chunk[0], chunk[1], blank_token_id, band_frames
+            )
+
+        if workers == 1 or len(chunks) < 2:
+            chunk_paths = [get_chunk_path(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunk_paths = list(executor.map(get_chunk_path, chunks))
+
+        path: list[tuple[int, int, float]] = []
+        for (start_token_idx, start_frame_idx), chunk_path in zip(
+            boundaries, chunk_paths, strict=False
+        ):
+            path.extend(
+                (start_token_idx + token_idx, start_frame_idx + frame_idx, probability)
+                for token_idx, frame_idx, probability in chunk_path
+            )
+        return path
+
+    @staticmethod
+    def _get_chunk_best_path(
+        log_probs: np.ndarray,
+        token_ids: Sequence[int],
+        blank_token_id: int,
+        band_frames: int | None,
+    ) -> list[tuple[int, int, float]]:
+        """Get the best CTC path through one banded transcript-token trellis.
+
+        Only tokens within the band of their frame under uniform speech are
+        considered, and only which transition reaches each considered trellis cell
+        is stored; scores are kept for two frames at a time. Within the band, the
+        path is that of the complete trellis.
+
         Arguments:
             log_probs: frame-by-token log probabilities
             token_ids: target token IDs
             blank_token_id: model blank token ID
+            band_frames: greatest distance in frames of any token from its frame
+              under uniform speech, or None for no limit
         Returns:
             path entries as transcript token index, frame index, and probability
         Raises:
@@ -494,58 +908,55 @@ class CtcAligner:
             alignment_token_ids.append(token_id)
             path_token_indices.append(token_idx)
 
-        # Initialize and populate the alignment trellis
+        # Get the band of alignment tokens considered at each frame
         alignment_token_count = len(alignment_token_ids)
-        trellis = np.empty((frame_count + 1, alignment_token_count + 1))
-        trellis[0, 0] = 0.0
-        trellis[1:, 0] = np.cumsum(log_probs[:, blank_token_id])
-        trellis[0, -alignment_token_count:] = -np.inf
-        trellis[-alignment_token_count:, 0] = np.inf
-        for frame_idx in range(frame_count):
-            stay_scores = trellis[frame_idx, 1:] + log_probs[frame_idx, blank_token_id]
-            token_log_probs = log_probs[frame_idx, alignment_token_ids]
-            change_scores = trellis[frame_idx, :-1] + token_log_probs
-            trellis[frame_idx + 1, 1:] = np.maximum(stay_scores, change_scores)
+        band_starts, band_ends = CtcAligner._get_band(
+            log_probs, blank_token_id, alignment_token_count, band_frames
+        )
+
+        # Populate banded transitions, seeding the first token with leading blanks
+        first_column = np.empty(frame_count + 1)
+        first_column[0] = 0.0
+        first_column[1:] = np.cumsum(log_probs[:, blank_token_id])
+        first_column[-alignment_token_count:] = np.inf
+        alignment_token_id_array = np.array(alignment_token_ids, dtype=np.int64)
+        changes, final_column = _get_ctc_transitions(
+            log_probs,
+            alignment_token_id_array,
+            blank_token_id,
+            first_column,
+            band_starts,
+            band_ends,
+        )
 
         # Select the best completed alignment
-        final_column = trellis[:, alignment_token_count]
         if np.all(np.isneginf(final_column)):
             raise TranscriptionAlignmentIncompleteError(
                 "CTC alignment did not reach all tokens."
             )
         frame_idx = int(np.argmax(final_column))
 
-        # Backtrack through the trellis to recover token frame spans
-        alignment_token_idx = alignment_token_count
-        path: list[tuple[int, int, float]] = []
-        for trellis_frame_idx in range(frame_idx, 0, -1):
-            token_id = alignment_token_ids[alignment_token_idx - 1]
-            stay_score = (
-                trellis[trellis_frame_idx - 1, alignment_token_idx]
-                + log_probs[trellis_frame_idx - 1, blank_token_id]
-            )
-            change_score = (
-                trellis[trellis_frame_idx - 1, alignment_token_idx - 1]
-                + log_probs[trellis_frame_idx - 1, token_id]
-            )
-            if change_score > stay_score:
-                score_token_id = token_id
-            else:
-                score_token_id = blank_token_id
-            path.append(
-                (
-                    path_token_indices[alignment_token_idx - 1],
-                    trellis_frame_idx - 1,
-                    float(np.exp(log_probs[trellis_frame_idx - 1, score_token_id])),
-                )
-            )
-            if change_score > stay_score:
-                alignment_token_idx -= 1
-                if alignment_token_idx == 0:
-                    break
-        else:
+        # Backtrack through the transitions to recover token frame spans
+        alignment_token_idxs, path_changes = _get_ctc_backtrack(
+            changes, band_starts, alignment_token_count, frame_idx
+        )
+        if alignment_token_idxs.size == 0 or alignment_token_idxs[-1] != 0:
             raise TranscriptionAlignmentError("CTC alignment backtrack failed.")
-
+        path_frame_idxs = np.arange(
+            frame_idx - 1, frame_idx - 1 - len(path_changes), -1
+        )
+        score_token_ids = np.where(
+            path_changes, alignment_token_id_array[alignment_token_idxs], blank_token_id
+        )
+        probabilities = np.exp(log_probs[path_frame_idxs, score_token_ids])
+        path = list(
+            zip(
+                np.array(path_token_indices)[alignment_token_idxs].tolist(),
+                path_frame_idxs.tolist(),
+                probabilities.tolist(),
+                strict=True,
+            )
+        )
         path.reverse()
         return path
 
@@ -841,3 +1252,113 @@ class CtcAligner:
         if blank_token_id < 0 or blank_token_id >= log_probs.shape[1]:
             raise TranscriptionAlignmentError("CTC blank token ID is out of range.")
         return frame_count
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _get_ctc_transitions(
+    log_probs: np.ndarray,
+    alignment_token_ids: np.ndarray,
+    blank_token_id: int,
+    first_column: np.ndarray,
+    band_starts: np.ndarray,
+    band_ends: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the transitions reaching each cell of a banded CTC trellis.
+
+    Cells outside the band are treated as unreachable.
+
+    Arguments:
+        log_probs: frame-by-token log probabilities
+        alignment_token_ids: target token IDs with blanks between repeated labels
+        blank_token_id: model blank token ID
+        first_column: trellis scores of no tokens emitted by each frame
+        band_starts: first alignment token considered at each frame
+        band_ends: last alignment token considered at each frame
+    Returns:
+        whether each banded cell is reached by emitting its token, by frame and
+        offset from the band start, and score of all tokens emitted by each frame
+    """
+    # Allocate transitions and rolling scores
+    frame_count = log_probs.shape[0]
+    alignment_token_count = len(alignment_token_ids)
+    band_width = 1
+    for frame_idx in range(frame_count + 1):
+        band_width = max(band_width, band_ends[frame_idx] - band_starts[frame_idx] + 1)
+    changes = np.zeros((frame_count + 1, band_width), dtype=np.uint8)
+    final_column = np.full(frame_count + 1, -np.inf)
+    previous_scores = np.full(alignment_token_count + 1, -np.inf)
+    current_scores = np.full(alignment_token_count + 1, -np.inf)
+
+    # Seed the first frame
+    previous_scores[0] = first_column[0]
+    previous_band_start = 0
+    previous_band_end = 0
+
+    # Fill each banded frame
+    for frame_idx in range(frame_count):
+        band_start = band_starts[frame_idx + 1]
+        band_end = band_ends[frame_idx + 1]
+        blank_log_prob = log_probs[frame_idx, blank_token_id]
+        for token_idx in range(band_start, band_end + 1):
+            if token_idx == 0:
+                current_scores[0] = first_column[frame_idx + 1]
+                continue
+            stay_score = -np.inf
+            if previous_band_start <= token_idx <= previous_band_end:
+                stay_score = previous_scores[token_idx]
+            stay_score += blank_log_prob
+            change_score = -np.inf
+            if previous_band_start <= token_idx - 1 <= previous_band_end:
+                change_score = previous_scores[token_idx - 1]
+            change_score += log_probs[frame_idx, alignment_token_ids[token_idx - 1]]
+            if change_score > stay_score:
+                current_scores[token_idx] = change_score
+                changes[frame_idx + 1, token_idx - band_start] = 1
+            else:
+                current_scores[token_idx] = stay_score
+        if band_end == alignment_token_count:
+            final_column[frame_idx + 1] = current_scores[alignment_token_count]
+
+        # Roll current scores forward
+        previous_scores, current_scores = current_scores, previous_scores
+        previous_band_start = band_start
+        previous_band_end = band_end
+
+    return changes, final_column
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _get_ctc_backtrack(
+    changes: np.ndarray,
+    band_starts: np.ndarray,
+    alignment_token_count: int,
+    frame_idx: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Backtrack through banded CTC transitions from a completed alignment.
+
+    Arguments:
+        changes: whether each banded cell is reached by emitting its token
+        band_starts: first alignment token considered at each frame
+        alignment_token_count: number of target tokens with inserted blanks
+        frame_idx: trellis frame at which all tokens have been emitted
+    Returns:
+        alignment token index and whether it was emitted, for each frame from the
+        last aligned to the first; incomplete if the final token index is not zero
+    """
+    alignment_token_idxs = np.empty(frame_idx, dtype=np.int64)
+    path_changes = np.empty(frame_idx, dtype=np.bool_)
+    alignment_token_idx = alignment_token_count
+    step_count = 0
+    for trellis_frame_idx in range(frame_idx, 0, -1):
+        offset = alignment_token_idx - band_starts[trellis_frame_idx]
+        change = offset >= 0 and changes[trellis_frame_idx, offset] == 1
+        alignment_token_idxs[step_count] = alignment_token_idx - 1
+        path_changes[step_count] = change
+        step_count += 1
+        if change:
+            alignment_token_idx -= 1
+            if alignment_token_idx == 0:
+                break
+    if alignment_token_idx != 0:
+        step_count = 0
+    return alignment_token_idxs[:step_count], path_changes[:step_count]
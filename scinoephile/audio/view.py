@@ -0,0 +1,192 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Read-only windows into decoded audio."""
+
+from __future__ import annotations
+
+from typing import Self
+
+import numpy as np
+from pydub import AudioSegment
+
+__all__ = ["AudioView", "get_audio_view"]
+
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+"""NumPy sample types keyed by sample width in bytes."""
+
+
+class AudioView:
+    """Read-only window into the decoded data of one audio segment.
+
+    Slicing a view by milliseconds yields another view of the same decoded data, so
+    that blocks and clips of a long recording share one buffer rather than each
+    holding a copy. Slices follow pydub's slicing semantics, including padding with
+    up to two milliseconds of silence when rounding reaches past the end of the
+    data. An AudioSegment is materialized only when one is requested.
+    """
+
+    def __init__(
+        self, source: AudioSegment, start_frame: int = 0, end_frame: int | None = None
+    ):
+        """Initialize.
+
+        Arguments:
+            source: audio segment whose decoded data to view
+            start_frame: inclusive frame index at which the view starts
+            end_frame: exclusive frame index at which the view ends, which may exceed
+              the source's frames by padding; None for the end of the source
+        Raises:
+            ValueError: if the frame range is invalid
+        """
+        source_frame_count = len(source.raw_data) // source.frame_width
+        if end_frame is None:
+            end_frame = source_frame_count
+        if not 0 <= start_frame <= end_frame:
+            raise ValueError(f"Invalid audio frame range {start_frame}-{end_frame}")
+        if start_frame > source_frame_count:
+            raise ValueError(
+                f"Audio frame {start_frame} is beyond {source_frame_count} frames"
+            )
+        self.source = source
+        """Audio segment whose decoded data is viewed."""
+        self.start_frame = start_frame
+        """Inclusive frame index at which the view starts."""
+        self.end_frame = end_frame
+        """Exclusive frame index at which the view ends."""
+
+    def __copy__(self) -> Self:
+        """Get this immutable view."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        """Get this immutable view rather than copying its decoded data.
+
+        Arguments:
+            memo: objects already copied
+        Returns:
+            this view
+        """
+        return self
+
+    def __getitem__(self, millisecond: int | slice) -> AudioView:
+        """Get a view of a millisecond or a range of milliseconds.
+
+        Arguments:
+            millisecond: millisecond, or slice of milliseconds without a step
+        Returns:
+            view of the selected audio
+        Raises:
+            ValueError: if the slice has a step
+        """
+        duration = len(self)
+        if isinstance(millisecond, slice):
+            if millisecond.step:
+                raise ValueError("Audio views do not support slice steps")
+            start = 0 if millisecond.start is None else millisecond.start
+            end = duration if millisecond.stop is None else millisecond.stop
+            start = min(start, duration)
+            end = min(end, duration)
+        else:
+            start = millisecond
+            end = millisecond + 1
+        start_frame = self.start_frame + self._get_frame_index(start)
+        end_frame = self.start_frame + self._get_frame_index(end)
+        return type(self)(self.source, start_frame, max(start_frame, end_frame))
+
+    def __len__(self) -> int:
+        """Duration in milliseconds."""
+        return round(1000 * self.frame_count / self.frame_rate)
+
+    @property
+    def channels(self) -> int:
+        """Number of channels."""
+        return self.source.channels
+
+    @property
+    def data(self) -> memoryview:
+        """Read-only view of raw data, excluding any padding."""
+        source_data = memoryview(self.source.raw_data).toreadonly()
+        frame_width = self.frame_width
+        end_frame = min(self.end_frame, len(source_data) // frame_width)
+        return source_data[self.start_frame * frame_width : end_frame * frame_width]
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames, including any padding."""
+        return self.end_frame - self.start_frame
+
+    @property
+    def frame_rate(self) -> int:
+        """Frame rate in Hz."""
+        return self.source.frame_rate
+
+    @property
+    def frame_width(self) -> int:
+        """Width of one frame of all channels in bytes."""
+        return self.source.frame_width
+
+    @property
+    def sample_width(self) -> int:
+        """Width of one sample in bytes."""
+        return self.source.sample_width
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Read-only array of interleaved samples, including any padding."""
+        dtype = _SAMPLE_DTYPES.get(self.sample_width)
+        if dtype is None:
+            raise ValueError(f"Unsupported sample width {self.sample_width}")
+        samples = np.frombuffer(self.data, dtype=dtype)
+        padding_count = self.frame_count * self.channels - len(samples)
+        if padding_count:
+            samples = np.concatenate((samples, np.zeros(padding_count, dtype=dtype)))
+            samples.flags.writeable = False
+        return samples
+
+    def to_audio_segment(self) -> AudioSegment:
+        """Get the viewed audio as an audio segment.
+
+        A view of the whole source returns the source itself; other views copy their
+        data into a new segment.
+
+        Returns:
+            audio segment
+        """
+        data = self.data
+        frame_width = self.frame_width
+        if self.start_frame == 0 and self.end_frame * frame_width == len(
+            self.source.raw_data
+        ):
+            return self.source
+        padding = b"\0" * (self.frame_count * frame_width - len(data))
+        return AudioSegment(
+            data=data.tobytes() + padding,
+            sample_width=self.sample_width,
+            frame_rate=self.frame_rate,
+            channels=self.channels,
+        )
+
+    def _get_frame_index(self, millisecond: float) -> int:
+        """Get the frame index of a millisecond relative to the start of this view.
+
+        Arguments:
+            millisecond: millisecond, counting from the end if negative
+        Returns:
+            frame index
+        """
+        if millisecond < 0:
+            millisecond = len(self) - abs(millisecond)
+        return int(millisecond * (self.frame_rate / 1000.0))
+
+
+def get_audio_view(audio: AudioSegment | AudioView) -> AudioView:
+    """Get a view of audio.
+
+    Arguments:
+        audio: audio segment or view
+    Returns:
+        provided view, or a view of the whole audio segment
+    """
+    if isinstance(audio, AudioView):
+        return audio
+    return AudioView(audio)
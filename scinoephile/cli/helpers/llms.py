@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from scinoephile.common.argument_parsing import input_file_arg, output_file_arg
+from scinoephile.common.argument_parsing import input_file_arg, int_arg, output_file_arg
 from scinoephile.core.cli import ScinoephileCliBase
 from scinoephile.llms.providers.registry import (
     DEFAULT_PROVIDER_NAME,
@@ -32,6 +32,7 @@ from .argument_bundle_field_action import ArgumentBundleFieldAction
 __all__ = [
     "LLM_LOCALIZATIONS",
     "LlmArguments",
+    "add_llm_concurrency_arg",
     "add_llm_provider_args",
     "add_llm_test_case_json_arg",
     "llm_provider_name_arg",
@@ -57,6 +58,15 @@ LLM_LOCALIZATIONS: dict[str, dict[str, str]] = {
             "--list-llm-providers 获取更多信息。"
         ),
         "list available LLM providers and exit": "列出可用 LLM 提供商并退出",
+        "maximum number of concurrent LLM queries (default: 1)": (
+            "最大并发 LLM 查询数（默认：1）"
+        ),
+        "maximum number of LLM requests per minute (default: no limit)": (
+            "每分钟最大 LLM 请求数（默认：无限制）"
+        ),
+        "maximum number of LLM tokens per minute (default: no limit)": (
+            "每分钟最大 LLM 词元数（默认：无限制）"
+        ),
     },
     "zh-hant": {
         "additional help": "附加說明",
@@ -76,6 +86,15 @@ LLM_LOCALIZATIONS: dict[str, dict[str, str]] = {
             "--list-llm-providers 取得更多資訊。"
         ),
         "list available LLM providers and exit": "列出可用 LLM 提供商並結束",
+        "maximum number of concurrent LLM queries (default: 1)": (
+            "最大並行 LLM 查詢數（預設：1）"
+        ),
+        "maximum number of LLM requests per minute (default: no limit)": (
+            "每分鐘最大 LLM 請求數（預設：無限制）"
+        ),
+        "maximum number of LLM tokens per minute (default: no limit)": (
+            "每分鐘最大 LLM 詞元數（預設：無限制）"
+        ),
     },
 }
 """Localized text shared by CLIs that expose LLM provider arguments."""
@@ -93,6 +112,30 @@ class LlmArguments:
     """Optional path to additional LLM prompt context."""
     no_op: bool = False
     """Whether to use neutral answers without calling an LLM."""
+    concurrency: int = 1
+    """Maximum number of concurrent LLM queries."""
+    requests_per_minute: int | None = None
+    """Optional maximum number of LLM requests per minute."""
+    tokens_per_minute: int | None = None
+    """Optional maximum number of LLM tokens per minute."""
+
+
+def add_llm_concurrency_arg(llm_arg_group: _ArgumentGroup):
+    """Add an LLM query concurrency argument.
+
+    Arguments:
+        llm_arg_group: group to which the concurrency argument is added
+    """
+    llm_arg_group.add_argument(
+        "--concurrency",
+        action=ArgumentBundleFieldAction,
+        bundle_type=LlmArguments,
+        dest="llm_args",
+        field_name="concurrency",
+        metavar="N",
+        type=int_arg(min_value=1),
+        help="maximum number of concurrent LLM queries (default: 1)",
+    )
 
 
 def add_llm_provider_args(
@@ -134,6 +177,26 @@ def add_llm_provider_args(
         type=input_file_arg(),
         help="text file from which to read additional LLM prompt context",
     )
+    llm_arg_group.add_argument(
+        "--llm-requests-per-minute",
+        action=ArgumentBundleFieldAction,
+        bundle_type=LlmArguments,
+        dest="llm_args",
+        field_name="requests_per_minute",
+        metavar="N",
+        type=int_arg(min_value=1),
+        help="maximum number of LLM requests per minute (default: no limit)",
+    )
+    llm_arg_group.add_argument(
+        "--llm-tokens-per-minute",
+        action=ArgumentBundleFieldAction,
+        bundle_type=LlmArguments,
+        dest="llm_args",
+        field_name="tokens_per_minute",
+        metavar="N",
+        type=int_arg(min_value=1),
+        help="maximum number of LLM tokens per minute (default: no limit)",
+    )
     llm_arg_group.add_argument(
         "--llm-no-op",
         action=ArgumentBundleFieldAction,
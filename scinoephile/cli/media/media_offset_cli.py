@@ -8,6 +8,11 @@ from argparse import ArgumentParser
 from math import nextafter
 from pathlib import Path
 
+from scinoephile.cli.helpers.cache import (
+    CACHE_LOCALIZATIONS,
+    CacheArguments,
+    add_cache_args,
+)
 from scinoephile.common.argument_parsing import (
     float_arg,
     get_arg_groups_by_name,
@@ -16,9 +21,11 @@ from scinoephile.common.argument_parsing import (
 )
 from scinoephile.core import ScinoephileError
 from scinoephile.core.cli import ScinoephileCliBase
+from scinoephile.core.cli.localization import merge_localizations
 from scinoephile.core.timing import format_time_ms
 from scinoephile.media.offset.video import VideoOffsetResult
 from scinoephile.media.offset.video.detection import get_video_offset
+from scinoephile.media.offset.video.video_frame_cache import VideoFrameCache
 from scinoephile.media.offset.video.video_offset_window_result import (
     VideoOffsetWindowResult,
 )
@@ -92,7 +99,7 @@ class MediaOffsetCli(ScinoephileCliBase):
     Positive output means the target is later than the reference.
     """
 
-    localizations = MEDIA_OFFSET_LOCALIZATIONS
+    localizations = merge_localizations(CACHE_LOCALIZATIONS, MEDIA_OFFSET_LOCALIZATIONS)
     """Localized help text keyed by locale and English source text."""
 
     @classmethod
@@ -107,6 +114,7 @@ class MediaOffsetCli(ScinoephileCliBase):
             parser,
             "input arguments",
             "operation arguments",
+            "cache arguments",
             optional_arguments_name="additional arguments",
         )
 
@@ -158,6 +166,9 @@ class MediaOffsetCli(ScinoephileCliBase):
             type=int_arg(min_value=1),
             help="sample window count (default: %(default)s)",
         )
+
+        # Cache arguments
+        add_cache_args(arg_groups["cache arguments"])
         parser.set_defaults(_parser=parser)
 
     @classmethod
@@ -181,6 +192,7 @@ class MediaOffsetCli(ScinoephileCliBase):
         duration: float,
         coarse_step: float,
         sample_windows: int,
+        cache_args: CacheArguments,
     ):
         """Execute with provided keyword arguments."""
         parser = _parser or cls.argparser()
@@ -193,6 +205,7 @@ class MediaOffsetCli(ScinoephileCliBase):
                 duration=duration,
                 coarse_step=coarse_step,
                 sample_windows=sample_windows,
+                frame_cache=VideoFrameCache(cache_args.root_path, cache_args.overwrite),
             )
             print(cls._get_result_description(result))
         except (ScinoephileError, ValueError) as exc:
@@ -15,6 +15,7 @@ from scinoephile.cli.helpers.cache import (
 from scinoephile.cli.helpers.llms import (
     LLM_LOCALIZATIONS,
     LlmArguments,
+    add_llm_concurrency_arg,
     add_llm_provider_args,
     read_llm_additional_context,
 )
@@ -153,6 +154,7 @@ class OcrProcessCli(ScinoephileCliBase):
         add_llm_provider_args(
             arg_groups["llm arguments"], arg_groups["additional help"]
         )
+        add_llm_concurrency_arg(arg_groups["llm arguments"])
 
         # Cache arguments
         add_cache_args(arg_groups["cache arguments"])
@@ -213,7 +215,12 @@ class OcrProcessCli(ScinoephileCliBase):
         additional_context = read_llm_additional_context(
             parser, llm_args.additional_context_file_path
         )
-        provider = get_provider(llm_args.provider_name, model=llm_args.model_name)
+        provider = get_provider(
+            llm_args.provider_name,
+            model=llm_args.model_name,
+            requests_per_minute=llm_args.requests_per_minute,
+            tokens_per_minute=llm_args.tokens_per_minute,
+        )
 
         # Perform operations
         try:
@@ -232,7 +239,7 @@ class OcrProcessCli(ScinoephileCliBase):
                 overwrite_cache=cache_args.overwrite,
                 provider=provider,
                 additional_context=additional_context,
-                fuser_kw={"no_op": llm_args.no_op},
+                fuser_kw={"no_op": llm_args.no_op, "concurrency": llm_args.concurrency},
             )()
         except ScinoephileError as exc:
             parser.error(str(exc))
@@ -18,6 +18,7 @@ from scinoephile.common.argument_parsing import (
     enum_metavar,
     get_arg_groups_by_name,
     input_file_or_dir_arg,
+    int_arg,
     output_file_arg,
 )
 from scinoephile.core import Language, ScinoephileError
@@ -41,6 +42,9 @@ OCR_TESSERACT_LOCALIZATIONS: dict[str, dict[str, str]] = {
         "run a second legacy-engine pass to detect italic text": (
             "运行第二次旧版引擎识别以检测斜体文本"
         ),
+        "maximum number of subtitles to recognize at once (default: %(default)s)": (
+            "同时识别的最大字幕数（默认：%(default)s）"
+        ),
         (
             "image subtitle infile path (directory containing index.html and "
             "png files, or a .sup file)"
@@ -60,6 +64,9 @@ OCR_TESSERACT_LOCALIZATIONS: dict[str, dict[str, str]] = {
         "run a second legacy-engine pass to detect italic text": (
             "執行第二次舊版引擎識別以偵測斜體文字"
         ),
+        "maximum number of subtitles to recognize at once (default: %(default)s)": (
+            "同時識別的最大字幕數（預設：%(default)s）"
+        ),
         (
             "image subtitle infile path (directory containing index.html and "
             "png files, or a .sup file)"
@@ -123,6 +130,16 @@ class OcrTesseractCli(ScinoephileCliBase):
             action="store_true",
             help="run a second legacy-engine pass to detect italic text",
         )
+        arg_groups["operation arguments"].add_argument(
+            "--jobs",
+            default=1,
+            metavar="N",
+            type=int_arg(min_value=1),
+            help=(
+                "maximum number of subtitles to recognize at once "
+                "(default: %(default)s)"
+            ),
+        )
 
         # Cache arguments
         add_cache_args(arg_groups["cache arguments"])
@@ -157,6 +174,7 @@ class OcrTesseractCli(ScinoephileCliBase):
         infile_path: Path,
         outfile_path: Path,
         detect_italics: bool,
+        jobs: int,
         language: Language,
         overwrite: bool,
         cache_args: CacheArguments,
@@ -177,6 +195,7 @@ class OcrTesseractCli(ScinoephileCliBase):
             text_series = ocr_image_series_with_tesseract(
                 image_series,
                 cache_root_path=cache_args.root_path,
+                jobs=jobs,
                 detect_italics=detect_italics,
                 language=language,
                 overwrite_cache=cache_args.overwrite,
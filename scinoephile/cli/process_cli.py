@@ -8,25 +8,40 @@ Process subtitles.
 from __future__ import annotations
 
 from argparse import ArgumentParser
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, as_completed
+from functools import partial
+from glob import glob
+from logging import getLogger
+from multiprocessing import get_context
 from pathlib import Path
 
 from scinoephile.common.argument_parsing import (
     enum_arg,
     enum_metavar,
     get_arg_groups_by_name,
-    input_file_arg,
     int_arg,
+    output_dir_arg,
     output_file_arg,
 )
+from scinoephile.common.exceptions import NotAFileError
+from scinoephile.common.validation import val_input_path
 from scinoephile.core import Language, ScinoephileError
 from scinoephile.core.cli import ScinoephileCliBase
 from scinoephile.core.cli.localization import merge_localizations
 from scinoephile.core.script import OpenCCConfig
-from scinoephile.lang.zho.script.conversion import get_zho_converted
-from scinoephile.workflows.clean import clean_series
-from scinoephile.workflows.flatten import flatten_series
+from scinoephile.core.subtitles import Series
+from scinoephile.lang.cmn.romanization import get_cmn_text_romanized
+from scinoephile.lang.yue.romanization import get_yue_text_romanized
+from scinoephile.lang.zho.script.conversion import (
+    get_zho_converter,
+    get_zho_text_converted,
+)
+from scinoephile.workflows.clean import get_clean_operation
+from scinoephile.workflows.flatten import get_flatten_operation
 from scinoephile.workflows.helpers import resolve_language
-from scinoephile.workflows.romanize import romanize_series
+from scinoephile.workflows.romanize import get_romanize_operation
+from scinoephile.workflows.text_pipeline import TextOperation, TextPipeline
 
 from .helpers.conversion import (
     CONVERSION_LOCALIZATIONS,
@@ -36,6 +51,10 @@ from .helpers.io import read_series, write_series
 
 __all__ = ["ProcessCli"]
 
+logger = getLogger(__name__)
+
+_SUBTITLE_SUFFIXES = (".ass", ".srt", ".ssa", ".sub", ".vtt")
+"""Suffixes of subtitle files processed from input directories."""
 
 PROCESS_LOCALIZATIONS: dict[str, dict[str, str]] = {
     "zh-hans": {
@@ -52,12 +71,18 @@ PROCESS_LOCALIZATIONS: dict[str, dict[str, str]] = {
         "shift subtitle timings by this many milliseconds": (
             "按指定毫秒数平移字幕时间"
         ),
-        'subtitle infile path or "-" for stdin': (
-            '字幕输入文件路径，或使用 "-" 表示标准输入'
+        "maximum number of files to process at once (default: %(default)s)": (
+            "同时处理的最大文件数（默认：%(default)s）"
         ),
+        (
+            'subtitle infile paths, directories, or glob patterns, or "-" for stdin'
+        ): '字幕输入文件路径、目录或通配模式，或使用 "-" 表示标准输入',
         "subtitle language (default: detected automatically)": (
             "字幕语言（默认：自动检测）"
         ),
+        "subtitle outfile directory, required for multiple infiles": (
+            "字幕输出目录，处理多个输入文件时必需"
+        ),
         "subtitle outfile path (default: stdout)": (
             "字幕输出文件路径（默认：标准输出）"
         ),
@@ -76,12 +101,18 @@ PROCESS_LOCALIZATIONS: dict[str, dict[str, str]] = {
         "shift subtitle timings by this many milliseconds": (
             "依指定毫秒數平移字幕時間"
         ),
-        'subtitle infile path or "-" for stdin': (
-            '字幕輸入檔路徑，或使用 "-" 代表標準輸入'
+        "maximum number of files to process at once (default: %(default)s)": (
+            "同時處理的最大檔案數（預設：%(default)s）"
         ),
+        (
+            'subtitle infile paths, directories, or glob patterns, or "-" for stdin'
+        ): '字幕輸入檔路徑、目錄或萬用字元模式，或使用 "-" 代表標準輸入',
         "subtitle language (default: detected automatically)": (
             "字幕語言（預設：自動偵測）"
         ),
+        "subtitle outfile directory, required for multiple infiles": (
+            "字幕輸出目錄，處理多個輸入檔時必需"
+        ),
         "subtitle outfile path (default: stdout)": "字幕輸出檔路徑（預設：標準輸出）",
     },
 }
@@ -115,10 +146,12 @@ class ProcessCli(ScinoephileCliBase):
         arg_groups["input arguments"].add_argument(
             "-i",
             "--infile",
-            dest="infile_path",
+            dest="infiles",
+            nargs="+",
             required=True,
-            type=input_file_arg(allow_stdin=True),
-            help='subtitle infile path or "-" for stdin',
+            help=(
+                'subtitle infile paths, directories, or glob patterns, or "-" for stdin'
+            ),
         )
 
         # Operation arguments
@@ -152,6 +185,13 @@ class ProcessCli(ScinoephileCliBase):
             type=int_arg(),
             help="shift subtitle timings by this many milliseconds",
         )
+        arg_groups["operation arguments"].add_argument(
+            "--jobs",
+            default=1,
+            metavar="N",
+            type=int_arg(min_value=1),
+            help="maximum number of files to process at once (default: %(default)s)",
+        )
 
         # Output arguments
         arg_groups["output arguments"].add_argument(
@@ -161,24 +201,32 @@ class ProcessCli(ScinoephileCliBase):
             type=output_file_arg(exist_ok=True),
             help="subtitle outfile path (default: stdout)",
         )
+        arg_groups["output arguments"].add_argument(
+            "--outdir",
+            dest="outdir_path",
+            type=output_dir_arg(),
+            help="subtitle outfile directory, required for multiple infiles",
+        )
         arg_groups["output arguments"].add_argument(
             "--overwrite", action="store_true", help="overwrite outfile if it exists"
         )
         parser.set_defaults(_parser=parser)
 
     @classmethod
-    def _main(  # noqa: PLR0912
+    def _main(
         cls,
         *,
         _parser: ArgumentParser | None = None,
-        infile_path: Path | str,
+        infiles: list[str],
         outfile_path: Path | None,
+        outdir_path: Path | None,
         language: Language | None,
         clean: bool,
         flatten: bool,
         convert: OpenCCConfig | bool | None,
         romanize: bool,
         offset: int,
+        jobs: int,
         overwrite: bool,
     ):
         """Execute with provided keyword arguments."""
@@ -186,44 +234,295 @@ class ProcessCli(ScinoephileCliBase):
         parser = _parser or cls.argparser()
         if not (clean or flatten or convert or romanize or offset):
             parser.error("At least one operation required")
-        if overwrite and outfile_path is None:
-            parser.error("--overwrite may only be used with --outfile")
-
-        # Read input and resolve language
-        series = read_series(parser, infile_path, allow_stdin=True)
-        try:
-            resolved_language = resolve_language(series, language)
-        except ScinoephileError as exc:
-            parser.error(str(exc))
-        if resolved_language is Language.eng and convert is not None:
-            parser.error("--convert may only be used with Chinese subtitles")
-        resolved_convert: OpenCCConfig | None = None
-        if isinstance(convert, OpenCCConfig):
-            resolved_convert = convert
-        elif convert:
-            if resolved_language.script == "Hans":
-                resolved_convert = OpenCCConfig.s2t
-            else:
-                resolved_convert = OpenCCConfig.t2s
-        if resolved_language is Language.eng and romanize:
-            parser.error("--romanize may only be used with Chinese subtitles")
-
-        # Perform operations
-        if clean:
-            series = clean_series(series, language=resolved_language)
-        if resolved_convert is not None:
-            series = get_zho_converted(series, resolved_convert)
-        if flatten:
-            series = flatten_series(series, language=resolved_language)
-        if romanize:
-            series = romanize_series(series, language=resolved_language, append=True)
-        if offset:
-            series.shift(ms=offset)
-
-        # Write output
-        write_series(
-            parser, series, outfile_path if outfile_path is not None else "-", overwrite
+        if overwrite and outfile_path is None and outdir_path is None:
+            parser.error("--overwrite may only be used with --outfile or --outdir")
+        process = partial(
+            _get_processed_series,
+            language=language,
+            clean=clean,
+            convert=convert,
+            flatten=flatten,
+            romanize=romanize,
+            offset=offset,
+        )
+
+        # Process a single file
+        batch = (
+            outdir_path is not None
+            or len(infiles) > 1
+            or _is_glob(infiles[0])
+            or Path(infiles[0]).is_dir()
+        )
+        if not batch:
+            series = read_series(parser, infiles[0], allow_stdin=True)
+            try:
+                series = process(series)
+            except ScinoephileError as exc:
+                parser.error(str(exc))
+            write_series(
+                parser,
+                series,
+                outfile_path if outfile_path is not None else "-",
+                overwrite,
+            )
+            return
+
+        # Process many files, reporting each as it completes
+        if outfile_path is not None:
+            parser.error("--outfile may only be used with a single infile")
+        if outdir_path is None:
+            parser.error("--outdir is required to process multiple infiles")
+        infile_paths = _get_infile_paths(parser, infiles)
+        outfile_paths = [
+            outdir_path / infile_path.with_suffix(".srt").name
+            for infile_path in infile_paths
+        ]
+        if len(set(outfile_paths)) < len(outfile_paths):
+            parser.error("Multiple infiles would be written to the same outfile")
+        errors = _process_files(
+            infile_paths,
+            outfile_paths,
+            process_file=partial(_process_file, process=process, overwrite=overwrite),
+            jobs=jobs,
+            convert=convert,
+            romanize=romanize,
+        )
+
+        # Summarize errors
+        if errors:
+            summary = "\n".join(
+                f"  {infile_path}: {error}"
+                for infile_path, error in sorted(errors.items())
+            )
+            parser.exit(
+                1,
+                f"Unable to process {len(errors)} of {len(infile_paths)} infiles:\n"
+                f"{summary}\n",
+            )
+
+
+def _get_infile_paths(parser: ArgumentParser, infiles: list[str]) -> list[Path]:
+    """Expand infile arguments into subtitle infile paths.
+
+    Arguments:
+        parser: parser used for user-facing error output
+        infiles: infile paths, directories, or glob patterns
+    Returns:
+        distinct infile paths, in order of their arguments
+    """
+    infile_paths: dict[Path, None] = {}
+    for infile in infiles:
+        if infile == "-":
+            parser.error('"-" may only be used as a single infile')
+        if _is_glob(infile):
+            matched_paths = sorted(Path(path) for path in glob(infile, recursive=True))
+            matched_paths = [path for path in matched_paths if path.is_file()]
+            if not matched_paths:
+                parser.error(f"No infiles match {infile}")
+        elif Path(infile).is_dir():
+            matched_paths = sorted(
+                path
+                for path in Path(infile).iterdir()
+                if path.is_file() and path.suffix.lower() in _SUBTITLE_SUFFIXES
+            )
+        else:
+            matched_paths = [Path(infile)]
+        for matched_path in matched_paths:
+            try:
+                infile_paths[val_input_path(matched_path)] = None
+            except (FileNotFoundError, NotAFileError) as exc:
+                parser.error(str(exc))
+    if not infile_paths:
+        parser.error("No infiles found")
+    return list(infile_paths)
+
+
+def _get_processed_series(
+    series: Series,
+    *,
+    language: Language | None,
+    clean: bool,
+    convert: OpenCCConfig | bool | None,
+    flatten: bool,
+    romanize: bool,
+    offset: int,
+) -> Series:
+    """Apply the requested operations to a subtitle series.
+
+    Arguments:
+        series: subtitle series to process
+        language: explicit language, or None to detect it
+        clean: whether to clean subtitles
+        convert: OpenCC configuration, True to convert to the other script, or None
+        flatten: whether to flatten multi-line subtitles
+        romanize: whether to append romanization
+        offset: milliseconds by which to shift subtitle timings
+    Returns:
+        processed subtitle series
+    Raises:
+        ScinoephileError: if the language cannot be resolved or does not support
+          an operation
+    """
+    # Resolve language
+    resolved_language = resolve_language(series, language)
+    if resolved_language is Language.eng and convert is not None:
+        raise ScinoephileError("--convert may only be used with Chinese subtitles")
+    resolved_convert: OpenCCConfig | None = None
+    if isinstance(convert, OpenCCConfig):
+        resolved_convert = convert
+    elif convert:
+        if resolved_language.script == "Hans":
+            resolved_convert = OpenCCConfig.s2t
+        else:
+            resolved_convert = OpenCCConfig.t2s
+    if resolved_language is Language.eng and romanize:
+        raise ScinoephileError("--romanize may only be used with Chinese subtitles")
+
+    # Perform operations in a single pass
+    operations: list[TextOperation] = []
+    if clean:
+        operations.append(get_clean_operation(resolved_language))
+    if resolved_convert is not None:
+        operations.append(
+            TextOperation(
+                "conversion", partial(get_zho_text_converted, config=resolved_convert)
+            )
         )
+    if flatten:
+        operations.append(get_flatten_operation(resolved_language))
+    if romanize:
+        operations.append(get_romanize_operation(resolved_language, append=True))
+    series = TextPipeline(operations)(series)
+    if offset:
+        series.shift(ms=offset)
+    return series
+
+
+def _initialize_worker(convert: OpenCCConfig | bool | None, romanize: bool):
+    """Load converters and dictionaries once in a worker process.
+
+    Arguments:
+        convert: OpenCC configuration, True to convert to the other script, or None
+        romanize: whether romanization will be appended
+    """
+    if isinstance(convert, OpenCCConfig):
+        get_zho_converter(convert)
+    elif convert:
+        get_zho_converter(OpenCCConfig.s2t)
+        get_zho_converter(OpenCCConfig.t2s)
+    if romanize:
+        get_cmn_text_romanized("你好")
+        get_yue_text_romanized("你好")
+
+
+def _is_glob(infile: str) -> bool:
+    """Get whether an infile argument is a glob pattern.
+
+    Arguments:
+        infile: infile argument
+    Returns:
+        whether the argument contains glob wildcards
+    """
+    return any(character in infile for character in "*?[")
+
+
+def _process_file(
+    infile_path: Path,
+    outfile_path: Path,
+    *,
+    process: Callable[[Series], Series],
+    overwrite: bool,
+):
+    """Process one subtitle file.
+
+    Arguments:
+        infile_path: subtitle infile path
+        outfile_path: subtitle outfile path
+        process: function applying the requested operations
+        overwrite: whether an existing outfile may be replaced
+    Raises:
+        FileExistsError: if the outfile exists and may not be replaced
+    """
+    if outfile_path.exists() and not overwrite:
+        raise FileExistsError(f"{outfile_path} already exists")
+    series = process(Series.load(infile_path))
+    series.save(outfile_path, format_="srt")
+
+
+def _process_files(
+    infile_paths: list[Path],
+    outfile_paths: list[Path],
+    *,
+    process_file: Callable[[Path, Path], None],
+    jobs: int,
+    convert: OpenCCConfig | bool | None,
+    romanize: bool,
+) -> dict[Path, str]:
+    """Process many subtitle files, printing each outfile path as it is written.
+
+    Arguments:
+        infile_paths: subtitle infile paths
+        outfile_paths: subtitle outfile paths, one per infile
+        process_file: function processing one infile into one outfile
+        jobs: maximum number of files to process at once
+        convert: OpenCC configuration, True to convert to the other script, or None
+        romanize: whether romanization will be appended
+    Returns:
+        error messages keyed by infile path, for files that could not be processed
+    """
+    errors: dict[Path, str] = {}
+    pairs = list(zip(infile_paths, outfile_paths, strict=True))
+
+    def report(infile_path: Path, outfile_path: Path, exc: Exception | None):
+        """Report the outcome of processing one file.
+
+        Arguments:
+            infile_path: subtitle infile path
+            outfile_path: subtitle outfile path
+            exc: exception raised while processing, if any
+        """
+        if exc is None:
+            print(outfile_path, flush=True)
+            return
+        errors[infile_path] = str(exc)
+        logger.error(f"Unable to process {infile_path}: {exc}")
+
+    if jobs == 1:
+        for infile_path, outfile_path in pairs:
+            try:
+                process_file(infile_path, outfile_path)
+            except (NotAFileError, OSError, ScinoephileError, ValueError) as exc:
+                report(infile_path, outfile_path, exc)
+            else:
+                report(infile_path, outfile_path, None)
+        return errors
+
+    # Start workers from a fresh server process rather than forking this one, whose
+    # threads may hold locks; each worker is warmed by the initializer instead
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=get_context("forkserver"),
+        initializer=_initialize_worker,
+        initargs=(convert, romanize),
+    ) as executor:
+        futures: dict[Future[None], tuple[Path, Path]] = {
+            executor.submit(process_file, *pair): pair for pair in pairs
+        }
+        for future in as_completed(futures):
+            infile_path, outfile_path = futures[future]
+            try:
+                future.result()
+            except (
+                BrokenExecutor,
+                NotAFileError,
+                OSError,
+                ScinoephileError,
+                ValueError,
+            ) as exc:
+                report(infile_path, outfile_path, exc)
+            else:
+                report(infile_path, outfile_path, None)
+    return errors
 
 
 if __name__ == "__main__":
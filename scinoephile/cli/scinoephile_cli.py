@@ -4,27 +4,56 @@
 
 from __future__ import annotations
 
-from argparse import SUPPRESS, ArgumentParser
-from typing import Any
+from argparse import SUPPRESS, ArgumentParser, _SubParsersAction  # noqa: PLC2701
+from functools import partial
+from importlib import import_module
+from typing import Any, cast
 
 from scinoephile.common import CommandLineInterface
 from scinoephile.common.argument_parsing import get_arg_groups_by_name
-from scinoephile.common.cli import ListAllCommandsAction
+from scinoephile.common.cli import LazySubParsersAction, ListAllCommandsAction
 from scinoephile.core.cli import ScinoephileCliBase
 
-from .audit import AuditCli
-from .dictionary import DictionaryCli
-from .media import MediaCli
-from .multi import MultiCli
-from .ocr import OcrCli
-from .process_cli import ProcessCli
-from .review_cli import ReviewCli
-from .transcribe_cli import TranscribeCli
-from .translate_cli import TranslateCli
-from .utility import UtilityCli
-
 __all__ = ["ScinoephileCli"]
 
+SUBCOMMANDS: dict[str, tuple[str, str, str]] = {
+    "audit": ("scinoephile.cli.audit", "AuditCli", "audit subtitle workflows"),
+    "dictionary": (
+        "scinoephile.cli.dictionary",
+        "DictionaryCli",
+        "build or search Chinese dictionaries",
+    ),
+    "media": ("scinoephile.cli.media", "MediaCli", "inspect and extract media streams"),
+    "multi": (
+        "scinoephile.cli.multi",
+        "MultiCli",
+        "operate on multiple subtitle series",
+    ),
+    "ocr": (
+        "scinoephile.cli.ocr",
+        "OcrCli",
+        "recognize text from image-based subtitles",
+    ),
+    "process": ("scinoephile.cli.process_cli", "ProcessCli", "process subtitles"),
+    "review": (
+        "scinoephile.cli.review_cli",
+        "ReviewCli",
+        "review subtitles using an LLM",
+    ),
+    "transcribe": (
+        "scinoephile.cli.transcribe_cli",
+        "TranscribeCli",
+        "transcribe audio by aligning and merging ASR sources",
+    ),
+    "translate": (
+        "scinoephile.cli.translate_cli",
+        "TranslateCli",
+        "translate subtitles between supported languages",
+    ),
+    "utility": ("scinoephile.cli.utility", "UtilityCli", "run utility commands"),
+}
+"""Module, class name, and help text of each subcommand, keyed by name."""
+
 SCINOEPHILE_LOCALIZATIONS: dict[str, dict[str, str]] = {
     "zh-hans": {
         "additional help": "附加帮助",
@@ -109,11 +138,12 @@ class ScinoephileCli(ScinoephileCliBase):
     """Localized help text keyed by locale and English source text."""
 
     @classmethod
-    def add_arguments_to_argparser(cls, parser: ArgumentParser):
+    def add_arguments_to_argparser(cls, parser: ArgumentParser, *, lazy: bool = False):
         """Add arguments to a nascent argument parser.
 
         Arguments:
             parser: nascent argument parser
+            lazy: whether to construct subcommand parsers only when selected
         """
         super().add_arguments_to_argparser(parser)
 
@@ -127,15 +157,47 @@ class ScinoephileCli(ScinoephileCliBase):
         )
 
         subparsers = parser.add_subparsers(
-            dest="subcommand_name", help="subcommand", required=True
+            action=LazySubParsersAction,
+            dest="subcommand_name",
+            help="subcommand",
+            required=True,
         )
-        subcommands = cls.subcommands()
-        for name in sorted(subcommands):
-            subcommands[name].argparser(subparsers=subparsers)
+        subparsers = cast(LazySubParsersAction, subparsers)
+        for name in sorted(SUBCOMMANDS):
+            if lazy:
+                subparsers.add_lazy_parser(
+                    name,
+                    help=cls.translate_text(SUBCOMMANDS[name][2]),
+                    loader=partial(cls._add_subcommand_parser, name),
+                )
+            else:
+                cls._add_subcommand_parser(name, subparsers)
         get_arg_groups_by_name(
             parser, "additional help", optional_arguments_name="additional arguments"
         )
 
+    @classmethod
+    def import_subcommand(cls, name: str) -> type[CommandLineInterface]:
+        """Import one tool wrapped by command-line interface.
+
+        Arguments:
+            name: subcommand name
+        Returns:
+            CLI class
+        """
+        module_name, class_name, _ = SUBCOMMANDS[name]
+        return getattr(import_module(module_name), class_name)
+
+    @classmethod
+    def main(cls, *, lazy: bool = True, **kwargs: Any):
+        """Execute from command line, importing only the selected subcommand.
+
+        Arguments:
+            lazy: whether to construct subcommand parsers only when selected
+            **kwargs: additional keyword arguments passed to argparser
+        """
+        super().main(lazy=lazy, **kwargs)
+
     @classmethod
     def subcommands(cls) -> dict[str, type[CommandLineInterface]]:
         """Names and types of tools wrapped by command-line interface.
@@ -143,23 +205,22 @@ class ScinoephileCli(ScinoephileCliBase):
         Returns:
             mapping of subcommand names to CLI classes
         """
-        return {
-            AuditCli.name(): AuditCli,
-            DictionaryCli.name(): DictionaryCli,
-            MediaCli.name(): MediaCli,
-            MultiCli.name(): MultiCli,
-            OcrCli.name(): OcrCli,
-            ProcessCli.name(): ProcessCli,
-            ReviewCli.name(): ReviewCli,
-            TranscribeCli.name(): TranscribeCli,
-            TranslateCli.name(): TranslateCli,
-            UtilityCli.name(): UtilityCli,
-        }
+        return {name: cls.import_subcommand(name) for name in SUBCOMMANDS}
+
+    @classmethod
+    def _add_subcommand_parser(cls, name: str, subparsers: _SubParsersAction):
+        """Import one subcommand and add its parser.
+
+        Arguments:
+            name: subcommand name
+            subparsers: subparsers group to which the parser will be added
+        """
+        cls.import_subcommand(name).argparser(subparsers=subparsers)
 
     @classmethod
     def _main(cls, *, subcommand_name: str, **kwargs: Any):
         """Execute with provided keyword arguments."""
-        cls.subcommands()[subcommand_name]._main(**kwargs)
+        cls.import_subcommand(subcommand_name)._main(**kwargs)
 
 
 if __name__ == "__main__":
@@ -406,7 +406,10 @@ class TranscribeCli(ScinoephileCliBase):
                 cache_root_path=cache_args.root_path,
                 overwrite_cache=cache_args.overwrite,
                 provider=get_provider(
-                    llm_args.provider_name, model=llm_args.model_name
+                    llm_args.provider_name,
+                    model=llm_args.model_name,
+                    requests_per_minute=llm_args.requests_per_minute,
+                    tokens_per_minute=llm_args.tokens_per_minute,
                 ),
                 additional_context=read_llm_additional_context(
                     parser, llm_args.additional_context_file_path
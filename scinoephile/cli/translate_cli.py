@@ -39,6 +39,7 @@ from .helpers.io import read_series, write_series
 from .helpers.llms import (
     LLM_LOCALIZATIONS,
     LlmArguments,
+    add_llm_concurrency_arg,
     add_llm_provider_args,
     add_llm_test_case_json_arg,
     read_llm_additional_context,
@@ -173,6 +174,7 @@ class TranslateCli(ScinoephileCliBase):
         add_llm_provider_args(
             arg_groups["llm arguments"], arg_groups["additional help"]
         )
+        add_llm_concurrency_arg(arg_groups["llm arguments"])
         add_llm_test_case_json_arg(arg_groups["llm arguments"])
 
         # Cache arguments
@@ -233,12 +235,18 @@ class TranslateCli(ScinoephileCliBase):
         kwargs: dict[str, Any] = {
             "source_language": source_language,
             "target_language": target_language,
-            "provider": get_provider(llm_args.provider_name, model=llm_args.model_name),
+            "provider": get_provider(
+                llm_args.provider_name,
+                model=llm_args.model_name,
+                requests_per_minute=llm_args.requests_per_minute,
+                tokens_per_minute=llm_args.tokens_per_minute,
+            ),
             "additional_context": read_llm_additional_context(
                 parser, llm_args.additional_context_file_path
             ),
             "cache_root_path": cache_args.root_path,
             "no_op": llm_args.no_op,
+            "concurrency": llm_args.concurrency,
             "overwrite_cache": cache_args.overwrite,
             "current_test_cases_path": json_path,
             "start_at_idx": start_at_idx,
@@ -4,7 +4,7 @@
 
 Package hierarchy (modules may import from any above):
 * output
-* cache_clear_cli / cache_inspect_cli
+* cache_clear_cli / cache_convert_cli / cache_inspect_cli
 * cache_cli
 """
 
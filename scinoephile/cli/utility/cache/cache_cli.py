@@ -11,6 +11,7 @@ from scinoephile.common import CommandLineInterface
 from scinoephile.core.cli import ScinoephileCliBase
 
 from .cache_clear_cli import CacheClearCli
+from .cache_convert_cli import CacheConvertCli
 from .cache_inspect_cli import CacheInspectCli
 
 __all__ = ["CacheCli"]
@@ -53,6 +54,7 @@ class CacheCli(ScinoephileCliBase):
         """
         return {
             CacheClearCli.name(): CacheClearCli,
+            CacheConvertCli.name(): CacheConvertCli,
             CacheInspectCli.name(): CacheInspectCli,
         }
 
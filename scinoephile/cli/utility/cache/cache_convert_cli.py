@@ -0,0 +1,92 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Command-line interface for converting cache storage backends."""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from scinoephile.cli.helpers.cache import CACHE_LOCALIZATIONS, add_cache_root_arg
+from scinoephile.common.argument_parsing import get_arg_groups_by_name
+from scinoephile.core.cache import CacheBackend
+from scinoephile.core.cli import ScinoephileCliBase
+from scinoephile.core.cli.localization import merge_localizations
+from scinoephile.core.llms.cache import convert_llm_cache
+
+__all__ = ["CacheConvertCli"]
+
+CACHE_CONVERT_LOCALIZATIONS: dict[str, dict[str, str]] = {
+    "zh-hans": {
+        "cache root directory to convert (default: %(default)s)": (
+            "要转换的缓存根目录（默认：%(default)s）"
+        ),
+        "convert cached LLM responses to another storage backend": (
+            "将缓存的 LLM 响应转换为另一种存储后端"
+        ),
+        "storage backend to which to convert": "要转换到的存储后端",
+    },
+    "zh-hant": {
+        "cache root directory to convert (default: %(default)s)": (
+            "要轉換的快取根目錄（預設：%(default)s）"
+        ),
+        "convert cached LLM responses to another storage backend": (
+            "將快取的 LLM 回應轉換為另一種儲存後端"
+        ),
+        "storage backend to which to convert": "要轉換到的儲存後端",
+    },
+}
+"""Localized help text keyed by locale and English source text."""
+
+
+class CacheConvertCli(ScinoephileCliBase):
+    """Convert cached LLM responses to another storage backend."""
+
+    localizations = merge_localizations(
+        CACHE_LOCALIZATIONS, CACHE_CONVERT_LOCALIZATIONS
+    )
+    """Localized help text keyed by locale and English source text."""
+
+    @classmethod
+    def add_arguments_to_argparser(cls, parser: ArgumentParser):
+        """Add arguments to a nascent argument parser.
+
+        Arguments:
+            parser: nascent argument parser
+        """
+        super().add_arguments_to_argparser(parser)
+        arg_groups = get_arg_groups_by_name(
+            parser,
+            "input arguments",
+            "operation arguments",
+            optional_arguments_name="additional arguments",
+        )
+
+        # Input arguments
+        add_cache_root_arg(
+            arg_groups["input arguments"],
+            help_text="cache root directory to convert (default: %(default)s)",
+        )
+
+        # Operation arguments
+        arg_groups["operation arguments"].add_argument(
+            "--backend",
+            choices=[backend.value for backend in CacheBackend],
+            required=True,
+            help="storage backend to which to convert",
+        )
+
+    @classmethod
+    def name(cls) -> str:
+        """Name of this tool used to define it when it is a subparser.
+
+        Returns:
+            subcommand name
+        """
+        return "convert"
+
+    @classmethod
+    def _main(cls, *, cache_root_path: Path, backend: str):
+        """Execute with provided keyword arguments."""
+        count = convert_llm_cache(cache_root_path, CacheBackend(backend))
+        print(f"Converted {count} cached LLM responses to the {backend} backend.")
@@ -4,12 +4,13 @@
 
 Package hierarchy (modules may import from any above):
 * command_line_interface
-* list_all_commands_action
+* lazy_subparsers_action / list_all_commands_action
 """
 
 from __future__ import annotations
 
 from .command_line_interface import CommandLineInterface
+from .lazy_subparsers_action import LazySubParsersAction
 from .list_all_commands_action import ListAllCommandsAction
 
-__all__ = ["CommandLineInterface", "ListAllCommandsAction"]
+__all__ = ["CommandLineInterface", "LazySubParsersAction", "ListAllCommandsAction"]
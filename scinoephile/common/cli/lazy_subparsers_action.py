@@ -0,0 +1,86 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Argparse subparsers action that constructs subcommand parsers when selected."""
+
+from __future__ import annotations
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    _SubParsersAction,  # noqa: PLC2701
+)
+from collections.abc import Callable, Sequence
+from typing import Any
+
+__all__ = ["LazySubParsersAction"]
+
+
+class LazySubParsersAction(_SubParsersAction):
+    """Subparsers action that constructs each subcommand's parser when selected.
+
+    Lazy subcommands are listed in help using only their name and help text, so
+    that the code defining their arguments need not be imported unless they are
+    selected.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize.
+
+        Arguments:
+            *args: positional arguments passed to argparse
+            **kwargs: keyword arguments passed to argparse
+        """
+        super().__init__(*args, **kwargs)
+        self.loaders: dict[str, Callable[[_SubParsersAction], object]] = {}
+        """Functions adding the complete parser of each unloaded subcommand."""
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ):
+        """Construct the selected subcommand's parser, then parse with it.
+
+        Arguments:
+            parser: active argument parser
+            namespace: parsed namespace
+            values: subcommand name followed by its arguments
+            option_string: option string used
+        """
+        if isinstance(values, Sequence) and values:
+            self.load_parser(str(values[0]))
+        super().__call__(parser, namespace, values, option_string)
+
+    def add_lazy_parser(
+        self,
+        name: str,
+        *,
+        help: str,  # noqa: A002
+        loader: Callable[[_SubParsersAction], object],
+    ):
+        """Add a subcommand whose complete parser is constructed when selected.
+
+        Arguments:
+            name: subcommand name
+            help: short description of the subcommand
+            loader: function adding the complete parser to these subparsers
+        """
+        self.add_parser(name, help=help, add_help=False)
+        self.loaders[name] = loader
+
+    def load_parser(self, name: str):
+        """Replace a lazy subcommand's placeholder with its complete parser.
+
+        Arguments:
+            name: subcommand name
+        """
+        loader = self.loaders.pop(name, None)
+        if loader is None:
+            return
+        del self._name_parser_map[name]
+        self._choices_actions = [
+            action for action in self._choices_actions if action.dest != name
+        ]
+        loader(self)
@@ -76,13 +76,15 @@ class CommandLineInterface(ABC):
 
     @classmethod
     def argparser(
-        cls, *, subparsers: _SubParsersAction | None = None
+        cls, *, subparsers: _SubParsersAction | None = None, **kwargs: Any
     ) -> ArgumentParser:
         """Construct argument parser.
 
         Arguments:
             subparsers: Subparsers group to which a new subparser will be added; if
               None, a new ArgumentParser will be created
+            **kwargs: Additional keyword arguments passed to
+              add_arguments_to_argparser
         Returns:
             Argument parser
         """
@@ -99,7 +101,7 @@ class CommandLineInterface(ABC):
                 formatter_class=RawDescriptionHelpFormatter,
             )
 
-        cls.add_arguments_to_argparser(parser)
+        cls.add_arguments_to_argparser(parser, **kwargs)
 
         return parser
 
@@ -115,9 +117,13 @@ class CommandLineInterface(ABC):
         return text[0].lower() + text[1:]
 
     @classmethod
-    def main(cls):
-        """Execute from command line."""
-        parser = cls.argparser()
+    def main(cls, **kwargs: Any):
+        """Execute from command line.
+
+        Arguments:
+            **kwargs: Additional keyword arguments passed to argparser
+        """
+        parser = cls.argparser(**kwargs)
         kwargs = vars(parser.parse_args())
 
         # Configure logging
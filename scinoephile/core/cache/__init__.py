@@ -3,16 +3,26 @@
 """Cache inspection and invalidation helpers.
 
 Package hierarchy (modules may import from any above):
-* artifact / cache_entry / cache_namespace / cache_stats / identity / runtime
-* cache_registry
+* artifact / audio_fingerprint / cache_backend / cache_entry / cache_namespace
+  / cache_stats / identity / runtime
+* cache_registry / sqlite_store
 * operations
 """
 
 from __future__ import annotations
 
+from .cache_backend import CacheBackend
 from .cache_entry import CacheEntry
 from .cache_namespace import CacheNamespace
 from .cache_registry import CacheRegistry
 from .cache_stats import CacheStats
+from .sqlite_store import CacheSqliteStore
 
-__all__ = ["CacheEntry", "CacheNamespace", "CacheRegistry", "CacheStats"]
+__all__ = [
+    "CacheBackend",
+    "CacheEntry",
+    "CacheNamespace",
+    "CacheRegistry",
+    "CacheSqliteStore",
+    "CacheStats",
+]
@@ -0,0 +1,103 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Memoized content hashes of audio shared by audio caches."""
+
+from __future__ import annotations
+
+import hashlib
+from threading import Lock
+from typing import TYPE_CHECKING
+from weakref import ReferenceType, ref
+
+__all__ = ["get_audio_hash"]
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
+    from pydub import AudioSegment
+
+_SAMPLE_COUNT = 16
+"""Number of evenly spaced chunks of raw data sampled to prefilter audio."""
+
+_SAMPLE_SIZE = 64
+"""Size in bytes of each chunk of raw data sampled to prefilter audio."""
+
+_audio_hashes: dict[tuple, list[tuple[ReferenceType[AudioSegment], _Hash]]] = {}
+"""Hash objects fed each live audio segment's raw data, keyed by prefilter."""
+
+_audio_hashes_lock = Lock()
+"""Lock guarding memoized audio hashes."""
+
+
+def get_audio_hash(audio: AudioSegment, algorithm: str = "sha256") -> _Hash:
+    """Get a hash object that has been fed an audio segment's raw data.
+
+    Each distinct audio content is hashed once per algorithm while any segment with
+    that content is alive. Segments are matched by a prefilter of their format,
+    length, and sampled raw data, then confirmed by identity or by comparing raw
+    data, which is far faster than hashing it. The returned hash object is a copy,
+    which callers may update with further identity.
+
+    Arguments:
+        audio: audio whose raw data to hash
+        algorithm: name of hashlib algorithm
+    Returns:
+        hash object fed the audio's raw data
+    """
+    raw_data = audio.raw_data
+    key = (
+        algorithm,
+        audio.channels,
+        audio.frame_rate,
+        audio.sample_width,
+        len(raw_data),
+        _get_samples(raw_data),
+    )
+    with _audio_hashes_lock:
+        _forget_dead_audio()
+        candidates = _audio_hashes.get(key, [])
+        for audio_ref, audio_hash in candidates:
+            if audio_ref() is audio:
+                return audio_hash.copy()
+        for audio_ref, audio_hash in candidates:
+            other_audio = audio_ref()
+            if other_audio is not None and other_audio.raw_data == raw_data:
+                candidates.append((ref(audio), audio_hash))
+                return audio_hash.copy()
+
+    # Hash outside the lock, since hashlib releases the GIL for large inputs
+    audio_hash = hashlib.new(algorithm, raw_data)
+    with _audio_hashes_lock:
+        _audio_hashes.setdefault(key, []).append((ref(audio), audio_hash))
+    return audio_hash.copy()
+
+
+def _forget_dead_audio():
+    """Forget hashes of audio segments that no longer exist."""
+    for key in list(_audio_hashes):
+        candidates = [
+            (audio_ref, audio_hash)
+            for audio_ref, audio_hash in _audio_hashes[key]
+            if audio_ref() is not None
+        ]
+        if candidates:
+            _audio_hashes[key] = candidates
+        else:
+            del _audio_hashes[key]
+
+
+def _get_samples(raw_data: bytes) -> bytes:
+    """Sample evenly spaced chunks of raw audio data.
+
+    Arguments:
+        raw_data: raw audio data
+    Returns:
+        concatenated sampled chunks
+    """
+    if len(raw_data) <= _SAMPLE_COUNT * _SAMPLE_SIZE:
+        return raw_data
+    stride = (len(raw_data) - _SAMPLE_SIZE) // (_SAMPLE_COUNT - 1)
+    return b"".join(
+        raw_data[idx * stride : idx * stride + _SAMPLE_SIZE]
+        for idx in range(_SAMPLE_COUNT)
+    )
@@ -0,0 +1,18 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Cache storage backends."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+__all__ = ["CacheBackend"]
+
+
+class CacheBackend(StrEnum):
+    """Storage backends of file-like cache entries."""
+
+    DIRECTORY = "directory"
+    """One file per entry beneath each namespace directory."""
+    SQLITE = "sqlite"
+    """One row per entry in a single SQLite file at the cache root."""
@@ -94,6 +94,24 @@ class CacheNamespace(StrEnum):
             )
         return self.value
 
+    def matches_name(self, name: str) -> bool:
+        """Check whether a portable namespace name is represented by this declaration.
+
+        Arguments:
+            name: portable namespace name
+        Returns:
+            whether the name is this namespace or one of its operation namespaces
+        """
+        template_path = _get_namespace_template_path(self.value)
+        if template_path.name != _OPERATION_PLACEHOLDER:
+            return name == self.value
+        name_path = PurePosixPath(name)
+        return (
+            name_path.parent == template_path.parent
+            and name_path.as_posix() == name
+            and _is_portable_child_name(name_path.name)
+        )
+
 
 def _get_namespace_template_path(value: str) -> PurePosixPath:
     """Validate and parse a portable cache namespace template.
@@ -65,3 +65,13 @@ class CacheRegistry:
             for namespace in self.namespaces
             for namespace_name in namespace.discover_names(cache_root_path)
         )
+
+    def matches_name(self, name: str) -> bool:
+        """Check whether a portable namespace name is registered.
+
+        Arguments:
+            name: portable namespace name
+        Returns:
+            whether any registered declaration represents the name
+        """
+        return any(namespace.matches_name(name) for namespace in self.namespaces)
@@ -1,6 +1,11 @@
 #  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
 #  and distributed under the terms of the BSD license. See the LICENSE file for details.
-"""Directory-based cache inspection and invalidation operations."""
+"""Cache inspection and invalidation operations.
+
+Entries stored as files beneath namespace directories are measured by walking those
+directories. Entries stored in the cache root's SQLite file are measured and deleted
+using aggregate queries.
+"""
 
 from __future__ import annotations
 
@@ -14,6 +19,7 @@ from .artifact import remove_cache_artifact
 from .cache_entry import CacheEntry
 from .cache_registry import CacheRegistry
 from .cache_stats import CacheStats
+from .sqlite_store import CacheSqliteStore
 
 __all__ = [
     "CacheEntry",
@@ -88,14 +94,26 @@ def get_cache_entries(
     Raises:
         ScinoephileError: if an explicit namespace does not exist
     """
+    store = CacheSqliteStore(cache_root_path)
     discovered_namespace_names = cache_registry.discover_names(cache_root_path)
+    store_namespace_names = _get_store_namespace_names(store, cache_registry)
     namespace_names = _get_namespace_names(
-        discovered_namespace_names, namespace=namespace
+        sorted({*discovered_namespace_names, *store_namespace_names}),
+        namespace=namespace,
     )
     entries = _get_cache_entries(
-        cache_root_path, namespace_names, discovered_namespace_names
+        cache_root_path,
+        [name for name in namespace_names if name in discovered_namespace_names],
+        discovered_namespace_names,
+    )
+    entries = _filter_cache_entries(entries, older_than=older_than)
+    entries.extend(
+        store.get_entries(
+            [name for name in namespace_names if name in store_namespace_names],
+            modified_before=_get_cutoff(older_than),
+        )
     )
-    return _filter_cache_entries(entries, older_than=older_than)
+    return entries
 
 
 def get_cache_stats(
@@ -115,22 +133,41 @@ def get_cache_stats(
     Returns:
         aggregate cache statistics
     """
+    store = CacheSqliteStore(cache_root_path)
     discovered_namespace_names = cache_registry.discover_names(cache_root_path)
+    store_namespace_names = _get_store_namespace_names(store, cache_registry)
     namespace_names = _get_namespace_names(
-        discovered_namespace_names, namespace=namespace
+        sorted({*discovered_namespace_names, *store_namespace_names}),
+        namespace=namespace,
     )
     entries = _get_cache_entries(
-        cache_root_path, namespace_names, discovered_namespace_names
+        cache_root_path,
+        [name for name in namespace_names if name in discovered_namespace_names],
+        discovered_namespace_names,
     )
     entries = _filter_cache_entries(entries, older_than=older_than)
+    store_stats = store.get_stats(
+        [name for name in namespace_names if name in store_namespace_names],
+        modified_before=_get_cutoff(older_than),
+    )
     stats = [
-        _aggregate_cache_stats(
+        _combine_cache_stats(
             namespace_name,
-            [entry for entry in entries if entry.namespace == namespace_name],
+            [
+                _aggregate_cache_stats(
+                    namespace_name,
+                    [entry for entry in entries if entry.namespace == namespace_name],
+                ),
+                *(
+                    [store_stats[namespace_name]]
+                    if namespace_name in store_stats
+                    else []
+                ),
+            ],
         )
         for namespace_name in namespace_names
     ]
-    stats.append(_aggregate_cache_stats("total", entries))
+    stats.append(_combine_cache_stats("total", stats))
     return stats
 
 
@@ -200,18 +237,33 @@ def _clear_registered_cache_entries(
     Returns:
         matching entries, deleted unless dry_run is enabled
     """
+    store = CacheSqliteStore(cache_root_path)
     discovered_namespace_names = cache_registry.discover_names(cache_root_path)
+    store_namespace_names = _get_store_namespace_names(store, cache_registry)
     namespace_names = _get_namespace_names(
-        discovered_namespace_names, namespace=namespace
+        sorted({*discovered_namespace_names, *store_namespace_names}),
+        namespace=namespace,
     )
+    selected_store_namespace_names = [
+        name for name in namespace_names if name in store_namespace_names
+    ]
+    cutoff = _get_cutoff(older_than)
+    store_entries = store.get_entries(
+        selected_store_namespace_names, modified_before=cutoff
+    )
+    namespace_names = [
+        name for name in namespace_names if name in discovered_namespace_names
+    ]
     entries = _get_cache_entries(
         cache_root_path, namespace_names, discovered_namespace_names
     )
     entries = _filter_cache_entries(entries, older_than=older_than)
     if dry_run:
-        return entries
+        return entries + store_entries
     for entry in entries:
         remove_cache_artifact(entry.path)
+    if store_entries:
+        store.delete_entries(selected_store_namespace_names, modified_before=cutoff)
 
     # Preserve nested namespaces that were not selected for clearing
     protected_namespace_paths = {
@@ -257,7 +309,40 @@ def _clear_registered_cache_entries(
             ):
                 parent_dir_path.rmdir()
                 parent_dir_path = parent_dir_path.parent
-    return entries
+    return entries + store_entries
+
+
+def _combine_cache_stats(namespace: str, stats: Iterable[CacheStats]) -> CacheStats:
+    """Combine cache statistics.
+
+    Arguments:
+        namespace: namespace name or total label
+        stats: cache statistics to combine
+    Returns:
+        combined cache statistics
+    """
+    stats_list = list(stats)
+    return CacheStats(
+        namespace=namespace,
+        entry_count=sum(stat.entry_count for stat in stats_list),
+        total_bytes=sum(stat.total_bytes for stat in stats_list),
+        oldest_modified_at=min(
+            (
+                stat.oldest_modified_at
+                for stat in stats_list
+                if stat.oldest_modified_at is not None
+            ),
+            default=None,
+        ),
+        newest_modified_at=max(
+            (
+                stat.newest_modified_at
+                for stat in stats_list
+                if stat.newest_modified_at is not None
+            ),
+            default=None,
+        ),
+    )
 
 
 def _filter_cache_entries(
@@ -271,9 +356,9 @@ def _filter_cache_entries(
     Returns:
         filtered entries
     """
-    if older_than is None:
+    cutoff = _get_cutoff(older_than)
+    if cutoff is None:
         return entries
-    cutoff = datetime.now().astimezone() - older_than
     return [entry for entry in entries if entry.modified_at < cutoff]
 
 
@@ -331,6 +416,19 @@ def _get_cache_root_entries(cache_root_path: Path) -> list[CacheEntry]:
     ]
 
 
+def _get_cutoff(older_than: timedelta | None) -> datetime | None:
+    """Get the modification time before which entries are older than a threshold.
+
+    Arguments:
+        older_than: optional entry age threshold
+    Returns:
+        modification time cutoff, if a threshold is provided
+    """
+    if older_than is None:
+        return None
+    return datetime.now().astimezone() - older_than
+
+
 def _get_namespace_dir_path(cache_root_path: Path, namespace_name: str) -> Path:
     """Get a namespace directory path from its portable name.
 
@@ -363,6 +461,24 @@ def _get_namespace_names(
     return [namespace]
 
 
+def _get_store_namespace_names(
+    store: CacheSqliteStore, cache_registry: CacheRegistry
+) -> list[str]:
+    """Get registered namespaces with entries in a cache root's SQLite file.
+
+    Arguments:
+        store: SQLite store of the cache root
+        cache_registry: namespaces available to cache maintenance operations
+    Returns:
+        sorted portable namespace names
+    """
+    return [
+        namespace_name
+        for namespace_name in store.get_namespace_names()
+        if cache_registry.matches_name(namespace_name)
+    ]
+
+
 def _measure_path(entry_path: Path) -> tuple[int, int, datetime]:
     """Measure a cache entry without following symlinked directories.
 
@@ -0,0 +1,481 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Single-file SQLite storage of file-like cache entries."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from os import utime
+from pathlib import Path, PurePosixPath
+from sqlite3 import Connection as SqliteConnection
+from threading import Lock
+from time import time_ns
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    Table,
+    Text,
+    create_engine,
+    delete,
+    event,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import Insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.sql import ColumnElement
+
+from .artifact import remove_cache_artifact
+from .cache_backend import CacheBackend
+from .cache_entry import CacheEntry
+from .cache_stats import CacheStats
+
+__all__ = ["CacheSqliteStore", "get_cache_backend"]
+
+
+class CacheSqliteStore:
+    """SQLite storage of file-like cache entries beneath one cache root.
+
+    Each entry is keyed by its namespace and the file name it would have in the
+    directory layout, and stores that file's contents and modification time. The
+    database uses write-ahead logging so that readers are not blocked by writers
+    and each save appends to the log rather than rewriting a file.
+    """
+
+    file_name = "cache.sqlite3"
+    """Name of the SQLite file within the cache root."""
+
+    schema_version = 1
+    """SQLite schema version."""
+
+    _metadata = MetaData()
+    """SQLAlchemy Core metadata for cache tables."""
+
+    _entries = Table(
+        "entries",
+        _metadata,
+        Column("namespace", Text, primary_key=True),
+        Column("name", Text, primary_key=True),
+        Column("contents", LargeBinary, nullable=False),
+        Column("size_bytes", Integer, nullable=False),
+        Column("modified_at_ns", Integer, nullable=False),
+        Index(
+            "entries_namespace_modified_at", "namespace", "modified_at_ns", "size_bytes"
+        ),
+    )
+    """Cache entry table, indexed to cover aggregate statistics queries."""
+
+    def __init__(self, cache_root_path: Path):
+        """Initialize.
+
+        Arguments:
+            cache_root_path: cache root directory path
+        """
+        self.cache_root_path = cache_root_path
+        """Cache root directory path."""
+        self.database_path = cache_root_path / self.file_name
+        """SQLite database path."""
+
+        self._engine: Engine | None = None
+        self._engine_lock = Lock()
+
+    @property
+    def exists(self) -> bool:
+        """Whether the SQLite file exists."""
+        return self.database_path.is_file()
+
+    def close(self):
+        """Close pooled connections to the SQLite file."""
+        with self._engine_lock:
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+
+    def create(self):
+        """Create the SQLite file and schema if they do not exist."""
+        self._get_engine()
+
+    def delete_entries(
+        self,
+        namespaces: Iterable[str] | None = None,
+        *,
+        modified_before: datetime | None = None,
+    ) -> int:
+        """Delete entries.
+
+        Arguments:
+            namespaces: namespaces from which to delete, or None for all
+            modified_before: optional modification time before which to delete
+        Returns:
+            number of entries deleted
+        """
+        if not self.exists:
+            return 0
+        statement = delete(self._entries).where(
+            *self._get_filters(namespaces, modified_before)
+        )
+        with self._get_engine().begin() as connection:
+            return connection.execute(statement).rowcount
+
+    def export_dir(self, namespace: str, dir_path: Path) -> int:
+        """Write a namespace's entries to files in a directory.
+
+        Files are given their entries' names, contents, and modification times, so
+        that exporting entries imported by import_dir reproduces the original files.
+
+        Arguments:
+            namespace: namespace to export
+            dir_path: directory to which to write entry files
+        Returns:
+            number of entries exported
+        """
+        if not self.exists:
+            return 0
+        dir_path.mkdir(parents=True, exist_ok=True)
+        statement = select(
+            self._entries.c.name,
+            self._entries.c.contents,
+            self._entries.c.modified_at_ns,
+        ).where(self._entries.c.namespace == namespace)
+        count = 0
+        with self._get_engine().connect() as connection:
+            for name, contents, modified_at_ns in connection.execute(statement):
+                entry_path = dir_path / name
+                entry_path.write_bytes(contents)
+                utime(entry_path, ns=(modified_at_ns, modified_at_ns))
+                count += 1
+        return count
+
+    def get_entries(
+        self,
+        namespaces: Iterable[str] | None = None,
+        *,
+        modified_before: datetime | None = None,
+    ) -> list[CacheEntry]:
+        """Get entries without loading their contents.
+
+        Arguments:
+            namespaces: namespaces from which to get entries, or None for all
+            modified_before: optional modification time before which to get entries
+        Returns:
+            cache entries sorted by namespace and name
+        """
+        if not self.exists:
+            return []
+        statement = (
+            select(
+                self._entries.c.namespace,
+                self._entries.c.name,
+                self._entries.c.size_bytes,
+                self._entries.c.modified_at_ns,
+            )
+            .where(*self._get_filters(namespaces, modified_before))
+            .order_by(self._entries.c.namespace, self._entries.c.name)
+        )
+        with self._get_engine().connect() as connection:
+            return [
+                CacheEntry(
+                    namespace=namespace,
+                    path=self.database_path,
+                    relative_path=Path(*PurePosixPath(namespace).parts, name),
+                    size_bytes=size_bytes,
+                    file_count=1,
+                    modified_at=_get_datetime(modified_at_ns),
+                    is_dir=False,
+                )
+                for namespace, name, size_bytes, modified_at_ns in connection.execute(
+                    statement
+                )
+            ]
+
+    def get_namespace_names(self) -> list[str]:
+        """Get the names of namespaces with at least one entry.
+
+        Returns:
+            sorted namespace names
+        """
+        if not self.exists:
+            return []
+        statement = (
+            select(self._entries.c.namespace)
+            .distinct()
+            .order_by(self._entries.c.namespace)
+        )
+        with self._get_engine().connect() as connection:
+            return list(connection.execute(statement).scalars())
+
+    def get_stats(
+        self,
+        namespaces: Iterable[str] | None = None,
+        *,
+        modified_before: datetime | None = None,
+    ) -> dict[str, CacheStats]:
+        """Get per-namespace statistics using one aggregate query.
+
+        Arguments:
+            namespaces: namespaces for which to get statistics, or None for all
+            modified_before: optional modification time before which to count
+        Returns:
+            statistics of namespaces with at least one matching entry, by namespace
+        """
+        if not self.exists:
+            return {}
+        statement = (
+            select(
+                self._entries.c.namespace,
+                func.count(),
+                func.sum(self._entries.c.size_bytes),
+                func.min(self._entries.c.modified_at_ns),
+                func.max(self._entries.c.modified_at_ns),
+            )
+            .where(*self._get_filters(namespaces, modified_before))
+            .group_by(self._entries.c.namespace)
+        )
+        with self._get_engine().connect() as connection:
+            return {
+                namespace: CacheStats(
+                    namespace=namespace,
+                    entry_count=entry_count,
+                    total_bytes=total_bytes,
+                    oldest_modified_at=_get_datetime(oldest),
+                    newest_modified_at=_get_datetime(newest),
+                )
+                for namespace, entry_count, total_bytes, oldest, newest in (
+                    connection.execute(statement)
+                )
+            }
+
+    def import_dir(self, namespace: str, dir_path: Path) -> int:
+        """Store the regular files in a directory as a namespace's entries.
+
+        Files are stored under their names with their contents and modification
+        times, replacing any entries of the same names. Subdirectories and symbolic
+        links are not imported.
+
+        Arguments:
+            namespace: namespace into which to import
+            dir_path: directory from which to read entry files
+        Returns:
+            number of entries imported
+        """
+        rows = []
+        for entry_path in sorted(dir_path.iterdir()):
+            if entry_path.is_symlink() or not entry_path.is_file():
+                continue
+            contents = entry_path.read_bytes()
+            rows.append(
+                {
+                    "namespace": namespace,
+                    "name": entry_path.name,
+                    "contents": contents,
+                    "size_bytes": len(contents),
+                    "modified_at_ns": entry_path.stat().st_mtime_ns,
+                }
+            )
+        if rows:
+            with self._get_engine().begin() as connection:
+                connection.execute(self._get_upsert(), rows)
+        return len(rows)
+
+    def load(self, namespace: str, name: str, *, touch: bool = True) -> bytes | None:
+        """Load an entry's contents.
+
+        Arguments:
+            namespace: namespace containing the entry
+            name: entry name
+            touch: whether to update the entry's modification time
+        Returns:
+            entry contents, or None if not present
+        """
+        if not self.exists:
+            return None
+        statement = select(self._entries.c.contents).where(
+            self._entries.c.namespace == namespace, self._entries.c.name == name
+        )
+        with self._get_engine().connect() as connection:
+            contents = connection.execute(statement).scalar_one_or_none()
+        if contents is not None and touch:
+            self.touch(namespace, name)
+        return contents
+
+    def load_all(self, namespace: str) -> dict[str, bytes]:
+        """Load the contents of all entries in a namespace using one query.
+
+        Arguments:
+            namespace: namespace to load
+        Returns:
+            entry contents by name
+        """
+        if not self.exists:
+            return {}
+        statement = select(self._entries.c.name, self._entries.c.contents).where(
+            self._entries.c.namespace == namespace
+        )
+        with self._get_engine().connect() as connection:
+            return {name: contents for name, contents in connection.execute(statement)}
+
+    def remove(self, namespace: str, name: str) -> bool:
+        """Remove an entry.
+
+        Arguments:
+            namespace: namespace containing the entry
+            name: entry name
+        Returns:
+            whether an entry was removed
+        """
+        if not self.exists:
+            return False
+        statement = delete(self._entries).where(
+            self._entries.c.namespace == namespace, self._entries.c.name == name
+        )
+        with self._get_engine().begin() as connection:
+            return connection.execute(statement).rowcount > 0
+
+    def remove_file(self):
+        """Close connections and remove the SQLite file and its journal files."""
+        self.close()
+        for suffix in ("", "-shm", "-wal"):
+            remove_cache_artifact(
+                self.database_path.with_name(f"{self.file_name}{suffix}")
+            )
+
+    def save(self, namespace: str, name: str, contents: bytes):
+        """Save an entry, replacing any existing entry of the same name.
+
+        Arguments:
+            namespace: namespace containing the entry
+            name: entry name
+            contents: entry contents
+        """
+        with self._get_engine().begin() as connection:
+            connection.execute(
+                self._get_upsert(),
+                {
+                    "namespace": namespace,
+                    "name": name,
+                    "contents": contents,
+                    "size_bytes": len(contents),
+                    "modified_at_ns": time_ns(),
+                },
+            )
+
+    def touch(self, namespace: str, name: str):
+        """Update an entry's modification time to now.
+
+        Arguments:
+            namespace: namespace containing the entry
+            name: entry name
+        """
+        statement = (
+            update(self._entries)
+            .where(self._entries.c.namespace == namespace, self._entries.c.name == name)
+            .values(modified_at_ns=time_ns())
+        )
+        with self._get_engine().begin() as connection:
+            connection.execute(statement)
+
+    @staticmethod
+    def _configure_connection(dbapi_connection: SqliteConnection, _: object):
+        """Configure a new SQLite connection.
+
+        Arguments:
+            dbapi_connection: SQLite connection
+            _: SQLAlchemy connection record
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.close()
+
+    def _get_engine(self) -> Engine:
+        """Get the pooled SQLite engine, creating the file and schema if needed.
+
+        Returns:
+            SQLite engine
+        """
+        with self._engine_lock:
+            if self._engine is None:
+                self.database_path.parent.mkdir(parents=True, exist_ok=True)
+                engine = create_engine(
+                    URL.create("sqlite", database=str(self.database_path)), future=True
+                )
+                event.listen(engine, "connect", self._configure_connection)
+                with engine.begin() as connection:
+                    self._metadata.create_all(connection)
+                    connection.exec_driver_sql(
+                        f"PRAGMA user_version={self.schema_version}"
+                    )
+                self._engine = engine
+            return self._engine
+
+    def _get_filters(
+        self, namespaces: Iterable[str] | None, modified_before: datetime | None
+    ) -> list[ColumnElement[bool]]:
+        """Get filters selecting entries.
+
+        Arguments:
+            namespaces: namespaces to select, or None for all
+            modified_before: optional modification time before which to select
+        Returns:
+            filter clauses
+        """
+        filters = []
+        if namespaces is not None:
+            filters.append(self._entries.c.namespace.in_(list(namespaces)))
+        if modified_before is not None:
+            filters.append(
+                self._entries.c.modified_at_ns
+                < int(modified_before.timestamp() * 1_000_000_000)
+            )
+        return filters
+
+    def _get_upsert(self) -> Insert:
+        """Get a statement inserting or replacing one entry.
+
+        Returns:
+            SQLite upsert statement
+        """
+        statement = sqlite_insert(self._entries)
+        return statement.on_conflict_do_update(
+            index_elements=[self._entries.c.namespace, self._entries.c.name],
+            set_={
+                "contents": statement.excluded.contents,
+                "size_bytes": statement.excluded.size_bytes,
+                "modified_at_ns": statement.excluded.modified_at_ns,
+            },
+        )
+
+
+def get_cache_backend(cache_root_path: Path) -> CacheBackend:
+    """Get the backend used by a cache root.
+
+    A cache root uses the SQLite backend once its SQLite file exists, and the
+    directory backend otherwise.
+
+    Arguments:
+        cache_root_path: cache root directory path
+    Returns:
+        cache backend
+    """
+    if (cache_root_path / CacheSqliteStore.file_name).is_file():
+        return CacheBackend.SQLITE
+    return CacheBackend.DIRECTORY
+
+
+def _get_datetime(timestamp_ns: int) -> datetime:
+    """Get a local datetime from a POSIX timestamp in nanoseconds.
+
+    Arguments:
+        timestamp_ns: POSIX timestamp in nanoseconds
+    Returns:
+        local datetime
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1_000_000_000).astimezone()
@@ -9,7 +9,7 @@ import re
 from argparse import ArgumentParser, _SubParsersAction  # noqa: PLC2701
 from inspect import cleandoc
 from os import getenv
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from scinoephile.common import CommandLineInterface
 
@@ -143,15 +143,19 @@ class ScinoephileCliBase(CommandLineInterface):
 
     @classmethod
     def argparser(
-        cls, *, subparsers: _SubParsersAction | None = None
+        cls, *, subparsers: _SubParsersAction | None = None, **kwargs: Any
     ) -> ArgumentParser:
         """Construct localized argument parser."""
-        parser = super().argparser(subparsers=subparsers)
+        parser = super().argparser(subparsers=subparsers, **kwargs)
         cls.localize_parser(parser)
         return parser
 
     @classmethod
-    def main(cls):
-        """Execute with locale detection."""
+    def main(cls, **kwargs: Any):
+        """Execute with locale detection.
+
+        Arguments:
+            **kwargs: additional keyword arguments passed to argparser
+        """
         ScinoephileCliBase.locale_name = cls._resolve_locale()
-        super().main()
+        super().main(**kwargs)
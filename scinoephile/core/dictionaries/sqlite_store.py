@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from logging import getLogger
 from pathlib import Path
+from sqlite3 import Connection as SqliteConnection
 from tempfile import TemporaryDirectory
+from time import perf_counter
 
 from sqlalchemy import (
     Boolean,
@@ -20,11 +23,12 @@ from sqlalchemy import (
     UniqueConstraint,
     case,
     create_engine,
+    event,
     func,
+    literal_column,
     select,
     text,
 )
-from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import URL, Connection, Engine, RowMapping
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.pool import NullPool
@@ -40,13 +44,22 @@ __all__ = ["DictionarySqliteStore"]
 
 logger = getLogger(__name__)
 
+_BUILD_CACHE_SIZE = -262144
+"""SQLite page cache size while building a database, as negative KiB."""
+
+_INSERT_BATCH_SIZE = 10000
+"""Number of definitions after which to insert pending rows while building."""
+
 
 class DictionarySqliteStore:
     """SQLite schema, persistence, and lookup for dictionary data."""
 
-    schema_version = 3
+    schema_version = 4
     """SQLite schema version."""
 
+    _romanization_fts_tables = ("entries_fts", "entries_trigram")
+    """Full-text indices of romanization, present from schema version 4."""
+
     _metadata = MetaData()
     """SQLAlchemy Core metadata for dictionary tables."""
 
@@ -192,14 +205,33 @@ class DictionarySqliteStore:
     )
     """Definition-to-sentence compatibility table."""
 
-    def __init__(self, database_path: Path):
+    def __init__(self, database_path: Path, *, read_only: bool = False):
         """Initialize.
 
         Arguments:
             database_path: SQLite database path
+            read_only: whether to keep pooled read-only connections open between
+              lookups, rather than opening a connection for each query
         """
         self.database_path = val_output_path(database_path, exist_ok=True)
-        self.engine = self._create_engine(self.database_path)
+        self.read_only = read_only
+        self.engine = self._create_engine(self.database_path, read_only=read_only)
+
+        self._romanization_fts_table_names: set[str] | None = None
+
+    def close(self):
+        """Close pooled connections to the SQLite database."""
+        self.engine.dispose()
+        self._romanization_fts_table_names = None
+
+    def get_schema_version(self) -> int:
+        """Get the schema version recorded in the SQLite database.
+
+        Returns:
+            SQLite user_version
+        """
+        with self.engine.connect() as connection:
+            return int(connection.execute(text("PRAGMA user_version")).scalar_one())
 
     def lookup_by_jyutping(self, query: str, limit: int) -> list[DictionaryEntry]:
         """Lookup entries by Jyutping.
@@ -210,23 +242,7 @@ class DictionarySqliteStore:
         Returns:
             dictionary entries
         """
-        like_query = f"%{self._get_escaped_query(query)}%"
-        statement = (
-            select(self._entries.c.entry_id)
-            .where(
-                (self._entries.c.jyutping == query)
-                | self._entries.c.jyutping.like(like_query, escape="\\")
-            )
-            .group_by(self._entries.c.entry_id)
-            .order_by(
-                case((self._entries.c.jyutping == query, 0), else_=1),
-                func.length(self._entries.c.traditional),
-                self._entries.c.entry_id,
-            )
-            .limit(limit)
-        )
-        entry_ids = self._select_entry_ids(statement)
-        return self._fetch_entries(entry_ids)
+        return self._lookup_by_romanization(self._entries.c.jyutping, query, limit)
 
     def lookup_by_pinyin(self, query: str, limit: int) -> list[DictionaryEntry]:
         """Lookup entries by pinyin.
@@ -237,23 +253,7 @@ class DictionarySqliteStore:
         Returns:
             dictionary entries
         """
-        like_query = f"%{self._get_escaped_query(query)}%"
-        statement = (
-            select(self._entries.c.entry_id)
-            .where(
-                (self._entries.c.pinyin == query)
-                | self._entries.c.pinyin.like(like_query, escape="\\")
-            )
-            .group_by(self._entries.c.entry_id)
-            .order_by(
-                case((self._entries.c.pinyin == query, 0), else_=1),
-                func.length(self._entries.c.traditional),
-                self._entries.c.entry_id,
-            )
-            .limit(limit)
-        )
-        entry_ids = self._select_entry_ids(statement)
-        return self._fetch_entries(entry_ids)
+        return self._lookup_by_romanization(self._entries.c.pinyin, query, limit)
 
     def lookup_by_simplified(self, query: str, limit: int) -> list[DictionaryEntry]:
         """Lookup entries by simplified Chinese headword.
@@ -298,34 +298,35 @@ class DictionarySqliteStore:
         return self._fetch_entries(entry_ids)
 
     def persist(
-        self, source_data: tuple[DictionarySource, list[DictionaryEntry]]
+        self, source_data: tuple[DictionarySource, Iterable[DictionaryEntry]]
     ) -> Path:
         """Persist dictionary data to SQLite.
 
+        Entries are consumed as they are iterated and inserted in batches into a
+        temporary database tuned for bulk loading, after which search indices are
+        generated in one pass and the temporary database replaces any existing one.
+
         Arguments:
             source_data: source metadata and normalized dictionary entries
         Returns:
             SQLite database path
         """
         source, entries = source_data
+        started = perf_counter()
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         with TemporaryDirectory(
             dir=self.database_path.parent, prefix=f".{self.database_path.name}."
         ) as temporary_dir_name:
             temporary_database_path = Path(temporary_dir_name) / self.database_path.name
             temporary_engine = self._create_engine(temporary_database_path)
+            event.listen(temporary_engine, "connect", self._configure_build_connection)
             try:
                 with temporary_engine.begin() as connection:
                     self._write_database_version(connection)
                     self._create_tables(connection)
 
                     source_id = self._insert_source(connection, source)
-                    for entry in entries:
-                        entry_id = self._insert_entry(connection, entry)
-                        for definition in entry.definitions:
-                            self._insert_definition(
-                                connection, definition, entry_id, source_id
-                            )
+                    entry_count = self._insert_entries(connection, entries, source_id)
 
                     self._generate_indices(connection)
                 self._validate_database(temporary_engine)
@@ -333,7 +334,11 @@ class DictionarySqliteStore:
                 temporary_engine.dispose()
 
             temporary_database_path.replace(self.database_path)
-            logger.info(f"Rebuilt SQLite database: {self.database_path}")
+            self._romanization_fts_table_names = None
+            logger.info(
+                f"Rebuilt SQLite database: {self.database_path} with {entry_count} "
+                f"entries in {perf_counter() - started:.1f} s"
+            )
 
         return self.database_path
 
@@ -405,7 +410,13 @@ class DictionarySqliteStore:
         self._metadata.create_all(connection)
         try:
             connection.execute(
-                text("CREATE VIRTUAL TABLE entries_fts USING fts5(pinyin, jyutping)")
+                text(
+                    """CREATE VIRTUAL TABLE entries_fts USING fts5(
+                           pinyin,
+                           jyutping,
+                           tokenize="unicode61 remove_diacritics 0 tokenchars ':'"
+                       )"""
+                )
             )
         except OperationalError as exc:
             if self._is_missing_fts5(exc):
@@ -416,6 +427,22 @@ class DictionarySqliteStore:
             else:
                 raise
 
+        try:
+            connection.execute(
+                text(
+                    """CREATE VIRTUAL TABLE entries_trigram
+                       USING fts5(pinyin, jyutping, tokenize="trigram")"""
+                )
+            )
+        except OperationalError as exc:
+            if self._is_missing_fts5(exc):
+                logger.warning(
+                    "SQLite FTS5 trigram tokenizer unavailable; continuing without "
+                    f"entries_trigram index: {exc}"
+                )
+            else:
+                raise
+
         try:
             connection.execute(
                 text(
@@ -433,14 +460,44 @@ class DictionarySqliteStore:
                 raise
 
     @staticmethod
-    def _create_engine(database_path: Path) -> Engine:
+    def _configure_build_connection(dbapi_connection: SqliteConnection, _: object):
+        """Configure a new connection to a temporary database for bulk loading.
+
+        The temporary database replaces the published one only after it has been
+        fully written and validated, so it needs no journal or durable writes.
+
+        Arguments:
+            dbapi_connection: SQLite connection
+            _: SQLAlchemy connection record
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute(f"PRAGMA cache_size={_BUILD_CACHE_SIZE}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @staticmethod
+    def _create_engine(database_path: Path, *, read_only: bool = False) -> Engine:
         """Create a SQLite engine for a database path.
 
         Arguments:
             database_path: SQLite database path
+            read_only: whether to open pooled read-only connections
         Returns:
             SQLite engine
         """
+        if read_only:
+            return create_engine(
+                URL.create(
+                    "sqlite",
+                    database=f"{database_path.absolute().as_uri()}?mode=ro",
+                    query={"uri": "true"},
+                ),
+                future=True,
+                pool_size=1,
+                max_overflow=4,
+            )
         return create_engine(
             URL.create("sqlite", database=str(database_path)),
             future=True,
@@ -507,6 +564,21 @@ class DictionarySqliteStore:
                 )
             else:
                 raise
+        try:
+            connection.execute(
+                text(
+                    """INSERT INTO entries_trigram (rowid, pinyin, jyutping)
+                       SELECT rowid, pinyin, jyutping FROM entries"""
+                )
+            )
+        except OperationalError as exc:
+            if DictionarySqliteStore._is_missing_fts5(exc):
+                logger.warning(
+                    "Skipping entries_trigram population because the FTS5 trigram "
+                    f"tokenizer is unavailable: {exc}"
+                )
+            else:
+                raise
         try:
             connection.execute(
                 text(
@@ -526,89 +598,120 @@ class DictionarySqliteStore:
             text("CREATE INDEX fk_entry_id_index ON definitions(fk_entry_id)")
         )
 
+    def _get_romanization_fts_table_names(self) -> set[str]:
+        """Get names of the romanization full-text indices present in the database.
+
+        Databases built before schema version 4 are treated as having none, since
+        their entries_fts index is tokenized differently.
+
+        Returns:
+            names of present romanization full-text indices
+        """
+        if self._romanization_fts_table_names is None:
+            with self.engine.connect() as connection:
+                schema_version = connection.execute(
+                    text("PRAGMA user_version")
+                ).scalar_one()
+                table_names = set()
+                if schema_version >= 4:
+                    table_names = set(
+                        connection.execute(
+                            select(literal_column("name"))
+                            .select_from(text("sqlite_master"))
+                            .where(
+                                literal_column("name").in_(
+                                    self._romanization_fts_tables
+                                )
+                            )
+                        )
+                        .scalars()
+                        .all()
+                    )
+            self._romanization_fts_table_names = table_names
+        return self._romanization_fts_table_names
+
     @staticmethod
-    def _insert_definition(
-        connection: Connection,
-        definition: DictionaryDefinition,
-        entry_id: int,
-        source_id: int,
-    ) -> int:
-        """Insert a dictionary definition and return its identifier.
+    def _get_syllable_match(column_name: str, query: str) -> str | None:
+        """Get an entries_fts query matching a run of syllables beginning with query's.
 
         Arguments:
-            connection: SQLAlchemy connection
-            definition: definition text
-            entry_id: related entry identifier
-            source_id: related source identifier
+            column_name: name of romanization column to match
+            query: query string of whitespace-separated syllables
         Returns:
-            definition identifier
+            FTS5 query, or None if query is not made of syllables
         """
-        result = connection.execute(
-            sqlite_insert(DictionarySqliteStore._definitions)
-            .values(
-                definition=definition.text,
-                label=definition.label,
-                fk_entry_id=entry_id,
-                fk_source_id=source_id,
-            )
-            .on_conflict_do_nothing()
-        )
-        if result.rowcount == 1:
-            inserted_primary_key = result.inserted_primary_key
-            if not inserted_primary_key:
-                raise RuntimeError("Failed to insert definition")
-            return int(inserted_primary_key[0])
-
-        row = connection.execute(
-            select(DictionarySqliteStore._definitions.c.definition_id).where(
-                (DictionarySqliteStore._definitions.c.definition == definition.text)
-                & (DictionarySqliteStore._definitions.c.label == definition.label)
-                & (DictionarySqliteStore._definitions.c.fk_entry_id == entry_id)
-                & (DictionarySqliteStore._definitions.c.fk_source_id == source_id)
-            )
-        ).first()
-        if row is None:
-            raise RuntimeError("Failed to insert or load existing definition")
-        return int(row[0])
+        syllables = query.split()
+        if not syllables or not all(
+            character.isalnum() or character == ":"
+            for syllable in syllables
+            for character in syllable
+        ):
+            return None
+        phrase = " + ".join(f'"{syllable}"*' for syllable in syllables)
+        return f"{column_name} : ({phrase})"
 
     @staticmethod
-    def _insert_entry(connection: Connection, entry: DictionaryEntry) -> int:
-        """Insert a dictionary entry and return its identifier.
+    def _insert_entries(
+        connection: Connection, entries: Iterable[DictionaryEntry], source_id: int
+    ) -> int:
+        """Insert dictionary entries and their definitions in batches.
+
+        Entry identifiers are assigned in order of first appearance, and repeated
+        entries are collapsed onto their first appearance, as by the entries table's
+        uniqueness rule; repeated definitions are collapsed by the definitions
+        table's uniqueness rule.
 
         Arguments:
             connection: SQLAlchemy connection
-            entry: dictionary entry
+            entries: dictionary entries
+            source_id: related source identifier
         Returns:
-            entry identifier
+            number of unique entries inserted
         """
-        result = connection.execute(
-            sqlite_insert(DictionarySqliteStore._entries)
-            .values(
-                traditional=entry.traditional,
-                simplified=entry.simplified,
-                pinyin=entry.pinyin,
-                jyutping=entry.jyutping,
-                frequency=entry.frequency,
-            )
-            .on_conflict_do_nothing()
-        )
-        if result.rowcount == 1:
-            inserted_primary_key = result.inserted_primary_key
-            if not inserted_primary_key:
-                raise RuntimeError("Failed to insert entry")
-            return int(inserted_primary_key[0])
-
-        row = connection.execute(
-            select(DictionarySqliteStore._entries.c.entry_id).where(
-                (DictionarySqliteStore._entries.c.traditional == entry.traditional)
-                & (DictionarySqliteStore._entries.c.simplified == entry.simplified)
-                & (DictionarySqliteStore._entries.c.pinyin == entry.pinyin)
-                & (DictionarySqliteStore._entries.c.jyutping == entry.jyutping)
+        entry_ids: dict[tuple[str, str, str, str], int] = {}
+        entry_rows: list[dict[str, object]] = []
+        definition_rows: list[dict[str, object]] = []
+
+        def insert_rows():
+            """Insert pending entry rows, and then the definition rows they own."""
+            if entry_rows:
+                connection.execute(DictionarySqliteStore._entries.insert(), entry_rows)
+                entry_rows.clear()
+            if definition_rows:
+                connection.execute(
+                    DictionarySqliteStore._definitions.insert(), definition_rows
+                )
+                definition_rows.clear()
+
+        for entry in entries:
+            key = (entry.traditional, entry.simplified, entry.pinyin, entry.jyutping)
+            entry_id = entry_ids.get(key)
+            if entry_id is None:
+                entry_id = len(entry_ids) + 1
+                entry_ids[key] = entry_id
+                entry_rows.append(
+                    {
+                        "entry_id": entry_id,
+                        "traditional": entry.traditional,
+                        "simplified": entry.simplified,
+                        "pinyin": entry.pinyin,
+                        "jyutping": entry.jyutping,
+                        "frequency": entry.frequency,
+                    }
+                )
+            definition_rows.extend(
+                {
+                    "definition": definition.text,
+                    "label": definition.label,
+                    "fk_entry_id": entry_id,
+                    "fk_source_id": source_id,
+                }
+                for definition in entry.definitions
             )
-        ).first()
-        if row is None:
-            raise RuntimeError("Failed to insert or load existing entry")
-        return int(row[0])
+            if len(definition_rows) >= _INSERT_BATCH_SIZE:
+                insert_rows()
+        insert_rows()
+        return len(entry_ids)
 
     @staticmethod
     def _insert_source(connection: Connection, source: DictionarySource) -> int:
@@ -647,10 +750,89 @@ class DictionarySqliteStore:
             whether error indicates missing FTS5 support
         """
         message = str(exc).lower()
-        if "fts5" in message or "no such module" in message:
+        if (
+            "fts5" in message
+            or "no such module" in message
+            or "no such tokenizer" in message
+        ):
             return True
         return "no such table" in message and "_fts" in message
 
+    def _lookup_by_romanization(
+        self, column: Column[str], query: str, limit: int
+    ) -> list[DictionaryEntry]:
+        """Lookup entries by a romanization column.
+
+        Queries of whitespace-separated syllables match consecutive syllables that
+        begin with the query's, through the entries_fts index, so that syllables may
+        be abbreviated or given without tones. Other queries, and syllable queries
+        without matches, match substrings through the entries_trigram index, or by a
+        scan for short queries and databases built without these indices. Exact
+        matches are ordered first, then shorter headwords.
+
+        Arguments:
+            column: romanization column
+            query: query string
+            limit: max results
+        Returns:
+            dictionary entries
+        """
+        order_by = (
+            case((column == query, 0), else_=1),
+            func.length(self._entries.c.traditional),
+            self._entries.c.entry_id,
+        )
+        fts_table_names = self._get_romanization_fts_table_names()
+
+        syllable_match = self._get_syllable_match(column.name, query)
+        if syllable_match is not None and "entries_fts" in fts_table_names:
+            statement = (
+                select(self._entries.c.entry_id)
+                .where(
+                    self._entries.c.entry_id.in_(
+                        text(
+                            "SELECT rowid FROM entries_fts "
+                            "WHERE entries_fts MATCH :match"
+                        )
+                        .bindparams(match=syllable_match)
+                        .columns(literal_column("rowid"))
+                    )
+                )
+                .order_by(*order_by)
+                .limit(limit)
+            )
+            entry_ids = self._select_entry_ids(statement)
+            if entry_ids:
+                return self._fetch_entries(entry_ids)
+
+        if len(query) >= 3 and "entries_trigram" in fts_table_names:
+            escaped_query = query.replace('"', '""')
+            statement = (
+                select(self._entries.c.entry_id)
+                .where(
+                    self._entries.c.entry_id.in_(
+                        text(
+                            "SELECT rowid FROM entries_trigram "
+                            "WHERE entries_trigram MATCH :match"
+                        )
+                        .bindparams(match=f'{column.name} : "{escaped_query}"')
+                        .columns(literal_column("rowid"))
+                    )
+                )
+                .order_by(*order_by)
+                .limit(limit)
+            )
+        else:
+            like_query = f"%{self._get_escaped_query(query)}%"
+            statement = (
+                select(self._entries.c.entry_id)
+                .where((column == query) | column.like(like_query, escape="\\"))
+                .order_by(*order_by)
+                .limit(limit)
+            )
+        entry_ids = self._select_entry_ids(statement)
+        return self._fetch_entries(entry_ids)
+
     def _select_entry_ids(self, statement: Select[tuple[int]]) -> list[int]:
         """Run entry selection query.
 
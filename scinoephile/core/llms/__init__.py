@@ -3,7 +3,7 @@
 """Core code related to interactions with LLMs.
 
 Package hierarchy (modules may import from any above):
-* cache_namespace / metrics / models / prompt / tool
+* cache_namespace / metrics / models / prompt / rate_limiter / tool
 * answer / query / test_case_subtitle / tool_box
 * llm_provider / test_case
 * manager / openai_provider_base / cache
@@ -25,6 +25,7 @@ from .processor import Processor, ProcessorKwargs
 from .prompt import Prompt, SharedPromptLocalizationFields
 from .query import Query
 from .queryer import Queryer
+from .rate_limiter import RateLimiter
 from .test_case import TestCase
 from .test_case_subtitle import AnnotatedTestCaseSubtitle, TestCaseSubtitle
 from .tool import Tool
@@ -47,6 +48,7 @@ __all__ = [
     "PromptModelField",
     "Query",
     "Queryer",
+    "RateLimiter",
     "SharedPromptLocalizationFields",
     "TestCase",
     "TestCaseSubtitle",
@@ -7,17 +7,19 @@ from __future__ import annotations
 import hashlib
 import json
 from logging import getLogger
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 from scinoephile.common.file import open_atomic_text_file
 from scinoephile.common.validation import val_output_dir_path
+from scinoephile.core.cache import CacheBackend, CacheSqliteStore
 from scinoephile.core.cache.artifact import remove_cache_artifact
 from scinoephile.core.cache.identity import CacheIdentity
+from scinoephile.core.cache.sqlite_store import get_cache_backend
 from scinoephile.core.paths import get_runtime_cache_root_path
 
 from .cache_namespace import LlmCacheNamespace
 
-__all__ = ["LlmCache"]
+__all__ = ["LlmCache", "convert_llm_cache"]
 
 logger = getLogger(__name__)
 
@@ -26,10 +28,20 @@ _CACHE_VERSION = 2
 
 
 class LlmCache:
-    """Cache of LLM response payloads."""
+    """Cache of LLM response payloads.
+
+    Responses are stored either as one file per response beneath the operation's
+    namespace directory, or as one row per response in the cache root's SQLite file.
+    Both are keyed by the same SHA-256 identity, such that get_path names the same
+    response under either backend.
+    """
 
     def __init__(
-        self, cache_root_path: Path | None, operation: str, overwrite: bool = False
+        self,
+        cache_root_path: Path | None,
+        operation: str,
+        overwrite: bool = False,
+        backend: CacheBackend | None = None,
     ):
         """Initialize.
 
@@ -37,6 +49,7 @@ class LlmCache:
             cache_root_path: root directory beneath which to cache, or None for default
             operation: stable LLM operation identifier
             overwrite: whether to replace matching cache files
+            backend: storage backend, or None to use the cache root's current backend
         """
         if cache_root_path is None:
             cache_root_path = get_runtime_cache_root_path()
@@ -44,14 +57,37 @@ class LlmCache:
         """Root directory beneath which LLM responses are cached."""
         self.operation = operation
         """Stable LLM operation identifier."""
-        self.cache_dir_path = LlmCacheNamespace.OPERATION.get_dir_path(
-            self.cache_root_path, operation=self.operation
-        )
+        if backend is None:
+            backend = get_cache_backend(self.cache_root_path)
+        self.backend = backend
+        """Storage backend of cached LLM responses."""
+        self.namespace = LlmCacheNamespace.OPERATION.get_name(operation=operation)
+        """Portable cache namespace name of this operation."""
+
+        # The SQLite backend names responses by their directory-layout paths, but
+        # does not create the directory
+        if backend == CacheBackend.SQLITE:
+            cache_dir_path = self.cache_root_path.joinpath(
+                *PurePosixPath(self.namespace).parts
+            )
+        else:
+            cache_dir_path = LlmCacheNamespace.OPERATION.get_dir_path(
+                self.cache_root_path, operation=self.operation
+            )
+        self.cache_dir_path = cache_dir_path
         """Directory in which cached LLM responses are stored."""
 
+        self._store: CacheSqliteStore | None = None
+        """SQLite store of cached LLM responses, if using the SQLite backend."""
+        if backend == CacheBackend.SQLITE:
+            self._store = CacheSqliteStore(self.cache_root_path)
+            self._store.create()
+
         self.overwrite = overwrite
         """Whether matching cache files should be replaced."""
 
+        self._prefetched: dict[str, bytes] = {}
+        """Prefetched SQLite cache contents by entry name."""
         self._refreshed_paths: set[Path] = set()
         """Cache paths refreshed by this cache instance."""
 
@@ -111,6 +147,8 @@ class LlmCache:
         cache_path = self.get_path(
             cache_identity, system_prompt, tools_json, query_json
         )
+        if self._store is not None:
+            return self._load_from_store(cache_path)
         if self.overwrite and cache_path not in self._refreshed_paths:
             self._refreshed_paths.add(cache_path)
             if remove_cache_artifact(cache_path):
@@ -131,6 +169,21 @@ class LlmCache:
         logger.info(f"Loaded LLM response from cache: {cache_path}")
         return contents
 
+    def prefetch(self):
+        """Load all of this operation's cached responses using one query.
+
+        Subsequent loads are answered from memory rather than querying for each
+        response. Directory-backed caches are read on demand, and caches being
+        overwritten have nothing to load, so both are unaffected.
+        """
+        if self._store is None or self.overwrite:
+            return
+        self._prefetched = self._store.load_all(self.namespace)
+        logger.debug(
+            f"Prefetched {len(self._prefetched)} LLM responses from cache: "
+            f"{self.namespace}"
+        )
+
     def remove(
         self,
         cache_identity: CacheIdentity,
@@ -153,7 +206,11 @@ class LlmCache:
         cache_path = self.get_path(
             cache_identity, system_prompt, tools_json, query_json
         )
-        if not remove_cache_artifact(cache_path):
+        if self._store is not None:
+            self._prefetched.pop(cache_path.name, None)
+            if not self._store.remove(self.namespace, cache_path.name):
+                return None
+        elif not remove_cache_artifact(cache_path):
             return None
         logger.info(f"Removed LLM response cache: {cache_path}")
         return cache_path
@@ -182,8 +239,89 @@ class LlmCache:
         cache_path = self.get_path(
             cache_identity, system_prompt, tools_json, query_json
         )
-        with open_atomic_text_file(cache_path) as cache_file:
-            cache_file.write(contents)
+        if self._store is not None:
+            self._prefetched.pop(cache_path.name, None)
+            self._store.save(self.namespace, cache_path.name, contents.encode("utf-8"))
+        else:
+            with open_atomic_text_file(cache_path) as cache_file:
+                cache_file.write(contents)
         self._refreshed_paths.add(cache_path)
         logger.info(f"Saved LLM response to cache: {cache_path}")
         return cache_path
+
+    def _load_from_store(self, cache_path: Path) -> str | None:
+        """Load a cached response payload from the SQLite store.
+
+        Arguments:
+            cache_path: directory-layout path naming the cached response
+        Returns:
+            cached response payload, or None when unavailable
+        """
+        assert self._store is not None
+        name = cache_path.name
+        if self.overwrite and cache_path not in self._refreshed_paths:
+            self._refreshed_paths.add(cache_path)
+            self._prefetched.pop(name, None)
+            if self._store.remove(self.namespace, name):
+                logger.info(f"Removed LLM response cache: {cache_path}")
+            return None
+
+        encoded_contents = self._prefetched.get(name)
+        if encoded_contents is None:
+            encoded_contents = self._store.load(self.namespace, name)
+            if encoded_contents is None:
+                return None
+        else:
+            self._store.touch(self.namespace, name)
+        try:
+            contents = encoded_contents.decode("utf-8")
+        except UnicodeError as exc:
+            self._prefetched.pop(name, None)
+            self._store.remove(self.namespace, name)
+            logger.warning(f"Discarded invalid LLM response cache {cache_path}: {exc}")
+            return None
+
+        logger.info(f"Loaded LLM response from cache: {cache_path}")
+        return contents
+
+
+def convert_llm_cache(cache_root_path: Path, backend: CacheBackend) -> int:
+    """Convert a cache root's cached LLM responses to a storage backend.
+
+    Responses keep their names, contents, and modification times, such that
+    converting to one backend and back reproduces the original cache. Converting to
+    the directory backend removes the cache root's SQLite file once it holds no
+    other entries.
+
+    Arguments:
+        cache_root_path: cache root directory path
+        backend: storage backend to which to convert
+    Returns:
+        number of responses converted
+    """
+    store = CacheSqliteStore(cache_root_path)
+    count = 0
+    if backend == CacheBackend.SQLITE:
+        store.create()
+        for namespace in LlmCacheNamespace.OPERATION.discover_names(cache_root_path):
+            namespace_dir_path = cache_root_path.joinpath(
+                *PurePosixPath(namespace).parts
+            )
+            count += store.import_dir(namespace, namespace_dir_path)
+            remove_cache_artifact(namespace_dir_path)
+    else:
+        namespaces = [
+            namespace
+            for namespace in store.get_namespace_names()
+            if LlmCacheNamespace.OPERATION.matches_name(namespace)
+        ]
+        for namespace in namespaces:
+            count += store.export_dir(
+                namespace, cache_root_path.joinpath(*PurePosixPath(namespace).parts)
+            )
+        store.delete_entries(namespaces)
+        if store.exists and not store.get_namespace_names():
+            store.remove_file()
+    store.close()
+    logger.info(f"Converted {count} cached LLM responses to {backend} backend")
+    return count
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from asyncio import to_thread
 from typing import Any, TypedDict, Unpack
 
 from scinoephile.core.cache.identity import CacheIdentity
@@ -87,3 +88,43 @@ class LLMProvider(ABC):
             ScinoephileError: Error during chat completion
         """
         raise NotImplementedError()
+
+    async def chat_completion_async(
+        self,
+        messages: list[dict[str, Any]],
+        response_format: type[Answer],
+        tool_box: ToolBox | None = None,
+        *,
+        operation: str | None = None,
+        query_key_sha256: str | None = None,
+        query_attempt: int = 1,
+        **kwargs: Unpack[ChatCompletionKwargs],
+    ) -> str:
+        """Return chat completion text asynchronously.
+
+        By default, runs chat_completion in a worker thread, so that completions
+        awaited together are still subject to any limits shared by the provider.
+
+        Arguments:
+            messages: messages to send
+            response_format: structured response format
+            tool_box: available tools
+            operation: stable LLM operation identifier
+            query_key_sha256: SHA-256 digest of the semantic query key
+            query_attempt: one-based answer-validation attempt
+            **kwargs: provider-specific keyword arguments
+        Returns:
+            completion text from the model
+        Raises:
+            ScinoephileError: Error during chat completion
+        """
+        return await to_thread(
+            self.chat_completion,
+            messages,
+            response_format,
+            tool_box,
+            operation=operation,
+            query_key_sha256=query_key_sha256,
+            query_attempt=query_attempt,
+            **kwargs,
+        )
@@ -6,13 +6,21 @@ from __future__ import annotations
 
 import os
 from collections.abc import Mapping
+from functools import cache
 from hashlib import sha256
 from json import dumps
 from logging import getLogger
 from time import monotonic, sleep
 from typing import Any, ClassVar, Unpack, cast
 
-from openai import OpenAI, OpenAIError
+from openai import (
+    APIConnectionError,
+    DefaultHttpxClient,
+    InternalServerError,
+    OpenAI,
+    OpenAIError,
+    RateLimitError,
+)
 from openai.types.chat import ChatCompletionMessageFunctionToolCall
 from pydantic import ValidationError
 
@@ -22,6 +30,12 @@ from scinoephile.core.exceptions import ScinoephileError
 from .answer import Answer
 from .llm_provider import ChatCompletionKwargs, LLMProvider
 from .metrics import ChatCompletionMetrics
+from .rate_limiter import (
+    RateLimiter,
+    get_backoff_seconds,
+    get_retry_after_seconds,
+    get_shared_rate_limiter,
+)
 from .tool_box import ToolBox
 
 __all__ = ["OpenAIProviderBase"]
@@ -47,6 +61,9 @@ class OpenAIProviderBase(LLMProvider):
     timeout_seconds: float
     """Timeout for each provider request."""
 
+    max_retries: int
+    """Maximum retries of each request after rate limits and transient errors."""
+
     def __init__(
         self,
         client: OpenAI | None = None,
@@ -55,6 +72,10 @@ class OpenAIProviderBase(LLMProvider):
         base_url: str | None = None,
         model: str | None = None,
         timeout_seconds: float = 120.0,
+        max_retries: int = 5,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         """Initialize.
 
@@ -64,14 +85,27 @@ class OpenAIProviderBase(LLMProvider):
             base_url: explicit base URL; if omitted, provider default is used
             model: model identifier override
             timeout_seconds: timeout for each provider request
+            max_retries: maximum retries of each request after rate limits and
+              transient errors
+            requests_per_minute: maximum requests per minute shared by providers of
+              the same endpoint and model
+            tokens_per_minute: maximum tokens per minute shared by providers of the
+              same endpoint and model
+            rate_limiter: explicit rate limiter; if omitted, shared limiter is used
         Raises:
-            ValueError: if timeout_seconds is not positive
+            ValueError: if timeout_seconds is not positive or max_retries is negative
         """
         if timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be positive.")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative.")
         self._sync_client: OpenAI | None = client
         self._api_key: str | None = api_key
+        self._rate_limiter = rate_limiter
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
         self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
         self.completion_metrics: list[ChatCompletionMetrics] = []
         """Usage and timing for completions made by this provider instance."""
         if base_url is not None:
@@ -112,14 +146,32 @@ class OpenAIProviderBase(LLMProvider):
         )
         return identity
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by providers of the same endpoint and model."""
+        if self._rate_limiter is None:
+            identity = self.cache_identity
+            self._rate_limiter = get_shared_rate_limiter(
+                f"{identity['base_url']} {identity['model']}",
+                self._requests_per_minute,
+                self._tokens_per_minute,
+            )
+        return self._rate_limiter
+
     @property
     def sync_client(self) -> OpenAI:
-        """Synchronous OpenAI client."""
+        """Synchronous OpenAI client.
+
+        Clients created here share one pool of HTTP connections, and leave retries
+        to this provider so that they are coordinated through its rate limiter.
+        """
         if self._sync_client is None:
             self._sync_client = OpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
                 timeout=self.timeout_seconds,
+                max_retries=0,
+                http_client=_get_shared_http_client(),
             )
         return self._sync_client
 
@@ -228,7 +280,6 @@ class OpenAIProviderBase(LLMProvider):
                     f"OpenAI-compatible API rate limit exceeded "
                     f"({exc_code=}, {exc_type=} {exc_param=}): {exc}"
                 )
-                sleep(1)
             raise ScinoephileError(
                 f"OpenAI-compatible API error ({exc_code=}, {exc_type=} {exc_param=}): "
                 f"{exc}"
@@ -260,10 +311,82 @@ class OpenAIProviderBase(LLMProvider):
             for tool in tool_box.specs
         ]
 
+    def _estimate_tokens(
+        self, messages: list[dict[str, Any]], request_kwargs: Mapping[str, Any]
+    ) -> int:
+        """Estimate the tokens a completion request will use.
+
+        Uses the mean total of the most recent completions reporting usage, or
+        about four characters per token for the first request.
+
+        Arguments:
+            messages: messages to send
+            request_kwargs: OpenAI SDK request keyword arguments
+        Returns:
+            estimated input and output tokens
+        """
+        recent_totals = [
+            metrics.total_tokens
+            for metrics in self.completion_metrics[-20:]
+            if metrics.total_tokens is not None
+        ]
+        if recent_totals:
+            return round(sum(recent_totals) / len(recent_totals))
+        message_chars = len(dumps(messages, ensure_ascii=False, default=str))
+        return message_chars // 4 + int(request_kwargs.get("max_tokens") or 0)
+
     def _query(
         self, messages: list[dict[str, Any]], request_kwargs: dict[str, Any]
     ) -> tuple[Any, int | None]:
-        """Query provider for completion.
+        """Query provider for completion, retrying rate limits and transient errors.
+
+        Each attempt waits for capacity in the rate limiter. Rate-limited attempts
+        pause the limiter for the delay requested by the server, if any, so that
+        all requests sharing the limiter back off together.
+
+        Arguments:
+            messages: messages to send
+            request_kwargs: OpenAI SDK request keyword arguments
+        Returns:
+            completion response object and transport retry count, if available
+        """
+        estimated_tokens = self._estimate_tokens(messages, request_kwargs)
+        retries = 0
+        while True:
+            self.rate_limiter.acquire(estimated_tokens)
+            try:
+                completion, sdk_retries = self._query_once(messages, request_kwargs)
+            except (APIConnectionError, InternalServerError, RateLimitError) as exc:
+                self.rate_limiter.settle(estimated_tokens, 0)
+                if retries >= self.max_retries:
+                    raise
+                retry_after_seconds = None
+                response = getattr(exc, "response", None)
+                if response is not None:
+                    retry_after_seconds = get_retry_after_seconds(response.headers)
+                delay = get_backoff_seconds(retries, retry_after_seconds)
+                logger.warning(
+                    f"Retrying OpenAI-compatible API request in {delay:.2f} s after "
+                    f"{type(exc).__name__}: {exc}"
+                )
+                if isinstance(exc, RateLimitError):
+                    self.rate_limiter.pause(delay)
+                else:
+                    sleep(delay)
+                retries += 1
+                continue
+            usage = getattr(completion, "usage", None)
+            self.rate_limiter.settle(
+                estimated_tokens, getattr(usage, "total_tokens", None)
+            )
+            if sdk_retries is None and retries == 0:
+                return completion, None
+            return completion, (sdk_retries or 0) + retries
+
+    def _query_once(
+        self, messages: list[dict[str, Any]], request_kwargs: dict[str, Any]
+    ) -> tuple[Any, int | None]:
+        """Query provider for completion once.
 
         Arguments:
             messages: messages to send
@@ -453,3 +576,13 @@ class OpenAIProviderBase(LLMProvider):
             request_kwargs.setdefault("parallel_tool_calls", False)
             request_kwargs["tools"] = openai_tools
         return request_kwargs
+
+
+@cache
+def _get_shared_http_client() -> DefaultHttpxClient:
+    """Get the HTTP client whose connection pool is shared by provider clients.
+
+    Returns:
+        shared HTTP client
+    """
+    return DefaultHttpxClient()
@@ -33,6 +33,9 @@ class ProcessorKwargs(TypedDict, total=False):
     cache_root_path: Path | None
     """Root directory beneath which to cache LLM responses."""
 
+    concurrency: int
+    """Maximum number of independent LLM queries in flight at once."""
+
     no_op: bool
     """Whether to use neutral answers instead of querying an LLM."""
 
@@ -70,6 +73,7 @@ class Processor(ABC):
         additional_context: str | None = None,
         auto_verify: bool = False,
         cache_root_path: Path | None = None,
+        concurrency: int = 1,
         no_op: bool = False,
         overwrite_cache: bool = False,
         prune_test_cases: bool = False,
@@ -85,6 +89,7 @@ class Processor(ABC):
             additional_context: additional context to include in the system prompt
             auto_verify: automatically verify test cases if they meet selected criteria
             cache_root_path: root directory beneath which to cache LLM responses
+            concurrency: maximum number of independent LLM queries in flight at once
             no_op: use neutral answers instead of querying the LLM
             overwrite_cache: whether to replace matching LLM response cache files
             prune_test_cases: remove persisted cases not encountered in this run
@@ -121,6 +126,7 @@ class Processor(ABC):
             cache_root_path=cache_root_path,
             additional_context=additional_context,
             auto_verify=auto_verify,
+            concurrency=concurrency,
             no_op=no_op,
             overwrite_cache=overwrite_cache,
             tool_box=tool_box,
@@ -4,8 +4,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
+from threading import local
 
 from pydantic import ValidationError
 
@@ -37,6 +40,7 @@ class Queryer[TTestCase: TestCase]:
         additional_context: str | None = None,
         max_attempts: int = 5,
         auto_verify: bool = False,
+        concurrency: int = 1,
         no_op: bool = False,
         overwrite_cache: bool = False,
         tool_box: ToolBox | None = None,
@@ -52,10 +56,15 @@ class Queryer[TTestCase: TestCase]:
             additional_context: additional context to include in the system prompt
             max_attempts: maximum number of attempts
             auto_verify: automatically mark test cases as verified if no changes
+            concurrency: maximum number of queries in flight in query_all
             no_op: use neutral answers without reading or writing response caches
             overwrite_cache: whether to replace matching cache files
             tool_box: available tools and handlers
+        Raises:
+            ValueError: if concurrency is less than one
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
         self.test_case_cls = test_case_cls
         """Class defining queries, answers, and prompt text."""
         self.prompt = test_case_cls.prompt
@@ -92,6 +101,10 @@ class Queryer[TTestCase: TestCase]:
         """Maximum number of query attempts."""
         self.auto_verify = auto_verify
         """Automatically verify test cases if they meet selected criteria."""
+        self.concurrency = concurrency
+        """Maximum number of queries in flight in query_all."""
+        self._deferred = local()
+        """Per-thread encountered test cases awaiting logging in query order."""
         self.tool_box = tool_box or ToolBox()
         """Available tools and handlers."""
         self.system_prompt = self.prompt.base_system_prompt
@@ -157,8 +170,13 @@ class Queryer[TTestCase: TestCase]:
                     raise
                 continue
             finally:
+                # Other threads may append to the provider's metrics concurrently
                 self.completion_metrics.extend(
-                    self.provider.completion_metrics[initial_completion_count:]
+                    metrics
+                    for metrics in self.provider.completion_metrics[
+                        initial_completion_count:
+                    ]
+                    if metrics.query_key_sha256 in (None, query_key_sha256)
                 )
 
             # Validate answer
@@ -285,10 +303,66 @@ class Queryer[TTestCase: TestCase]:
         key = normalized.query.key
         normalized.few_shot |= key in self.few_shot_test_cases
         normalized.verified |= key in self.verified_test_cases
+        deferred = getattr(self._deferred, "test_cases", None)
+        if deferred is not None:
+            deferred.append(normalized)
+            return normalized
         self.encountered_test_cases[key] = normalized
         logger.debug(f"Logged test case: {normalized.query.key_str}")
         return normalized
 
+    def query_all(self, test_cases: Sequence[TestCase]) -> list[TTestCase]:
+        """Query LLM for multiple independent test cases.
+
+        Up to concurrency queries are run at once. Test cases sharing a query are run
+        in turn by one worker, so that repeats are answered from the first. Test cases
+        are logged as encountered in the order provided, regardless of the order in
+        which their queries complete. Cached responses of the operation are prefetched
+        before any are looked up.
+
+        Arguments:
+            test_cases: test cases containing queries for LLM
+        Returns:
+            test cases including LLM's answers, in the order provided
+        """
+        if self._cache is not None and len(test_cases) > 1:
+            self._cache.prefetch()
+        if self.concurrency == 1 or len(test_cases) < 2:
+            return [self(test_case) for test_case in test_cases]
+
+        # Group test cases by query
+        idxs_by_key: dict[tuple, list[int]] = {}
+        for idx, test_case in enumerate(test_cases):
+            idxs_by_key.setdefault(test_case.query.key, []).append(idx)
+
+        # Query each group in a worker, deferring logging of encountered test cases
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self._query_deferred, [test_cases[idx] for idx in idxs])
+                for idxs in idxs_by_key.values()
+            ]
+            results: dict[int, tuple[TTestCase, list[TTestCase]]] = {}
+            errors: dict[int, BaseException] = {}
+            for idxs, future in zip(idxs_by_key.values(), futures, strict=True):
+                group_results, error = future.result()
+                results.update(zip(idxs, group_results, strict=False))
+                if error is not None:
+                    errors[idxs[len(group_results)]] = error
+
+        # Log encountered test cases in order, stopping where a query failed
+        answered_test_cases = []
+        for idx in range(len(test_cases)):
+            if idx in errors:
+                raise errors[idx]
+            answered_test_case, encountered_test_cases = results[idx]
+            for encountered_test_case in encountered_test_cases:
+                self.encountered_test_cases[encountered_test_case.query.key] = (
+                    encountered_test_case
+                )
+                logger.debug(f"Logged test case: {encountered_test_case.query.key_str}")
+            answered_test_cases.append(answered_test_case)
+        return answered_test_cases
+
     def store_answered_test_case(self, test_case: TestCase) -> TTestCase:
         """Log an answered test case and store its response under this queryer.
 
@@ -424,6 +498,29 @@ class Queryer[TTestCase: TestCase]:
             existing.verified |= normalized.verified
         return verified_test_cases_by_query
 
+    def _query_deferred(
+        self, test_cases: list[TestCase]
+    ) -> tuple[list[tuple[TTestCase, list[TTestCase]]], BaseException | None]:
+        """Query LLM in turn, deferring logging of encountered test cases.
+
+        Arguments:
+            test_cases: test cases containing queries for LLM
+        Returns:
+            answered test case and test cases encountered while answering it, for each
+            test case answered, and the error that stopped querying, if any
+        """
+        results: list[tuple[TTestCase, list[TTestCase]]] = []
+        try:
+            for test_case in test_cases:
+                self._deferred.test_cases = []
+                answered_test_case = self(test_case)
+                results.append((answered_test_case, self._deferred.test_cases))
+        except Exception as exc:  # noqa: BLE001
+            return results, exc
+        finally:
+            self._deferred.test_cases = None
+        return results, None
+
     @staticmethod
     def _format_validation_errors(exc: ValidationError) -> str:
         """Format validation errors for logging.
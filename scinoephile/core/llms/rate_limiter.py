@@ -0,0 +1,234 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Request scheduling shared by LLM providers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+
+__all__ = [
+    "RateLimiter",
+    "get_backoff_seconds",
+    "get_retry_after_seconds",
+    "get_shared_rate_limiter",
+]
+
+_shared_rate_limiters: dict[tuple[str, float | None, float | None], RateLimiter] = {}
+"""Rate limiters shared by providers, keyed by endpoint and limits."""
+
+_shared_rate_limiters_lock = Lock()
+"""Lock guarding construction of shared rate limiters."""
+
+
+class RateLimiter:
+    """Token-bucket limits on LLM requests and tokens per minute.
+
+    One limiter may be shared by many providers and threads. Each request waits for
+    capacity in both buckets and for any pause requested by the server, such as
+    through a Retry-After header. Token counts are estimated before each request
+    and settled once the provider reports actual usage.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        *,
+        clock: Callable[[], float] = monotonic,
+        sleep_fn: Callable[[float], None] = sleep,
+    ):
+        """Initialize.
+
+        Arguments:
+            requests_per_minute: maximum requests per minute; None for no limit
+            tokens_per_minute: maximum tokens per minute; None for no limit
+            clock: monotonic clock returning seconds
+            sleep_fn: function used to wait for capacity
+        Raises:
+            ValueError: if a limit is not positive
+        """
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive.")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive.")
+        self.requests_per_minute = requests_per_minute
+        """Maximum requests per minute, if limited."""
+        self.tokens_per_minute = tokens_per_minute
+        """Maximum tokens per minute, if limited."""
+        self._clock = clock
+        self._sleep_fn = sleep_fn
+        self._lock = Lock()
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._paused_until = clock()
+        self._updated = self._paused_until
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Wait until a request expected to use a number of tokens may be sent.
+
+        A request expected to use more tokens than the per-minute limit waits for a
+        full bucket rather than forever.
+
+        Arguments:
+            tokens: estimated tokens used by the request
+        Returns:
+            seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._try_acquire(tokens)
+            if delay <= 0:
+                return waited
+            self._sleep_fn(delay)
+            waited += delay
+
+    def pause(self, seconds: float):
+        """Hold all requests for a number of seconds.
+
+        Arguments:
+            seconds: seconds from now before requests may resume
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int | None):
+        """Correct the token bucket once a request's actual usage is known.
+
+        Arguments:
+            estimated_tokens: tokens reserved when the request was acquired
+            actual_tokens: tokens reported by the provider; None to keep estimate
+        """
+        if self.tokens_per_minute is None or actual_tokens is None:
+            return
+        with self._lock:
+            self._refill()
+            self._available_tokens -= actual_tokens - estimated_tokens
+
+    def _refill(self):
+        """Refill both buckets for the time elapsed since the last update."""
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        if self.requests_per_minute is not None:
+            self._available_requests = min(
+                self.requests_per_minute,
+                self._available_requests + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute is not None:
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Reserve capacity for one request if available.
+
+        Arguments:
+            tokens: estimated tokens used by the request
+        Returns:
+            seconds to wait before trying again, or 0 if capacity was reserved
+        """
+        self._refill()
+        delay = self._paused_until - self._updated
+        if self.requests_per_minute is not None and self._available_requests < 1:
+            delay = max(
+                delay, (1 - self._available_requests) * 60 / self.requests_per_minute
+            )
+        if self.tokens_per_minute is not None:
+            needed = min(tokens, self.tokens_per_minute)
+            if self._available_tokens < needed:
+                delay = max(
+                    delay,
+                    (needed - self._available_tokens) * 60 / self.tokens_per_minute,
+                )
+        if delay > 0:
+            return delay
+        if self.requests_per_minute is not None:
+            self._available_requests -= 1
+        if self.tokens_per_minute is not None:
+            self._available_tokens -= tokens
+        return 0.0
+
+
+def get_backoff_seconds(
+    retry: int,
+    retry_after_seconds: float | None = None,
+    *,
+    base_seconds: float = 1.0,
+    max_seconds: float = 60.0,
+) -> float:
+    """Get the delay before retrying a failed request.
+
+    Without a server-requested delay, uses exponential backoff with full jitter.
+    With one, waits that long plus up to base_seconds of jitter, so that clients
+    told to wait the same time do not all retry at once.
+
+    Arguments:
+        retry: zero-based retry number
+        retry_after_seconds: delay requested by the server, if any
+        base_seconds: delay scale of the first retry
+        max_seconds: maximum delay
+    Returns:
+        seconds to wait before retrying
+    """
+    if retry_after_seconds is not None:
+        return min(max_seconds, retry_after_seconds + uniform(0, base_seconds))
+    return uniform(0, min(max_seconds, base_seconds * 2**retry))
+
+
+def get_retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Get the delay requested by a server's retry headers.
+
+    Arguments:
+        headers: HTTP response headers
+    Returns:
+        requested delay in seconds, if present and valid
+    """
+    lower_headers = {key.lower(): value for key, value in headers.items()}
+    if (retry_after_ms := lower_headers.get("retry-after-ms")) is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+    if (retry_after := lower_headers.get("retry-after")) is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def get_shared_rate_limiter(
+    key: str,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> RateLimiter:
+    """Get the rate limiter shared by all providers of one endpoint.
+
+    Arguments:
+        key: identifier of the endpoint and model whose limits are shared
+        requests_per_minute: maximum requests per minute; None for no limit
+        tokens_per_minute: maximum tokens per minute; None for no limit
+    Returns:
+        shared rate limiter
+    """
+    limiter_key = (key, requests_per_minute, tokens_per_minute)
+    with _shared_rate_limiters_lock:
+        rate_limiter = _shared_rate_limiters.get(limiter_key)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _shared_rate_limiters[limiter_key] = rate_limiter
+        return rate_limiter
@@ -11,16 +11,24 @@ Package hierarchy (modules may import from any above):
 from __future__ import annotations
 
 from .comparison import are_series_one_to_one
-from .groups import SyncGroup, get_sync_groups, get_sync_groups_string
+from .groups import SyncGroup, SyncGroupEngine, get_sync_groups, get_sync_groups_string
 from .offsets import SyncOffsetDatum, SyncOffsetStats, get_sync_offset_stats
-from .overlap import get_overlap_string, get_sync_overlap_matrix
+from .overlap import (
+    SparseSyncOverlap,
+    get_overlap_string,
+    get_sparse_sync_overlap,
+    get_sync_overlap_matrix,
+)
 
 __all__ = [
+    "SparseSyncOverlap",
     "SyncGroup",
+    "SyncGroupEngine",
     "SyncOffsetDatum",
     "SyncOffsetStats",
     "are_series_one_to_one",
     "get_overlap_string",
+    "get_sparse_sync_overlap",
     "get_sync_groups",
     "get_sync_groups_string",
     "get_sync_offset_stats",
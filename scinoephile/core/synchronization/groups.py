@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from logging import getLogger
+from enum import StrEnum
+from logging import DEBUG, getLogger
 from pprint import pformat
 
 import numpy as np
@@ -12,9 +13,14 @@ import numpy as np
 from scinoephile.core.exceptions import ScinoephileError
 from scinoephile.core.subtitles import Series
 
-from .overlap import get_overlap_string, get_sync_overlap_matrix
+from .overlap import (
+    SparseSyncOverlap,
+    get_overlap_string,
+    get_sparse_sync_overlap,
+    get_sync_overlap_matrix,
+)
 
-__all__ = ["SyncGroup", "get_sync_groups", "get_sync_groups_string"]
+__all__ = ["SyncGroup", "SyncGroupEngine", "get_sync_groups", "get_sync_groups_string"]
 
 logger = getLogger(__name__)
 
@@ -22,7 +28,21 @@ SyncGroup = tuple[list[int], list[int]]
 """Group of subtitles; items are indexes in first and second series, respectively."""
 
 
-def get_sync_groups(one: Series, two: Series, cutoff: float = 0.16) -> list[SyncGroup]:
+class SyncGroupEngine(StrEnum):
+    """Engines used to derive sync groups."""
+
+    DENSE = "dense"
+    """Prune a copy of the full overlap matrix at each cutoff."""
+    SPARSE = "sparse"
+    """Prune only the overlaps that may survive, stored in sparse format."""
+
+
+def get_sync_groups(
+    one: Series,
+    two: Series,
+    cutoff: float = 0.16,
+    engine: SyncGroupEngine = SyncGroupEngine.SPARSE,
+) -> list[SyncGroup]:
     """Distribute subtitles from two series into sync groups based on their overlap.
 
     Subtitles are grouped based on the overlap between them. Subtitles are treated as
@@ -41,10 +61,16 @@ def get_sync_groups(one: Series, two: Series, cutoff: float = 0.16) -> list[Sync
     bound; if a subtitle in series two overlaps less than this amount with a subtitle
     in series one, it is included without a partner.
 
+    The sparse engine yields the same sync groups as the dense engine, but stores only
+    the overlaps that may survive pruning at the initial cutoff, and skips grouping at
+    any cutoff whose pruned overlaps are unchanged from the previous attempt. Since
+    pruning is not monotonic in the cutoff, each cutoff is still attempted in turn.
+
     Arguments:
         one: First series
         two: Second series
         cutoff: Initial overlap cutoff used to adjust overlap matrix
+        engine: Engine used to derive sync groups
     Returns:
         List of sync groups, each of which is a list of two lists of subtitle indexes,
         the first list corresponding to subtitles in series one and the second list
@@ -55,6 +81,9 @@ def get_sync_groups(one: Series, two: Series, cutoff: float = 0.16) -> list[Sync
     if len(two) == 0:
         return [([i], []) for i in range(len(one))]
 
+    if engine == SyncGroupEngine.SPARSE:
+        return _get_sync_groups_sparse(one, two, cutoff)
+
     overlap = get_sync_overlap_matrix(one, two)
     logger.debug(f"OVERLAP:\n{get_overlap_string(overlap)}")
 
@@ -66,12 +95,7 @@ def get_sync_groups(one: Series, two: Series, cutoff: float = 0.16) -> list[Sync
         except ScinoephileError:
             cutoff += 0.01
             if cutoff > max_cutoff:
-                raise ScinoephileError(
-                    f"Failed to compute sync groups: cutoff exceeded {max_cutoff}. "
-                    f"Final cutoff: {cutoff:.2f}. "
-                    f"Overlap matrix shape: {overlap.shape}. "
-                    f"This may indicate malformed or incompatible subtitle timing."
-                )
+                raise _get_max_cutoff_error(max_cutoff, cutoff, overlap.shape)
             continue
         break
 
@@ -97,21 +121,19 @@ def get_sync_groups_string(sync_groups: list[SyncGroup]) -> str:
 
 
 def _compare_sync_groups(  # noqa: PLR0912
-    first: SyncGroup, second: SyncGroup
+    first: tuple[int | None, int | None], second: tuple[int | None, int | None]
 ) -> int | None:
     """Compare two sync groups.
 
     Arguments:
-        first: First sync group
-        second: Second sync group
+        first: minimum subtitle indexes in series one and two of first sync group
+        second: minimum subtitle indexes in series one and two of second sync group
     Returns:
         -1 if first is less than second, 0 if they are equal, 1 if first is greater,
         and None if they cannot be compared
     """
-    first_min_one = min(first[0]) if first[0] else None
-    first_min_two = min(first[1]) if first[1] else None
-    second_min_one = min(second[0]) if second[0] else None
-    second_min_two = min(second[1]) if second[1] else None
+    first_min_one, first_min_two = first
+    second_min_one, second_min_two = second
     first_order = None
     second_order = None
     if first_min_one is not None and second_min_one is not None:
@@ -173,6 +195,39 @@ def _compare_sync_groups_by_timing(
     return 0
 
 
+def _get_max_cutoff_error(
+    max_cutoff: float, cutoff: float, shape: tuple[int, ...]
+) -> ScinoephileError:
+    """Get error raised when no cutoff yields valid sync groups.
+
+    Arguments:
+        max_cutoff: maximum cutoff attempted
+        cutoff: final cutoff reached
+        shape: shape of overlap matrix
+    Returns:
+        error describing the failure
+    """
+    return ScinoephileError(
+        f"Failed to compute sync groups: cutoff exceeded {max_cutoff}. "
+        f"Final cutoff: {cutoff:.2f}. "
+        f"Overlap matrix shape: {shape}. "
+        f"This may indicate malformed or incompatible subtitle timing."
+    )
+
+
+def _get_sync_group_minimums(sync_group: SyncGroup) -> tuple[int | None, int | None]:
+    """Get the minimum subtitle indexes of a sync group.
+
+    Arguments:
+        sync_group: Sync group
+    Returns:
+        minimum subtitle indexes in series one and two, or None where empty
+    """
+    min_one = min(sync_group[0]) if sync_group[0] else None
+    min_two = min(sync_group[1]) if sync_group[1] else None
+    return min_one, min_two
+
+
 def _get_sync_group_timing(
     one: Series, two: Series, sync_group: SyncGroup
 ) -> tuple[int, int]:
@@ -196,7 +251,7 @@ def _get_sync_group_timing(
     )
 
 
-def _get_sync_groups(  # noqa: PLR0912, PLR0915
+def _get_sync_groups(
     one: Series, two: Series, overlap: np.ndarray, cutoff: float
 ) -> list[SyncGroup]:
     """Build sync groups from a filtered overlap matrix.
@@ -209,8 +264,6 @@ def _get_sync_groups(  # noqa: PLR0912, PLR0915
     Returns:
         list of sync groups derived from the overlap matrix
     """
-    sync_groups = []
-
     for i in range(len(one)):
         scale = np.max(overlap[i])
         if scale == 0:
@@ -227,24 +280,52 @@ def _get_sync_groups(  # noqa: PLR0912, PLR0915
 
     logger.debug(f"OVERLAP ({cutoff:.2f}):\n{get_overlap_string(overlap)}")
 
-    available_is = set(range(len(one)))
-    available_js = set(range(len(two)))
-
     nonzero = np.argwhere(overlap)
 
-    js_that_match_each_i = {}
-    for i in range(len(one)):
-        js_that_match_each_i[i] = [
-            int(j) for j in sorted(nonzero[nonzero[:, 0] == i, 1])
-        ]
+    js_that_match_each_i = [
+        [int(j) for j in sorted(nonzero[nonzero[:, 0] == i, 1])]
+        for i in range(len(one))
+    ]
+    is_that_match_each_j = [
+        [int(i) for i in sorted(nonzero[nonzero[:, 1] == j, 0])]
+        for j in range(len(two))
+    ]
+
+    sync_groups = _get_sync_groups_from_matches(
+        one, two, js_that_match_each_i, is_that_match_each_j
+    )
+
+    logger.info(f"OVERLAP ({cutoff:.2f}):\n{get_overlap_string(overlap)}")
+
+    return sync_groups
 
-    is_that_match_each_j = {}
-    for j in range(len(two)):
-        is_that_match_each_j[j] = [
-            int(i) for i in sorted(nonzero[nonzero[:, 1] == j, 0])
-        ]
 
-    for i, js_that_match_this_i in js_that_match_each_i.items():
+def _get_sync_groups_from_matches(  # noqa: PLR0912
+    one: Series,
+    two: Series,
+    js_that_match_each_i: list[list[int]],
+    is_that_match_each_j: list[list[int]],
+) -> list[SyncGroup]:
+    """Build sync groups from the nonzero cells of a pruned overlap matrix.
+
+    Arguments:
+        one: first subtitle series
+        two: second subtitle series
+        js_that_match_each_i: sorted indexes in series two matching each subtitle in
+          series one
+        is_that_match_each_j: sorted indexes in series one matching each subtitle in
+          series two
+    Returns:
+        list of sync groups
+    Raises:
+        ScinoephileError: if the matches cannot be cleanly assigned to sync groups
+    """
+    sync_groups = []
+
+    available_is = set(range(len(one)))
+    available_js = set(range(len(two)))
+
+    for i, js_that_match_this_i in enumerate(js_that_match_each_i):
         if i not in available_is:
             continue
 
@@ -296,11 +377,75 @@ def _get_sync_groups(  # noqa: PLR0912, PLR0915
         sync_groups.extend([([], [j])])
 
     # Sort sync groups by indexes, falling back to timing when needed
-    sync_groups = _sort_sync_groups(one, two, sync_groups)
+    return _sort_sync_groups(one, two, sync_groups)
 
-    logger.info(f"OVERLAP ({cutoff:.2f}):\n{get_overlap_string(overlap)}")
 
-    return sync_groups
+def _get_sync_groups_sparse(one: Series, two: Series, cutoff: float) -> list[SyncGroup]:
+    """Distribute subtitles into sync groups using a sparse overlap.
+
+    Arguments:
+        one: first subtitle series
+        two: second subtitle series
+        cutoff: initial overlap cutoff used when pruning overlap values
+    Returns:
+        list of sync groups, identical to those of the dense engine
+    """
+    overlap = get_sparse_sync_overlap(one, two, cutoff)
+    rows = overlap.rows
+    logger.debug(f"OVERLAP: {len(overlap.data)} cells of {overlap.shape}")
+
+    max_cutoff = 1.0
+    previous_keep = None
+    while True:
+        # Prune overlap; grouping is deterministic, so unchanged cells fail again
+        keep = _prune_sparse_sync_overlap(overlap, rows, cutoff)
+        if previous_keep is None or not np.array_equal(keep, previous_keep):
+            previous_keep = keep
+            if logger.isEnabledFor(DEBUG):
+                pruned = overlap.toarray()
+                pruned[rows[~keep], overlap.indices[~keep]] = 0
+                logger.debug(f"OVERLAP ({cutoff:.2f}):\n{get_overlap_string(pruned)}")
+
+            js_that_match_each_i: list[list[int]] = [[] for _ in range(len(one))]
+            is_that_match_each_j: list[list[int]] = [[] for _ in range(len(two))]
+            for i, j in zip(
+                rows[keep].tolist(), overlap.indices[keep].tolist(), strict=True
+            ):
+                js_that_match_each_i[i].append(j)
+                is_that_match_each_j[j].append(i)
+            try:
+                return _get_sync_groups_from_matches(
+                    one, two, js_that_match_each_i, is_that_match_each_j
+                )
+            except ScinoephileError:
+                pass
+
+        cutoff += 0.01
+        if cutoff > max_cutoff:
+            raise _get_max_cutoff_error(max_cutoff, cutoff, overlap.shape)
+
+
+def _prune_sparse_sync_overlap(
+    overlap: SparseSyncOverlap, rows: np.ndarray, cutoff: float
+) -> np.ndarray:
+    """Prune a sparse overlap by row and then by column.
+
+    Arguments:
+        overlap: sparse overlap between series
+        rows: row index of each stored cell
+        cutoff: overlap cutoff used when pruning values
+    Returns:
+        mask of stored cells that survive pruning
+    """
+    data = overlap.data
+    keep = ~(data / overlap.row_max[rows] < cutoff)
+
+    cols = overlap.indices[keep]
+    col_max = np.zeros(overlap.shape[1])
+    np.maximum.at(col_max, cols, data[keep])
+    keep[keep] = ~(data[keep] / col_max[cols] < cutoff)
+
+    return keep
 
 
 def _sort_sync_groups(
@@ -319,23 +464,46 @@ def _sort_sync_groups(
         Sorted sync groups
     """
     sorted_groups = []
+    sorted_minimums = []
 
+    # Leading groups with increasing indexes in series one compare greater than all
+    # sorted groups unless their indexes in series two are out of order
+    max_min_one = -1
+    max_min_two = -1
     for group in sync_groups:
+        min_one, min_two = minimums = _get_sync_group_minimums(group)
+        if min_one is None or min_one <= max_min_one:
+            break
+        if min_two is not None:
+            if min_two <= max_min_two:
+                raise ScinoephileError(
+                    "Unexpected comparison result between sync groups"
+                )
+            max_min_two = min_two
+        max_min_one = min_one
+        sorted_groups.append(group)
+        sorted_minimums.append(minimums)
+
+    # Insert remaining groups before the first sorted group they precede
+    for group in sync_groups[len(sorted_groups) :]:
+        minimums = _get_sync_group_minimums(group)
         inserted = False
         for i in range(len(sorted_groups) + 1):
             # Try inserting at position i
             if i == len(sorted_groups):
                 sorted_groups.append(group)
+                sorted_minimums.append(minimums)
                 inserted = True
                 break
 
-            result = _compare_sync_groups(group, sorted_groups[i])
+            result = _compare_sync_groups(minimums, sorted_minimums[i])
             if result is None:
                 result = _compare_sync_groups_by_timing(
                     one, two, group, sorted_groups[i]
                 )
             if result < 0:
                 sorted_groups.insert(i, group)
+                sorted_minimums.insert(i, minimums)
                 inserted = True
                 break
         if not inserted:
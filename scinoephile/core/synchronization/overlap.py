@@ -4,12 +4,65 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 
 from scinoephile.core.exceptions import ScinoephileError
 from scinoephile.core.subtitles import Series
 
-__all__ = ["get_overlap_string", "get_sync_overlap_matrix"]
+__all__ = [
+    "SparseSyncOverlap",
+    "get_overlap_string",
+    "get_sparse_sync_overlap",
+    "get_sync_overlap_matrix",
+]
+
+_MIN_OVERLAP = float(np.nextafter(0.0, 1.0))
+"""Smallest positive overlap; anything below this underflows to zero."""
+
+_WINDOW_MARGIN = 1e-6
+"""Relative margin added to sweep windows to absorb floating-point error."""
+
+
+@dataclass(frozen=True)
+class SparseSyncOverlap:
+    """Overlap between two series, stored in compressed sparse row format.
+
+    Only cells that may survive pruning at or above the cutoff used to build the
+    overlap are stored. Values of stored cells are identical to the corresponding
+    cells of the dense overlap matrix.
+    """
+
+    shape: tuple[int, int]
+    """Number of subtitles in series one and series two."""
+
+    indptr: np.ndarray
+    """Offsets of each row's cells within indices and data."""
+
+    indices: np.ndarray
+    """Column index of each stored cell, ascending within each row."""
+
+    data: np.ndarray
+    """Overlap value of each stored cell."""
+
+    row_max: np.ndarray
+    """Maximum overlap of each row across all columns, including unstored cells."""
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row index of each stored cell."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def toarray(self) -> np.ndarray:
+        """Get dense overlap matrix containing only the stored cells.
+
+        Returns:
+            two-dimensional array of stored overlaps, with zeros elsewhere
+        """
+        overlap = np.zeros(self.shape)
+        overlap[self.rows, self.indices] = self.data
+        return overlap
 
 
 def get_overlap_string(overlap: np.ndarray) -> str:
@@ -39,6 +92,87 @@ def get_overlap_string(overlap: np.ndarray) -> str:
     return "\n".join(lines)
 
 
+def get_sparse_sync_overlap(
+    one: Series, two: Series, cutoff: float = 0.0
+) -> SparseSyncOverlap:
+    """Quantify the overlap between two series, storing only cells that may be kept.
+
+    Uses a sweep over the subtitles of series two sorted by midpoint, so that only
+    overlaps within a window of each subtitle in series one are evaluated. Each window
+    is bounded using the widest subtitle in series two, so the stored cells are a
+    superset of those whose overlap divided by their row's maximum is at least
+    cutoff; the remaining cells are zeroed by row pruning at any cutoff at or above
+    this value, and are not stored.
+
+    Arguments:
+        one: First series
+        two: Second series
+        cutoff: Lowest overlap cutoff at which the overlap will be pruned
+    Returns:
+        sparse overlap whose stored values match get_sync_overlap_matrix
+    Raises:
+        ScinoephileError: if any subtitle has zero or negative duration
+    """
+    one_mu, one_sigma = _get_sync_gaussians(one, "one")
+    two_mu, two_sigma = _get_sync_gaussians(two, "two")
+    n_one = len(one_mu)
+    n_two = len(two_mu)
+    if n_one == 0 or n_two == 0:
+        return SparseSyncOverlap(
+            shape=(n_one, n_two),
+            indptr=np.zeros(n_one + 1, dtype=np.int64),
+            indices=np.zeros(0, dtype=np.int64),
+            data=np.zeros(0),
+            row_max=np.zeros(n_one),
+        )
+
+    # Sort series two by midpoint for the sweep
+    order = np.argsort(two_mu, kind="stable")
+    sorted_mu = two_mu[order]
+    max_two_sigma_sq = float(np.max(two_sigma)) ** 2
+
+    # Lower bound each row's maximum using the nearest subtitles by midpoint
+    nearest = np.searchsorted(sorted_mu, one_mu)
+    left = order[np.clip(nearest - 1, 0, n_two - 1)]
+    right = order[np.clip(nearest, 0, n_two - 1)]
+    lower_bound = np.maximum(
+        _get_overlaps(one_mu, one_sigma, two_mu[left], two_sigma[left]),
+        _get_overlaps(one_mu, one_sigma, two_mu[right], two_sigma[right]),
+    )
+
+    # Find exact maximum of each row within window that may exceed lower bound
+    rows, cols = _get_window_cells(
+        one_mu, one_sigma, sorted_mu, order, max_two_sigma_sq, lower_bound
+    )
+    values = _get_overlaps(one_mu[rows], one_sigma[rows], two_mu[cols], two_sigma[cols])
+    row_max = np.zeros(n_one)
+    np.maximum.at(row_max, rows, values)
+
+    # Collect cells within window that may survive row pruning at cutoff
+    rows, cols = _get_window_cells(
+        one_mu, one_sigma, sorted_mu, order, max_two_sigma_sq, cutoff * row_max
+    )
+    values = _get_overlaps(one_mu[rows], one_sigma[rows], two_mu[cols], two_sigma[cols])
+    keep = values > 0
+    keep[keep] = ~(values[keep] / row_max[rows[keep]] < cutoff)
+    rows = rows[keep]
+    cols = cols[keep]
+    values = values[keep]
+
+    # Compress rows, with columns ascending within each row
+    cell_order = np.lexsort((cols, rows))
+    indptr = np.zeros(n_one + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_one), out=indptr[1:])
+
+    return SparseSyncOverlap(
+        shape=(n_one, n_two),
+        indptr=indptr,
+        indices=cols[cell_order],
+        data=values[cell_order],
+        row_max=row_max,
+    )
+
+
 def get_sync_overlap_matrix(one: Series, two: Series) -> np.ndarray:
     """Quantify the overlap between two series and compile the results in a matrix.
 
@@ -53,33 +187,96 @@ def get_sync_overlap_matrix(one: Series, two: Series) -> np.ndarray:
     Raises:
         ScinoephileError: if any subtitle has zero or negative duration
     """
-    # Validate subtitle durations in series one
-    for i, event in enumerate(one.events):
-        duration = event.end - event.start
-        if duration <= 0:
-            raise ScinoephileError(
-                f"Subtitle {i + 1} in series one has invalid duration "
-                f"(start={event.start}, end={event.end}, duration={duration}). "
-                f"Subtitles must have positive duration for synchronization."
-            )
+    one_mu, one_sigma = _get_sync_gaussians(one, "one")
+    two_mu, two_sigma = _get_sync_gaussians(two, "two")
 
-    # Validate subtitle durations in series two
-    for i, event in enumerate(two.events):
+    overlap = _get_overlaps(
+        one_mu[:, np.newaxis],
+        one_sigma[:, np.newaxis],
+        two_mu[np.newaxis, :],
+        two_sigma[np.newaxis, :],
+    )
+
+    return overlap
+
+
+def _get_overlaps(
+    one_mu: np.ndarray, one_sigma: np.ndarray, two_mu: np.ndarray, two_sigma: np.ndarray
+) -> np.ndarray:
+    """Get Gaussian overlaps between pairs of subtitles.
+
+    Arguments:
+        one_mu: midpoints of subtitles in series one
+        one_sigma: standard deviations of subtitles in series one
+        two_mu: midpoints of subtitles in series two
+        two_sigma: standard deviations of subtitles in series two
+    Returns:
+        overlaps, broadcast across the inputs
+    """
+    mu_diff_sq = (one_mu - two_mu) ** 2
+    sigma_sq_sum = one_sigma**2 + two_sigma**2
+    return np.exp(-mu_diff_sq / (2 * sigma_sq_sum))
+
+
+def _get_sync_gaussians(series: Series, name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Get Gaussian midpoints and standard deviations of the subtitles in a series.
+
+    Arguments:
+        series: series whose subtitles to describe
+        name: name of series used in error messages
+    Returns:
+        midpoints and standard deviations of subtitles
+    Raises:
+        ScinoephileError: if any subtitle has zero or negative duration
+    """
+    for i, event in enumerate(series.events):
         duration = event.end - event.start
         if duration <= 0:
             raise ScinoephileError(
-                f"Subtitle {i + 1} in series two has invalid duration "
+                f"Subtitle {i + 1} in series {name} has invalid duration "
                 f"(start={event.start}, end={event.end}, duration={duration}). "
                 f"Subtitles must have positive duration for synchronization."
             )
 
-    one_mu = np.array([e.start + (e.end - e.start) / 2 for e in one])
-    one_sigma = np.array([(e.end - e.start) / 4 for e in one])
-    two_mu = np.array([e.start + (e.end - e.start) / 2 for e in two])
-    two_sigma = np.array([(e.end - e.start) / 4 for e in two])
+    mu = np.array([e.start + (e.end - e.start) / 2 for e in series], dtype=float)
+    sigma = np.array([(e.end - e.start) / 4 for e in series], dtype=float)
+    return mu, sigma
 
-    mu_diff_sq = (one_mu[:, np.newaxis] - two_mu[np.newaxis, :]) ** 2
-    sigma_sq_sum = one_sigma[:, np.newaxis] ** 2 + two_sigma[np.newaxis, :] ** 2
-    overlap = np.exp(-mu_diff_sq / (2 * sigma_sq_sum))
 
-    return overlap
+def _get_window_cells(
+    one_mu: np.ndarray,
+    one_sigma: np.ndarray,
+    sorted_mu: np.ndarray,
+    order: np.ndarray,
+    max_two_sigma_sq: float,
+    thresholds: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get cells whose overlap may reach a per-row threshold.
+
+    An overlap of at least threshold t requires that the squared difference between
+    midpoints be no more than -2 ln(t) times the sum of squared standard deviations,
+    which is bounded using the widest subtitle in series two.
+
+    Arguments:
+        one_mu: midpoints of subtitles in series one
+        one_sigma: standard deviations of subtitles in series one
+        sorted_mu: midpoints of subtitles in series two, sorted
+        order: indexes of subtitles in series two in sorted order
+        max_two_sigma_sq: largest squared standard deviation in series two
+        thresholds: minimum overlap of interest for each row
+    Returns:
+        row and column indexes of cells within each row's window
+    """
+    thresholds = np.clip(thresholds, _MIN_OVERLAP, 1.0)
+    radii = np.sqrt(-2 * np.log(thresholds) * (one_sigma**2 + max_two_sigma_sq))
+    radii = radii * (1 + _WINDOW_MARGIN) + _WINDOW_MARGIN
+    starts = np.searchsorted(sorted_mu, one_mu - radii, side="left")
+    ends = np.searchsorted(sorted_mu, one_mu + radii, side="right")
+
+    counts = ends - starts
+    rows = np.repeat(np.arange(len(one_mu)), counts)
+    offsets = np.arange(int(counts.sum())) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    cols = order[np.repeat(starts, counts) + offsets]
+    return rows, cols
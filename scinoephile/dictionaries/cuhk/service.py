@@ -27,6 +27,7 @@ class CuhkDictionaryService:
         database_path: Path | None = None,
         *,
         auto_build_missing: bool = False,
+        read_only: bool = False,
         cache_root_path: Path | None = None,
         scraper_kwargs: CuhkDictionaryScraperKwargs | None = None,
     ):
@@ -35,6 +36,7 @@ class CuhkDictionaryService:
         Arguments:
             database_path: SQLite database path
             auto_build_missing: build CUHK data automatically if missing
+            read_only: whether to query through pooled read-only connections
             cache_root_path: root directory beneath which to cache scrape artifacts
             scraper_kwargs: keyword arguments forwarded to CuhkDictionaryScraper
         """
@@ -44,7 +46,9 @@ class CuhkDictionaryService:
             )
         self.database_path = val_output_path(database_path, exist_ok=True)
         self.auto_build_missing = auto_build_missing
-        self.database = DictionarySqliteStore(database_path=self.database_path)
+        self.database = DictionarySqliteStore(
+            database_path=self.database_path, read_only=read_only
+        )
         resolved_scraper_kwargs = CuhkDictionaryScraperKwargs()
         if scraper_kwargs is not None:
             resolved_scraper_kwargs.update(scraper_kwargs)
@@ -5,18 +5,25 @@
 from __future__ import annotations
 
 from logging import getLogger
+from threading import Lock
 
 from scinoephile.core.dictionaries import DictionaryLookupResponse, DictionaryToolPrompt
 from scinoephile.core.dictionaries.serialization import dictionary_entry_to_dict
 from scinoephile.core.llms.tool import Tool
 from scinoephile.core.llms.tool_box import ToolBox
 
-from .lookup import lookup_dictionary_entries
+from .lookup import DictionaryLookupService
 
 __all__ = ["get_dictionary_tools", "lookup_dictionary"]
 logger = getLogger(__name__)
 """Module logger."""
 
+_lookup_services: dict[bool, DictionaryLookupService] = {}
+"""Lookup services shared by dictionary tool calls, keyed by auto_build_missing."""
+
+_lookup_services_lock = Lock()
+"""Lock guarding construction of shared lookup services."""
+
 
 def get_dictionary_tools(prompt: DictionaryToolPrompt) -> ToolBox:
     """Get dictionary tool definitions and handlers for LLM providers.
@@ -98,8 +105,8 @@ def lookup_dictionary(
         }
 
     try:
-        entries = lookup_dictionary_entries(
-            query=normalized_query, limit=10, auto_build_missing=auto_build_missing
+        entries = _get_lookup_service(auto_build_missing).lookup(
+            normalized_query, limit=10
         )
     except (FileNotFoundError, ValueError) as exc:
         logger.warning(f"Dictionary lookup failed: {exc}")
@@ -117,3 +124,19 @@ def lookup_dictionary(
         "result_count": len(entries),
         "entries": [dictionary_entry_to_dict(entry) for entry in entries],
     }
+
+
+def _get_lookup_service(auto_build_missing: bool) -> DictionaryLookupService:
+    """Get the lookup service shared by dictionary tool calls.
+
+    Arguments:
+        auto_build_missing: build database automatically if missing
+    Returns:
+        shared lookup service
+    """
+    with _lookup_services_lock:
+        if auto_build_missing not in _lookup_services:
+            _lookup_services[auto_build_missing] = DictionaryLookupService(
+                auto_build_missing=auto_build_missing
+            )
+        return _lookup_services[auto_build_missing]
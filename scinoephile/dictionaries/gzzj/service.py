@@ -28,6 +28,7 @@ class GzzjDictionaryService:
         *,
         source_json_path: Path | None = None,
         auto_build_missing: bool = False,
+        read_only: bool = False,
     ):
         """Initialize.
 
@@ -35,6 +36,7 @@ class GzzjDictionaryService:
             database_path: SQLite database path
             source_json_path: path to a manually downloaded `B01_資料.json` file
             auto_build_missing: build GZZJ data automatically if missing
+            read_only: whether to query through pooled read-only connections
         """
         if database_path is None:
             database_path = (
@@ -47,7 +49,9 @@ class GzzjDictionaryService:
         self.database_path = val_output_path(database_path, exist_ok=True)
         self.source_json_path = Path(source_json_path)
         self.auto_build_missing = auto_build_missing
-        self.database = DictionarySqliteStore(database_path=self.database_path)
+        self.database = DictionarySqliteStore(
+            database_path=self.database_path, read_only=read_only
+        )
         self.parser = GzzjDictionaryParser()
 
     def build(self, overwrite: bool = False) -> Path:
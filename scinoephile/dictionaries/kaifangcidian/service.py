@@ -29,6 +29,7 @@ class KaifangcidianDictionaryService:
         database_path: Path | None = None,
         *,
         auto_build_missing: bool = False,
+        read_only: bool = False,
         local_data_dir_path: Path | None = None,
         runtime_data_dir_path: Path | None = None,
     ):
@@ -37,6 +38,7 @@ class KaifangcidianDictionaryService:
         Arguments:
             database_path: SQLite database path
             auto_build_missing: build Kaifangcidian data automatically if missing
+            read_only: whether to query through pooled read-only connections
             local_data_dir_path: optional local canonical data directory override
             runtime_data_dir_path: optional runtime canonical data directory override
         """
@@ -49,7 +51,9 @@ class KaifangcidianDictionaryService:
             )
         self.database_path = val_output_path(database_path, exist_ok=True)
         self.auto_build_missing = auto_build_missing
-        self.database = DictionarySqliteStore(database_path=self.database_path)
+        self.database = DictionarySqliteStore(
+            database_path=self.database_path, read_only=read_only
+        )
         self.parser = KaifangcidianDictionaryParser()
         self.downloader = KaifangcidianDownloader()
 
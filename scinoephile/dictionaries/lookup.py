@@ -4,10 +4,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
 from typing import Literal
 
 from scinoephile.core.dictionaries import DictionaryDefinition, DictionaryEntry
+from scinoephile.core.paths import get_runtime_data_root_path
 
 from .cuhk import CuhkDictionaryService
 from .gzzj import GzzjDictionaryService
@@ -15,10 +19,23 @@ from .kaifangcidian import KaifangcidianDictionaryService
 from .unihan import UnihanDictionaryService
 from .wiktionary import WiktionaryDictionaryService
 
-__all__ = ["AVAILABLE_DICTIONARY_NAMES", "DictionaryName", "lookup_dictionary_entries"]
+__all__ = [
+    "AVAILABLE_DICTIONARY_NAMES",
+    "DictionaryLookupService",
+    "DictionaryName",
+    "lookup_dictionary_entries",
+]
 
 type DictionaryName = Literal["cuhk", "gzzj", "kaifangcidian", "unihan", "wiktionary"]
 
+type _DictionaryService = (
+    CuhkDictionaryService
+    | GzzjDictionaryService
+    | KaifangcidianDictionaryService
+    | UnihanDictionaryService
+    | WiktionaryDictionaryService
+)
+
 AVAILABLE_DICTIONARY_NAMES: tuple[DictionaryName, ...] = (
     "cuhk",
     "gzzj",
@@ -38,6 +55,153 @@ _DICTIONARY_SERVICES = {
 """Dictionary service classes keyed by selector."""
 
 
+class DictionaryLookupService:
+    """Long-lived lookup of many queries in one or more local dictionaries.
+
+    Keeps one service, with pooled read-only connections, per dictionary database;
+    searches the dictionaries concurrently; and memoizes merged entries of recent
+    queries. Services and memoized entries are discarded when the runtime data root
+    changes or any database file is added, removed, or rewritten.
+    """
+
+    def __init__(
+        self,
+        dictionaries: list[str] | tuple[str, ...] | None = None,
+        *,
+        database_path: Path | None = None,
+        auto_build_missing: bool = False,
+        cache_size: int = 1024,
+    ):
+        """Initialize.
+
+        Arguments:
+            dictionaries: dictionary selectors, or None for all available selectors
+            database_path: optional explicit database path for a single dictionary
+            auto_build_missing: build a missing dictionary if supported
+            cache_size: maximum number of queries whose merged entries to memoize
+        Raises:
+            ValueError: dictionaries, database_path, or cache_size were invalid
+        """
+        self.dictionary_names = _normalize_dictionary_names(dictionaries)
+        """Dictionaries to search."""
+        if database_path is not None and len(self.dictionary_names) != 1:
+            raise ValueError(
+                "database_path may only be used when searching a single dictionary"
+            )
+        if cache_size < 0:
+            raise ValueError("cache_size must be at least 0.")
+        self.database_path = database_path
+        """Optional explicit database path for a single dictionary."""
+        self.auto_build_missing = auto_build_missing
+        """Whether to build a missing dictionary if supported."""
+        self.cache_size = cache_size
+        """Maximum number of queries whose merged entries to memoize."""
+
+        self._cache: OrderedDict[tuple[str, int], list[DictionaryEntry]] = OrderedDict()
+        self._data_root_path: Path | None = None
+        self._database_identity: tuple[object, ...] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        if len(self.dictionary_names) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.dictionary_names),
+                thread_name_prefix="dictionary-lookup",
+            )
+        self._lock = Lock()
+        self._services: dict[DictionaryName, _DictionaryService] = {}
+
+    def close(self):
+        """Close pooled connections and stop lookup threads."""
+        with self._lock:
+            self._close_services()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def lookup(self, query: str, limit: int = 10) -> list[DictionaryEntry]:
+        """Search the configured dictionaries.
+
+        Arguments:
+            query: lookup query
+            limit: max results per dictionary
+        Returns:
+            merged dictionary entries
+        Raises:
+            FileNotFoundError: no requested databases were available
+            ValueError: query format could not be inferred
+        """
+        key = (query.strip(), limit)
+        with self._lock:
+            services, database_identity = self._get_services()
+            entries = self._cache.get(key)
+            if entries is not None:
+                self._cache.move_to_end(key)
+                return list(entries)
+
+        entries = _lookup_entries(
+            services, query=key[0], limit=limit, executor=self._executor
+        )
+
+        with self._lock:
+            if self.cache_size > 0 and self._database_identity == database_identity:
+                self._cache[key] = entries
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return list(entries)
+
+    def _close_services(self):
+        """Close the pooled connections of services and forget memoized entries."""
+        for service in self._services.values():
+            service.database.close()
+        self._services = {}
+        self._cache.clear()
+        self._data_root_path = None
+        self._database_identity = None
+
+    def _get_services(
+        self,
+    ) -> tuple[dict[DictionaryName, _DictionaryService], tuple[object, ...]]:
+        """Get current services, replacing them if any database has changed.
+
+        Must be called while holding the lock.
+
+        Returns:
+            services keyed by dictionary name, and identity of their databases
+        """
+        data_root_path = None
+        if self.database_path is None:
+            data_root_path = get_runtime_data_root_path(create=False)
+        if not self._services or data_root_path != self._data_root_path:
+            self._close_services()
+            self._services = {
+                dictionary_name: _DICTIONARY_SERVICES[dictionary_name](
+                    database_path=self.database_path,
+                    auto_build_missing=self.auto_build_missing,
+                    read_only=True,
+                )
+                for dictionary_name in self.dictionary_names
+            }
+            self._data_root_path = data_root_path
+
+        file_identity = tuple(
+            _get_file_identity(service.database_path)
+            for service in self._services.values()
+        )
+        if (
+            self._database_identity is None
+            or self._database_identity[0] != file_identity
+        ):
+            for service in self._services.values():
+                service.database.close()
+            schema_versions = tuple(
+                service.database.get_schema_version()
+                if service.database_path.exists()
+                else None
+                for service in self._services.values()
+            )
+            self._cache.clear()
+            self._database_identity = (file_identity, schema_versions)
+        return dict(self._services), self._database_identity
+
+
 def _dedupe_definitions(
     definitions: list[DictionaryDefinition],
 ) -> list[DictionaryDefinition]:
@@ -59,6 +223,84 @@ def _dedupe_definitions(
     return deduped
 
 
+def _get_file_identity(path: Path) -> tuple[int, int, int] | None:
+    """Get the identity of a file's current contents.
+
+    Arguments:
+        path: file path
+    Returns:
+        inode, modification time in nanoseconds, and size; None if missing
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _lookup_entries(
+    services: dict[DictionaryName, _DictionaryService],
+    *,
+    query: str,
+    limit: int,
+    executor: ThreadPoolExecutor | None = None,
+) -> list[DictionaryEntry]:
+    """Search dictionary services and merge their entries.
+
+    Arguments:
+        services: services keyed by dictionary name
+        query: lookup query
+        limit: max results per dictionary
+        executor: optional executor with which to search services concurrently
+    Returns:
+        merged dictionary entries
+    Raises:
+        FileNotFoundError: no requested databases were available
+    """
+    if executor is None:
+        results = {}
+        for dictionary_name, service in services.items():
+            try:
+                results[dictionary_name] = service.lookup(query=query, limit=limit)
+            except FileNotFoundError as exc:
+                results[dictionary_name] = exc
+    else:
+        futures = {
+            dictionary_name: executor.submit(service.lookup, query=query, limit=limit)
+            for dictionary_name, service in services.items()
+        }
+        results = {}
+        for dictionary_name, future in futures.items():
+            try:
+                results[dictionary_name] = future.result()
+            except FileNotFoundError as exc:
+                results[dictionary_name] = exc
+
+    entries: list[DictionaryEntry] = []
+    missing_dictionaries: list[DictionaryName] = []
+    aggregate_lookup = len(services) > 1
+    available_dictionary_count = 0
+    for dictionary_name, result in results.items():
+        if isinstance(result, FileNotFoundError):
+            if not aggregate_lookup:
+                raise result
+            missing_dictionaries.append(dictionary_name)
+            continue
+        entries.extend(result)
+        available_dictionary_count += 1
+
+    if entries or available_dictionary_count > 0:
+        return _merge_entries(entries)
+
+    if missing_dictionaries:
+        missing_display = ", ".join(sorted(missing_dictionaries))
+        raise FileNotFoundError(
+            "No searchable dictionary databases were found. Build one or more "
+            f"of: {missing_display}."
+        )
+    return []
+
+
 def _merge_entries(entries: list[DictionaryEntry]) -> list[DictionaryEntry]:
     """Merge duplicate entries while preserving definitions.
 
@@ -147,29 +389,10 @@ def lookup_dictionary_entries(
             "database_path may only be used when searching a single dictionary"
         )
 
-    entries: list[DictionaryEntry] = []
-    missing_dictionaries: list[DictionaryName] = []
-    aggregate_lookup = len(dictionary_names) > 1
-    available_dictionary_count = 0
-    for dictionary_name in dictionary_names:
-        service = _DICTIONARY_SERVICES[dictionary_name](
+    services = {
+        dictionary_name: _DICTIONARY_SERVICES[dictionary_name](
             database_path=database_path, auto_build_missing=auto_build_missing
         )
-        try:
-            entries.extend(service.lookup(query=query, limit=limit))
-            available_dictionary_count += 1
-        except FileNotFoundError:
-            if not aggregate_lookup:
-                raise
-            missing_dictionaries.append(dictionary_name)
-
-    if entries or available_dictionary_count > 0:
-        return _merge_entries(entries)
-
-    if missing_dictionaries:
-        missing_display = ", ".join(sorted(missing_dictionaries))
-        raise FileNotFoundError(
-            "No searchable dictionary databases were found. Build one or more "
-            f"of: {missing_display}."
-        )
-    return []
+        for dictionary_name in dictionary_names
+    }
+    return _lookup_entries(services, query=query, limit=limit)
@@ -34,6 +34,7 @@ class WiktionaryDictionaryService:
         database_path: Path | None = None,
         *,
         auto_build_missing: bool = False,
+        read_only: bool = False,
         local_data_dir_path: Path | None = None,
         runtime_data_dir_path: Path | None = None,
     ):
@@ -42,6 +43,7 @@ class WiktionaryDictionaryService:
         Arguments:
             database_path: SQLite database path
             auto_build_missing: build Wiktionary data automatically if missing
+            read_only: whether to query through pooled read-only connections
             local_data_dir_path: optional local canonical data directory override
             runtime_data_dir_path: optional runtime canonical data directory override
         """
@@ -56,7 +58,9 @@ class WiktionaryDictionaryService:
         """SQLite database path."""
         self.auto_build_missing = auto_build_missing
         """Whether to build Wiktionary data automatically when the DB is missing."""
-        self.database = DictionarySqliteStore(database_path=self.database_path)
+        self.database = DictionarySqliteStore(
+            database_path=self.database_path, read_only=read_only
+        )
         """SQLite store used for lookup and persistence."""
         self.parser = WiktionaryDictionaryParser()
         """Parser for Kaikki Wiktionary JSONL input."""
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from PIL import Image
 
@@ -14,7 +17,7 @@ from .colors import (
     get_grayscale_and_alpha_arrs,
 )
 
-__all__ = ["get_bboxes", "get_merged_bbox"]
+__all__ = ["get_bboxes", "get_bboxes_of_images", "get_merged_bbox"]
 
 
 def get_bboxes(img: Image.Image) -> list[Bbox]:  # noqa: PLR0912, PLR0915
@@ -34,19 +37,7 @@ def get_bboxes(img: Image.Image) -> list[Bbox]:  # noqa: PLR0912, PLR0915
     white_mask = get_fill_color_mask_arr(grayscale, alpha, fill_color)
 
     # Determine top and bottom of each line separated by whitespace
-    lines = []
-    line = None
-    for i, white_pixels in enumerate(np.sum(white_mask, axis=1)):
-        if white_pixels > 0:
-            if line is None:
-                line = [i, i + 1]
-            else:
-                line[1] = i + 1
-        elif line is not None:
-            lines.append(line)
-            line = None
-    if line is not None:
-        lines.append(line)
+    lines = _get_runs(white_mask.any(axis=1))
 
     min_line_gap = 5
     min_line_height = 30
@@ -120,34 +111,48 @@ def get_bboxes(img: Image.Image) -> list[Bbox]:  # noqa: PLR0912, PLR0915
     bboxes: list[Bbox] = []
     for y1, y2 in final_lines:
         line_mask = white_mask[y1:y2]
-        sections = []
-        section = None
-        for i, white_pixels in enumerate(np.sum(line_mask, axis=0)):
-            if white_pixels > 0:
-                if section is None:
-                    section = [i, i + 1]
-                else:
-                    section[1] = i + 1
-            elif section is not None:
-                sections.append(section)
-                section = None
-        if section is not None:
-            sections.append(section)
-
-        for x1, x2 in sections:
-            section_mask = line_mask[:, x1:x2]
-            white_pixels = np.sum(section_mask, axis=1)
-            if np.max(white_pixels) == 0:
-                continue
-            section_y1 = int(np.argmax(white_pixels > 0))
-            section_y2 = (
-                int(len(white_pixels) - np.argmax(white_pixels[::-1] > 0) - 1) + 1
-            )
+        sections = _get_runs(line_mask.any(axis=0))
+        if not sections:
+            continue
+
+        # Each section's rows containing white; columns between sections are empty
+        section_rows = np.logical_or.reduceat(
+            line_mask, [x1 for x1, _ in sections], axis=1
+        )
+        section_y1s = np.argmax(section_rows, axis=0)
+        section_y2s = len(section_rows) - np.argmax(section_rows[::-1], axis=0)
+        for (x1, x2), section_y1, section_y2 in zip(
+            sections, section_y1s.tolist(), section_y2s.tolist(), strict=True
+        ):
             bboxes.append(Bbox(x1=x1, x2=x2, y1=y1 + section_y1, y2=y1 + section_y2))
 
     return bboxes
 
 
+def get_bboxes_of_images(
+    imgs: Sequence[Image.Image], workers: int = 1
+) -> list[list[Bbox]]:
+    """Get bboxes surrounding the fill color interiors of characters in images.
+
+    Most of the work is in NumPy operations, which release the GIL, so images may
+    be analyzed on several threads.
+
+    Arguments:
+        imgs: subtitle images to analyze
+        workers: maximum number of images to analyze at once
+    Returns:
+        bboxes of each image, in input order
+    Raises:
+        ValueError: if workers is less than one
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    if workers == 1 or len(imgs) < 2:
+        return [get_bboxes(img) for img in imgs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(get_bboxes, imgs))
+
+
 def get_merged_bbox(bboxes: list[Bbox]) -> Bbox:
     """Get merged bbox from a list of bboxes.
 
@@ -162,3 +167,17 @@ def get_merged_bbox(bboxes: list[Bbox]) -> Bbox:
         y1=min(bbox.y1 for bbox in bboxes),
         y2=max(bbox.y2 for bbox in bboxes),
     )
+
+
+def _get_runs(occupied: np.ndarray) -> list[list[int]]:
+    """Get runs of consecutive occupied indexes.
+
+    Arguments:
+        occupied: one-dimensional boolean array
+    Returns:
+        start and exclusive end of each run
+    """
+    padded = np.zeros(len(occupied) + 2, dtype=np.bool_)
+    padded[1:-1] = occupied
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return edges.reshape(-1, 2).tolist()
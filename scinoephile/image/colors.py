@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import numba as nb
 import numpy as np
 from PIL import Image
 
@@ -58,7 +59,7 @@ def get_fill_color_mask_arr(
     tolerance = 10
     lower = max(0, fill_color - tolerance)
     upper = min(255, fill_color + tolerance)
-    return (alpha > 0) & (grayscale >= lower) & (grayscale <= upper)
+    return _get_fill_color_mask_arr(grayscale, alpha, lower, upper)
 
 
 def get_fill_and_outline_colors(
@@ -72,12 +73,7 @@ def get_fill_and_outline_colors(
     Returns:
         Fill and outline grayscale values
     """
-    mask = alpha != 0
-    values = grayscale[mask]
-    if values.size == 0:
-        return 255, 0
-    hist = np.bincount(values, minlength=256)
-    return get_fill_and_outline_colors_from_hist(hist)
+    return get_fill_and_outline_colors_from_hist(_get_opaque_hist(grayscale, alpha))
 
 
 def get_fill_and_outline_colors_from_hist(hist: np.ndarray) -> tuple[int, int]:
@@ -94,3 +90,44 @@ def get_fill_and_outline_colors_from_hist(hist: np.ndarray) -> tuple[int, int]:
     if outline > fill:
         fill, outline = outline, fill
     return fill, outline
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _get_fill_color_mask_arr(
+    grayscale: np.ndarray, alpha: np.ndarray, lower: int, upper: int
+) -> np.ndarray:
+    """Get a boolean mask array that is true for opaque pixels within a range.
+
+    Arguments:
+        grayscale: grayscale values
+        alpha: alpha values
+        lower: inclusive lower bound of grayscale values
+        upper: inclusive upper bound of grayscale values
+    Returns:
+        boolean mask array
+    """
+    mask = np.zeros(grayscale.shape, dtype=np.bool_)
+    for y in range(grayscale.shape[0]):
+        for x in range(grayscale.shape[1]):
+            value = grayscale[y, x]
+            if alpha[y, x] > 0 and lower <= value <= upper:
+                mask[y, x] = True
+    return mask
+
+
+@nb.jit(nopython=True, nogil=True, cache=True)
+def _get_opaque_hist(grayscale: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """Get a histogram of the grayscale values of opaque pixels.
+
+    Arguments:
+        grayscale: grayscale values
+        alpha: alpha values
+    Returns:
+        count of opaque pixels with each grayscale value
+    """
+    hist = np.zeros(256, dtype=np.int64)
+    for y in range(grayscale.shape[0]):
+        for x in range(grayscale.shape[1]):
+            if alpha[y, x] != 0:
+                hist[grayscale[y, x]] += 1
+    return hist
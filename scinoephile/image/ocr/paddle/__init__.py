@@ -32,12 +32,15 @@ logger = getLogger(__name__)
 
 
 def ocr_image_series_with_paddle(
-    image_series: ImageSeries, **kwargs: Unpack[PaddleRecognizerKwargs]
+    image_series: ImageSeries,
+    batch_size: int = 1,
+    **kwargs: Unpack[PaddleRecognizerKwargs],
 ) -> Series:
     """OCR an image subtitle series with PaddleOCR.
 
     Arguments:
         image_series: image subtitle series
+        batch_size: maximum number of subtitles to predict at once
         **kwargs: additional keyword arguments for PaddleRecognizer
     Returns:
         text subtitle series
@@ -46,19 +49,34 @@ def ocr_image_series_with_paddle(
         from .preprocessing import preprocess_paddle_ocr_image  # noqa: PLC0415
 
         paddle_recognizer = PaddleRecognizer(**kwargs)
+        image_subtitles = [cast(ImageSubtitle, subtitle) for subtitle in image_series]
 
-        events = []
-        subtitle_count = len(image_series.events)
-        for subtitle_idx, subtitle in enumerate(image_series, 1):
+        if batch_size == 1:
+            texts = []
+            subtitle_count = len(image_subtitles)
+            for subtitle_idx, image_subtitle in enumerate(image_subtitles, 1):
+                logger.info(
+                    f"OCRing subtitle {subtitle_idx}/{subtitle_count} with PaddleOCR"
+                )
+                preprocessed_image = preprocess_paddle_ocr_image(image_subtitle.img)
+                texts.append(paddle_recognizer.recognize_image(preprocessed_image))
+        else:
             logger.info(
-                f"OCRing subtitle {subtitle_idx}/{subtitle_count} with PaddleOCR"
+                f"OCRing {len(image_subtitles)} subtitles with PaddleOCR "
+                f"in batches of up to {batch_size}"
             )
-            image_subtitle = cast(ImageSubtitle, subtitle)
-            preprocessed_image = preprocess_paddle_ocr_image(image_subtitle.img)
-            text = paddle_recognizer.recognize_image(preprocessed_image)
-            events.append(
-                Subtitle(start=image_subtitle.start, end=image_subtitle.end, text=text)
+            texts = paddle_recognizer.recognize_images(
+                [
+                    preprocess_paddle_ocr_image(image_subtitle.img)
+                    for image_subtitle in image_subtitles
+                ],
+                batch_size=batch_size,
             )
+
+        events = [
+            Subtitle(start=image_subtitle.start, end=image_subtitle.end, text=text)
+            for image_subtitle, text in zip(image_subtitles, texts, strict=True)
+        ]
         return Series(events=events)
     except ScinoephileError:
         raise
@@ -5,10 +5,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
+from itertools import batched
 from logging import getLogger
 from pathlib import Path
 from platform import system
-from typing import Any, TypedDict, override
+from typing import Any, TypedDict, cast, override
 
 import numpy as np
 from PIL import Image
@@ -24,6 +26,8 @@ from .text_result import PaddleOcrTextResult
 
 __all__ = ["PaddleRecognizer", "PaddleRecognizerKwargs"]
 
+logger = getLogger(__name__)
+
 _TEXT_DETECTION_MODEL_NAME = "PP-OCRv5_server_det"
 _TEXT_RECOGNITION_MODEL_NAME = "PP-OCRv5_server_rec"
 _TEXTLINE_ORIENTATION_MODEL_NAME = "PP-LCNet_x1_0_textline_ori"
@@ -122,13 +126,7 @@ class PaddleRecognizer:
             recognized text
         """
         array = np.array(image.convert("RGB"))
-        cache_identity: CacheIdentity = {
-            "language": self.paddle_language_code,
-            "runtime": self.runtime_identity,
-            "text_detection_model": _TEXT_DETECTION_MODEL_NAME,
-            "text_recognition_model": _TEXT_RECOGNITION_MODEL_NAME,
-            "textline_orientation_model": _TEXTLINE_ORIENTATION_MODEL_NAME,
-        }
+        cache_identity = self._get_cache_identity()
         if (results := self._cache.load(image, cache_identity)) is not None:
             return self._format_paddle_ocr_text(
                 results, min_confidence=self.min_confidence
@@ -139,6 +137,112 @@ class PaddleRecognizer:
         self._cache.save(image, cache_identity, results)
         return self._format_paddle_ocr_text(results, min_confidence=self.min_confidence)
 
+    def recognize_images(
+        self, images: Sequence[Image.Image], batch_size: int = 1
+    ) -> list[str]:
+        """Recognize text from images, predicting cache misses in batches.
+
+        Cached results are loaded and new results saved in input order, using the
+        same PaddleCache entries as recognize_image. Images sharing a cache entry are
+        predicted once. Cache misses are ordered by size, so that each batch holds
+        images of similar size, and predicted batch_size at a time. A batch whose
+        prediction fails is predicted again one image at a time.
+
+        Arguments:
+            images: input images
+            batch_size: maximum number of images to predict at once
+        Returns:
+            recognized text of each image, in input order
+        Raises:
+            ValueError: if batch_size is less than one
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if batch_size == 1:
+            return [self.recognize_image(image) for image in images]
+
+        # Load cached results, grouping uncached images by cache entry
+        cache_identity = self._get_cache_identity()
+        results_by_idx: list[list[PaddleOcrTextResult] | None] = []
+        uncached_idxs: dict[Path, list[int]] = {}
+        for idx, image in enumerate(images):
+            cache_path = self._cache.get_path(image, cache_identity)
+            if cache_path in uncached_idxs:
+                uncached_idxs[cache_path].append(idx)
+                results_by_idx.append(None)
+                continue
+            results = self._cache.load(image, cache_identity)
+            if results is None:
+                uncached_idxs[cache_path] = [idx]
+            results_by_idx.append(results)
+
+        # Predict uncached images in batches of similar size
+        idx_groups = sorted(
+            uncached_idxs.values(),
+            key=lambda idxs: (images[idxs[0]].height, images[idxs[0]].width),
+        )
+        for batch in batched(idx_groups, batch_size):
+            batch_images = [images[idxs[0]] for idxs in batch]
+            for idxs, results in zip(
+                batch, self._predict_batch(batch_images), strict=True
+            ):
+                self._cache.save(images[idxs[0]], cache_identity, results)
+                for idx in idxs:
+                    results_by_idx[idx] = results
+
+        return [
+            self._format_paddle_ocr_text(results, min_confidence=self.min_confidence)
+            for results in cast(list[list[PaddleOcrTextResult]], results_by_idx)
+        ]
+
+    def _get_cache_identity(self) -> CacheIdentity:
+        """Get the recognizer configuration identifying cached results.
+
+        Returns:
+            cache identity
+        """
+        return {
+            "language": self.paddle_language_code,
+            "runtime": self.runtime_identity,
+            "text_detection_model": _TEXT_DETECTION_MODEL_NAME,
+            "text_recognition_model": _TEXT_RECOGNITION_MODEL_NAME,
+            "textline_orientation_model": _TEXTLINE_ORIENTATION_MODEL_NAME,
+        }
+
+    def _predict_batch(
+        self, images: Sequence[Image.Image]
+    ) -> list[list[PaddleOcrTextResult]]:
+        """Predict text in a batch of images.
+
+        Arguments:
+            images: input images
+        Returns:
+            normalized text results of each image
+        """
+        arrays = [np.array(image.convert("RGB")) for image in images]
+        if len(arrays) > 1:
+            try:
+                raw_results = list(self._ocr.predict(arrays))
+            except (RuntimeError, ValueError) as exc:
+                logger.warning(
+                    f"PaddleOCR batch prediction failed, predicting "
+                    f"{len(arrays)} images individually: {exc}"
+                )
+            else:
+                if len(raw_results) == len(arrays):
+                    return [
+                        self._normalize_paddle_ocr_results([raw_result])
+                        for raw_result in raw_results
+                    ]
+                logger.warning(
+                    f"PaddleOCR batch prediction returned {len(raw_results)} results "
+                    f"for {len(arrays)} images, predicting them individually"
+                )
+        return [
+            self._normalize_paddle_ocr_results(self._ocr.predict(array))
+            for array in arrays
+        ]
+
     @staticmethod
     def _format_paddle_ocr_text(
         results: list[PaddleOcrTextResult], *, min_confidence: float = 0.0
@@ -32,30 +32,44 @@ logger = getLogger(__name__)
 
 
 def ocr_image_series_with_tesseract(
-    image_series: ImageSeries, **kwargs: Unpack[TesseractRecognizerKwargs]
+    image_series: ImageSeries,
+    jobs: int = 1,
+    **kwargs: Unpack[TesseractRecognizerKwargs],
 ) -> Series:
     """OCR an image subtitle series with Tesseract.
 
     Arguments:
         image_series: image subtitle series
+        jobs: maximum number of subtitles to recognize at once
         **kwargs: additional keyword arguments for TesseractRecognizer
     Returns:
         text subtitle series
     """
     try:
         tesseract_recognizer = TesseractRecognizer(**kwargs)
+        image_subtitles = [cast(ImageSubtitle, subtitle) for subtitle in image_series]
 
-        events = []
-        subtitle_count = len(image_series.events)
-        for subtitle_idx, subtitle in enumerate(image_series, 1):
+        if jobs == 1:
+            texts = []
+            subtitle_count = len(image_subtitles)
+            for subtitle_idx, image_subtitle in enumerate(image_subtitles, 1):
+                logger.info(
+                    f"OCRing subtitle {subtitle_idx}/{subtitle_count} with Tesseract"
+                )
+                texts.append(tesseract_recognizer.recognize_image(image_subtitle.img))
+        else:
             logger.info(
-                f"OCRing subtitle {subtitle_idx}/{subtitle_count} with Tesseract"
+                f"OCRing {len(image_subtitles)} subtitles with Tesseract "
+                f"using up to {jobs} jobs"
             )
-            image_subtitle = cast(ImageSubtitle, subtitle)
-            text = tesseract_recognizer.recognize_image(image_subtitle.img)
-            events.append(
-                Subtitle(start=image_subtitle.start, end=image_subtitle.end, text=text)
+            texts = tesseract_recognizer.recognize_images(
+                [image_subtitle.img for image_subtitle in image_subtitles], jobs=jobs
             )
+
+        events = [
+            Subtitle(start=image_subtitle.start, end=image_subtitle.end, text=text)
+            for image_subtitle, text in zip(image_subtitles, texts, strict=True)
+        ]
         return Series(events=events)
     except ScinoephileError:
         raise
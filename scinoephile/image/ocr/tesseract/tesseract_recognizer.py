@@ -4,10 +4,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from logging import getLogger
 from pathlib import Path
+from queue import SimpleQueue
 from tempfile import TemporaryDirectory
-from typing import TypedDict, override
+from threading import Lock
+from typing import TypedDict, cast, override
 
 import requests
 from PIL import Image
@@ -125,6 +130,8 @@ class TesseractRecognizer:
         self._legacy_data_cache = TesseractLegacyDataCache(
             cache_root_path, overwrite=overwrite_cache
         )
+        self._legacy_data_lock = Lock()
+        """Lock guarding retrieval of legacy traineddata by parallel workers."""
 
         resolved_executable_path = Path(executable_path)
         if not skip_executable_validation:
@@ -166,23 +173,7 @@ class TesseractRecognizer:
         Returns:
             recognized text
         """
-        cache_identity: CacheIdentity = {
-            "detect_italics": self.detect_italics,
-            "language": self.tesseract_language_code,
-            "legacy_tessdata_revision": self._legacy_data_cache.source_revision,
-            "oem": self.oem,
-            "psm": self.psm,
-            "runtime": {
-                "executable": str(self.executable_path),
-                "version": self.executable_version,
-            },
-            "scale": self.scale,
-            "tessdata_dir": (
-                str(self.tessdata_dir_path)
-                if self.tessdata_dir_path is not None
-                else None
-            ),
-        }
+        cache_identity = self._get_cache_identity()
         if (text := self._cache.load(image, cache_identity)) is not None:
             return text
 
@@ -190,6 +181,93 @@ class TesseractRecognizer:
         self._cache.save(image, cache_identity, text)
         return text
 
+    def recognize_images(
+        self, images: Sequence[Image.Image], jobs: int = 1
+    ) -> list[str]:
+        """Recognize text from images, running Tesseract on up to jobs at once.
+
+        Cached results are loaded and new results saved on the calling thread in
+        input order, using the same cache entries as recognize_image. Images sharing
+        a cache entry are recognized once. Each worker reuses one scratch directory
+        for all of the images it recognizes.
+
+        Arguments:
+            images: input images
+            jobs: maximum number of images to recognize at once
+        Returns:
+            recognized text of each image, in input order
+        Raises:
+            ValueError: if jobs is less than one
+        """
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1.")
+        if jobs == 1:
+            return [self.recognize_image(image) for image in images]
+
+        # Load cached results, grouping uncached images by cache entry
+        cache_identity = self._get_cache_identity()
+        texts: list[str | None] = []
+        uncached_idxs: dict[Path, list[int]] = {}
+        for idx, image in enumerate(images):
+            cache_path = self._cache.get_path(image, cache_identity)
+            if cache_path in uncached_idxs:
+                uncached_idxs[cache_path].append(idx)
+                texts.append(None)
+                continue
+            text = self._cache.load(image, cache_identity)
+            if text is None:
+                uncached_idxs[cache_path] = [idx]
+            texts.append(text)
+        if not uncached_idxs:
+            return cast(list[str], texts)
+
+        # Recognize uncached images in parallel, saving results in input order
+        worker_count = min(jobs, len(uncached_idxs))
+        with ExitStack() as stack:
+            scratch_dir_paths: SimpleQueue[Path] = SimpleQueue()
+            for _ in range(worker_count):
+                scratch_dir_paths.put(
+                    Path(
+                        stack.enter_context(
+                            TemporaryDirectory(prefix="scinoephile_tesseract_")
+                        )
+                    )
+                )
+
+            def recognize(image: Image.Image) -> str:
+                """Recognize text from an image in an available scratch directory.
+
+                Arguments:
+                    image: input image
+                Returns:
+                    recognized text
+                """
+                scratch_dir_path = scratch_dir_paths.get()
+                try:
+                    return self._recognize_uncached_image_in_dir(
+                        image, scratch_dir_path
+                    )
+                finally:
+                    for path in scratch_dir_path.iterdir():
+                        path.unlink()
+                    scratch_dir_paths.put(scratch_dir_path)
+
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = [
+                    executor.submit(recognize, images[idxs[0]])
+                    for idxs in uncached_idxs.values()
+                ]
+                try:
+                    for idxs, future in zip(uncached_idxs.values(), futures):
+                        text = future.result()
+                        self._cache.save(images[idxs[0]], cache_identity, text)
+                        for idx in idxs:
+                            texts[idx] = text
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        return cast(list[str], texts)
+
     @property
     def _hocr_word_separator(self) -> str:
         """Text with which to join hOCR word spans."""
@@ -309,6 +387,30 @@ class TesseractRecognizer:
             ) from exc
         return response.content
 
+    def _get_cache_identity(self) -> CacheIdentity:
+        """Get the recognizer configuration identifying cached results.
+
+        Returns:
+            cache identity
+        """
+        return {
+            "detect_italics": self.detect_italics,
+            "language": self.tesseract_language_code,
+            "legacy_tessdata_revision": self._legacy_data_cache.source_revision,
+            "oem": self.oem,
+            "psm": self.psm,
+            "runtime": {
+                "executable": str(self.executable_path),
+                "version": self.executable_version,
+            },
+            "scale": self.scale,
+            "tessdata_dir": (
+                str(self.tessdata_dir_path)
+                if self.tessdata_dir_path is not None
+                else None
+            ),
+        }
+
     def _get_executable_version(self) -> str:
         """Get the configured Tesseract executable version.
 
@@ -333,11 +435,14 @@ class TesseractRecognizer:
         Returns:
             legacy tessdata directory path
         """
-        traineddata_path = self._legacy_data_cache.load(self.tesseract_language_code)
-        if traineddata_path is None:
-            traineddata_path = self._legacy_data_cache.save(
-                self.tesseract_language_code, self._download_legacy_traineddata()
+        with self._legacy_data_lock:
+            traineddata_path = self._legacy_data_cache.load(
+                self.tesseract_language_code
             )
+            if traineddata_path is None:
+                traineddata_path = self._legacy_data_cache.save(
+                    self.tesseract_language_code, self._download_legacy_traineddata()
+                )
         return traineddata_path.parent
 
     def _recognize_uncached_image(self, image: Image.Image) -> str:
@@ -349,30 +454,42 @@ class TesseractRecognizer:
             recognized text
         """
         with TemporaryDirectory(prefix="scinoephile_tesseract_") as tmp_dir:
-            tmp_dir_path = Path(tmp_dir)
-            image_path = tmp_dir_path / "input.png"
-            output_base_path = tmp_dir_path / "output"
-            preprocessed_image = preprocess_tesseract_ocr_image(image, scale=self.scale)
-            preprocessed_image.save(image_path)
-            text = self._run_tesseract(image_path, output_base_path)
-            if text.strip():
-                return text
-
-            fallback_image_path = tmp_dir_path / "input_legacy_fallback.png"
-            fallback_output_base_path = tmp_dir_path / "output_legacy_fallback"
-            fallback_image = preprocess_tesseract_ocr_image(image, scale=1)
-            fallback_image.save(fallback_image_path)
-            fallback_text = self._run_legacy_blank_fallback(
-                fallback_image_path, fallback_output_base_path
-            )
-            if self._is_usable_legacy_blank_fallback_text(fallback_text):
-                logger.info(
-                    "Using Tesseract legacy fallback for blank OCR result "
-                    f"with language {self.tesseract_language_code}"
-                )
-                return fallback_text
+            return self._recognize_uncached_image_in_dir(image, Path(tmp_dir))
+
+    def _recognize_uncached_image_in_dir(
+        self, image: Image.Image, tmp_dir_path: Path
+    ) -> str:
+        """Preprocess and recognize text from an image in a scratch directory.
+
+        Arguments:
+            image: input image
+            tmp_dir_path: empty scratch directory for Tesseract inputs and outputs
+        Returns:
+            recognized text
+        """
+        image_path = tmp_dir_path / "input.png"
+        output_base_path = tmp_dir_path / "output"
+        preprocessed_image = preprocess_tesseract_ocr_image(image, scale=self.scale)
+        preprocessed_image.save(image_path)
+        text = self._run_tesseract(image_path, output_base_path)
+        if text.strip():
             return text
 
+        fallback_image_path = tmp_dir_path / "input_legacy_fallback.png"
+        fallback_output_base_path = tmp_dir_path / "output_legacy_fallback"
+        fallback_image = preprocess_tesseract_ocr_image(image, scale=1)
+        fallback_image.save(fallback_image_path)
+        fallback_text = self._run_legacy_blank_fallback(
+            fallback_image_path, fallback_output_base_path
+        )
+        if self._is_usable_legacy_blank_fallback_text(fallback_text):
+            logger.info(
+                "Using Tesseract legacy fallback for blank OCR result "
+                f"with language {self.tesseract_language_code}"
+            )
+            return fallback_text
+        return text
+
     def _run_command(self, command: list[str]) -> tuple[int, str, str]:
         """Run command.
 
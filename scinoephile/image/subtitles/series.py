@@ -5,8 +5,9 @@
 from __future__ import annotations
 
 import re
-from collections import Counter
-from collections.abc import Sequence
+from collections import Counter, deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from html import escape, unescape
 from logging import getLogger
@@ -22,17 +23,18 @@ from scinoephile.common.validation import (
     val_child_path,
     val_input_dir_path,
     val_input_file_or_dir_path,
+    val_input_path,
     val_output_dir_path,
     val_output_path,
 )
 from scinoephile.core import ScinoephileError
 from scinoephile.core.subtitles import Series, Subtitle
-from scinoephile.image.bboxes import get_bboxes
+from scinoephile.image.bboxes import get_bboxes, get_bboxes_of_images
 from scinoephile.image.colors import get_fill_and_outline_colors_from_hist
 from scinoephile.image.drawing import convert_rgba_img_to_la
 
 from .subtitle import ImageSubtitle
-from .sup import read_sup_series
+from .sup import decode_sup_image, index_sup_series
 
 __all__ = ["ImageSeries"]
 
@@ -146,6 +148,19 @@ class ImageSeries(Series):
         for source_subtitle, image_subtitle in zip(source, self.events):
             image_subtitle.text = source_subtitle.text
 
+    def init_bboxes(self, workers: int = 1):
+        """Initialize bboxes of subtitles that do not yet have them.
+
+        Arguments:
+            workers: maximum number of subtitle images to analyze at once
+        """
+        subtitles = [subtitle for subtitle in self.events if subtitle.bboxes is None]
+        bboxes = get_bboxes_of_images(
+            [subtitle.img for subtitle in subtitles], workers=workers
+        )
+        for subtitle, subtitle_bboxes in zip(subtitles, bboxes, strict=True):
+            subtitle.bboxes = subtitle_bboxes
+
     def save_html_index(
         self,
         dir_path: str | PathLike[str],
@@ -271,6 +286,67 @@ class ImageSeries(Series):
             "index.html file and N png files, or a .sup file."
         )
 
+    @classmethod
+    def iter_sup(
+        cls, path: str | PathLike[str], workers: int = 1
+    ) -> Iterator[ImageSubtitle]:
+        """Iterate over the subtitles of a sup file as their images are decoded.
+
+        The file is memory-mapped and indexed first, after which images are decoded
+        one display set at a time, so that callers such as OCR may begin work on
+        early subtitles before later ones are decoded and need not hold every image
+        at once. Images with only gray colors are decoded directly as LA.
+
+        Arguments:
+            path: sup file path
+            workers: maximum number of images to decode at once; subtitles are
+              yielded in order regardless
+        Returns:
+            iterator of subtitles
+        Raises:
+            ValueError: if workers is less than 1 or the sup data is malformed
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        file_path = val_input_path(path)
+        if file_path.stat().st_size == 0:
+            data = np.zeros(0, np.uint8)
+        else:
+            data = np.asarray(np.memmap(file_path, dtype=np.uint8, mode="r"))
+        times, image_fields, pieces = index_sup_series(data)
+
+        def decode(event_i: int) -> ImageSubtitle:
+            """Decode one subtitle.
+
+            Arguments:
+                event_i: index of subtitle
+            Returns:
+                subtitle
+            """
+            image = decode_sup_image(data, image_fields[event_i], pieces)
+            return cls.event_class(
+                start=int(round(times[event_i, 0] * 1000)),
+                end=int(round(times[event_i, 1] * 1000)),
+                img=Image.fromarray(image),
+            )
+
+        if workers == 1:
+            for event_i in range(len(times)):
+                yield decode(event_i)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures: deque[Future[ImageSubtitle]] = deque()
+            for event_i in range(len(times)):
+                futures.append(executor.submit(decode, event_i))
+                if len(futures) >= 2 * workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
     @override
     def _copy_with_events(self, events: Sequence[Subtitle]) -> Self:
         """Copy this image series with a selected collection of events.
@@ -412,32 +488,16 @@ class ImageSeries(Series):
         return series
 
     @classmethod
-    def _load_sup(cls, file_path: Path) -> Self:
+    def _load_sup(cls, file_path: Path, workers: int = 1) -> Self:
         """Load series from a sup file.
 
         Arguments:
             file_path: path to sup file
+            workers: maximum number of images to decode at once
         Returns:
             loaded series
         """
-        data = np.frombuffer(file_path.read_bytes(), dtype=np.uint8)
-        starts, ends, images = read_sup_series(data)
-        if len(starts) != len(ends) or len(starts) != len(images):
-            raise ScinoephileError(
-                f"Sup data in {file_path} is malformed: "
-                f"{len(starts)} starts, {len(ends)} ends, {len(images)} images."
-            )
-
-        events = []
-        for start, end, image in zip(starts, ends, images):
-            img = Image.fromarray(image, "RGBA")
-            img = convert_rgba_img_to_la(img)
-            events.append(
-                cls.event_class(
-                    start=int(round(start * 1000)), end=int(round(end * 1000)), img=img
-                )
-            )
-        series = cls(events=events)
+        series = cls(events=list(cls.iter_sup(file_path, workers=workers)))
         series.format = "sup"
         return series
 
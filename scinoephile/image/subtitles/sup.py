@@ -7,7 +7,13 @@ from __future__ import annotations
 import numba as nb
 import numpy as np
 
-__all__ = ["read_sup_image_array", "read_sup_palette", "read_sup_series"]
+__all__ = [
+    "decode_sup_image",
+    "index_sup_series",
+    "read_sup_image_array",
+    "read_sup_palette",
+    "read_sup_series",
+]
 
 
 @nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
@@ -32,129 +38,147 @@ def _render_sup_image(
 
 
 @nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
-def read_sup_image_array(  # noqa: PLR0912, PLR0915
-    bytes_: np.ndarray, height: int, width: int
+def _render_sup_la_image(
+    compressed_image: np.ndarray, height: int, width: int, palette: np.ndarray
 ) -> np.ndarray:
-    """Read a palette-compressed image from a block of bytes.
+    """Render an LA subtitle image from a gray palette and compressed image data.
 
     Arguments:
-        bytes_: block of bytes
-        height: height of image
-        width: width of image
+        compressed_image: palette-index image data
+        height: image height
+        width: image width
+        palette: RGBA palette whose used colors are gray
     Returns:
-        compressed image
+        rendered LA image
     """
-    array = np.zeros((height, width), np.uint8)
-    byte_i = 0
-    row_i = 0
-    col_i = 0
-    while byte_i < len(bytes_):
-        if row_i >= height:
-            raise ValueError("SUP image data extends past declared image height.")
-        byte_1 = bytes_[byte_i]
-        if byte_1 == 0x00:  # 00 | Special behaviors
-            if byte_i + 1 >= len(bytes_):
-                raise ValueError("SUP image data ended inside an RLE sequence.")
-            byte_2 = bytes_[byte_i + 1]
-            if byte_2 == 0x00:  # 00 00 | New line
-                byte_i += 2
-                row_i += 1
-                col_i = 0
-            else:
-                if (byte_2 & 0xC0) == 0x40:  # 00 4X XX | Color 0, X times
-                    if byte_i + 2 >= len(bytes_):
-                        raise ValueError("SUP image data ended inside an RLE sequence.")
-                    byte_3 = bytes_[byte_i + 2]
-                    n_pixels = ((byte_2 - 0x40) << 8) + byte_3
-                    color = 0
-                    byte_i += 3
-                elif (byte_2 & 0xC0) == 0x80:  # 00 8Y XX | Color X,  Y times
-                    if byte_i + 2 >= len(bytes_):
-                        raise ValueError("SUP image data ended inside an RLE sequence.")
-                    byte_3 = bytes_[byte_i + 2]
-                    n_pixels = byte_2 - 0x80
-                    color = byte_3
-                    byte_i += 3
-                elif (byte_2 & 0xC0) != 0x00:  # 00 CY YY XX | Color X, Y times
-                    if byte_i + 3 >= len(bytes_):
-                        raise ValueError("SUP image data ended inside an RLE sequence.")
-                    byte_3 = bytes_[byte_i + 2]
-                    byte_4 = bytes_[byte_i + 3]
-                    n_pixels = ((byte_2 - 0xC0) << 8) + byte_3
-                    color = byte_4
-                    byte_i += 4
-                else:  # 00 XX | 0 X times
-                    n_pixels = byte_2
-                    color = 0
-                    byte_i += 2
-                if col_i + n_pixels > width:
-                    raise ValueError("SUP image data extends past declared row width.")
-                array[row_i, col_i : col_i + n_pixels] = color
-                col_i += n_pixels
-        else:  # XX | Color X, once
-            if col_i >= width:
-                raise ValueError("SUP image data extends past declared row width.")
-            color = byte_1
-            array[row_i, col_i] = color
-            col_i += 1
-            byte_i += 1
-    return array
+    image = np.zeros((height, width, 2), np.uint8)
+    for i in range(height):
+        for j in range(width):
+            color_i = compressed_image[i, j]
+            image[i, j, 0] = palette[color_i, 0]
+            image[i, j, 1] = palette[color_i, 3]
+    return image
 
 
 @nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
-def read_sup_palette(bytes_: np.ndarray) -> np.ndarray:
-    """Read a color palette from a block of bytes.
+def _read_sup_indexed_image(
+    bytes_: np.ndarray, event: np.ndarray, pieces: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read one indexed palette-compressed image and its palette.
 
     Arguments:
-        bytes_: block of bytes
+        bytes_: block of bytes that was indexed
+        event: row of image fields from index_sup_series
+        pieces: image data piece offsets and lengths from index_sup_series
     Returns:
-        palette; first index is color, second is channel
+        compressed image and RGBA palette
     """
-    palette = np.zeros((256, 4), np.uint8)
-    byte_i = 0
-    while byte_i < len(bytes_):
-        color_i = bytes_[byte_i]
-        y = bytes_[byte_i + 1]
-        cb = bytes_[byte_i + 2]
-        cr = bytes_[byte_i + 3]
-        palette[color_i, 0] = y + 1.402 * (cr - 128)
-        palette[color_i, 1] = y - 0.34414 * (cb - 128) - 0.71414 * (cr - 128)
-        palette[color_i, 2] = y + 1.772 * (cb - 128)
-        palette[color_i, 3] = bytes_[byte_i + 4]
-        byte_i += 5
-    palette[255] = [16, 128, 128, 0]
+    height = event[0]
+    width = event[1]
+    palette_offset = event[2]
+    palette_size = event[3]
+    piece_start = event[4]
+    piece_end = event[5]
 
-    return palette
+    if piece_end - piece_start == 1:
+        offset = pieces[piece_start, 0]
+        data = bytes_[offset : offset + pieces[piece_start, 1]]
+    else:
+        data = np.empty(pieces[piece_start:piece_end, 1].sum(), np.uint8)
+        data_i = 0
+        for piece_i in range(piece_start, piece_end):
+            offset = pieces[piece_i, 0]
+            length = pieces[piece_i, 1]
+            data[data_i : data_i + length] = bytes_[offset : offset + length]
+            data_i += length
+    compressed_image = read_sup_image_array(data, height, width)
+
+    if palette_offset < 0:
+        palette = np.zeros((256, 4), np.uint8)
+    else:
+        palette = read_sup_palette(
+            bytes_[palette_offset : palette_offset + palette_size]
+        )
+    return compressed_image, palette
+
+
+@nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def decode_sup_image(
+    bytes_: np.ndarray, event: np.ndarray, pieces: np.ndarray
+) -> np.ndarray:
+    """Decode one indexed subtitle image from a block of bytes.
+
+    Images whose pixels are all gray are rendered directly as LA, with luminance
+    equal to the shared color channel value, matching Pillow's RGBA to LA conversion;
+    other images are rendered as RGBA.
+
+    Arguments:
+        bytes_: block of bytes that was indexed
+        event: row of image fields from index_sup_series
+        pieces: image data piece offsets and lengths from index_sup_series
+    Returns:
+        rendered LA or RGBA image
+    """
+    compressed_image, palette = _read_sup_indexed_image(bytes_, event, pieces)
+    height, width = compressed_image.shape
+
+    used = np.zeros(256, np.bool_)
+    for i in range(height):
+        for j in range(width):
+            used[compressed_image[i, j]] = True
+    for color_i in range(256):
+        if used[color_i] and (
+            palette[color_i, 0] != palette[color_i, 1]
+            or palette[color_i, 1] != palette[color_i, 2]
+        ):
+            return _render_sup_image(compressed_image, height, width, palette)
+    return _render_sup_la_image(compressed_image, height, width, palette)
 
 
 @nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
-def read_sup_series(  # noqa: PLR0912, PLR0915
+def index_sup_series(  # noqa: PLR0912, PLR0915
     bytes_: np.ndarray,
-) -> tuple[list[float], list[float], list[np.ndarray]]:
-    """Read subtitle images and times from a block of bytes.
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Index subtitle times and image locations in a block of bytes.
+
+    Validates segments, but records where each subtitle's palette and image data
+    are rather than decoding them, so that images may be decoded individually with
+    decode_sup_image.
 
     Arguments:
         bytes_: block of bytes
     Returns:
-        subtitle starts, ends, and images
+        subtitle start and end times; per-subtitle image fields (height, width,
+        palette offset, palette size, and first and past-the-end piece indexes,
+        with a palette offset of -1 for the initial empty palette); and image data
+        piece offsets and lengths
     """
-    starts = []
-    ends = []
-    images = []
+    starts = [0.0]
+    ends = [0.0]
+    events = [(0, 0, 0, 0, 0, 0)]
+    piece_offsets = [0]
+    piece_lengths = [0]
+    starts.pop()
+    ends.pop()
+    events.pop()
+    piece_offsets.pop()
+    piece_lengths.pop()
 
-    palette = np.zeros((256, 4), np.uint8)
-    current_image = np.zeros((0, 0), np.uint8)
+    palette_offset = -1
+    palette_size = 0
+    current_image = (0, 0, 0, 0)
     has_current_image = False
 
-    pending_image_data = np.zeros(0, np.uint8)
     pending_image_data_length = -1
+    pending_image_data_read = 0
     pending_image_height = 0
     pending_image_object_id = -1
+    pending_image_piece_start = 0
     pending_image_version = -1
     pending_image_width = 0
 
     active_start = -1.0
-    active_image = np.zeros((0, 0, 4), np.uint8)
+    active_event = (0, 0, 0, 0, 0, 0)
     has_active_image = False
     active_composition_number = -1
 
@@ -180,7 +204,6 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
         byte_i += 2
         if byte_i + size > len(bytes_):
             raise ValueError("SUP segment data is truncated.")
-        segment_bytes = bytes_[byte_i : byte_i + size]
 
         if set_timestamp < 0:
             set_timestamp = timestamp
@@ -188,13 +211,14 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
         if segment_kind == 0x14:  # Palette
             if size < 2 or (size - 2) % 5 != 0:
                 raise ValueError("SUP palette segment is truncated.")
-            palette = read_sup_palette(segment_bytes[2:])
+            palette_offset = byte_i + 2
+            palette_size = size - 2
         elif segment_kind == 0x15:  # Image
             if size < 4:
                 raise ValueError("SUP image segment is truncated.")
-            object_id = int(segment_bytes[0]) * 256 + int(segment_bytes[1])
-            object_version = int(segment_bytes[2])
-            sequence_descriptor = int(segment_bytes[3])
+            object_id = int(bytes_[byte_i]) * 256 + int(bytes_[byte_i + 1])
+            object_version = int(bytes_[byte_i + 2])
+            sequence_descriptor = int(bytes_[byte_i + 3])
             if (sequence_descriptor & 0x3F) != 0:
                 raise ValueError("SUP image segment has invalid sequence descriptor.")
 
@@ -206,22 +230,25 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
                 if size < 11:
                     raise ValueError("SUP image segment is truncated.")
                 object_data_length = (
-                    int(segment_bytes[4]) * 65536
-                    + int(segment_bytes[5]) * 256
-                    + int(segment_bytes[6])
+                    int(bytes_[byte_i + 4]) * 65536
+                    + int(bytes_[byte_i + 5]) * 256
+                    + int(bytes_[byte_i + 6])
                 )
                 if object_data_length < 4:
                     raise ValueError("SUP image segment is truncated.")
-                pending_image_data = segment_bytes[11:]
                 pending_image_data_length = object_data_length - 4
-                pending_image_height = int(segment_bytes[9]) * 256 + int(
-                    segment_bytes[10]
+                pending_image_data_read = size - 11
+                pending_image_height = int(bytes_[byte_i + 9]) * 256 + int(
+                    bytes_[byte_i + 10]
                 )
                 pending_image_object_id = object_id
+                pending_image_piece_start = len(piece_offsets)
                 pending_image_version = object_version
-                pending_image_width = int(segment_bytes[7]) * 256 + int(
-                    segment_bytes[8]
+                pending_image_width = int(bytes_[byte_i + 7]) * 256 + int(
+                    bytes_[byte_i + 8]
                 )
+                piece_offsets.append(byte_i + 11)
+                piece_lengths.append(size - 11)
             else:
                 if pending_image_object_id < 0:
                     raise ValueError(
@@ -235,23 +262,26 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
                     raise ValueError(
                         "SUP image continuation does not match initial image segment."
                     )
-                pending_image_data = np.concatenate(
-                    (pending_image_data, segment_bytes[4:])
-                )
+                pending_image_data_read += size - 4
+                piece_offsets.append(byte_i + 4)
+                piece_lengths.append(size - 4)
 
-            if len(pending_image_data) > pending_image_data_length:
+            if pending_image_data_read > pending_image_data_length:
                 raise ValueError(
                     "SUP image data extends past declared object data length."
                 )
             if (sequence_descriptor & 0x40) != 0:
-                if len(pending_image_data) != pending_image_data_length:
+                if pending_image_data_read != pending_image_data_length:
                     raise ValueError("SUP image segment data is truncated.")
-                current_image = read_sup_image_array(
-                    pending_image_data, pending_image_height, pending_image_width
+                current_image = (
+                    pending_image_height,
+                    pending_image_width,
+                    pending_image_piece_start,
+                    len(piece_offsets),
                 )
                 has_current_image = True
-                pending_image_data = np.zeros(0, np.uint8)
                 pending_image_data_length = -1
+                pending_image_data_read = 0
                 pending_image_height = 0
                 pending_image_object_id = -1
                 pending_image_version = -1
@@ -259,8 +289,10 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
         elif segment_kind == 0x16:  # Presentation Composition
             if size < 11:
                 raise ValueError("SUP presentation composition segment is truncated.")
-            set_composition_number = int(segment_bytes[5]) * 256 + int(segment_bytes[6])
-            set_has_object = segment_bytes[10] > 0
+            set_composition_number = int(bytes_[byte_i + 5]) * 256 + int(
+                bytes_[byte_i + 6]
+            )
+            set_has_object = bytes_[byte_i + 10] > 0
         elif segment_kind == 0x80:  # End
             if set_timestamp < 0:
                 raise ValueError("Unexpected empty display set in SUP data.")
@@ -270,26 +302,27 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
                     if has_active_image:
                         starts.append(active_start)
                         ends.append(set_timestamp)
-                        images.append(active_image)
+                        events.append(active_event)
                     if not has_current_image:
                         raise ValueError(
                             "Encountered object display set without image data."
                         )
                     active_start = set_timestamp
-                    active_image = _render_sup_image(
-                        current_image,
-                        current_image.shape[0],
-                        current_image.shape[1],
-                        palette,
+                    active_event = (
+                        current_image[0],
+                        current_image[1],
+                        palette_offset,
+                        palette_size,
+                        current_image[2],
+                        current_image[3],
                     )
                     has_active_image = True
                     active_composition_number = set_composition_number
             elif has_active_image:
                 starts.append(active_start)
                 ends.append(set_timestamp)
-                images.append(active_image)
+                events.append(active_event)
                 active_start = -1.0
-                active_image = np.zeros((0, 0, 4), np.uint8)
                 has_active_image = False
                 active_composition_number = -1
 
@@ -305,6 +338,138 @@ def read_sup_series(  # noqa: PLR0912, PLR0915
     if has_active_image:
         starts.append(active_start)
         ends.append(active_start)
-        images.append(active_image)
+        events.append(active_event)
+
+    times = np.empty((len(starts), 2), np.float64)
+    event_array = np.empty((len(events), 6), np.int64)
+    for event_i in range(len(events)):
+        times[event_i, 0] = starts[event_i]
+        times[event_i, 1] = ends[event_i]
+        for field_i in range(6):
+            event_array[event_i, field_i] = events[event_i][field_i]
+    pieces = np.empty((len(piece_offsets), 2), np.int64)
+    for piece_i in range(len(piece_offsets)):
+        pieces[piece_i, 0] = piece_offsets[piece_i]
+        pieces[piece_i, 1] = piece_lengths[piece_i]
+    return times, event_array, pieces
 
-    return starts, ends, images
+
+@nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def read_sup_image_array(  # noqa: PLR0912, PLR0915
+    bytes_: np.ndarray, height: int, width: int
+) -> np.ndarray:
+    """Read a palette-compressed image from a block of bytes.
+
+    Arguments:
+        bytes_: block of bytes
+        height: height of image
+        width: width of image
+    Returns:
+        compressed image
+    """
+    array = np.zeros((height, width), np.uint8)
+    byte_i = 0
+    row_i = 0
+    col_i = 0
+    while byte_i < len(bytes_):
+        if row_i >= height:
+            raise ValueError("SUP image data extends past declared image height.")
+        byte_1 = bytes_[byte_i]
+        if byte_1 == 0x00:  # 00 | Special behaviors
+            if byte_i + 1 >= len(bytes_):
+                raise ValueError("SUP image data ended inside an RLE sequence.")
+            byte_2 = bytes_[byte_i + 1]
+            if byte_2 == 0x00:  # 00 00 | New line
+                byte_i += 2
+                row_i += 1
+                col_i = 0
+            else:
+                if (byte_2 & 0xC0) == 0x40:  # 00 4X XX | Color 0, X times
+                    if byte_i + 2 >= len(bytes_):
+                        raise ValueError("SUP image data ended inside an RLE sequence.")
+                    byte_3 = bytes_[byte_i + 2]
+                    n_pixels = ((byte_2 - 0x40) << 8) + byte_3
+                    color = 0
+                    byte_i += 3
+                elif (byte_2 & 0xC0) == 0x80:  # 00 8Y XX | Color X,  Y times
+                    if byte_i + 2 >= len(bytes_):
+                        raise ValueError("SUP image data ended inside an RLE sequence.")
+                    byte_3 = bytes_[byte_i + 2]
+                    n_pixels = byte_2 - 0x80
+                    color = byte_3
+                    byte_i += 3
+                elif (byte_2 & 0xC0) != 0x00:  # 00 CY YY XX | Color X, Y times
+                    if byte_i + 3 >= len(bytes_):
+                        raise ValueError("SUP image data ended inside an RLE sequence.")
+                    byte_3 = bytes_[byte_i + 2]
+                    byte_4 = bytes_[byte_i + 3]
+                    n_pixels = ((byte_2 - 0xC0) << 8) + byte_3
+                    color = byte_4
+                    byte_i += 4
+                else:  # 00 XX | 0 X times
+                    n_pixels = byte_2
+                    color = 0
+                    byte_i += 2
+                if col_i + n_pixels > width:
+                    raise ValueError("SUP image data extends past declared row width.")
+                array[row_i, col_i : col_i + n_pixels] = color
+                col_i += n_pixels
+        else:  # XX | Color X, once
+            if col_i >= width:
+                raise ValueError("SUP image data extends past declared row width.")
+            color = byte_1
+            array[row_i, col_i] = color
+            col_i += 1
+            byte_i += 1
+    return array
+
+
+@nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def read_sup_palette(bytes_: np.ndarray) -> np.ndarray:
+    """Read a color palette from a block of bytes.
+
+    Arguments:
+        bytes_: block of bytes
+    Returns:
+        palette; first index is color, second is channel
+    """
+    palette = np.zeros((256, 4), np.uint8)
+    byte_i = 0
+    while byte_i < len(bytes_):
+        color_i = bytes_[byte_i]
+        y = bytes_[byte_i + 1]
+        cb = bytes_[byte_i + 2]
+        cr = bytes_[byte_i + 3]
+        palette[color_i, 0] = y + 1.402 * (cr - 128)
+        palette[color_i, 1] = y - 0.34414 * (cb - 128) - 0.71414 * (cr - 128)
+        palette[color_i, 2] = y + 1.772 * (cb - 128)
+        palette[color_i, 3] = bytes_[byte_i + 4]
+        byte_i += 5
+    palette[255] = [16, 128, 128, 0]
+
+    return palette
+
+
+def read_sup_series(
+    bytes_: np.ndarray,
+) -> tuple[list[float], list[float], list[np.ndarray]]:
+    """Read subtitle images and times from a block of bytes.
+
+    Arguments:
+        bytes_: block of bytes
+    Returns:
+        subtitle starts, ends, and RGBA images
+    """
+    times, image_fields, pieces = index_sup_series(bytes_)
+    images = []
+    for event in image_fields:
+        compressed_image, palette = _read_sup_indexed_image(bytes_, event, pieces)
+        images.append(
+            _render_sup_image(
+                compressed_image,
+                compressed_image.shape[0],
+                compressed_image.shape[1],
+                palette,
+            )
+        )
+    return times[:, 0].tolist(), times[:, 1].tolist(), images
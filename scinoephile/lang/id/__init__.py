@@ -8,7 +8,11 @@ Package hierarchy (modules may import from any above):
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from hashlib import blake2b
+from math import sqrt
+from threading import Lock
 
 from scinoephile.core import Language
 from scinoephile.core.subtitles import Series
@@ -19,22 +23,84 @@ __all__ = ["LanguageId", "get_series_language"]
 
 SERIES_LANGUAGE_AGREEMENT_THRESHOLD = 3
 """Number of conclusive subtitles that must agree on a series language."""
+SERIES_LANGUAGE_SAMPLE_SIZE = 32
+"""Minimum number of conclusive subtitles sampled before stopping early."""
+SERIES_LANGUAGE_SAMPLE_Z = 3.89
+"""Z-score the sampled majority must clear before stopping early."""
+SERIES_LANGUAGE_CACHE_SIZE = 64
+"""Maximum number of series whose detected languages are memoized."""
 
+_series_languages: OrderedDict[tuple[bytes, bool], Language | None] = OrderedDict()
+"""Detected languages keyed by series text digest and whether sampled."""
+_series_languages_lock = Lock()
+"""Lock guarding memoized series languages."""
 
-def get_series_language(series: Series) -> Language | None:
+
+def get_series_language(series: Series, *, sample: bool = True) -> Language | None:
     """Get the detected language of a subtitle series.
 
+    When sampling, subtitles are classified in an order spread evenly across the
+    series, stopping once the languages of those classified show a decisive
+    majority. Results are memoized by the text of the series.
+
     Arguments:
         series: subtitle series to classify
+        sample: whether to stop once a decisive majority is found, rather than
+          classifying every subtitle
     Returns:
         detected language, if enough subtitle events agree
     """
+    texts = [subtitle.text for subtitle in series.events]
+    digest = blake2b("\0".join(texts).encode("utf-8"), digest_size=16).digest()
+    key = (digest, sample)
+    with _series_languages_lock:
+        if key in _series_languages:
+            _series_languages.move_to_end(key)
+            return _series_languages[key]
+
+    language = _get_texts_language(texts, sample=sample)
+    with _series_languages_lock:
+        _series_languages[key] = language
+        if len(_series_languages) > SERIES_LANGUAGE_CACHE_SIZE:
+            _series_languages.popitem(last=False)
+    return language
+
+
+def _get_stratified_idxs(count: int) -> Iterator[int]:
+    """Get indexes in an order in which each prefix is spread across a sequence.
+
+    Indexes are visited in bit-reversed order, so that the first two halve the
+    sequence, the first four quarter it, and so on.
+
+    Arguments:
+        count: length of sequence
+    Yields:
+        each index in range(count), once
+    """
+    bits = max(count - 1, 0).bit_length()
+    for i in range(1 << bits):
+        idx = int(f"{i:0{bits}b}"[::-1], 2) if bits else 0
+        if idx < count:
+            yield idx
+
+
+def _get_texts_language(texts: list[str], *, sample: bool) -> Language | None:
+    """Get the detected language of subtitle texts.
+
+    Arguments:
+        texts: subtitle texts to classify
+        sample: whether to stop once a decisive majority is found
+    Returns:
+        detected language, if enough subtitle texts agree
+    """
     counts: Counter[Language] = Counter()
-    for subtitle in series.events:
-        language = LanguageId.from_text(subtitle.text).language
+    for idx in _get_stratified_idxs(len(texts)) if sample else range(len(texts)):
+        language = LanguageId.from_text(texts[idx]).language
         if language is None:
             continue
         counts[language] += 1
+        if sample and _is_decisive(counts):
+            return counts.most_common(1)[0][0]
 
     if not counts:
         return None
@@ -46,3 +112,26 @@ def get_series_language(series: Series) -> Language | None:
     if len(most_common) > 1 and most_common[1][1] == count:
         return None
     return language
+
+
+def _is_decisive(counts: Counter[Language]) -> bool:
+    """Get whether sampled language counts show a decisive majority.
+
+    The majority is decisive if the lower Wilson score bound of its share of
+    conclusive subtitles exceeds one half, so that it is very unlikely to be
+    overtaken by the subtitles not yet sampled.
+
+    Arguments:
+        counts: number of sampled subtitles detected as each language
+    Returns:
+        whether the most common language is decisive
+    """
+    total = counts.total()
+    if total < SERIES_LANGUAGE_SAMPLE_SIZE:
+        return False
+    count = counts.most_common(1)[0][1]
+    z = SERIES_LANGUAGE_SAMPLE_Z
+    share = count / total
+    center = share + z * z / (2 * total)
+    margin = z * sqrt(share * (1 - share) / total + z * z / (4 * total * total))
+    return (center - margin) / (1 + z * z / total) > 0.5
@@ -295,7 +295,7 @@ class GuidedTranscriber:
             output_events.extend(output_block.events)
 
         output_events.sort(key=lambda event: event.start)
-        output = AudioSeries(audio=audio_series.audio, events=output_events)
+        output = AudioSeries(audio=audio_series.audio_view, events=output_events)
         logger.info(f"Concatenated Series:\n{output.to_simple_string()}")
         self.aligner.update_all_test_cases()
         return output
@@ -349,7 +349,7 @@ class GuidedTranscriber:
                 segment for segment in split_segments if segment.text.strip()
             ]
         transcription_block = get_series_from_segments(
-            split_segments, audio=audio_block.audio, offset=offset
+            split_segments, audio=audio_block.audio_view, offset=offset
         )
         alignment = self.aligner.align(reference_block, transcription_block)
         return alignment.transcription
@@ -11,6 +11,10 @@ import pycantonese
 
 from scinoephile.core.script import OpenCCConfig
 from scinoephile.core.text import normalize_nfkc
+from scinoephile.lang.zho.script.character_table import (
+    ZhoCharacterScript,
+    get_zho_character_table,
+)
 from scinoephile.lang.zho.script.conversion import get_zho_text_converted
 
 __all__ = ["CharacterFeatures"]
@@ -51,12 +55,23 @@ class CharacterFeatures:
             cached comparison features
         """
         nfkc = normalize_nfkc(character)
-        simplified = get_zho_text_converted(
-            nfkc, OpenCCConfig.t2s, apply_exclusions=False
-        )
-        traditional = get_zho_text_converted(
-            nfkc, OpenCCConfig.s2t, apply_exclusions=False
-        )
+
+        # Skip conversions that the character table shows cannot change a Hanzi
+        script = ZhoCharacterScript.NON_HANZI
+        if len(nfkc) == 1:
+            script = get_zho_character_table().get_script(nfkc)
+        if script in (ZhoCharacterScript.SHARED, ZhoCharacterScript.SIMPLIFIED):
+            simplified = nfkc
+        else:
+            simplified = get_zho_text_converted(
+                nfkc, OpenCCConfig.t2s, apply_exclusions=False
+            )
+        if script is ZhoCharacterScript.SHARED:
+            traditional = nfkc
+        else:
+            traditional = get_zho_text_converted(
+                nfkc, OpenCCConfig.s2t, apply_exclusions=False
+            )
         script_forms = frozenset({nfkc, simplified, traditional})
         equivalence_groups = frozenset(
             group_idx
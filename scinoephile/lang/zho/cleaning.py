@@ -10,6 +10,14 @@ from scinoephile.core.text import HALF_TO_FULL_PUNC, normalize_text
 
 __all__ = ["get_zho_text_cleaned"]
 
+_HALF_TO_FULL_PUNC_PATTERN = re.compile(
+    rf"\s*([{''.join(re.escape(punc) for punc in HALF_TO_FULL_PUNC)}])\s*"
+)
+"""Half-width punctuation to replace, with surrounding whitespace."""
+
+_HALF_TO_FULL_PUNC_TABLE = str.maketrans(HALF_TO_FULL_PUNC)
+"""Translation table from half-width to full-width punctuation."""
+
 
 def get_zho_text_cleaned(text: str) -> str | None:
     """Get standard Chinese text cleaned.
@@ -38,10 +46,9 @@ def get_zho_text_cleaned(text: str) -> str | None:
         cleaned_line = re.sub(r"[^\S]*·[^\S]*", "・", cleaned_line)
 
         # Replace half-width punctuation with full-width punctuation
-        for old_punc, new_punc in HALF_TO_FULL_PUNC.items():
-            cleaned_line = re.sub(
-                rf"[^\S]*{re.escape(old_punc)}[^\S]*", new_punc, cleaned_line
-            )
+        cleaned_line = _HALF_TO_FULL_PUNC_PATTERN.sub(r"\1", cleaned_line).translate(
+            _HALF_TO_FULL_PUNC_TABLE
+        )
 
         # Clean up double quotes
         cleaned_line = re.sub(r"[“”〞〝\"]", "＂", cleaned_line)
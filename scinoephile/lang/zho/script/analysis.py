@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from scinoephile.core.script import OpenCCConfig
 from scinoephile.core.text import RE_HANZI
 
+from .character_table import ZhoCharacterScript, get_zho_character_table
 from .conversion import get_zho_text_converted
 
 __all__ = [
@@ -46,24 +47,10 @@ def get_zho_script_analysis(text: str) -> ZhoScriptAnalysis:
     Returns:
         Chinese script analysis
     """
-    simplified_count = 0
-    traditional_count = 0
-    shared_count = 0
-
-    for match in RE_HANZI.finditer(text):
-        char = match.group(0)
-        simplified_char = get_zho_text_converted(
-            char, OpenCCConfig.t2s, apply_exclusions=False
-        )
-        traditional_char = get_zho_text_converted(
-            char, OpenCCConfig.s2t, apply_exclusions=False
-        )
-        if char != simplified_char:
-            traditional_count += 1
-        elif char != traditional_char:
-            simplified_count += 1
-        else:
-            shared_count += 1
+    counts = get_zho_character_table().get_script_counts(text)
+    simplified_count = counts[ZhoCharacterScript.SIMPLIFIED]
+    traditional_count = counts[ZhoCharacterScript.TRADITIONAL]
+    shared_count = counts[ZhoCharacterScript.SHARED]
 
     script = None
     if _is_decisively_greater(simplified_count, traditional_count):
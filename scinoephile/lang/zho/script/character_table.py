@@ -0,0 +1,136 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Lookup table of the Chinese script to which each Hanzi code point is specific."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from functools import cache
+from importlib.metadata import version
+
+from scinoephile.core.script import OpenCCConfig
+from scinoephile.core.text import RE_HANZI
+
+from .conversion import get_zho_converter
+
+__all__ = ["ZhoCharacterScript", "ZhoCharacterTable", "get_zho_character_table"]
+
+
+class ZhoCharacterScript(IntEnum):
+    """Chinese script to which a code point is specific."""
+
+    NON_HANZI = 0
+    """Not a Hanzi."""
+    SHARED = 1
+    """Hanzi unchanged by conversion in either direction."""
+    SIMPLIFIED = 2
+    """Hanzi changed by conversion to traditional but not to simplified."""
+    TRADITIONAL = 3
+    """Hanzi changed by conversion to simplified."""
+
+
+class ZhoCharacterTable:
+    """Lookup table of the Chinese script of each code point.
+
+    Scripts are stored one byte per code point in a Latin-1 string, about 200 kB
+    covering every Hanzi block, which str.translate can use to classify all of a
+    text's code points in one pass. Each Hanzi is classified by converting it
+    alone with OpenCC, and so without the context of the phrases around it.
+    """
+
+    def __init__(self, scripts: str, opencc_version: str):
+        """Initialize.
+
+        Arguments:
+            scripts: string whose character at each code point encodes the
+              ZhoCharacterScript of that code point
+            opencc_version: version of OpenCC whose dictionaries built the table
+        """
+        self.scripts = scripts
+        """String whose character at each code point encodes its script."""
+        self.opencc_version = opencc_version
+        """Version of OpenCC whose dictionaries built the table."""
+
+    def __len__(self) -> int:
+        """Number of code points covered."""
+        return len(self.scripts)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return (
+            f"<{self.__class__.__name__} of {len(self)} code points "
+            f"from OpenCC {self.opencc_version}>"
+        )
+
+    def get_script(self, character: str) -> ZhoCharacterScript:
+        """Get the script to which a character is specific.
+
+        Arguments:
+            character: single character
+        Returns:
+            script of character
+        """
+        code_point = ord(character)
+        if code_point >= len(self.scripts):
+            return ZhoCharacterScript.NON_HANZI
+        return ZhoCharacterScript(ord(self.scripts[code_point]))
+
+    def get_script_counts(self, text: str) -> tuple[int, int, int, int]:
+        """Get the number of characters in text specific to each script.
+
+        Arguments:
+            text: text to classify
+        Returns:
+            number of characters of each script, indexed by ZhoCharacterScript
+        """
+        # Code points beyond the table are left untranslated, and are not Hanzi
+        scripts = text.translate(self.scripts)
+        shared_count = scripts.count(chr(ZhoCharacterScript.SHARED))
+        simplified_count = scripts.count(chr(ZhoCharacterScript.SIMPLIFIED))
+        traditional_count = scripts.count(chr(ZhoCharacterScript.TRADITIONAL))
+        return (
+            len(text) - shared_count - simplified_count - traditional_count,
+            shared_count,
+            simplified_count,
+            traditional_count,
+        )
+
+    @classmethod
+    def from_opencc(cls) -> ZhoCharacterTable:
+        """Build table by converting each Hanzi with the installed OpenCC.
+
+        Returns:
+            character table
+        """
+        # Convert all Hanzi at once, separated so that none forms a phrase
+        all_code_points = "".join(map(chr, range(0xD800))) + "".join(
+            map(chr, range(0xE000, 0x40000))
+        )
+        characters = RE_HANZI.findall(all_code_points)
+        text = "\n".join(characters)
+        simplified = get_zho_converter(OpenCCConfig.t2s).convert(text).split("\n")
+        traditional = get_zho_converter(OpenCCConfig.s2t).convert(text).split("\n")
+
+        # Classify each Hanzi
+        scripts = bytearray(ord(characters[-1]) + 1)
+        for character, simplified_character, traditional_character in zip(
+            characters, simplified, traditional, strict=True
+        ):
+            if simplified_character != character:
+                script = ZhoCharacterScript.TRADITIONAL
+            elif traditional_character != character:
+                script = ZhoCharacterScript.SIMPLIFIED
+            else:
+                script = ZhoCharacterScript.SHARED
+            scripts[ord(character)] = script
+        return cls(scripts.decode("latin-1"), version("opencc"))
+
+
+@cache
+def get_zho_character_table() -> ZhoCharacterTable:
+    """Get lookup table of the Chinese script of each code point.
+
+    Returns:
+        character table built from the installed OpenCC, from cache if available
+    """
+    return ZhoCharacterTable.from_opencc()
@@ -56,6 +56,12 @@ class GapTranslationProcessor(Processor):
         block_pairs = get_block_pairs_by_pause(source_one, source_two)
         output_series_to_concatenate: list[Series | None] = [None] * len(block_pairs)
         block_range = val_index_range(len(block_pairs), start_at_idx, stop_at_idx)
+
+        # Query LLM for blocks with gaps
+        test_case_cls = self.test_case_cls
+        query_cls = test_case_cls.query_cls
+        queried_blk_idxs = []
+        test_cases = []
         for blk_idx in block_range:
             one_blk, two_blk = block_pairs[blk_idx]
 
@@ -71,9 +77,7 @@ class GapTranslationProcessor(Processor):
                 output_series_to_concatenate[blk_idx] = one_blk
                 continue
 
-            # Query LLM
-            test_case_cls = self.test_case_cls
-            query_cls = test_case_cls.query_cls
+            # Build query
             targets: list[dict[str, int | str]] = []
             guides: list[dict[str, int | str]] = []
             one_idx = 0
@@ -94,9 +98,14 @@ class GapTranslationProcessor(Processor):
                     }
                 )
             query = query_cls.model_validate({"targets": targets, "guides": guides})
-            test_case = test_case_cls(query=query)
-            test_case = cast(GapTranslationTestCase, self.queryer(test_case))
+            queried_blk_idxs.append(blk_idx)
+            test_cases.append(test_case_cls(query=query))
+        test_cases = self.queryer.query_all(test_cases)
 
+        for blk_idx, test_case in zip(queried_blk_idxs, test_cases, strict=True):
+            one_blk, two_blk = block_pairs[blk_idx]
+            size = len(two_blk)
+            test_case = cast(GapTranslationTestCase, test_case)
             if test_case.answer is None:
                 raise ScinoephileError("Gap translation returned no answer.")
             target_text_by_index = {
@@ -56,14 +56,16 @@ class GuidedReviewProcessor(Processor):
         output_blocks: list[Series | None] = [None] * len(block_pairs)
         block_range = val_index_range(len(block_pairs), start_at_idx, stop_at_idx)
 
+        # Query LLM
+        test_case_cls = self.test_case_cls
+        query_cls = test_case_cls.query_cls
+        queried_block_idxs = []
+        test_cases = []
         for block_idx in block_range:
             target_block, guide_block = block_pairs[block_idx]
             if not target_block:
                 output_blocks[block_idx] = Series()
                 continue
-
-            test_case_cls = self.test_case_cls
-            query_cls = test_case_cls.query_cls
             query = query_cls.model_validate(
                 {
                     "targets": [
@@ -76,9 +78,12 @@ class GuidedReviewProcessor(Processor):
                     ],
                 }
             )
-            test_case = test_case_cls(query=query)
-            test_case = self.queryer(test_case)
+            queried_block_idxs.append(block_idx)
+            test_cases.append(test_case_cls(query=query))
+        test_cases = self.queryer.query_all(test_cases)
 
+        for block_idx, test_case in zip(queried_block_idxs, test_cases, strict=True):
+            target_block = block_pairs[block_idx][0]
             answer = cast(GuidedReviewAnswer, test_case.answer)
             revision_text_by_index = {
                 revision.index: revision.text for revision in answer.revisions
@@ -52,14 +52,17 @@ class GuidedTranslationProcessor(Processor):
         block_pairs = get_block_pairs_by_pause(source_one, source_two)
         output_series_to_concatenate: list[Series | None] = [None] * len(block_pairs)
         block_range = val_index_range(len(block_pairs), start_at_idx, stop_at_idx)
+
+        # Query LLM
+        test_case_cls = self.test_case_cls
+        query_cls = test_case_cls.query_cls
+        queried_blk_idxs = []
+        test_cases = []
         for blk_idx in block_range:
             one_blk, two_blk = block_pairs[blk_idx]
             if not one_blk:
                 output_series_to_concatenate[blk_idx] = Series()
                 continue
-
-            test_case_cls = self.test_case_cls
-            query_cls = test_case_cls.query_cls
             query = query_cls.model_validate(
                 {
                     "subtitles": [
@@ -72,9 +75,12 @@ class GuidedTranslationProcessor(Processor):
                     ],
                 }
             )
-            test_case = test_case_cls(query=query)
-            test_case = self.queryer(test_case)
+            queried_blk_idxs.append(blk_idx)
+            test_cases.append(test_case_cls(query=query))
+        test_cases = self.queryer.query_all(test_cases)
 
+        for blk_idx, test_case in zip(queried_blk_idxs, test_cases, strict=True):
+            one_blk = block_pairs[blk_idx][0]
             answer = cast(GuidedTranslationAnswer, test_case.answer)
             output_text_by_index = {
                 output.index: output.text for output in answer.outputs
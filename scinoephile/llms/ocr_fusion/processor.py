@@ -50,7 +50,9 @@ class OcrFusionProcessor(Processor):
         prompt: OcrFusionPrompt = getattr(self, "prompt")
 
         # Process subtitles
-        output_subtitles = []
+        output_subtitles: list[Subtitle | None] = []
+        queried_sub_idxs = []
+        test_cases = []
         if stop_at_idx is None:
             stop_at_idx = len(source_one)
         elif stop_at_idx < 0:
@@ -92,24 +94,31 @@ class OcrFusionProcessor(Processor):
                 )
                 continue
 
-            # Query LLM
+            # Build query, leaving a placeholder for the fused subtitle
             test_case_cls = self.test_case_cls
             query_cls = test_case_cls.query_cls
             query = query_cls.model_validate(
                 {"source_one": text_one, "source_two": text_two}
             )
-            test_case = test_case_cls(query=query)
-            test_case = self.queryer(test_case)
-
+            queried_sub_idxs.append(sub_idx)
+            test_cases.append(test_case_cls(query=query))
+            output_subtitles.append(None)
+
+        # Query LLM
+        test_cases = self.queryer.query_all(test_cases)
+        for sub_idx, test_case in zip(queried_sub_idxs, test_cases, strict=True):
+            sub_one = source_one.events[sub_idx]
             answer = cast(OcrFusionAnswer, test_case.answer)
             output_text = answer.output
             sub = Subtitle(start=sub_one.start, end=sub_one.end, text=output_text)
             logger.info(
                 f"Subtitle {sub_idx + 1} processed:     {sub.text.replace('\n', '\\n')}"
             )
-            output_subtitles.append(sub)
+            output_subtitles[sub_idx] = sub
 
         self.save_encountered_test_cases()
 
         # Organize and return
-        return Series(events=output_subtitles)
+        return Series(
+            events=[subtitle for subtitle in output_subtitles if subtitle is not None]
+        )
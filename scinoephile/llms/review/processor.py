@@ -47,24 +47,26 @@ class ReviewProcessor(Processor):
         output_series_to_concatenate: list[Series | None] = [None] * len(blocks)
         block_range = val_index_range(len(blocks), start_at_idx, stop_at_idx)
 
-        # Track indices for logging
-        current_idx = sum(len(block) for block in blocks[: block_range.start])
+        # Query LLM
+        test_case_cls = self.test_case_cls
+        query_cls = test_case_cls.query_cls
+        test_cases = []
         for block_idx in block_range:
-            block = blocks[block_idx]
-
-            # Query LLM
-            test_case_cls = self.test_case_cls
-            query_cls = test_case_cls.query_cls
             query = query_cls.model_validate(
                 {
                     "subtitles": [
                         {"index": idx, "text": subtitle.text_with_newline.strip()}
-                        for idx, subtitle in enumerate(block.events, 1)
+                        for idx, subtitle in enumerate(blocks[block_idx].events, 1)
                     ]
                 }
             )
-            test_case = test_case_cls(query=query)
-            test_case = self.queryer(test_case)
+            test_cases.append(test_case_cls(query=query))
+        test_cases = self.queryer.query_all(test_cases)
+
+        # Track indices for logging
+        current_idx = sum(len(block) for block in blocks[: block_range.start])
+        for block_idx, test_case in zip(block_range, test_cases, strict=True):
+            block = blocks[block_idx]
 
             answer = cast(ReviewAnswer, test_case.answer)
             revision_text_by_index = {
@@ -3,7 +3,7 @@
 """Media file operations.
 
 Package hierarchy (modules may import from any above):
-* cache_namespace / constants / offset / probe
-* audio
+* cache_namespace / constants / probe
+* audio / offset
 * subtitles
 """
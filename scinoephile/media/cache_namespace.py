@@ -12,5 +12,7 @@ __all__ = ["MediaCacheNamespace"]
 class MediaCacheNamespace(CacheNamespace):
     """Cache namespaces owned by the media package."""
 
+    OFFSET_VIDEO = "media/offset/video"
+    """Video frames sampled for offset detection."""
     SUBTITLES = "media/subtitles"
     """Extracted subtitle streams and image series."""
@@ -3,5 +3,5 @@
 """Media offset detection.
 
 Package hierarchy (modules may import from any above):
-* video
+* audio / video
 """
@@ -0,0 +1,16 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Audio offset detection from cross-correlated onset envelopes.
+
+Package hierarchy (modules may import from any above):
+* audio_offset_candidate
+* audio_offset_window_result
+* audio_offset_result
+* detection
+"""
+
+from __future__ import annotations
+
+from .audio_offset_result import AudioOffsetResult
+
+__all__ = ["AudioOffsetResult"]
@@ -0,0 +1,23 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Score for one candidate audio offset."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["AudioOffsetCandidate"]
+
+
+@dataclass(frozen=True)
+class AudioOffsetCandidate:
+    """Score for one candidate audio offset."""
+
+    offset: float
+    """Target timestamp minus reference timestamp in seconds."""
+
+    matched_count: int
+    """Number of overlapping envelope samples compared."""
+
+    score: float
+    """Normalized envelope cross-correlation; higher values are better."""
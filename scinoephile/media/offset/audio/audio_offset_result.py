@@ -0,0 +1,48 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Best audio offset estimate between two media files."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .audio_offset_candidate import AudioOffsetCandidate
+from .audio_offset_window_result import AudioOffsetWindowResult
+
+__all__ = ["AudioOffsetResult"]
+
+
+@dataclass(frozen=True)
+class AudioOffsetResult:
+    """Best audio offset estimate between two media files."""
+
+    offset: float
+    """Estimated target timestamp minus reference timestamp in seconds.
+
+    When drift is estimated, this is the offset at reference timestamp zero.
+    """
+
+    confidence: str
+    """Confidence label for the estimate."""
+
+    best: AudioOffsetCandidate
+    """Best-scoring candidate offset."""
+
+    second_best: AudioOffsetCandidate | None
+    """Second-best distinct candidate offset, if available."""
+
+    drift: float = 0.0
+    """Change in offset per second of reference time."""
+
+    windows: tuple[AudioOffsetWindowResult, ...] = ()
+    """Per-window results when drift was estimated."""
+
+    def get_offset_at(self, time: float) -> float:
+        """Get the estimated offset at a reference timestamp.
+
+        Arguments:
+            time: reference timestamp in seconds
+        Returns:
+            target timestamp minus reference timestamp in seconds
+        """
+        return self.offset + self.drift * time
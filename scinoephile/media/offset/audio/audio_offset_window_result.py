@@ -0,0 +1,31 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Audio offset estimate for one sampled window."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .audio_offset_candidate import AudioOffsetCandidate
+
+__all__ = ["AudioOffsetWindowResult"]
+
+
+@dataclass(frozen=True)
+class AudioOffsetWindowResult:
+    """Audio offset estimate for one sampled window."""
+
+    start_time: float
+    """Window start time in seconds."""
+
+    offset: float
+    """Estimated target timestamp minus reference timestamp in seconds."""
+
+    confidence: str
+    """Confidence label for the estimate."""
+
+    best: AudioOffsetCandidate
+    """Best-scoring candidate offset."""
+
+    second_best: AudioOffsetCandidate | None
+    """Second-best distinct candidate offset, if available."""
@@ -0,0 +1,460 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Audio offset detection from cross-correlated onset envelopes."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from math import nextafter
+from pathlib import Path
+
+import ffmpeg
+import numpy as np
+
+from scinoephile.common.validation import val_float, val_int
+from scinoephile.core.exceptions import ScinoephileError
+
+from .audio_offset_candidate import AudioOffsetCandidate
+from .audio_offset_result import AudioOffsetResult
+from .audio_offset_window_result import AudioOffsetWindowResult
+
+__all__ = ["get_audio_offset", "get_envelope_offset", "sample_audio_envelope"]
+
+logger = getLogger(__name__)
+
+_AUDIO_SAMPLE_RATE = 8000
+"""Sample rate in samples per second at which audio is decoded."""
+
+_DRIFT_TOLERANCE = 0.04
+"""Maximum deviation in seconds of a window offset from the fitted drift."""
+
+_PEAK_SEPARATION = 0.5
+"""Minimum separation in seconds of the second-best from the best offset."""
+
+_READ_SIZE = 1 << 20
+"""Number of bytes of decoded audio read from ffmpeg at once."""
+
+
+def get_audio_offset(
+    *,
+    reference_infile_path: Path,
+    target_infile_path: Path,
+    max_offset: float = 10.0,
+    envelope_rate: float = 100.0,
+    estimate_drift: bool = False,
+    duration: float = 300.0,
+    sample_windows: int = 4,
+    reference_stream_index: int | None = None,
+    target_stream_index: int | None = None,
+) -> AudioOffsetResult:
+    """Estimate the offset between the audio of two media files.
+
+    Each file's audio is streamed once through ffmpeg into an onset envelope, the
+    two concurrently, and the envelopes are then compared by get_envelope_offset.
+
+    Arguments:
+        reference_infile_path: reference media input path
+        target_infile_path: target media input path
+        max_offset: maximum absolute offset to search, in seconds
+        envelope_rate: onset envelope rate in samples per second
+        estimate_drift: whether to estimate linear drift in addition to offset
+        duration: duration of each window in seconds, when estimating drift
+        sample_windows: number of windows, when estimating drift
+        reference_stream_index: absolute reference audio stream index, or None for
+          the first audio stream
+        target_stream_index: absolute target audio stream index, or None for the
+          first audio stream
+    Returns:
+        estimated audio offset result
+    Raises:
+        ValueError: if numeric parameters are invalid
+        ScinoephileError: if audio cannot be sampled or correlated
+    """
+    # Validate numeric search parameters
+    positive_float_min = nextafter(0.0, 1.0)
+    max_offset = val_float(max_offset, min_value=positive_float_min)
+    envelope_rate = val_float(
+        envelope_rate, min_value=positive_float_min, max_value=_AUDIO_SAMPLE_RATE
+    )
+    duration = val_float(duration, min_value=positive_float_min)
+    sample_windows = val_int(sample_windows, min_value=2 if estimate_drift else 1)
+
+    # Sample the envelopes of both files concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reference_future, target_future = (
+            executor.submit(
+                sample_audio_envelope,
+                infile_path,
+                envelope_rate=envelope_rate,
+                stream_index=stream_index,
+            )
+            for infile_path, stream_index in (
+                (reference_infile_path, reference_stream_index),
+                (target_infile_path, target_stream_index),
+            )
+        )
+        reference_envelope = reference_future.result()
+        target_envelope = target_future.result()
+    return get_envelope_offset(
+        reference_envelope,
+        target_envelope,
+        max_offset=max_offset,
+        envelope_rate=_get_envelope_rate(envelope_rate),
+        estimate_drift=estimate_drift,
+        duration=duration,
+        sample_windows=sample_windows,
+    )
+
+
+def get_envelope_offset(
+    reference_envelope: np.ndarray,
+    target_envelope: np.ndarray,
+    *,
+    max_offset: float = 10.0,
+    envelope_rate: float = 100.0,
+    estimate_drift: bool = False,
+    duration: float = 300.0,
+    sample_windows: int = 4,
+) -> AudioOffsetResult:
+    """Estimate the offset between two onset envelopes.
+
+    A constant offset is found by FFT cross-correlation of the complete envelopes.
+    Drift is instead found by fitting a line to the offsets of several windows of
+    the reference, each correlated against nearby target envelope. If the shared
+    envelope is too short for windows to start at distinct times, a constant
+    offset is estimated instead, with zero drift.
+
+    Arguments:
+        reference_envelope: reference onset envelope
+        target_envelope: target onset envelope
+        max_offset: maximum absolute offset to search, in seconds
+        envelope_rate: envelope rate in samples per second
+        estimate_drift: whether to estimate linear drift in addition to offset
+        duration: duration of each window in seconds, when estimating drift
+        sample_windows: number of windows, when estimating drift
+    Returns:
+        estimated audio offset result
+    Raises:
+        ValueError: if numeric parameters are invalid
+        ScinoephileError: if the envelopes do not overlap enough
+    """
+    positive_float_min = nextafter(0.0, 1.0)
+    max_offset = val_float(max_offset, min_value=positive_float_min)
+    envelope_rate = val_float(envelope_rate, min_value=positive_float_min)
+    duration = val_float(duration, min_value=positive_float_min)
+    sample_windows = val_int(sample_windows, min_value=2 if estimate_drift else 1)
+    max_lag = int(round(max_offset * envelope_rate))
+
+    # Place windows across the shared envelope; drift cannot be fit unless at
+    # least two windows start at distinct times
+    window_starts = []
+    window_length = 0
+    if estimate_drift:
+        window_length = min(
+            int(round(duration * envelope_rate)),
+            len(reference_envelope),
+            len(target_envelope),
+        )
+        max_start = min(len(reference_envelope), len(target_envelope)) - window_length
+        window_starts = [
+            int(round(max_start * (0.1 + 0.8 * index / (sample_windows - 1))))
+            for index in range(sample_windows)
+        ]
+        if len(set(window_starts)) < 2:
+            logger.warning(
+                "Envelopes are too short to sample distinct windows of "
+                f"{duration:g} s; estimating a constant offset without drift."
+            )
+            estimate_drift = False
+
+    if not estimate_drift:
+        best, second_best = _get_offset_candidates(
+            reference_envelope,
+            target_envelope,
+            lag_shift=0,
+            max_lag=max_lag,
+            envelope_rate=envelope_rate,
+        )
+        return AudioOffsetResult(
+            offset=best.offset,
+            confidence=_get_candidate_confidence(best=best, second_best=second_best),
+            best=best,
+            second_best=second_best,
+        )
+
+    # Correlate each window of the reference against nearby target audio
+    windows = []
+    for window_start in window_starts:
+        target_start = max(0, window_start - max_lag)
+        target_end = window_start + window_length + max_lag
+        best, second_best = _get_offset_candidates(
+            reference_envelope[window_start : window_start + window_length],
+            target_envelope[target_start:target_end],
+            lag_shift=target_start - window_start,
+            max_lag=max_lag,
+            envelope_rate=envelope_rate,
+        )
+        windows.append(
+            AudioOffsetWindowResult(
+                start_time=window_start / envelope_rate,
+                offset=best.offset,
+                confidence=_get_candidate_confidence(
+                    best=best, second_best=second_best
+                ),
+                best=best,
+                second_best=second_best,
+            )
+        )
+
+    # Fit offset and drift to the window offsets
+    times = np.array([window.start_time for window in windows])
+    times += window_length / envelope_rate / 2
+    offsets = np.array([window.offset for window in windows])
+    drift, offset = np.polyfit(times, offsets, 1)
+    residuals = np.abs(offsets - (offset + drift * times))
+    best_window = min(
+        zip(windows, residuals, strict=True),
+        key=lambda item: (item[1], -item[0].best.score),
+    )[0]
+    return AudioOffsetResult(
+        offset=float(offset),
+        confidence=_get_drift_confidence(tuple(windows), residuals),
+        best=best_window.best,
+        second_best=best_window.second_best,
+        drift=float(drift),
+        windows=tuple(windows),
+    )
+
+
+def sample_audio_envelope(
+    infile_path: Path, *, envelope_rate: float = 100.0, stream_index: int | None = None
+) -> np.ndarray:
+    """Sample the onset envelope of a media file's audio.
+
+    Audio is decoded to low-rate mono by ffmpeg and streamed through a pipe, so that
+    only the envelope of a complete feature is held in memory. The envelope is the
+    rectified rise in log energy between consecutive blocks, which is insensitive
+    to differences in level and equalization between releases.
+
+    Arguments:
+        infile_path: media input path
+        envelope_rate: envelope rate in samples per second
+        stream_index: absolute audio stream index, or None for the first audio stream
+    Returns:
+        onset envelope
+    Raises:
+        ScinoephileError: if ffmpeg fails or no audio is sampled
+    """
+    block_size = _get_block_size(envelope_rate)
+    block_bytes = block_size * 4
+    stream_map = "0:a:0" if stream_index is None else f"0:{stream_index}"
+
+    # Stream decoded audio through per-block log energies
+    log_energies = []
+    try:
+        process = (
+            ffmpeg.input(str(infile_path))
+            .output(
+                "pipe:",
+                map=stream_map,
+                format="f32le",
+                acodec="pcm_f32le",
+                ac=1,
+                ar=_AUDIO_SAMPLE_RATE,
+            )
+            .global_args("-nostdin", "-loglevel", "error")
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+    except OSError as exc:
+        raise ScinoephileError(f"Could not sample audio from {infile_path}") from exc
+    remainder = b""
+    while chunk := process.stdout.read(_READ_SIZE):
+        data = remainder + chunk
+        usable = len(data) // block_bytes * block_bytes
+        blocks = np.frombuffer(data[:usable], dtype=np.float32)
+        blocks = blocks.reshape((-1, block_size))
+        log_energies.append(np.log(np.mean(np.square(blocks), axis=1) + 1e-10))
+        remainder = data[usable:]
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        logger.error(stderr.decode("utf-8", errors="replace").strip())
+        raise ScinoephileError(f"Could not sample audio from {infile_path}")
+
+    log_energy = np.concatenate(log_energies) if log_energies else np.empty(0)
+    if len(log_energy) < 2:
+        raise ScinoephileError(f"No audio sampled from {infile_path}")
+    return np.maximum(np.diff(log_energy, prepend=log_energy[0]), 0).astype(np.float32)
+
+
+def _get_block_size(envelope_rate: float) -> int:
+    """Get the number of decoded audio samples per envelope sample.
+
+    Arguments:
+        envelope_rate: requested envelope rate in samples per second
+    Returns:
+        block size
+    """
+    return max(1, int(round(_AUDIO_SAMPLE_RATE / envelope_rate)))
+
+
+def _get_candidate_confidence(
+    *, best: AudioOffsetCandidate, second_best: AudioOffsetCandidate | None
+) -> str:
+    """Classify confidence from correlation peak separation.
+
+    Arguments:
+        best: best candidate
+        second_best: second-best distinct candidate
+    Returns:
+        confidence label
+    """
+    if second_best is None or best.score <= 0:
+        return "low"
+    if second_best.score <= 0:
+        return "high"
+
+    ratio = best.score / second_best.score
+    if ratio >= 3.0:
+        return "high"
+    if ratio >= 1.5:
+        return "medium"
+    return "low"
+
+
+def _get_cross_correlation(
+    reference: np.ndarray, target: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the normalized cross-correlation of two envelopes at every lag.
+
+    Arguments:
+        reference: reference envelope
+        target: target envelope
+    Returns:
+        correlation at each lag from -(len(reference) - 1) to len(target) - 1, in
+        which target index minus reference index is the lag, and the number of
+        overlapping samples at each lag
+    """
+    reference = _get_standardized(reference)
+    target = _get_standardized(target)
+    size = len(reference) + len(target) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    correlation = np.fft.irfft(
+        np.conj(np.fft.rfft(reference, fft_size)) * np.fft.rfft(target, fft_size),
+        fft_size,
+    )
+    correlation = np.concatenate(
+        (correlation[fft_size - len(reference) + 1 :], correlation[: len(target)])
+    )
+    lags = np.arange(-(len(reference) - 1), len(target))
+    overlaps = np.minimum(len(reference), len(target) - lags) - np.maximum(0, -lags)
+    return correlation / np.maximum(overlaps, 1), overlaps
+
+
+def _get_drift_confidence(
+    windows: tuple[AudioOffsetWindowResult, ...], residuals: np.ndarray
+) -> str:
+    """Return drift confidence from window agreement with the fitted drift.
+
+    Arguments:
+        windows: per-window results
+        residuals: absolute deviation of each window offset from the fitted drift
+    Returns:
+        confidence label
+    """
+    agreeing_count = int(np.sum(residuals <= _DRIFT_TOLERANCE))
+    if agreeing_count == len(windows):
+        if any(window.confidence == "high" for window in windows):
+            return "high"
+        return "medium"
+    if agreeing_count > len(windows) / 2:
+        return "medium"
+    return "low"
+
+
+def _get_envelope_rate(envelope_rate: float) -> float:
+    """Get the envelope rate realized by whole blocks of decoded audio.
+
+    Arguments:
+        envelope_rate: requested envelope rate in samples per second
+    Returns:
+        realized envelope rate in samples per second
+    """
+    return _AUDIO_SAMPLE_RATE / _get_block_size(envelope_rate)
+
+
+def _get_offset_candidates(
+    reference: np.ndarray,
+    target: np.ndarray,
+    *,
+    lag_shift: int,
+    max_lag: int,
+    envelope_rate: float,
+) -> tuple[AudioOffsetCandidate, AudioOffsetCandidate | None]:
+    """Get the best and second-best offsets of two envelopes.
+
+    Arguments:
+        reference: reference envelope
+        target: target envelope
+        lag_shift: start of target minus start of reference in the full envelopes,
+          in envelope samples
+        max_lag: maximum absolute offset to search in the full envelopes, in
+          envelope samples
+        envelope_rate: envelope rate in samples per second
+    Returns:
+        best and second-best distinct candidates
+    Raises:
+        ScinoephileError: if the envelopes do not overlap enough at any offset
+    """
+    correlation, overlaps = _get_cross_correlation(reference, target)
+    lags = np.arange(-(len(reference) - 1), len(target)) + lag_shift
+    valid = (np.abs(lags) <= max_lag) & (
+        overlaps >= min(len(reference), len(target)) // 2
+    )
+    if not np.any(valid):
+        raise ScinoephileError("Could not find enough overlapping audio")
+    correlation = np.where(valid, correlation, -np.inf)
+
+    # Refine the best lag between envelope samples with a parabolic fit
+    best_index = int(np.argmax(correlation))
+    refinement = 0.0
+    if 0 < best_index < len(correlation) - 1 and np.all(
+        valid[best_index - 1 : best_index + 2]
+    ):
+        before, peak, after = correlation[best_index - 1 : best_index + 2]
+        curvature = before - 2 * peak + after
+        if curvature < 0:
+            refinement = 0.5 * (before - after) / curvature
+    best = AudioOffsetCandidate(
+        offset=float((lags[best_index] + refinement) / envelope_rate),
+        matched_count=int(overlaps[best_index]),
+        score=float(correlation[best_index]),
+    )
+
+    # Find the best candidate distinct from the best
+    separation = int(np.ceil(_PEAK_SEPARATION * envelope_rate))
+    distinct = valid & (np.abs(lags - lags[best_index]) >= separation)
+    if not np.any(distinct):
+        return best, None
+    second_index = int(np.argmax(np.where(distinct, correlation, -np.inf)))
+    second_best = AudioOffsetCandidate(
+        offset=float(lags[second_index] / envelope_rate),
+        matched_count=int(overlaps[second_index]),
+        score=float(correlation[second_index]),
+    )
+    return best, second_best
+
+
+def _get_standardized(envelope: np.ndarray) -> np.ndarray:
+    """Get an envelope with zero mean and unit variance.
+
+    Arguments:
+        envelope: envelope
+    Returns:
+        standardized envelope
+    """
+    envelope = envelope.astype(np.float64) - float(np.mean(envelope))
+    std = float(np.std(envelope))
+    if std > 0:
+        envelope /= std
+    return envelope
@@ -3,7 +3,8 @@
 """Video offset detection from sampled frame comparisons.
 
 Package hierarchy (modules may import from any above):
-* video_frame_sample / video_metadata / video_offset_aggregate / video_offset_candidate
+* video_frame_cache / video_frame_sample / video_metadata
+* video_offset_aggregate / video_offset_candidate
 * video_offset_window_result
 * video_offset_result
 * detection
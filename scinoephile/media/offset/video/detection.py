@@ -10,21 +10,26 @@ See `docs/THIRD_PARTY_NOTICES.md` for license details.
 
 from __future__ import annotations
 
-from bisect import bisect_left
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from functools import partial
 from logging import getLogger
 from math import ceil, floor, nextafter
+from os import cpu_count
 from pathlib import Path
 from statistics import mean, median, pstdev
+from tempfile import TemporaryDirectory
 from typing import cast
 
 import ffmpeg
+import numba as nb
 import numpy as np
 
 from scinoephile.common.validation import val_float, val_int
 from scinoephile.core.exceptions import ScinoephileError
 
+from .video_frame_cache import VideoFrameCache
 from .video_frame_sample import VideoFrameSample
 from .video_metadata import VideoMetadata
 from .video_offset_aggregate import VideoOffsetAggregate
@@ -32,7 +37,12 @@ from .video_offset_candidate import VideoOffsetCandidate
 from .video_offset_result import VideoOffsetResult
 from .video_offset_window_result import VideoOffsetWindowResult
 
-__all__ = ["get_offsets", "get_video_offset", "sample_video_frames"]
+__all__ = [
+    "get_offsets",
+    "get_video_offset",
+    "sample_video_frames",
+    "sample_video_windows",
+]
 
 logger = getLogger(__name__)
 
@@ -74,9 +84,13 @@ def get_video_offset(
     sample_windows: int = 4,
     width: int = 160,
     height: int = 90,
+    frame_cache: VideoFrameCache | None = None,
 ) -> VideoOffsetResult:
     """Estimate the constant visual offset between two video files.
 
+    Each file is decoded once for all sample windows, the two concurrently, and the
+    windows are then searched concurrently.
+
     Arguments:
         reference_infile_path: reference media input path
         target_infile_path: target media input path
@@ -87,6 +101,7 @@ def get_video_offset(
         sample_windows: number of sampled windows
         width: sampled frame width in pixels
         height: sampled frame height in pixels
+        frame_cache: sampled video frame cache, or None for default
     Returns:
         estimated visual offset result
     Raises:
@@ -122,22 +137,44 @@ def get_video_offset(
         target_duration=target_metadata.duration,
     )
 
+    # Sample all windows of both files, decoding the two files concurrently
+    if frame_cache is None:
+        frame_cache = VideoFrameCache()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reference_future, target_future = (
+            executor.submit(
+                sample_video_windows,
+                infile_path,
+                sample_rate=sample_rate,
+                start_times=start_times,
+                duration=duration,
+                width=width,
+                height=height,
+                frame_cache=frame_cache,
+            )
+            for infile_path in (reference_infile_path, target_infile_path)
+        )
+        reference_windows = reference_future.result()
+        target_windows = target_future.result()
+
     # Run one independent visual search per sampled window
-    window_results = tuple(
-        _get_video_offset_window(
-            reference_infile_path=reference_infile_path,
-            target_infile_path=target_infile_path,
-            max_offset=max_offset,
-            sample_rate=sample_rate,
-            start_time=window_start_time,
-            duration=duration,
-            coarse_step=coarse_step,
-            frame_duration=frame_duration,
-            width=width,
-            height=height,
+    with ThreadPoolExecutor(
+        max_workers=min(len(start_times), cpu_count() or 1)
+    ) as executor:
+        window_results = tuple(
+            executor.map(
+                partial(
+                    _get_video_offset_window,
+                    max_offset=max_offset,
+                    sample_rate=sample_rate,
+                    coarse_step=coarse_step,
+                    frame_duration=frame_duration,
+                ),
+                reference_windows,
+                target_windows,
+                start_times,
+            )
         )
-        for window_start_time in start_times
-    )
 
     if len(window_results) == 1:
         window = window_results[0]
@@ -191,22 +228,17 @@ def sample_video_frames(
     Raises:
         ScinoephileError: if ffmpeg fails or no frames are sampled
     """
-    frame_size = width * height
-
-    # Build ffmpeg input options for the requested sample window
-    input_kwargs = {}
-    if start_time > 0:
-        input_kwargs["ss"] = start_time
-    if duration > 0:
-        input_kwargs["t"] = duration
-
     # Decode scaled grayscale frames as raw bytes
     try:
         output, _ = (
-            ffmpeg.input(str(infile_path), **input_kwargs)
-            .filter("fps", fps=sample_rate)
-            .filter("scale", width, height)
-            .filter("format", "gray")
+            _get_sampled_video_stream(
+                infile_path,
+                sample_rate=sample_rate,
+                start_time=start_time,
+                duration=duration,
+                width=width,
+                height=height,
+            )
             .output("pipe:", format="rawvideo", pix_fmt="gray")
             .run(capture_stdout=True, capture_stderr=True)
         )
@@ -215,30 +247,93 @@ def sample_video_frames(
             f"Could not sample video frames from {infile_path}"
         ) from exc
 
-    if len(output) < frame_size:
-        raise ScinoephileError(f"No video frames sampled from {infile_path}")
-    if len(output) % frame_size != 0:
-        logger.warning(
-            f"Truncating partial sampled video frame from {infile_path}: "
-            f"{len(output) % frame_size} trailing bytes"
-        )
+    frames = _get_frames(output, infile_path=infile_path, width=width, height=height)
+    return _get_frame_samples(frames, sample_rate=sample_rate)
 
-    frame_count = len(output) // frame_size
 
-    # Reshape raw frame bytes into sample objects
-    array = np.frombuffer(output[: frame_count * frame_size], dtype=np.uint8)
-    array = array.reshape((frame_count, height, width)).astype(np.float32)
+def sample_video_windows(
+    infile_path: Path,
+    *,
+    sample_rate: float,
+    start_times: list[float],
+    duration: float,
+    width: int,
+    height: int,
+    frame_cache: VideoFrameCache | None = None,
+) -> list[list[VideoFrameSample]]:
+    """Sample grayscale frames from several windows of a video file.
+
+    Windows that are not cached are decoded by a single ffmpeg process, which seeks
+    to each window in turn.
+
+    Arguments:
+        infile_path: media input path
+        sample_rate: samples per second
+        start_times: media timestamps at which sampling windows start, in seconds
+        duration: sampled window duration in seconds
+        width: output frame width
+        height: output frame height
+        frame_cache: sampled video frame cache, or None to decode every window
+    Returns:
+        sampled video frames of each window
+    Raises:
+        ScinoephileError: if ffmpeg fails or no frames are sampled from a window
+    """
+    window_kwargs = [
+        {
+            "sample_rate": sample_rate,
+            "start_time": start_time,
+            "duration": duration,
+            "width": width,
+            "height": height,
+        }
+        for start_time in start_times
+    ]
+
+    # Load cached windows
+    frames_by_window: list[np.ndarray | None] = [None] * len(start_times)
+    if frame_cache is not None:
+        for index, kwargs in enumerate(window_kwargs):
+            frames_by_window[index] = frame_cache.load(infile_path, **kwargs)
 
-    # Normalize brightness once per sampled frame
-    for index in range(frame_count):
-        frame = array[index]
-        frame_std = float(np.std(frame))
-        if frame_std > 0:
-            array[index] = (frame - float(np.mean(frame))) / frame_std
+    # Decode the remaining windows to one raw video file each in a single pass
+    missing_indexes = [
+        index for index, frames in enumerate(frames_by_window) if frames is None
+    ]
+    if missing_indexes:
+        with TemporaryDirectory() as temp_dir:
+            outfile_paths = [
+                Path(temp_dir) / f"{index}.gray" for index in missing_indexes
+            ]
+            outputs = [
+                _get_sampled_video_stream(infile_path, **window_kwargs[index]).output(
+                    str(outfile_path), format="rawvideo", pix_fmt="gray"
+                )
+                for index, outfile_path in zip(missing_indexes, outfile_paths)
+            ]
+            try:
+                ffmpeg.merge_outputs(*outputs).run(
+                    capture_stdout=True, capture_stderr=True, overwrite_output=True
+                )
+            except ffmpeg.Error as exc:
+                raise ScinoephileError(
+                    f"Could not sample video frames from {infile_path}"
+                ) from exc
+            for index, outfile_path in zip(missing_indexes, outfile_paths):
+                frames = _get_frames(
+                    outfile_path.read_bytes(),
+                    infile_path=infile_path,
+                    width=width,
+                    height=height,
+                )
+                frames_by_window[index] = frames
+                if frame_cache is not None:
+                    frame_cache.save(infile_path, frames, **window_kwargs[index])
 
     return [
-        VideoFrameSample(time=index / sample_rate, frame=array[index])
-        for index in range(frame_count)
+        _get_frame_samples(frames, sample_rate=sample_rate)
+        for frames in frames_by_window
+        if frames is not None
     ]
 
 
@@ -345,6 +440,85 @@ def _get_frame_grid_offsets(
     ]
 
 
+def _get_frame_samples(
+    frames: np.ndarray, *, sample_rate: float
+) -> list[VideoFrameSample]:
+    """Return brightness-normalized samples of grayscale frames.
+
+    Arguments:
+        frames: grayscale frames of shape (frames, height, width)
+        sample_rate: samples per second
+    Returns:
+        sampled video frames
+    """
+    array = frames.astype(np.float32)
+    means = array.mean(axis=(1, 2), keepdims=True)
+    stds = array.std(axis=(1, 2), keepdims=True)
+    np.divide(array - means, stds, out=array, where=stds > 0)
+    return [
+        VideoFrameSample(time=index / sample_rate, frame=array[index])
+        for index in range(len(array))
+    ]
+
+
+def _get_frames(
+    output: bytes, *, infile_path: Path, width: int, height: int
+) -> np.ndarray:
+    """Return grayscale frames from raw ffmpeg output.
+
+    Arguments:
+        output: raw grayscale video bytes
+        infile_path: media input path, for messages
+        width: frame width
+        height: frame height
+    Returns:
+        grayscale frames of shape (frames, height, width)
+    Raises:
+        ScinoephileError: if no frames were sampled
+    """
+    frame_size = width * height
+    if len(output) < frame_size:
+        raise ScinoephileError(f"No video frames sampled from {infile_path}")
+    if len(output) % frame_size != 0:
+        logger.warning(
+            f"Truncating partial sampled video frame from {infile_path}: "
+            f"{len(output) % frame_size} trailing bytes"
+        )
+
+    frame_count = len(output) // frame_size
+    array = np.frombuffer(output[: frame_count * frame_size], dtype=np.uint8)
+    return array.reshape((frame_count, height, width))
+
+
+@nb.jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def _get_mean_absolute_differences(
+    reference_frames: np.ndarray,
+    target_frames: np.ndarray,
+    reference_indexes: np.ndarray,
+    target_indexes: np.ndarray,
+) -> np.ndarray:
+    """Return mean absolute differences of pairs of flattened frames.
+
+    Arguments:
+        reference_frames: flattened reference frames
+        target_frames: flattened target frames
+        reference_indexes: reference frame index of each pair
+        target_indexes: target frame index of each pair
+    Returns:
+        mean absolute difference of each pair
+    """
+    pixel_count = reference_frames.shape[1]
+    scores = np.empty(len(reference_indexes), dtype=np.float32)
+    for pair_index in range(len(reference_indexes)):
+        reference_frame = reference_frames[reference_indexes[pair_index]]
+        target_frame = target_frames[target_indexes[pair_index]]
+        total = np.float32(0.0)
+        for pixel_index in range(pixel_count):
+            total += abs(reference_frame[pixel_index] - target_frame[pixel_index])
+        scores[pair_index] = total / pixel_count
+    return scores
+
+
 def _get_sample_window_starts(
     *,
     duration: float,
@@ -374,52 +548,63 @@ def _get_sample_window_starts(
     return [round(start + step * index, 6) for index in range(sample_windows)]
 
 
-def _get_video_offset_window(
+def _get_sampled_video_stream(
+    infile_path: Path,
     *,
-    reference_infile_path: Path,
-    target_infile_path: Path,
-    max_offset: float,
     sample_rate: float,
     start_time: float,
     duration: float,
-    coarse_step: float,
-    frame_duration: float,
     width: int,
     height: int,
+) -> ffmpeg.nodes.FilterableStream:
+    """Return an ffmpeg stream of scaled grayscale frames from one window.
+
+    Arguments:
+        infile_path: media input path
+        sample_rate: samples per second
+        start_time: media timestamp at which sampling starts, in seconds
+        duration: sampled window duration in seconds
+        width: output frame width
+        height: output frame height
+    Returns:
+        ffmpeg stream
+    """
+    input_kwargs = {}
+    if start_time > 0:
+        input_kwargs["ss"] = start_time
+    if duration > 0:
+        input_kwargs["t"] = duration
+    return (
+        ffmpeg.input(str(infile_path), **input_kwargs)
+        .filter("fps", fps=sample_rate)
+        .filter("scale", width, height)
+        .filter("format", "gray")
+    )
+
+
+def _get_video_offset_window(
+    reference_samples: list[VideoFrameSample],
+    target_samples: list[VideoFrameSample],
+    start_time: float,
+    *,
+    max_offset: float,
+    sample_rate: float,
+    coarse_step: float,
+    frame_duration: float,
 ) -> VideoOffsetWindowResult:
     """Estimate video offset for one sample window.
 
     Arguments:
-        reference_infile_path: reference media input path
-        target_infile_path: target media input path
+        reference_samples: reference video samples of the window
+        target_samples: target video samples of the window
+        start_time: media timestamp at which sampling starts, in seconds
         max_offset: maximum absolute offset to search, in seconds
         sample_rate: frame sample rate in samples per second
-        start_time: media timestamp at which sampling starts, in seconds
-        duration: sampled window duration in seconds
         coarse_step: coarse search step in seconds
         frame_duration: reference frame duration in seconds
-        width: sampled frame width in pixels
-        height: sampled frame height in pixels
     Returns:
         window offset result
     """
-    reference_samples = sample_video_frames(
-        reference_infile_path,
-        sample_rate=sample_rate,
-        start_time=start_time,
-        duration=duration,
-        width=width,
-        height=height,
-    )
-    target_samples = sample_video_frames(
-        target_infile_path,
-        sample_rate=sample_rate,
-        start_time=start_time,
-        duration=duration,
-        width=width,
-        height=height,
-    )
-
     # Search the full offset range at coarse resolution
     min_matches = max(2, int(sample_rate * 2))
     coarse_offsets = get_offsets(-max_offset, max_offset, coarse_step)
@@ -585,6 +770,9 @@ def _score_offsets(
 ) -> list[VideoOffsetCandidate]:
     """Score candidate offsets.
 
+    Each reference sample is matched to the nearest target sample at each offset at
+    once, and each distinct matched pair of frames is compared only once.
+
     Arguments:
         reference_samples: reference video samples
         target_samples: target video samples
@@ -595,46 +783,64 @@ def _score_offsets(
     Returns:
         sorted candidate scores
     """
-    candidates = []
+    if not offsets or not reference_samples or not target_samples:
+        return []
     tolerance = 0.49 / sample_rate
 
-    # Precompute target timestamps for nearest-frame lookup
-    target_times = [sample.time for sample in target_samples]
-
-    for offset in offsets:
-        scores = []
-        for reference_sample in reference_samples:
-            # Match each reference sample to the nearest target sample
-            target_time = reference_sample.time + offset
-            best_index = None
-            best_delta = tolerance
-            insertion_index = bisect_left(target_times, target_time)
-            for index in [insertion_index - 1, insertion_index]:
-                if index < 0 or index >= len(target_samples):
-                    continue
-                delta = abs(target_times[index] - target_time)
-                if delta <= best_delta:
-                    best_delta = delta
-                    best_index = index
-            if best_index is None:
-                continue
-
-            target_sample = target_samples[best_index]
-            reference_frame = reference_sample.frame
-            target_frame = target_sample.frame
-            scores.append(float(np.mean(np.abs(reference_frame - target_frame))))
-
-        # Keep candidate offsets with enough matched samples
-        if len(scores) >= min_matches:
-            offset_frames = None
-            if frame_duration is not None:
-                offset_frames = int(round(offset / frame_duration))
-            candidates.append(
-                VideoOffsetCandidate(
-                    offset=offset,
-                    matched_count=len(scores),
-                    score=float(np.median(np.array(scores, dtype=np.float32))),
-                    offset_frames=offset_frames,
-                )
+    # Match each reference sample to the nearest target sample at every offset
+    reference_times = np.array([sample.time for sample in reference_samples])
+    target_times = np.array([sample.time for sample in target_samples])
+    target_count = len(target_times)
+    shifted_times = reference_times[np.newaxis, :] + np.array(offsets)[:, np.newaxis]
+    insertion_indexes = np.searchsorted(target_times, shifted_times, side="left")
+    previous_indexes = np.clip(insertion_indexes - 1, 0, target_count - 1)
+    next_indexes = np.clip(insertion_indexes, 0, target_count - 1)
+    previous_deltas = np.abs(target_times[previous_indexes] - shifted_times)
+    next_deltas = np.abs(target_times[next_indexes] - shifted_times)
+    previous_matches = (insertion_indexes > 0) & (previous_deltas <= tolerance)
+    next_matches = (insertion_indexes < target_count) & (
+        next_deltas <= np.where(previous_matches, previous_deltas, tolerance)
+    )
+    matches = previous_matches | next_matches
+    target_indexes = np.where(next_matches, next_indexes, previous_indexes)
+
+    # Compare each distinct matched pair of frames once
+    reference_frames = np.stack(
+        [np.ravel(sample.frame) for sample in reference_samples]
+    ).astype(np.float32, copy=False)
+    target_frames = np.stack(
+        [np.ravel(sample.frame) for sample in target_samples]
+    ).astype(np.float32, copy=False)
+    reference_indexes = np.broadcast_to(
+        np.arange(len(reference_samples)), matches.shape
+    )
+    pair_codes = reference_indexes * target_count + target_indexes
+    unique_codes, inverse = np.unique(pair_codes[matches], return_inverse=True)
+    pair_scores = _get_mean_absolute_differences(
+        reference_frames,
+        target_frames,
+        unique_codes // target_count,
+        unique_codes % target_count,
+    )
+
+    # Keep candidate offsets with enough matched samples
+    scores = np.full(matches.shape, np.nan, dtype=np.float32)
+    scores[matches] = pair_scores[inverse]
+    matched_counts = matches.sum(axis=1)
+    candidates = []
+    for offset_index, offset in enumerate(offsets):
+        matched_count = int(matched_counts[offset_index])
+        if matched_count < min_matches:
+            continue
+        offset_frames = None
+        if frame_duration is not None:
+            offset_frames = int(round(offset / frame_duration))
+        candidates.append(
+            VideoOffsetCandidate(
+                offset=offset,
+                matched_count=matched_count,
+                score=float(np.nanmedian(scores[offset_index])),
+                offset_frames=offset_frames,
             )
+        )
     return sorted(candidates, key=lambda candidate: candidate.score)
@@ -0,0 +1,233 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Persistent cache for video frames sampled for offset detection."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from logging import getLogger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import BadZipFile
+
+import numpy as np
+
+from scinoephile.common.validation import val_output_dir_path
+from scinoephile.core.cache.artifact import remove_cache_artifact
+from scinoephile.core.cache.identity import CacheIdentity
+from scinoephile.core.paths import get_runtime_cache_root_path
+from scinoephile.media.cache_namespace import MediaCacheNamespace
+
+__all__ = ["VideoFrameCache"]
+
+logger = getLogger(__name__)
+
+_CACHE_VERSION = 1
+"""Current sampled video frame cache version."""
+
+
+class VideoFrameCache:
+    """Cache of downscaled grayscale video frames by file and sample window."""
+
+    def __init__(self, cache_root_path: Path | None = None, overwrite: bool = False):
+        """Initialize.
+
+        Arguments:
+            cache_root_path: root directory beneath which to cache, or None for default
+            overwrite: whether to replace matching cached frames
+        """
+        if cache_root_path is None:
+            cache_root_path = get_runtime_cache_root_path()
+        self.cache_root_path = val_output_dir_path(cache_root_path)
+        """Root directory beneath which sampled frames are cached."""
+        self.cache_dir_path = MediaCacheNamespace.OFFSET_VIDEO.get_dir_path(
+            self.cache_root_path
+        )
+        """Directory in which sampled frames are cached."""
+        self.overwrite = overwrite
+        """Whether matching cached frames should be replaced."""
+        self._refreshed_paths: set[Path] = set()
+        """Cache paths refreshed by this cache instance."""
+
+    def get_path(
+        self,
+        infile_path: Path,
+        *,
+        sample_rate: float,
+        start_time: float,
+        duration: float,
+        width: int,
+        height: int,
+    ) -> Path:
+        """Get the cache path for one sample window of a video file.
+
+        Arguments:
+            infile_path: media input path
+            sample_rate: samples per second
+            start_time: media timestamp at which sampling starts, in seconds
+            duration: sampled window duration in seconds
+            width: sampled frame width
+            height: sampled frame height
+        Returns:
+            cache path
+        """
+        cache_identity = self._get_cache_identity(
+            infile_path,
+            sample_rate=sample_rate,
+            start_time=start_time,
+            duration=duration,
+            width=width,
+            height=height,
+        )
+        encoded_identity = json.dumps(cache_identity, sort_keys=True).encode("utf-8")
+        cache_key = hashlib.sha256(encoded_identity).hexdigest()
+        return self.cache_dir_path / f"{cache_key}.npz"
+
+    def load(
+        self,
+        infile_path: Path,
+        *,
+        sample_rate: float,
+        start_time: float,
+        duration: float,
+        width: int,
+        height: int,
+    ) -> np.ndarray | None:
+        """Load cached frames for one sample window of a video file.
+
+        Arguments:
+            infile_path: media input path
+            sample_rate: samples per second
+            start_time: media timestamp at which sampling starts, in seconds
+            duration: sampled window duration in seconds
+            width: sampled frame width
+            height: sampled frame height
+        Returns:
+            grayscale frames of shape (frames, height, width), if present
+        """
+        window = {
+            "sample_rate": sample_rate,
+            "start_time": start_time,
+            "duration": duration,
+            "width": width,
+            "height": height,
+        }
+        cache_path = self.get_path(infile_path, **window)
+        if self.overwrite and cache_path not in self._refreshed_paths:
+            self._refreshed_paths.add(cache_path)
+            if remove_cache_artifact(cache_path):
+                logger.info(f"Removed sampled video frame cache: {cache_path}")
+        if not cache_path.is_file() or cache_path.is_symlink():
+            if remove_cache_artifact(cache_path):
+                logger.warning(
+                    f"Discarded invalid sampled video frame cache: {cache_path}"
+                )
+            return None
+
+        expected_cache_identity = self._get_cache_identity(infile_path, **window)
+        try:
+            with np.load(cache_path, allow_pickle=False) as payload:
+                raw_cache_identity = payload["cache_identity"].item()
+                if not isinstance(raw_cache_identity, str):
+                    raise ValueError("cache identity must be serialized text")
+                if json.loads(raw_cache_identity) != expected_cache_identity:
+                    raise ValueError("cache identity does not match")
+                frames = payload["frames"]
+                if frames.dtype != np.uint8 or frames.shape[1:] != (height, width):
+                    raise ValueError("cached frames do not match sample size")
+        except (BadZipFile, KeyError, OSError, TypeError, ValueError) as exc:
+            remove_cache_artifact(cache_path)
+            logger.warning(
+                f"Discarded invalid sampled video frame cache {cache_path}: {exc}"
+            )
+            return None
+
+        cache_path.touch()
+        logger.info(f"Loaded sampled video frames from cache: {cache_path}")
+        return frames
+
+    def save(
+        self,
+        infile_path: Path,
+        frames: np.ndarray,
+        *,
+        sample_rate: float,
+        start_time: float,
+        duration: float,
+        width: int,
+        height: int,
+    ) -> Path:
+        """Save frames for one sample window of a video file.
+
+        Arguments:
+            infile_path: media input path
+            frames: grayscale frames of shape (frames, height, width)
+            sample_rate: samples per second
+            start_time: media timestamp at which sampling starts, in seconds
+            duration: sampled window duration in seconds
+            width: sampled frame width
+            height: sampled frame height
+        Returns:
+            saved cache path
+        """
+        window = {
+            "sample_rate": sample_rate,
+            "start_time": start_time,
+            "duration": duration,
+            "width": width,
+            "height": height,
+        }
+        cache_path = self.get_path(infile_path, **window)
+        serialized_cache_identity = json.dumps(
+            self._get_cache_identity(infile_path, **window), sort_keys=True
+        )
+        with TemporaryDirectory(
+            dir=cache_path.parent, prefix=f".{cache_path.stem}-"
+        ) as temp_dir:
+            staging_path = Path(temp_dir) / cache_path.name
+            np.savez_compressed(
+                staging_path,
+                cache_identity=np.asarray(serialized_cache_identity),
+                frames=np.asarray(frames, dtype=np.uint8),
+            )
+            staging_path.replace(cache_path)
+        self._refreshed_paths.add(cache_path)
+        logger.info(f"Saved sampled video frames to cache: {cache_path}")
+        return cache_path
+
+    @staticmethod
+    def _get_cache_identity(
+        infile_path: Path,
+        *,
+        sample_rate: float,
+        start_time: float,
+        duration: float,
+        width: int,
+        height: int,
+    ) -> CacheIdentity:
+        """Get the complete cache identity.
+
+        Arguments:
+            infile_path: media input path
+            sample_rate: samples per second
+            start_time: media timestamp at which sampling starts, in seconds
+            duration: sampled window duration in seconds
+            width: sampled frame width
+            height: sampled frame height
+        Returns:
+            complete cache identity
+        """
+        infile_path = infile_path.resolve()
+        stat = infile_path.stat()
+        return {
+            "cache_version": _CACHE_VERSION,
+            "path": str(infile_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sample_rate": sample_rate,
+            "start_time": start_time,
+            "duration": duration,
+            "width": width,
+            "height": height,
+        }
@@ -4,7 +4,7 @@
 
 Package hierarchy (modules may import from any above):
 * cache_registry / helpers / ocr_fusion / ocr_validation / prompt_catalog
-  / subtitle_extraction
+  / subtitle_extraction / text_pipeline
 * clean / flatten / review / romanize / transcription_alignment / translation
 * multisource_transcription / ocr_processing
 * transcription_pipeline
@@ -4,16 +4,15 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from scinoephile.core import Language
 from scinoephile.core.subtitles import Series
 from scinoephile.lang.eng.cleaning import get_eng_text_cleaned
 from scinoephile.lang.zho.cleaning import get_zho_text_cleaned
 
 from .helpers import resolve_language
+from .text_pipeline import TextOperation, TextPipeline
 
-__all__ = ["clean_series"]
+__all__ = ["clean_series", "get_clean_operation"]
 
 
 def clean_series(
@@ -31,17 +30,34 @@ def clean_series(
         ScinoephileError: if a language cannot be resolved
     """
     resolved_language = resolve_language(series, language)
-    if resolved_language is Language.eng:
+    operation = get_clean_operation(resolved_language, remove_empty=remove_empty)
+    return TextPipeline([operation])(series)
+
+
+def get_clean_operation(
+    language: Language, *, remove_empty: bool = True
+) -> TextOperation:
+    """Get text operation cleaning subtitles.
+
+    Arguments:
+        language: language of subtitles
+        remove_empty: whether to remove subtitles with empty text
+    Returns:
+        text operation cleaning subtitles
+    """
+    if language is Language.eng:
         clean_text = get_eng_text_cleaned
     else:
         clean_text = get_zho_text_cleaned
 
-    cleaned = deepcopy(series)
-    cleaned_events = []
-    for event in cleaned:
-        text = clean_text((event.text or "").strip())
-        if text or not remove_empty:
-            event.text = text if text is not None else ""
-            cleaned_events.append(event)
-    cleaned.events = cleaned_events
-    return cleaned
+    def transform(text: str) -> str:
+        """Clean the text of one subtitle.
+
+        Arguments:
+            text: subtitle text
+        Returns:
+            cleaned text
+        """
+        return clean_text((text or "").strip()) or ""
+
+    return TextOperation("cleaning", transform, remove_empty=remove_empty)
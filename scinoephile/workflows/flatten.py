@@ -5,8 +5,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from copy import deepcopy
-from logging import getLogger
 
 from scinoephile.core import Language, ScinoephileError
 from scinoephile.core.subtitles import Series
@@ -14,11 +12,9 @@ from scinoephile.lang.eng.flattening import get_eng_text_flattened
 from scinoephile.lang.zho.flattening import get_zho_text_flattened
 
 from .helpers import resolve_language
+from .text_pipeline import TextOperation, TextPipeline
 
-__all__ = ["flatten_series"]
-
-
-logger = getLogger(__name__)
+__all__ = ["flatten_series", "get_flatten_operation"]
 
 
 def flatten_series(
@@ -39,26 +35,42 @@ def flatten_series(
         ScinoephileError: if a language cannot be resolved or an exclusion index is
             invalid
     """
-    exclusion_set = set(exclusions or [])
+    resolved_language = resolve_language(series, language)
+    operation = get_flatten_operation(resolved_language, exclusions=exclusions)
+    return TextPipeline([operation])(series)
+
+
+def get_flatten_operation(
+    language: Language, *, exclusions: Iterable[int] | None = None
+) -> TextOperation:
+    """Get text operation flattening multi-line subtitles to single lines.
+
+    Arguments:
+        language: language of subtitles
+        exclusions: 1-based subtitle indexes to exclude from flattening
+    Returns:
+        text operation flattening subtitles
+    Raises:
+        ScinoephileError: if an exclusion index is invalid
+    """
+    exclusion_set = frozenset(exclusions or [])
     if any(idx < 1 for idx in exclusion_set):
         raise ScinoephileError("Exclusion indexes must be positive (1-based).")
 
-    resolved_language = resolve_language(series, language)
-    flatten_text: Callable[[str], str]
-    if resolved_language is Language.eng:
-        flatten_text = get_eng_text_flattened
+    transform: Callable[[str], str]
+    if language is Language.eng:
+
+        def transform(text: str) -> str:
+            """Flatten the text of one English subtitle.
+
+            Arguments:
+                text: subtitle text
+            Returns:
+                flattened text
+            """
+            return get_eng_text_flattened(text.strip())
+
     else:
-        flatten_text = get_zho_text_flattened
-
-    flattened = deepcopy(series)
-    for i, event in enumerate(flattened, 1):
-        if i in exclusion_set:
-            logger.info(
-                f"Skipping flattening of subtitle {i}, with text:\n{event.text}"
-            )
-            continue
-        text = event.text
-        if resolved_language is Language.eng:
-            text = text.strip()
-        event.text = flatten_text(text)
-    return flattened
+        transform = get_zho_text_flattened
+
+    return TextOperation("flattening", transform, exclusions=exclusion_set)
@@ -101,7 +101,31 @@ def get_timed_request_segments(  # noqa: PLR0912, PLR0915
     output_segments = []
     output_timing_sources: list[TimingSource] = []
     duration_seconds = len(audio) / 1000
-    for request_idx, request_result in enumerate(request_results, start=1):
+
+    request_intervals = [
+        get_request_interval(
+            alignment,
+            (request_result.start_column, request_result.end_column),
+            duration_seconds,
+        )
+        if request_result.answer.transcript
+        else None
+        for request_result in request_results
+    ]
+
+    # Infer CTC emissions of request evidence intervals in batches, no more at
+    # once than the aligner memoizes, so that none is evicted before it is used
+    prefetch_size = ctc_aligner.emission_cache_size
+    for request_idx, (request_result, request_interval) in enumerate(
+        zip(request_results, request_intervals, strict=True), start=1
+    ):
+        if prefetch_size > 0 and (request_idx - 1) % prefetch_size == 0:
+            _load_request_emissions(
+                audio,
+                request_results[request_idx - 1 : request_idx - 1 + prefetch_size],
+                request_intervals[request_idx - 1 : request_idx - 1 + prefetch_size],
+                ctc_aligner,
+            )
         answer = request_result.answer
         if not answer.transcript:
             logger.info(
@@ -109,11 +133,6 @@ def get_timed_request_segments(  # noqa: PLR0912, PLR0915
                 "processor found no sufficiently supported speech."
             )
             continue
-        request_interval = get_request_interval(
-            alignment,
-            (request_result.start_column, request_result.end_column),
-            duration_seconds,
-        )
         if request_interval is None:
             logger.warning(
                 f"Skipping transcription request {request_idx} because its "
@@ -222,6 +241,39 @@ def _get_offset_segment(
     )
 
 
+def _load_request_emissions(
+    audio: AudioSegment,
+    request_results: Sequence[TranscriptionRequestResult],
+    request_intervals: Sequence[tuple[float, float] | None],
+    ctc_aligner: CtcAligner,
+):
+    """Infer CTC emissions of request evidence intervals in batches.
+
+    Arguments:
+        audio: complete block audio
+        request_results: LLM request answers and alignment spans
+        request_intervals: evidence interval of each request, or None if unusable
+        ctc_aligner: aligner whose emissions to load
+    """
+    try:
+        ctc_aligner.load_emissions(
+            [
+                (
+                    audio[round(interval[0] * 1000) : round(interval[1] * 1000)],
+                    request_result.answer.transcript,
+                )
+                for request_result, interval in zip(
+                    request_results, request_intervals, strict=True
+                )
+                if interval is not None
+            ]
+        )
+    except TranscriptionAlignmentError as exc:
+        logger.warning(
+            f"Batched CTC inference failed; inferring each request separately: {exc}"
+        )
+
+
 def _split_aligned_segment(
     segment: TranscribedSegment, answer: TranscriptionAnswer
 ) -> list[TranscribedSegment]:
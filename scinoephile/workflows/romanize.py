@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from copy import deepcopy
 
 from scinoephile.core import Language, ScinoephileError
 from scinoephile.core.subtitles import Series
@@ -13,8 +12,9 @@ from scinoephile.lang.cmn.romanization import get_cmn_text_romanized
 from scinoephile.lang.yue.romanization import get_yue_text_romanized
 
 from .helpers import resolve_language
+from .text_pipeline import TextOperation, TextPipeline
 
-__all__ = ["romanize_series"]
+__all__ = ["get_romanize_operation", "romanize_series"]
 
 
 def romanize_series(
@@ -32,22 +32,44 @@ def romanize_series(
         ScinoephileError: if a language cannot be resolved or is unsupported
     """
     resolved_language = resolve_language(series, language)
+    operation = get_romanize_operation(resolved_language, append=append)
+    return TextPipeline([operation])(series)
+
+
+def get_romanize_operation(language: Language, *, append: bool = True) -> TextOperation:
+    """Get text operation romanizing subtitles.
+
+    Arguments:
+        language: language of subtitles
+        append: whether to append romanization to the original text
+    Returns:
+        text operation romanizing subtitles
+    Raises:
+        ScinoephileError: if the language is unsupported
+    """
     romanize_text: Callable[[str], str]
-    if resolved_language.is_cantonese:
+    if language.is_cantonese:
         romanize_text = get_yue_text_romanized
-    elif resolved_language.is_chinese:
+    elif language.is_chinese:
         romanize_text = get_cmn_text_romanized
     else:
         raise ScinoephileError(
-            f"Romanization does not support language {resolved_language.code}"
+            f"Romanization does not support language {language.code}"
         )
+    if not append:
+        return TextOperation("romanization", romanize_text)
+
+    def transform(text: str) -> str:
+        """Append romanization to the text of one subtitle.
+
+        Arguments:
+            text: subtitle text
+        Returns:
+            text followed by its romanization on a new line
+        """
+        romanized_text = romanize_text(text)
+        if romanized_text:
+            return f"{text}\\N{romanized_text}"
+        return text
 
-    romanized_series = deepcopy(series)
-    for event in romanized_series:
-        romanized_text = romanize_text(event.text)
-        if append:
-            if romanized_text:
-                event.text = f"{event.text}\\N{romanized_text}"
-        else:
-            event.text = romanized_text
-    return romanized_series
+    return TextOperation("romanization", transform)
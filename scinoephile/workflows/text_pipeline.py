@@ -0,0 +1,104 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Pipeline applying text operations to each subtitle of a series in one pass."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Self
+
+from scinoephile.core.subtitles import Series
+
+__all__ = ["TextOperation", "TextPipeline"]
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TextOperation:
+    """Operation transforming the text of each subtitle."""
+
+    name: str
+    """Name of the operation, used in log messages."""
+    transform: Callable[[str], str]
+    """Function transforming the text of one subtitle."""
+    remove_empty: bool = False
+    """Whether to remove subtitles whose transformed text is empty."""
+    exclusions: frozenset[int] = field(default_factory=frozenset)
+    """1-based indexes of subtitles to leave unchanged.
+
+    Subtitles are numbered as they reach this operation, so that the indexes match
+    those of the series produced by the preceding operations.
+    """
+
+
+class TextPipeline:
+    """Sequence of text operations applied to each subtitle in a single pass.
+
+    Applying a pipeline copies the series once and passes the text of each
+    subtitle through every operation in turn, rather than copying and walking the
+    series once per operation.
+    """
+
+    def __init__(self, operations: Iterable[TextOperation] = ()):
+        """Initialize.
+
+        Arguments:
+            operations: operations to apply, in order
+        """
+        self.operations = tuple(operations)
+        """Operations to apply, in order."""
+
+    def __call__(self, series: Series) -> Series:
+        """Apply operations to a copy of a subtitle series.
+
+        Arguments:
+            series: subtitle series to process
+        Returns:
+            processed subtitle series
+        """
+        processed = series.slice(0, len(series))
+        if not self.operations:
+            return processed
+
+        idxs = [0] * len(self.operations)
+        processed_events = []
+        for event in processed:
+            text = event.text
+            for i, operation in enumerate(self.operations):
+                idxs[i] += 1
+                if idxs[i] in operation.exclusions:
+                    logger.info(
+                        f"Skipping {operation.name} of subtitle {idxs[i]}, "
+                        f"with text:\n{text}"
+                    )
+                    continue
+                text = operation.transform(text)
+                if operation.remove_empty and not text:
+                    break
+            else:
+                event.text = text
+                processed_events.append(event)
+        processed.events = processed_events
+        return processed
+
+    def __len__(self) -> int:
+        """Number of operations."""
+        return len(self.operations)
+
+    def __repr__(self) -> str:
+        """Representation."""
+        names = ", ".join(operation.name for operation in self.operations)
+        return f"<{self.__class__.__name__} [{names}]>"
+
+    def then(self, operation: TextOperation) -> Self:
+        """Get a pipeline applying an additional operation after these.
+
+        Arguments:
+            operation: operation to apply last
+        Returns:
+            extended pipeline
+        """
+        return type(self)((*self.operations, operation))
@@ -49,6 +49,7 @@ from scinoephile.audio.vad import (
     VoiceActivityTrace,
 )
 from scinoephile.core import Language, ScinoephileError
+from scinoephile.core.cache.audio_fingerprint import get_audio_hash
 from scinoephile.core.cache.identity import CacheIdentity
 from scinoephile.workflows.multisource_transcription.transcriber import (
     MultiSourceTranscriber,
@@ -253,7 +254,7 @@ class TranscriptionPipeline:
         alignment_blocks: list[AlignmentBlock] = []
         for block in selected_blocks:
             block_index = block.index + 1
-            block_audio = audio_series.audio[
+            block_audio = audio_series.audio_view[
                 block.buffered_start_ms : block.buffered_end_ms
             ]
             pause_intervals = self._get_block_pause_intervals(
@@ -261,7 +262,7 @@ class TranscriptionPipeline:
             )
             try:
                 block_segments = self.transcriber.transcribe_block(
-                    block_audio,
+                    block_audio.to_audio_segment(),
                     audio_events=audio_events,
                     language_identification=language_identification,
                     pause_intervals_seconds=pause_intervals,
@@ -430,7 +431,7 @@ class TranscriptionPipeline:
             raise RuntimeError("Cannot build run provenance without an artifact.")
         return RunManifest(
             language=self.language,
-            audio_sha256=sha256(audio.raw_data).hexdigest(),
+            audio_sha256=get_audio_hash(audio).hexdigest(),
             audio_duration_ms=len(audio),
             audio_channels=audio.channels,
             audio_frame_rate=audio.frame_rate,
@@ -87,6 +87,44 @@ def test_alignment_uses_time_to_resolve_repeated_character():
     assert [column.tokens[1] is None for column in alignment.columns] == [True, False]
 
 
+def test_banded_alignment_matches_unbanded_alignment():
+    """Test restricting alignment to a time band preserves local alignments."""
+    texts = ("我真係好鍾意", "我係好鍾意佢", "我真系好中意", "你真係好鍾意")
+    sequences = tuple(
+        _get_sequence(
+            f"source-{idx}",
+            text * 3,
+            tuple(character_idx * 2.0 for character_idx in range(len(text) * 3)),
+        )
+        for idx, text in enumerate(texts)
+    )
+
+    banded = timed_msa.Aligner(_get_similarity, timed_msa.Settings(band_seconds=5.0))(
+        sequences
+    )
+    unbanded = timed_msa.Aligner(
+        _get_similarity, timed_msa.Settings(band_seconds=None)
+    )(sequences)
+
+    assert banded == unbanded
+
+
+def test_banded_alignment_excludes_distant_tokens():
+    """Test tokens outside the time band are not aligned to one another."""
+    one = _get_sequence("one", "我係", (0.0, 20.0))
+    two = _get_sequence("two", "係", (0.0,))
+
+    unbanded = timed_msa.Aligner(
+        _get_similarity, timed_msa.Settings(band_seconds=None)
+    )((one, two))
+    banded = timed_msa.Aligner(_get_similarity, timed_msa.Settings(band_seconds=5.0))(
+        (one, two)
+    )
+
+    assert [column.tokens[1] is None for column in unbanded.columns] == [True, False]
+    assert [column.tokens[1] is None for column in banded.columns] == [False, True]
+
+
 def test_large_alignment_uses_guide_orders():
     """Test a large source set is aligned without factorial order enumeration."""
     texts = ("我真係", "我真系", "我係", "我真是", "我就係", "我就系")
@@ -108,6 +146,29 @@ def test_large_alignment_uses_guide_orders():
     )
 
 
+def test_order_pruning_preserves_alignment():
+    """Test pruned order searches retain the exhaustive alignment."""
+    texts = ("我真係好鍾意", "我係好鍾意佢", "我真系好中意", "你真係好鍾意")
+    sequences = tuple(
+        _get_sequence(
+            f"source-{idx}",
+            text,
+            tuple(character_idx / 2 for character_idx in range(len(text))),
+        )
+        for idx, text in enumerate(texts)
+    )
+    expected = timed_msa.Aligner(_get_similarity)(sequences)
+
+    settings = timed_msa.Settings(prune_orders=True)
+    assert timed_msa.Aligner(_get_similarity, settings)(sequences) == expected
+
+
+def test_settings_reject_nonpositive_band():
+    """Test a time band must admit some tokens."""
+    with raises(ValueError, match="Timed alignment band must be finite and positive"):
+        timed_msa.Settings(band_seconds=0.0)
+
+
 def test_settings_reject_too_small_exhaustive_limit():
     """Test at least pairwise order search is required."""
     with raises(
@@ -119,3 +119,25 @@ def test_audio_series_slice_supports_empty_ranges():
     assert type(sliced) is AudioSeries
     assert len(sliced) == 0
     assert len(sliced.audio) == 0
+
+
+def test_audio_series_blocks_and_clips_share_decoded_audio():
+    """Test blocks and clips view the series audio rather than copying it."""
+    full_audio = AudioSegment.silent(duration=10_000, frame_rate=16000)
+    text_series = AudioSeries(
+        audio=full_audio,
+        events=[
+            AudioSubtitle(start=1000, end=2000, text="One"),
+            AudioSubtitle(start=8000, end=9000, text="Two"),
+        ],
+    )
+
+    series = AudioSeries.build_series(text_series, full_audio, buffer=500)
+
+    assert series.audio is full_audio
+    assert series.events[0].audio_view.source is full_audio
+    assert len(series.events[0].audio) == 2000
+    assert len(series.blocks) == 2
+    for block in series.blocks:
+        assert block.audio_view.source is full_audio
+        assert len(block.audio) == block.buffered_end - block.buffered_start
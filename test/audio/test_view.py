@@ -0,0 +1,108 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of read-only windows into decoded audio."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from os import urandom
+
+import numpy as np
+from pydub import AudioSegment
+from pytest import mark, raises
+
+from scinoephile.audio.view import AudioView, get_audio_view
+
+
+def _get_audio(duration: int = 1000) -> AudioSegment:
+    """Get random stereo audio at a frame rate with fractional frames per ms.
+
+    Arguments:
+        duration: duration in milliseconds
+    Returns:
+        audio segment
+    """
+    frame_rate = 22050
+    return AudioSegment(
+        data=urandom(duration * frame_rate // 1000 * 4),
+        sample_width=2,
+        frame_rate=frame_rate,
+        channels=2,
+    )
+
+
+@mark.parametrize(
+    "key",
+    [
+        slice(None, None),
+        slice(100, 400),
+        slice(0, 0),
+        slice(-300, None),
+        slice(250, -250),
+        slice(900, 5000),
+        slice(400, 100),
+        7,
+    ],
+)
+def test_audio_view_matches_pydub_slicing(key: int | slice):
+    """Test view slices select the same data as pydub slices.
+
+    Arguments:
+        key: millisecond or slice of milliseconds
+    """
+    audio = _get_audio()
+
+    expected = audio[key]
+    view = get_audio_view(audio)[key]
+
+    assert len(view) == len(expected)
+    assert view.to_audio_segment().raw_data == expected.raw_data
+
+
+def test_audio_view_nested_slices_match_pydub_slicing():
+    """Test slices of views match slices of pydub slices, including padding."""
+    audio = _get_audio(999)
+
+    expected = audio[300:999][100:699]
+    view = get_audio_view(audio)[300:999][100:699]
+
+    assert view.source is audio
+    assert view.frame_count == len(expected.raw_data) // expected.frame_width
+    assert view.to_audio_segment().raw_data == expected.raw_data
+
+
+def test_audio_view_exposes_read_only_samples():
+    """Test samples share the source's data and cannot be modified."""
+    audio = _get_audio()
+    view = get_audio_view(audio)[100:200]
+
+    samples = view.samples
+
+    assert not samples.flags.writeable
+    assert np.array_equal(samples, np.array(audio[100:200].get_array_of_samples()))
+    assert np.shares_memory(samples, np.frombuffer(audio.raw_data, dtype=np.int16))
+    with raises(TypeError):
+        view.data[0] = 0
+
+
+def test_audio_view_materializes_whole_source_without_copying():
+    """Test views of whole audio return the source and copy as themselves."""
+    audio = _get_audio()
+    view = get_audio_view(audio)
+
+    assert get_audio_view(view) is view
+    assert view.to_audio_segment() is audio
+    assert deepcopy(view) is view
+    assert view[0:500].to_audio_segment() is not audio
+
+
+def test_audio_view_rejects_invalid_ranges():
+    """Test invalid frame ranges and stepped slices are rejected."""
+    audio = _get_audio()
+
+    with raises(ValueError, match="Invalid audio frame range"):
+        AudioView(audio, 10, 5)
+    with raises(ValueError, match="beyond"):
+        AudioView(audio, 10**9, 10**9)
+    with raises(ValueError, match="slice steps"):
+        get_audio_view(audio)[::2]
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
@@ -22,6 +23,168 @@ from scinoephile.audio.transcription import (
 from scinoephile.core import Language
 
 
+class _FakeCtcModel:
+    """Minimal CTC model stand-in whose feature encoder strides by four samples."""
+
+    config = SimpleNamespace(conv_kernel=[4], conv_stride=[4], pad_token_id=0)
+    """Model configuration."""
+
+    def __init__(self):
+        """Initialize."""
+        self.batch_shapes: list[tuple[int, int]] = []
+
+    def __call__(
+        self, input_values: _FakeTensor, attention_mask: _FakeTensor | None = None
+    ) -> SimpleNamespace:
+        """Emit blank at every frame but the second, which emits token one.
+
+        Like group normalization, the samples of each audio segment are centered
+        on their mean, over every sample unless an attention mask excludes padding,
+        and the mean of each frame is added to the log probability of token two.
+
+        Arguments:
+            input_values: padded batch of audio samples
+            attention_mask: optional mask of samples that are not padding
+        Returns:
+            model output stand-in
+        """
+        values = input_values.values
+        batch_size, sample_count = values.shape
+        frame_count = (sample_count - 4) // 4 + 1
+        self.batch_shapes.append((batch_size, frame_count))
+        if attention_mask is None:
+            mask = np.ones_like(values, dtype=bool)
+        else:
+            mask = attention_mask.values.astype(bool)
+        means = (values * mask).sum(axis=1, keepdims=True) / mask.sum(
+            axis=1, keepdims=True
+        )
+        centered = (values - means)[:, : frame_count * 4]
+        probs = np.full((batch_size, frame_count, 3), 0.05)
+        probs[:, :, 0] = 0.9
+        probs[:, 1] = [0.05, 0.9, 0.05]
+        log_probs = np.log(probs)
+        log_probs[:, :, 2] += centered.reshape(batch_size, frame_count, 4).mean(axis=2)
+        return SimpleNamespace(logits=_FakeTensor(log_probs))
+
+
+class _FakeCtcProcessor:
+    """Minimal CTC processor stand-in that pads audio samples with zeros."""
+
+    def __init__(self, return_attention_mask: bool = True):
+        """Initialize.
+
+        Arguments:
+            return_attention_mask: whether to return a mask of padded samples
+        """
+        self.feature_extractor = SimpleNamespace(
+            return_attention_mask=return_attention_mask, sampling_rate=1000
+        )
+        """Feature extractor."""
+
+    def __call__(
+        self, samples: list[np.ndarray], **kwargs: object
+    ) -> dict[str, _FakeTensor]:
+        """Pad audio samples into one batch.
+
+        Arguments:
+            samples: audio samples of each audio segment
+            **kwargs: processor options
+        Returns:
+            model inputs
+        """
+        assert kwargs["padding"] is True
+        values = np.zeros((len(samples), max(sample.size for sample in samples)))
+        mask = np.zeros_like(values, dtype=np.int64)
+        for sample_idx, sample in enumerate(samples):
+            values[sample_idx, : sample.size] = sample
+            mask[sample_idx, : sample.size] = 1
+        inputs = {"input_values": _FakeTensor(values)}
+        if self.feature_extractor.return_attention_mask:
+            inputs["attention_mask"] = _FakeTensor(mask)
+        return inputs
+
+
+class _FakeTensor:
+    """Minimal Torch tensor stand-in backed by a NumPy array."""
+
+    def __init__(self, values: np.ndarray):
+        """Initialize.
+
+        Arguments:
+            values: tensor values
+        """
+        self.values = values
+
+    def cpu(self) -> _FakeTensor:
+        """Return this tensor.
+
+        Returns:
+            this tensor
+        """
+        return self
+
+    def detach(self) -> _FakeTensor:
+        """Return this tensor.
+
+        Returns:
+            this tensor
+        """
+        return self
+
+    def log_softmax(self, dim: int) -> _FakeTensor:
+        """Return this tensor, whose values are already log probabilities.
+
+        Arguments:
+            dim: normalized dimension
+        Returns:
+            this tensor
+        """
+        assert dim == -1
+        return self
+
+    def numpy(self) -> np.ndarray:
+        """Get tensor values.
+
+        Returns:
+            tensor values
+        """
+        return self.values
+
+
+class _FakeTorch:
+    """Minimal Torch stand-in recording inference thread counts."""
+
+    def __init__(self):
+        """Initialize."""
+        self.num_threads_history: list[int] = []
+
+    def get_num_threads(self) -> int:
+        """Get the default thread count.
+
+        Returns:
+            thread count
+        """
+        return 1
+
+    @staticmethod
+    def inference_mode() -> nullcontext:
+        """Get an inference context.
+
+        Returns:
+            inert context manager
+        """
+        return nullcontext()
+
+    def set_num_threads(self, num_threads: int):
+        """Record a thread count.
+
+        Arguments:
+            num_threads: thread count
+        """
+        self.num_threads_history.append(num_threads)
+
+
 def test_ctc_aligner_allows_model_override(monkeypatch: pytest.MonkeyPatch):
     """Test an explicit CTC model does not require a language default.
 
@@ -217,6 +380,106 @@ def test_ctc_aligner_persistently_caches_alignment(
     assert len(list((tmp_path / "audio" / "transcription" / "ctc").glob("*.json"))) == 1
 
 
+def test_ctc_aligner_batches_emissions_by_length(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test audio of similar length is inferred together without padding frames.
+
+    Arguments:
+        tmp_path: temporary directory path
+        monkeypatch: pytest monkeypatch fixture
+    """
+    torch = _FakeTorch()
+    monkeypatch.setattr(
+        "scinoephile.audio.transcription.ctc_aligner.import_torch", lambda: torch
+    )
+    model = _FakeCtcModel()
+    aligner = CtcAligner(
+        Language.yue_hant, cache_root_path=tmp_path, inference_threads=2
+    )
+    aligner._processor = cast(Any, _FakeCtcProcessor())
+    aligner._model = cast(Any, model)
+    audios = [AudioSegment.silent(duration=duration) for duration in (1000, 500, 900)]
+
+    aligner.load_emissions([(audio, "你") for audio in audios])
+
+    assert model.batch_shapes == [(1, 125), (2, 250)]
+    assert torch.num_threads_history == [2, 1]
+    emissions = aligner._get_emissions(audios)
+    assert [log_probs.shape[0] for log_probs in emissions] == [250, 125, 225]
+    assert len(model.batch_shapes) == 2
+
+
+@pytest.mark.parametrize("return_attention_mask", [True, False])
+def test_ctc_aligner_batched_emissions_match_single_emissions(
+    monkeypatch: pytest.MonkeyPatch, return_attention_mask: bool
+):
+    """Test emissions of audio do not depend on the audio inferred alongside it.
+
+    Without an attention mask, each audio segment is inferred alone.
+
+    Arguments:
+        monkeypatch: pytest monkeypatch fixture
+        return_attention_mask: whether the processor masks padded samples
+    """
+    monkeypatch.setattr(
+        "scinoephile.audio.transcription.ctc_aligner.import_torch", _FakeTorch
+    )
+    rng = np.random.default_rng(0)
+    audios = [
+        AudioSegment(
+            rng.integers(-8000, 8000, duration, dtype=np.int16).tobytes(),
+            channels=1,
+            frame_rate=1000,
+            sample_width=2,
+        )
+        for duration in (1000, 950, 900)
+    ]
+    expected = []
+    for audio in audios:
+        aligner = CtcAligner(Language.yue_hant, emission_cache_size=0)
+        aligner._processor = cast(Any, _FakeCtcProcessor(return_attention_mask))
+        aligner._model = cast(Any, _FakeCtcModel())
+        expected.extend(aligner._get_emissions([audio]))
+    model = _FakeCtcModel()
+    aligner = CtcAligner(Language.yue_hant, emission_cache_size=0)
+    aligner._processor = cast(Any, _FakeCtcProcessor(return_attention_mask))
+    aligner._model = cast(Any, model)
+
+    emissions = aligner._get_emissions(audios)
+
+    assert model.batch_shapes == (
+        [(3, 250)] if return_attention_mask else [(1, 225), (1, 237), (1, 250)]
+    )
+    for log_probs, expected_log_probs in zip(emissions, expected, strict=True):
+        np.testing.assert_allclose(log_probs, expected_log_probs)
+
+
+def test_ctc_aligner_reuses_emissions_for_different_transcripts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test repeated alignment of the same audio runs the model once.
+
+    Arguments:
+        tmp_path: temporary directory path
+        monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(
+        "scinoephile.audio.transcription.ctc_aligner.import_torch", _FakeTorch
+    )
+    model = _FakeCtcModel()
+    aligner = CtcAligner(Language.yue_hant, cache_root_path=tmp_path)
+    aligner._processor = cast(Any, _FakeCtcProcessor())
+    aligner._model = cast(Any, model)
+    monkeypatch.setattr(aligner, "_get_token_ids", lambda text: ([1], [0]))
+
+    first_segments = aligner.align(AudioSegment.silent(duration=1000), "你")
+    second_segments = aligner.align(AudioSegment.silent(duration=1000), "妳")
+
+    assert model.batch_shapes == [(1, 250)]
+    assert first_segments[0].start == second_segments[0].start == 0.004
+
+
 def test_ctc_audio_samples_use_requested_rate_and_float32():
     """Test CTC audio conversion normalizes channel, rate, and sample format."""
     audio = (
@@ -279,6 +542,64 @@ def test_ctc_best_path_accepts_blank_between_repeated_labels():
     ]
 
 
+def test_ctc_best_path_band_preserves_path_with_leading_and_trailing_silence():
+    """Test a band that does not bind preserves the path through silence."""
+    log_probs, token_ids = _get_speech_log_probs(400, 20, (100, 300))
+
+    unbanded = CtcAligner._get_best_path(log_probs, token_ids, 0)
+    banded = CtcAligner._get_best_path(log_probs, token_ids, 0, band_frames=20)
+
+    assert banded == unbanded
+    assert unbanded[0][1] >= 100
+    assert unbanded[-1][1] <= 300
+
+
+def test_ctc_best_path_aligns_chunks_between_anchors():
+    """Test chunks between anchors are offset into the complete path."""
+    log_probs, token_ids = _get_speech_log_probs(400, 20, (100, 300))
+
+    unanchored = CtcAligner._get_best_path(log_probs, token_ids, 0)
+    anchored = CtcAligner._get_best_path(
+        log_probs, token_ids, 0, anchors=[(10, 200)], workers=2
+    )
+
+    assert anchored[-1][:2] == unanchored[-1][:2]
+    assert _get_token_frame_idxs(anchored) == _get_token_frame_idxs(unanchored)
+
+
+def test_ctc_anchors_disregard_pauses_outside_or_out_of_order():
+    """Test only interior pauses that follow preceding pauses become anchors."""
+    anchors = CtcAligner._get_anchors(
+        [(0, 1.0), (4, 2.0), (2, 1.0), (3, 0.5), (6, 3.0), (8, 20.0)],
+        [0, 1, 2, 4, 6, 8],
+        10.0,
+        100,
+    )
+
+    assert anchors == [(2, 10), (3, 20), (4, 30)]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"band_seconds": 0.0}, "CTC alignment band must be positive"),
+        ({"workers": 0}, "workers must be at least 1"),
+        ({"batch_size": 0}, "batch_size must be at least 1"),
+        ({"inference_threads": 0}, "inference_threads must be at least 1"),
+        ({"emission_cache_size": -1}, "emission_cache_size must be at least 0"),
+    ],
+)
+def test_ctc_aligner_rejects_invalid_settings(kwargs: dict[str, Any], message: str):
+    """Test the alignment band and counts are validated.
+
+    Arguments:
+        kwargs: invalid keyword arguments
+        message: expected error message
+    """
+    with pytest.raises(ValueError, match=message):
+        CtcAligner(Language.yue_hant, **kwargs)
+
+
 def test_ctc_aligner_aligns_word_delimiter():
     """Test a tokenizer word delimiter participates in the CTC path."""
 
@@ -741,3 +1062,40 @@ def test_ctc_aligner_wraps_backend_errors(
         TranscriptionAlignmentError, match="Unable to run CTC transcription alignment"
     ):
         aligner.align(AudioSegment.silent(duration=1000), "你好")
+
+
+def _get_speech_log_probs(
+    frame_count: int, token_count: int, speech_frames: tuple[int, int]
+) -> tuple[np.ndarray, list[int]]:
+    """Get log probabilities of evenly spaced tokens amid blank frames.
+
+    Arguments:
+        frame_count: number of frames
+        token_count: number of tokens
+        speech_frames: first and last frame between which tokens are spoken
+    Returns:
+        frame-by-token log probabilities and target token IDs
+    """
+    random = np.random.default_rng(0)
+    token_ids = [int(token_id) for token_id in random.integers(1, 5, token_count)]
+    probs = np.full((frame_count, 5), 0.001)
+    probs[:, 0] = 0.996
+    token_frame_idxs = np.linspace(*speech_frames, token_count).astype(int)
+    for token_id, frame_idx in zip(token_ids, token_frame_idxs, strict=True):
+        probs[frame_idx] = 0.001
+        probs[frame_idx, token_id] = 0.996
+    return np.log(probs), token_ids
+
+
+def _get_token_frame_idxs(path: list[tuple[int, int, float]]) -> dict[int, int]:
+    """Get the first frame assigned to each token of a CTC path.
+
+    Arguments:
+        path: CTC alignment path
+    Returns:
+        transcript token index mapped to first frame index
+    """
+    frame_idxs: dict[int, int] = {}
+    for token_idx, frame_idx, _ in path:
+        frame_idxs.setdefault(token_idx, frame_idx)
+    return frame_idxs
@@ -0,0 +1,127 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark audio cache hits with and without memoized audio hashes.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_audio_cache_keys`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Sequence
+from logging import WARNING, getLogger
+from os import urandom
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+from pydub import AudioSegment
+
+from scinoephile.audio.cache_namespace import AudioCacheNamespace
+from scinoephile.audio.classification.cache import AudioClassificationCache
+from scinoephile.audio.diarization.cache import SpeakerDiarizationCache
+from scinoephile.audio.separation.demucs.cache import DemucsCache
+from scinoephile.audio.transcription.cache import TranscriptionCache
+from scinoephile.audio.vad import VoiceActivityTrace
+from scinoephile.audio.vad.cache import VoiceActivityCache
+from scinoephile.core.cache import audio_fingerprint
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the audio cache key benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+
+    audio = AudioSegment(
+        data=urandom(args.minutes * 60 * 16000 * 2),
+        sample_width=2,
+        frame_rate=16000,
+        channels=1,
+    )
+    print(f"{len(audio.raw_data) / 1e6:.0f} MB of audio")
+    with TemporaryDirectory() as temp_dir:
+        cache_root_path = Path(temp_dir)
+        vad_cache = VoiceActivityCache(cache_root_path)
+        vad_cache.save(
+            audio,
+            {"model": "benchmark"},
+            VoiceActivityTrace(
+                np.zeros(len(audio) // 100, dtype=np.float32),
+                start_ms=50.0,
+                step_ms=100.0,
+                duration_ms=len(audio),
+            ),
+        )
+        lookups: dict[str, Callable[[], object]] = {
+            "vad hit": lambda: vad_cache.load(audio, {"model": "benchmark"}),
+            "demucs key": lambda: DemucsCache(cache_root_path, "htdemucs").get_path(
+                audio
+            ),
+            "diarization key": lambda: SpeakerDiarizationCache(
+                cache_root_path
+            ).get_path(audio, {"model": "benchmark"}),
+            "classification key": lambda: AudioClassificationCache(
+                cache_root_path, AudioCacheNamespace.CLASSIFICATION_LANGUAGE
+            ).get_path(audio, {"model": "benchmark"}),
+            "transcription key": lambda: TranscriptionCache(
+                cache_root_path,
+                AudioCacheNamespace.TRANSCRIPTION_WHISPER,
+                "whisper",
+                "Whisper",
+            ).get_path(audio, {"model": "benchmark"}),
+        }
+
+        print(f"{'lookup':>20} {'rehashed':>10} {'memoized':>10}")
+        for name, lookup in lookups.items():
+            rehashed = _time(lookup, args.repeats, forget=True)
+            memoized = _time(lookup, args.repeats, forget=False)
+            print(f"{name:>20} {rehashed:>10.4f} {memoized:>10.4f}")
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--minutes", type=int, default=120, help="duration of 16 kHz mono audio"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="lookups over which to average"
+    )
+    return parser.parse_args(argv)
+
+
+def _time(lookup: Callable[[], object], repeats: int, *, forget: bool) -> float:
+    """Time a cache lookup.
+
+    Arguments:
+        lookup: cache lookup to time
+        repeats: lookups over which to average
+        forget: whether to forget memoized audio hashes before each lookup
+    Returns:
+        mean seconds per lookup
+    """
+    lookup()
+    elapsed = 0.0
+    for _ in range(repeats):
+        if forget:
+            audio_fingerprint._audio_hashes.clear()
+        start = perf_counter()
+        lookup()
+        elapsed += perf_counter() - start
+    return elapsed / repeats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark audio offset detection.
+
+Times cross-correlation of synthetic onset envelopes as long as a feature film, and,
+when reference and target media are provided, complete detection between them,
+including decoding their audio.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_audio_offset`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from scinoephile.media.offset.audio.detection import (
+    get_audio_offset,
+    get_envelope_offset,
+)
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the audio offset benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    random = np.random.default_rng(0)
+    envelope_length = int(args.length * 100)
+    envelope = random.exponential(1.0, envelope_length + 1000).astype(np.float32)
+    print(f"{'operation':>28} {'seconds':>8} {'offset':>8}")
+    started = perf_counter()
+    result = get_envelope_offset(
+        envelope[:envelope_length], envelope[437 : envelope_length + 437]
+    )
+    print(f"{'correlate envelopes':>28} {perf_counter() - started:>8.3f} ", end="")
+    print(f"{result.offset:>+8.3f}")
+
+    if args.reference_infile is None or args.target_infile is None:
+        return
+    for estimate_drift in (False, True):
+        started = perf_counter()
+        result = get_audio_offset(
+            reference_infile_path=args.reference_infile,
+            target_infile_path=args.target_infile,
+            estimate_drift=estimate_drift,
+        )
+        label = "detect offset and drift" if estimate_drift else "detect offset"
+        print(f"{label:>28} {perf_counter() - started:>8.3f} ", end="")
+        print(f"{result.offset:>+8.3f}")
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--reference-infile", type=Path, help="reference media")
+    parser.add_argument("--target-infile", type=Path, help="target media")
+    parser.add_argument(
+        "--length",
+        type=float,
+        default=7200.0,
+        help="length of synthetic envelopes in seconds",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
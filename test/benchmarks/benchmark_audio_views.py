@@ -0,0 +1,124 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark peak memory of audio series blocks and clips.
+
+Each run slices one long recording into buffered subtitle clips and blocks, either
+as copies with pydub slicing or as views with AudioSeries, and reports the peak
+traced memory and the peak resident set size of a fresh process.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_audio_views`.
+"""
+
+from __future__ import annotations
+
+import resource
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from logging import WARNING, getLogger
+from os import urandom
+from subprocess import run
+from time import perf_counter
+
+from pydub import AudioSegment
+
+from scinoephile.audio.subtitles import AudioSeries, AudioSubtitle
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the audio view benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    if args.mode is not None:
+        _run(args.mode, args.minutes)
+        return
+
+    print(f"{args.minutes} minutes of 16 kHz mono audio")
+    print(f"{'mode':>8} {'seconds':>8} {'traced MB':>10} {'peak RSS MB':>12}")
+    for mode in ("copies", "views"):
+        completed = run(
+            [
+                sys.executable,
+                "-m",
+                "test.benchmarks.benchmark_audio_views",
+                "--minutes",
+                str(args.minutes),
+                "--mode",
+                mode,
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        print(completed.stdout.strip())
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--minutes", type=int, default=120, help="duration of 16 kHz mono audio"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("copies", "views"),
+        help="measure one mode in this process rather than each in a subprocess",
+    )
+    return parser.parse_args(argv)
+
+
+def _run(mode: str, minutes: int):
+    """Slice a long recording into clips and blocks and report memory usage.
+
+    Arguments:
+        mode: whether to slice copies with pydub or views with AudioSeries
+        minutes: duration of audio
+    """
+    getLogger("scinoephile").setLevel(WARNING)
+    duration = minutes * 60 * 1000
+    audio = AudioSegment(
+        data=urandom(duration * 16 * 2), sample_width=2, frame_rate=16000, channels=1
+    )
+    events = [
+        AudioSubtitle(start=start, end=start + 2000, text="Text")
+        for start in range(1000, duration - 3000, 4000)
+    ]
+
+    tracemalloc.start()
+    started = perf_counter()
+    if mode == "copies":
+        kept = [audio[event.start - 1000 : event.end + 1000] for event in events]
+        kept.extend(
+            audio[start : start + 60_000] for start in range(0, duration, 60_000)
+        )
+    else:
+        series = AudioSeries.build_series(
+            AudioSeries(audio=audio, events=events), audio, 1000
+        )
+        kept = [series.events, series.blocks]
+    elapsed = perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    print(
+        f"{mode:>8} {elapsed:>8.2f} {traced_peak / 1e6:>10.1f} {peak_rss / 1e6:>12.1f}"
+    )
+    del kept
+
+
+if __name__ == "__main__":
+    main()
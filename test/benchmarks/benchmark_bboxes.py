@@ -0,0 +1,100 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark bbox extraction from subtitle images.
+
+Uses the images of an image subtitle series when provided, or otherwise draws
+synthetic two-line outlined subtitles.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_bboxes`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from pathlib import Path
+from random import Random
+from time import perf_counter
+
+from PIL import Image, ImageDraw, ImageFont
+
+from scinoephile.image.bboxes import get_bboxes, get_bboxes_of_images
+from scinoephile.image.subtitles import ImageSeries
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the bbox extraction benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    if args.infile is not None:
+        imgs = [event.img for event in ImageSeries.load(args.infile).events]
+    else:
+        imgs = [_get_synthetic_img(seed) for seed in range(args.count)]
+
+    start = perf_counter()
+    get_bboxes(imgs[0])
+    print(f"{len(imgs)} images; first call {perf_counter() - start:.3f} s")
+    print(f"{'workers':>8} {'seconds':>8} {'images/s':>9}")
+    for workers in args.workers:
+        start = perf_counter()
+        get_bboxes_of_images(imgs, workers=workers)
+        elapsed = perf_counter() - start
+        print(f"{workers:>8} {elapsed:>8.3f} {len(imgs) / elapsed:>9.0f}")
+
+
+def _get_synthetic_img(seed: int) -> Image.Image:
+    """Draw a synthetic two-line outlined subtitle image.
+
+    Arguments:
+        seed: random seed for subtitle text
+    Returns:
+        subtitle image
+    """
+    random = Random(seed)
+    img = Image.new("LA", (950, 130), (0, 0))
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=48)
+    for line_idx in range(2):
+        text = "".join(
+            random.choice("abcdefghijklmnopqrstuvwxyz ABCDEF:;,.!") for _ in range(28)
+        )
+        draw.text(
+            (10, 5 + line_idx * 62),
+            text,
+            font=font,
+            fill=(255, 255),
+            stroke_width=3,
+            stroke_fill=(40, 255),
+        )
+    return img
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--infile", type=Path, help="image subtitle infile path")
+    parser.add_argument(
+        "--count", type=int, default=1000, help="number of synthetic images"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="worker counts to compare",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark build time and peak memory of dictionary databases.
+
+By default persists streams of synthetic entries of several sizes. Dictionaries
+named with --dictionaries are instead built through their services, which may
+download source data that is not already available. Each build runs in a fresh
+process, so that its peak resident set size is its own.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_dictionary_build`.
+"""
+
+from __future__ import annotations
+
+import resource
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator, Sequence
+from logging import WARNING, getLogger
+from pathlib import Path
+from random import Random
+from subprocess import run
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from scinoephile.core.dictionaries import (
+    DictionaryDefinition,
+    DictionaryEntry,
+    DictionarySource,
+    DictionarySqliteStore,
+)
+from scinoephile.dictionaries.cuhk import CuhkDictionaryService
+from scinoephile.dictionaries.gzzj import GzzjDictionaryService
+from scinoephile.dictionaries.kaifangcidian import KaifangcidianDictionaryService
+from scinoephile.dictionaries.unihan import UnihanDictionaryService
+from scinoephile.dictionaries.wiktionary import WiktionaryDictionaryService
+
+_SERVICES = {
+    "cuhk": CuhkDictionaryService,
+    "gzzj": GzzjDictionaryService,
+    "kaifangcidian": KaifangcidianDictionaryService,
+    "unihan": UnihanDictionaryService,
+    "wiktionary": WiktionaryDictionaryService,
+}
+"""Dictionary service classes keyed by name."""
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the dictionary build benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    if args.run is not None:
+        _run(args.run)
+        return
+
+    runs = [f"synthetic:{count}" for count in args.synthetic_counts]
+    runs.extend(args.dictionaries)
+    print(f"{'dictionary':>18} {'entries':>9} {'seconds':>8} {'peak RSS MB':>12}")
+    for run_name in runs:
+        completed = run(
+            [
+                sys.executable,
+                "-m",
+                "test.benchmarks.benchmark_dictionary_build",
+                "--run",
+                run_name,
+            ],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1:]
+            print(f"{run_name:>18} unavailable: {' '.join(error)}")
+            continue
+        print(completed.stdout.rstrip())
+
+
+def _get_synthetic_entries(count: int) -> Iterator[DictionaryEntry]:
+    """Generate synthetic dictionary entries.
+
+    Arguments:
+        count: number of entries
+    Yields:
+        dictionary entries
+    """
+    random = Random(0)
+    for entry_i in range(count):
+        syllable_count = random.randint(1, 4)
+        headword = "".join(
+            chr(0x4E00 + random.randrange(20000)) for _ in range(syllable_count)
+        )
+        yield DictionaryEntry(
+            traditional=headword,
+            simplified=headword,
+            pinyin=" ".join(
+                f"pin{random.randrange(400)}{random.randint(1, 5)}"
+                for _ in range(syllable_count)
+            ),
+            jyutping=" ".join(
+                f"jyut{random.randrange(600)}{random.randint(1, 6)}"
+                for _ in range(syllable_count)
+            ),
+            frequency=0.0,
+            definitions=[
+                DictionaryDefinition(
+                    text=f"synthetic definition {entry_i}.{definition_i}", label="noun"
+                )
+                for definition_i in range(random.randint(1, 4))
+            ],
+        )
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--synthetic-counts",
+        type=int,
+        nargs="*",
+        default=[20000, 100000, 300000],
+        help="numbers of synthetic entries to persist",
+    )
+    parser.add_argument(
+        "--dictionaries",
+        choices=sorted(_SERVICES),
+        nargs="*",
+        default=[],
+        help="dictionaries to build through their services",
+    )
+    parser.add_argument(
+        "--run", help="build one dictionary, or synthetic:N, in this process and report"
+    )
+    return parser.parse_args(argv)
+
+
+def _run(run_name: str):
+    """Build one dictionary database into a temporary directory and report.
+
+    Arguments:
+        run_name: dictionary name, or synthetic:N for N synthetic entries
+    """
+    getLogger("scinoephile").setLevel(WARNING)
+    with TemporaryDirectory() as temp_dir:
+        database_path = Path(temp_dir) / "dictionary.db"
+        started = perf_counter()
+        if run_name.startswith("synthetic:"):
+            DictionarySqliteStore(database_path=database_path).persist(
+                (
+                    DictionarySource(
+                        name="Synthetic",
+                        shortname="synthetic",
+                        version="1",
+                        description="Synthetic benchmark dictionary.",
+                        legal="",
+                        link="",
+                        update_url="",
+                        other="",
+                    ),
+                    _get_synthetic_entries(int(run_name.split(":")[1])),
+                )
+            )
+        else:
+            _SERVICES[run_name](database_path=database_path).build(overwrite=True)
+        elapsed = perf_counter() - started
+
+        store = DictionarySqliteStore(database_path=database_path, read_only=True)
+        with store.engine.connect() as connection:
+            entry_count = connection.exec_driver_sql(
+                "SELECT count(*) FROM entries"
+            ).scalar_one()
+        store.close()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    print(f"{run_name:>18} {entry_count:>9} {elapsed:>8.2f} {peak_rss / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
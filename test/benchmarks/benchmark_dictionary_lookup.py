@@ -0,0 +1,188 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark per-lookup latency of dictionary tool lookups.
+
+Uses the dictionary databases beneath the runtime data root when any are built, or
+otherwise builds synthetic databases in a temporary runtime data root. Compares
+one-off lookups, which open every dictionary for each query, with a long-lived
+lookup service, for both distinct and repeated queries.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_dictionary_lookup`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Sequence
+from logging import WARNING, getLogger
+from os import environ
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from scinoephile.core.dictionaries import (
+    DictionaryDefinition,
+    DictionaryEntry,
+    DictionarySource,
+    DictionarySqliteStore,
+)
+from scinoephile.core.paths import get_runtime_data_root_path
+from scinoephile.dictionaries.lookup import (
+    AVAILABLE_DICTIONARY_NAMES,
+    DictionaryLookupService,
+    lookup_dictionary_entries,
+)
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the dictionary lookup benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+    with TemporaryDirectory() as temp_dir:
+        data_root_path = get_runtime_data_root_path(create=False)
+        if args.synthetic or not any(
+            (data_root_path / "dictionaries" / name / f"{name}.db").exists()
+            for name in AVAILABLE_DICTIONARY_NAMES
+        ):
+            data_root_path = Path(temp_dir)
+            _write_synthetic_databases(data_root_path, args.entries)
+            environ["SCINOEPHILE_DATA_DIR"] = str(data_root_path)
+        print(f"Dictionaries beneath {data_root_path}")
+
+        queries = _get_queries(data_root_path, args.count)
+        service = DictionaryLookupService()
+        try:
+            print(f"{'lookup':>24} {'queries':>8} {'ms/lookup':>10}")
+            _print_timing(
+                "one-off",
+                queries,
+                lambda query: lookup_dictionary_entries(query=query, limit=10),
+            )
+            _print_timing(
+                "service, distinct",
+                queries,
+                lambda query: service.lookup(query, limit=10),
+            )
+            _print_timing(
+                "service, repeated",
+                queries,
+                lambda query: service.lookup(query, limit=10),
+            )
+        finally:
+            service.close()
+
+
+def _get_queries(data_root_path: Path, count: int) -> list[str]:
+    """Get traditional headwords to look up.
+
+    Arguments:
+        data_root_path: runtime data root path
+        count: number of queries
+    Returns:
+        queries
+    """
+    for name in AVAILABLE_DICTIONARY_NAMES:
+        database_path = data_root_path / "dictionaries" / name / f"{name}.db"
+        if not database_path.exists():
+            continue
+        store = DictionarySqliteStore(database_path, read_only=True)
+        try:
+            with store.engine.connect() as connection:
+                rows = connection.exec_driver_sql(
+                    "SELECT traditional FROM entries ORDER BY entry_id LIMIT ?",
+                    (count,),
+                ).all()
+        finally:
+            store.close()
+        return [str(row[0]) for row in rows]
+    return []
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200, help="number of queries")
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=20000,
+        help="number of entries per synthetic dictionary",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="use synthetic databases even if runtime databases are built",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_timing(label: str, queries: list[str], lookup: Callable[[str], object]):
+    """Time lookups of queries and print the mean latency.
+
+    Arguments:
+        label: row label
+        queries: queries to look up
+        lookup: function looking up one query
+    """
+    started = perf_counter()
+    for query in queries:
+        lookup(query)
+    elapsed = perf_counter() - started
+    print(f"{label:>24} {len(queries):>8} {1000 * elapsed / len(queries):>10.3f}")
+
+
+def _write_synthetic_databases(data_root_path: Path, entry_count: int):
+    """Write synthetic databases for every dictionary.
+
+    Arguments:
+        data_root_path: runtime data root path
+        entry_count: number of entries per dictionary
+    """
+    random = Random(0)
+    for name in AVAILABLE_DICTIONARY_NAMES:
+        entries = []
+        for entry_i in range(entry_count):
+            headword = chr(0x4E00 + entry_i // 64) + chr(0x4E00 + entry_i % 64 * 37)
+            entries.append(
+                DictionaryEntry(
+                    traditional=headword,
+                    simplified=headword,
+                    pinyin=f"pin{random.randrange(400)}1 yin{random.randrange(400)}2",
+                    jyutping=f"jyu{random.randrange(400)}3 ping4",
+                    frequency=random.random(),
+                    definitions=[DictionaryDefinition(text=f"{name} {entry_i}")],
+                )
+            )
+        DictionarySqliteStore(
+            database_path=data_root_path / "dictionaries" / name / f"{name}.db"
+        ).persist(
+            (
+                DictionarySource(
+                    name=f"Synthetic {name}",
+                    shortname=name,
+                    version="1",
+                    description="Synthetic benchmark dictionary.",
+                    legal="",
+                    link="",
+                    update_url="",
+                    other="",
+                ),
+                entries,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark CPU PaddleOCR throughput as batch size varies.
+
+Each batch size recognizes the same preprocessed subtitle images with an empty
+cache, so that every image is predicted. Requires the optional PaddleOCR runtime.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_paddle_batches`.
+"""
+
+from __future__ import annotations
+
+import os
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from logging import WARNING, getLogger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from PIL import Image
+
+from scinoephile.core import Language
+from scinoephile.image.ocr.paddle import PaddleRecognizer
+from scinoephile.image.ocr.paddle.preprocessing import preprocess_paddle_ocr_image
+from scinoephile.image.subtitles import ImageSeries, ImageSubtitle
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the PaddleOCR batch size benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    getLogger("scinoephile").setLevel(WARNING)
+
+    image_series = ImageSeries.load(args.infile)
+    images = [
+        preprocess_paddle_ocr_image(event.img)
+        for event in image_series.events[: args.count]
+        if isinstance(event, ImageSubtitle)
+    ]
+    print(f"{len(images)} subtitle images from {args.infile}")
+    print(f"{'batch size':>10} {'seconds':>8} {'images/s':>9}")
+    for batch_size in args.batch_sizes:
+        elapsed = _time(images, args.language, batch_size)
+        print(f"{batch_size:>10} {elapsed:>8.2f} {len(images) / elapsed:>9.2f}")
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--infile",
+        type=Path,
+        default=Path("test/data/mlamd/input/eng_ocr/source.sup"),
+        help="image subtitle infile path",
+    )
+    parser.add_argument(
+        "--language", type=Language, default=Language.eng, help="subtitle language"
+    )
+    parser.add_argument(
+        "--count", type=int, default=200, help="number of subtitles to recognize"
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="batch sizes to compare",
+    )
+    return parser.parse_args(argv)
+
+
+def _time(images: list[Image.Image], language: Language, batch_size: int) -> float:
+    """Time recognition of images with an empty cache.
+
+    Arguments:
+        images: preprocessed subtitle images
+        language: subtitle language
+        batch_size: maximum number of images to predict at once
+    Returns:
+        elapsed seconds, excluding model loading
+    """
+    with TemporaryDirectory() as temp_dir:
+        recognizer = PaddleRecognizer(cache_root_path=Path(temp_dir), language=language)
+        start = perf_counter()
+        recognizer.recognize_images(images, batch_size=batch_size)
+        return perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark romanization lookups through full-text indices and by scanning.
+
+Uses the Wiktionary and CUHK databases beneath the runtime data root when built,
+or otherwise a synthetic database. Each database is copied and stripped of its
+romanization full-text indices, so that lookups of the copy scan the entries table
+as databases built before schema version 4 do.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_romanization_lookup`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from contextlib import closing
+from logging import WARNING, getLogger
+from pathlib import Path
+from random import Random
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from scinoephile.core.dictionaries import (
+    DictionaryDefinition,
+    DictionaryEntry,
+    DictionarySource,
+    DictionarySqliteStore,
+)
+from scinoephile.core.paths import get_runtime_data_root_path
+
+_SYLLABLES = (
+    "a ai an ang ba bai ban bang bao bei ben bi bian bo bu ca cai can cao ce chang "
+    "chao che chen cheng chi chong chu chuan chun da dai dan dao de deng di dian "
+    "ding dong du duan fa fan fang fei fen feng fu gai gan gang gao ge gei gen "
+    "geng gong gou gu gua guan guang gui guo hai han hao he hei hen hong hou hu "
+    "hua huai huan huang hui hun huo ji jia jian jiang jiao jie jin jing jiu ju "
+    "jue kai kan kang ke keng kong kou ku kuai kuan lai lan lang lao le lei li "
+    "lian liang lin ling liu long lu luo ma mai man mao mei men meng mi mian min "
+    "ming mo mu na nan neng ni nian niu nong nu pa pai pan pang pei peng pi pian "
+    "ping po pu qi qian qiang qiao qie qin qing qiu qu quan que ran rang re ren "
+    "ri rong ru ruan sa san sang se sha shan shang shao she shen sheng shi shou "
+    "shu shuang shui shuo si song su suan sui ta tai tan tang te ti tian tiao "
+    "ting tong tou tu tuan tui wa wai wan wang wei wen wo wu xi xia xian xiang "
+    "xiao xie xin xing xiong xiu xu xuan xue ya yan yang yao ye yi yin ying yong "
+    "you yu yuan yue yun za zai zan zang ze zen zeng zha zhan zhang zhao zhe zhen "
+    "zheng zhi zhong zhou zhu zhuan zhuang zi zong zou zu zui zuo"
+).split()
+"""Pinyin syllables without tones from which to build synthetic entries."""
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the romanization lookup benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+    with TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        data_root_path = get_runtime_data_root_path(create=False)
+        database_paths = [
+            data_root_path / "dictionaries" / name / f"{name}.db"
+            for name in ("wiktionary", "cuhk")
+        ]
+        database_paths = [path for path in database_paths if path.exists()]
+        if args.synthetic or not database_paths:
+            database_paths = [temp_dir_path / "synthetic.db"]
+            _write_synthetic_database(database_paths[0], args.entries)
+
+        print(f"{'database':>16} {'queries':>22} {'scan ms':>8} {'index ms':>9}")
+        for database_path in database_paths:
+            scan_path = temp_dir_path / f"scan-{database_path.name}"
+            copyfile(database_path, scan_path)
+            with closing(sqlite3.connect(scan_path)) as connection:
+                connection.execute("DROP TABLE IF EXISTS entries_fts")
+                connection.execute("DROP TABLE IF EXISTS entries_trigram")
+                connection.execute("PRAGMA user_version=3")
+                connection.commit()
+
+            indexed_store = DictionarySqliteStore(database_path, read_only=True)
+            scan_store = DictionarySqliteStore(scan_path, read_only=True)
+            pinyins = _get_pinyins(database_path, args.count)
+            query_sets = {
+                "whole syllables": pinyins,
+                "last syllable prefix": [pinyin[:-2] for pinyin in pinyins],
+                "substring": [pinyin[1:] for pinyin in pinyins],
+            }
+            for label, queries in query_sets.items():
+                scan_ms = _time(scan_store, queries)
+                index_ms = _time(indexed_store, queries)
+                print(
+                    f"{database_path.stem:>16} {label:>22} {scan_ms:>8.3f} "
+                    f"{index_ms:>9.3f}"
+                )
+            indexed_store.close()
+            scan_store.close()
+
+
+def _get_pinyins(database_path: Path, count: int) -> list[str]:
+    """Get multi-syllable pinyin of entries spread through a database.
+
+    Arguments:
+        database_path: SQLite database path
+        count: number of pinyin strings
+    Returns:
+        pinyin strings
+    """
+    with closing(sqlite3.connect(database_path)) as connection:
+        rows = connection.execute(
+            "SELECT pinyin FROM entries WHERE pinyin LIKE '% %' "
+            "ORDER BY (entry_id * 7919) % 10007 LIMIT ?",
+            (count,),
+        ).fetchall()
+    return [str(row[0]) for row in rows]
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200, help="number of queries")
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=100000,
+        help="number of entries in the synthetic database",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="use a synthetic database even if runtime databases are built",
+    )
+    return parser.parse_args(argv)
+
+
+def _time(store: DictionarySqliteStore, queries: list[str]) -> float:
+    """Time pinyin lookups.
+
+    Arguments:
+        store: dictionary store
+        queries: pinyin queries
+    Returns:
+        mean milliseconds per lookup
+    """
+    started = perf_counter()
+    for query in queries:
+        store.lookup_by_pinyin(query, limit=10)
+    return 1000 * (perf_counter() - started) / len(queries)
+
+
+def _write_synthetic_database(database_path: Path, entry_count: int):
+    """Write a synthetic dictionary database with pinyin of random syllables.
+
+    Arguments:
+        database_path: SQLite database path
+        entry_count: number of entries
+    """
+    random = Random(0)
+    entries = []
+    for entry_i in range(entry_count):
+        syllables = [
+            f"{random.choice(_SYLLABLES)}{random.randint(1, 5)}"
+            for _ in range(random.randint(1, 4))
+        ]
+        headword = "".join(
+            chr(0x4E00 + random.randrange(20000)) for _ in range(len(syllables))
+        )
+        entries.append(
+            DictionaryEntry(
+                traditional=headword,
+                simplified=headword,
+                pinyin=" ".join(syllables),
+                jyutping="",
+                frequency=0.0,
+                definitions=[DictionaryDefinition(text=f"definition {entry_i}")],
+            )
+        )
+    DictionarySqliteStore(database_path=database_path).persist(
+        (
+            DictionarySource(
+                name="Synthetic",
+                shortname="synthetic",
+                version="1",
+                description="Synthetic benchmark dictionary.",
+                legal="",
+                link="",
+                update_url="",
+                other="",
+            ),
+            entries,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
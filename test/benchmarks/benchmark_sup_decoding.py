@@ -0,0 +1,246 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark eager and streaming decoding of SUP subtitles.
+
+Uses a SUP file when provided, or otherwise writes a synthetic one with large
+gray subtitle bitmaps. Each mode runs in a fresh process and reports the time until
+the first subtitle is available, the total time, and the peak resident set size.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_sup_decoding`.
+"""
+
+from __future__ import annotations
+
+import resource
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from pathlib import Path
+from random import Random
+from subprocess import run
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+from PIL import Image
+
+from scinoephile.image.drawing import convert_rgba_img_to_la
+from scinoephile.image.subtitles import ImageSeries
+from scinoephile.image.subtitles.sup import read_sup_series
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the SUP decoding benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    if args.mode is not None:
+        _run(args.infile, args.mode, args.workers[0])
+        return
+
+    with TemporaryDirectory() as temp_dir:
+        warmup_path = Path(temp_dir) / "warmup.sup"
+        _write_synthetic_sup(warmup_path, 1, 100, 80)
+        read_sup_series(np.frombuffer(warmup_path.read_bytes(), dtype=np.uint8))
+        list(ImageSeries.iter_sup(warmup_path))
+
+        infile = args.infile
+        if infile is None:
+            infile = Path(temp_dir) / "source.sup"
+            _write_synthetic_sup(infile, args.count, args.width, args.height)
+        print(f"{infile.stat().st_size / 1e6:.1f} MB of SUP data")
+        print(
+            f"{'mode':>10} {'workers':>8} {'first s':>8} {'total s':>8} "
+            f"{'peak RSS MB':>12}"
+        )
+        runs = [("eager", 1)] + [("streaming", workers) for workers in args.workers]
+        for mode, workers in runs:
+            completed = run(
+                [
+                    sys.executable,
+                    "-m",
+                    "test.benchmarks.benchmark_sup_decoding",
+                    "--infile",
+                    str(infile),
+                    "--mode",
+                    mode,
+                    "--workers",
+                    str(workers),
+                ],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            print(completed.stdout.rstrip())
+
+
+def _encode_rle(array: np.ndarray) -> bytes:
+    """Encode a palette-index image as SUP run-length data.
+
+    Arguments:
+        array: palette-index image
+    Returns:
+        run-length data
+    """
+    encoded = bytearray()
+    for row in array:
+        edges = np.flatnonzero(np.diff(row)) + 1
+        for start, end in zip(
+            np.concatenate(([0], edges)), np.concatenate((edges, [len(row)]))
+        ):
+            color = int(row[start])
+            count = int(end - start)
+            if color == 0:
+                encoded += (
+                    bytes([0, count])
+                    if count < 64
+                    else bytes([0, 0x40 | count >> 8, count & 0xFF])
+                )
+            elif count < 3:
+                encoded += bytes([color]) * count
+            elif count < 64:
+                encoded += bytes([0, 0x80 | count, color])
+            else:
+                encoded += bytes([0, 0xC0 | count >> 8, count & 0xFF, color])
+        encoded += b"\x00\x00"
+    return bytes(encoded)
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--infile", type=Path, help="SUP infile path")
+    parser.add_argument(
+        "--count", type=int, default=400, help="number of synthetic subtitles"
+    )
+    parser.add_argument(
+        "--width", type=int, default=1920, help="width of synthetic subtitles"
+    )
+    parser.add_argument(
+        "--height", type=int, default=270, help="height of synthetic subtitles"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 4],
+        help="streaming worker counts to compare",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("eager", "streaming"),
+        help="measure one mode in this process rather than each in a subprocess",
+    )
+    return parser.parse_args(argv)
+
+
+def _presentation(composition_number: int, object_count: int) -> bytes:
+    """Build a minimal presentation composition payload.
+
+    Arguments:
+        composition_number: presentation composition number
+        object_count: number of referenced objects
+    Returns:
+        presentation composition payload
+    """
+    payload = bytearray(11)
+    payload[5:7] = composition_number.to_bytes(2, "big")
+    payload[10] = object_count
+    return bytes(payload)
+
+
+def _run(infile: Path, mode: str, workers: int):
+    """Decode a SUP file and report timing and memory usage.
+
+    Arguments:
+        infile: SUP infile path
+        mode: whether to decode all images at once or stream them
+        workers: maximum number of images to decode at once when streaming
+    """
+    started = perf_counter()
+    first = None
+    imgs = []
+    if mode == "eager":
+        data = np.frombuffer(infile.read_bytes(), dtype=np.uint8)
+        _, _, images = read_sup_series(data)
+        for image in images:
+            imgs.append(convert_rgba_img_to_la(Image.fromarray(image, "RGBA")))
+            if first is None:
+                first = perf_counter() - started
+    else:
+        for subtitle in ImageSeries.iter_sup(infile, workers=workers):
+            imgs.append(subtitle.img)
+            if first is None:
+                first = perf_counter() - started
+    elapsed = perf_counter() - started
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    print(
+        f"{mode:>10} {workers:>8} {first or 0.0:>8.3f} {elapsed:>8.3f} "
+        f"{peak_rss / 1e6:>12.1f}"
+    )
+
+
+def _write_synthetic_sup(path: Path, count: int, width: int, height: int):
+    """Write a SUP file of synthetic outlined text-like subtitles.
+
+    Arguments:
+        path: SUP outfile path
+        count: number of subtitles
+        width: image width
+        height: image height
+    """
+    random = Random(0)
+    palette = b"\x00\x00" + b"\x01\xeb\x80\x80\xff" + b"\x02\x10\x80\x80\xff"
+    with path.open("wb") as outfile:
+        for subtitle_i in range(count):
+            array = np.zeros((height, width), np.uint8)
+            for _ in range(60):
+                x = random.randrange(0, max(1, width - 40))
+                y = random.randrange(0, max(1, height - 60))
+                array[y : y + 60, x : x + 40] = 2
+                array[y + 4 : y + 56, x + 4 : x + 36] = 1
+            rle = _encode_rle(array)
+            start = (subtitle_i * 2 + 1) * 90000
+            end = start + 90000
+            header = (
+                b"\x00\x00\x00\x80"
+                + (4 + len(rle)).to_bytes(3, "big")
+                + width.to_bytes(2, "big")
+                + height.to_bytes(2, "big")
+            )
+            pieces = [header + rle[:65500]]
+            pieces.extend(
+                b"\x00\x00\x00\x00" + rle[i : i + 65500]
+                for i in range(65500, len(rle), 65500)
+            )
+            pieces[-1] = pieces[-1][:3] + bytes([pieces[-1][3] | 0x40]) + pieces[-1][4:]
+            segments = [
+                (start, 0x16, _presentation(subtitle_i * 2, 1)),
+                (start, 0x14, palette),
+                *((start, 0x15, piece) for piece in pieces),
+                (start, 0x80, b""),
+                (end, 0x16, _presentation(subtitle_i * 2 + 1, 0)),
+                (end, 0x80, b""),
+            ]
+            for timestamp, kind, payload in segments:
+                pts = timestamp.to_bytes(4, "big")
+                outfile.write(
+                    b"PG" + pts + pts + bytes([kind]) + len(payload).to_bytes(2, "big")
+                )
+                outfile.write(payload)
+
+
+if __name__ == "__main__":
+    main()
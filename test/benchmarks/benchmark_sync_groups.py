@@ -0,0 +1,109 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark dense and sparse sync group engines on synthetic series.
+
+Run from the repository root with `python -m test.benchmarks.benchmark_sync_groups`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from logging import WARNING, getLogger
+from random import Random
+from time import perf_counter
+
+from scinoephile.core.subtitles import Series, Subtitle
+from scinoephile.core.synchronization import SyncGroupEngine, get_sync_groups
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the sync group engine benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+
+    print(f"{'events':>8} {'engine':>8} {'seconds':>10} {'groups':>8}")
+    for size in args.sizes:
+        one, two = _get_synthetic_series(size, args.seed)
+        results = {}
+        for engine in SyncGroupEngine:
+            if engine == SyncGroupEngine.DENSE and size > args.dense_limit:
+                print(f"{size:>8} {engine:>8} {'skipped':>10} {'':>8}")
+                continue
+            start = perf_counter()
+            results[engine] = get_sync_groups(one, two, engine=engine)
+            elapsed = perf_counter() - start
+            print(f"{size:>8} {engine:>8} {elapsed:>10.3f} {len(results[engine]):>8}")
+        if len(results) == 2 and len(set(map(repr, results.values()))) != 1:
+            raise AssertionError(f"Engines disagree for {size} events")
+
+
+def _get_synthetic_series(size: int, seed: int) -> tuple[Series, Series]:
+    """Get a pair of synthetic series resembling two releases of one film.
+
+    The second series drops, splits, and jitters subtitles of the first.
+
+    Arguments:
+        size: number of subtitles in the first series
+        seed: random seed
+    Returns:
+        first and second series
+    """
+    random = Random(seed)
+    one = Series()
+    time = 0
+    for _ in range(size):
+        time += random.randint(200, 3000)
+        duration = random.randint(800, 4000)
+        one.events.append(Subtitle(start=time, end=time + duration, text="A"))
+        time += duration
+
+    two = Series()
+    for event in one.events:
+        roll = random.random()
+        if roll < 0.02:
+            continue
+        start = event.start + random.randint(-150, 150)
+        end = event.end + random.randint(-150, 150)
+        if roll < 0.05:
+            middle = (start + end) // 2
+            two.events.append(Subtitle(start=start, end=middle, text="1"))
+            two.events.append(Subtitle(start=middle, end=end, text="2"))
+            continue
+        two.events.append(Subtitle(start=start, end=end, text="1"))
+
+    return one, two
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 500, 1000, 2000, 5000, 10000, 20000],
+        help="numbers of subtitles in the first series",
+    )
+    parser.add_argument(
+        "--dense-limit",
+        type=int,
+        default=2000,
+        help="largest size at which to run the dense engine",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
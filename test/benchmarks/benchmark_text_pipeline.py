@@ -0,0 +1,109 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark chained series workflows against a single-pass text pipeline.
+
+The chained workflows copy the series, resolve its language, and walk its
+subtitles once per operation; the pipeline does each once.
+
+Run from the repository root with `python -m test.benchmarks.benchmark_text_pipeline`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from copy import deepcopy
+from functools import partial
+from logging import ERROR, getLogger
+from time import perf_counter
+
+from scinoephile.core import Language
+from scinoephile.core.script import OpenCCConfig
+from scinoephile.core.subtitles import Series
+from scinoephile.lang.zho.script.conversion import (
+    get_zho_converted,
+    get_zho_text_converted,
+)
+from scinoephile.workflows.clean import clean_series, get_clean_operation
+from scinoephile.workflows.flatten import flatten_series, get_flatten_operation
+from scinoephile.workflows.romanize import get_romanize_operation, romanize_series
+from scinoephile.workflows.text_pipeline import TextOperation, TextPipeline
+from test.helpers import test_data_root
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the text pipeline benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(ERROR)
+    language = Language.yue_hans
+    source = Series.load(test_data_root / "kob" / "input" / "yue-Hans.srt")
+    series = Series(
+        events=[deepcopy(source.events[i % len(source)]) for i in range(args.events)]
+    )
+
+    operations = [
+        get_clean_operation(language),
+        TextOperation(
+            "conversion", partial(get_zho_text_converted, config=OpenCCConfig.s2t)
+        ),
+        get_flatten_operation(language),
+    ]
+    if args.romanize:
+        operations.append(get_romanize_operation(language))
+    pipeline = TextPipeline(operations)
+
+    def chained() -> Series:
+        """Process the series with one workflow per operation.
+
+        Returns:
+            processed series
+        """
+        processed = clean_series(series, language=language)
+        processed = get_zho_converted(processed, OpenCCConfig.s2t)
+        processed = flatten_series(processed, language=language)
+        if args.romanize:
+            processed = romanize_series(processed, language=language)
+        return processed
+
+    # Warm converters, dictionaries, and language detection before timing
+    TextPipeline(operations)(series.slice(0, 10))
+
+    print(f"{'events':>8} {'chained s':>10} {'pipeline s':>11} {'speedup':>8}")
+    start = perf_counter()
+    expected = chained()
+    chained_seconds = perf_counter() - start
+    start = perf_counter()
+    processed = pipeline(series)
+    pipeline_seconds = perf_counter() - start
+    if processed != expected:
+        raise AssertionError("Pipeline output differs from chained workflows")
+    print(
+        f"{args.events:>8} {chained_seconds:>10.3f} {pipeline_seconds:>11.3f} "
+        f"{chained_seconds / pipeline_seconds:>7.1f}x"
+    )
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--events", type=int, default=10000, help="number of subtitles in the series"
+    )
+    parser.add_argument(
+        "--romanize", action="store_true", help="also append romanization"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark timed multiple-sequence alignment of long blocks.
+
+Aligns synthetic transcriptions of one block of speech from several sources, each
+with its own timing offset and jitter, substitutions, deletions, and insertions, with
+and without restricting dynamic programming to a time band. Progressive orders may
+optionally be pruned.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_timed_msa`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from random import Random
+from time import perf_counter
+
+from scinoephile.analysis.alignment.timed_msa import (
+    Aligner,
+    AlignmentSequence,
+    Settings,
+    Token,
+)
+
+_CHARACTERS = "我你佢係嘅唔咗喺度好就真啲冇"
+"""Characters from which synthetic transcriptions are drawn."""
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the timed multiple-sequence alignment benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    Aligner(_get_similarity)(_get_sequences(2, 10))
+    print(f"{'sources':>8} {'tokens':>7} {'band':>6} {'seconds':>8}")
+    for length in args.lengths:
+        sequences = _get_sequences(args.sources, length)
+        alignments = []
+        for band_seconds in (None, args.band):
+            settings = Settings(
+                band_seconds=band_seconds, prune_orders=args.prune_orders
+            )
+            aligner = Aligner(_get_similarity, settings)
+            started = perf_counter()
+            alignments.append(aligner(sequences))
+            elapsed = perf_counter() - started
+            band = "none" if band_seconds is None else f"{band_seconds:g}"
+            print(f"{args.sources:>8} {length:>7} {band:>6} {elapsed:>8.2f}")
+        if alignments[0] != alignments[1]:
+            print(f"{'':>8} {'':>7} banded alignment differs")
+
+
+def _get_sequences(source_count: int, length: int) -> tuple[AlignmentSequence, ...]:
+    """Get synthetic transcriptions of one block of speech.
+
+    Arguments:
+        source_count: number of sources
+        length: number of spoken characters
+    Returns:
+        timestamped sequences, one per source
+    """
+    random = Random(0)
+    spoken = []
+    start = 0.0
+    for _ in range(length):
+        start += random.uniform(0.1, 0.4)
+        spoken.append((random.choice(_CHARACTERS), start))
+    sequences = []
+    for source_idx in range(source_count):
+        source_offset = random.uniform(-0.5, 0.5)
+        tokens = []
+        for spoken_character, spoken_start in spoken:
+            draw = random.random()
+            if draw < 0.08:
+                continue
+            character = spoken_character
+            if draw < 0.16:
+                character = random.choice(_CHARACTERS)
+            start = max(0.0, spoken_start + source_offset + random.uniform(0.0, 0.05))
+            tokens.append(Token(character, start, start + 0.1))
+            if random.random() < 0.05:
+                tokens.append(Token(random.choice("啊呀"), start + 0.05, start + 0.1))
+        sequences.append(AlignmentSequence(f"source-{source_idx}", tuple(tokens)))
+    return tuple(sequences)
+
+
+def _get_similarity(one: Token, two: Token) -> float:
+    """Score two tokens by character identity and midpoint distance.
+
+    Arguments:
+        one: first timestamped character
+        two: second timestamped character
+    Returns:
+        combined lexical and temporal substitution score
+    """
+    lexical_score = 6.0 if one.text == two.text else -2.0
+    one_midpoint = (one.start_seconds + one.end_seconds) / 2
+    two_midpoint = (two.start_seconds + two.end_seconds) / 2
+    return lexical_score + 2.0 * max(-1.0, 1.0 - abs(one_midpoint - two_midpoint))
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, default=4, help="number of sources")
+    parser.add_argument(
+        "--lengths",
+        type=int,
+        nargs="*",
+        default=[200, 400, 800],
+        help="numbers of spoken characters per block",
+    )
+    parser.add_argument(
+        "--band",
+        type=float,
+        default=Settings().band_seconds,
+        help="time band in seconds",
+    )
+    parser.add_argument(
+        "--prune-orders",
+        action="store_true",
+        help="abandon orders whose score bound cannot exceed the best",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
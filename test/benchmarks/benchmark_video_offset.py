@@ -0,0 +1,124 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark sampling of video frames for offset detection.
+
+Uses reference and target videos when provided, or otherwise renders a synthetic
+pair with ffmpeg. Compares decoding each window of each file separately with decoding
+all windows of each file in one pass, and with reading them back from the cache.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_video_offset`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from logging import WARNING, getLogger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import ffmpeg
+
+from scinoephile.media.offset.video.detection import (
+    get_video_offset,
+    sample_video_frames,
+    sample_video_windows,
+)
+from scinoephile.media.offset.video.video_frame_cache import VideoFrameCache
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the video offset sampling benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+    with TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        reference_infile_path = args.reference_infile
+        target_infile_path = args.target_infile
+        if reference_infile_path is None or target_infile_path is None:
+            reference_infile_path = temp_dir_path / "reference.mkv"
+            target_infile_path = temp_dir_path / "target.mkv"
+            _write_synthetic_video(reference_infile_path, args.length, 0.0)
+            _write_synthetic_video(target_infile_path, args.length, 1.5)
+
+        start_times = [
+            (args.length - args.duration) * (0.1 + 0.8 * index / 3)
+            for index in range(4)
+        ]
+        kwargs = {
+            "sample_rate": 2.0,
+            "duration": args.duration,
+            "width": 160,
+            "height": 90,
+        }
+        print(f"{'sampling':>24} {'seconds':>8}")
+
+        started = perf_counter()
+        for infile_path in (reference_infile_path, target_infile_path):
+            for start_time in start_times:
+                sample_video_frames(infile_path, start_time=start_time, **kwargs)
+        print(f"{'per window':>24} {perf_counter() - started:>8.2f}")
+
+        frame_cache = VideoFrameCache(temp_dir_path / "cache")
+        started = perf_counter()
+        for infile_path in (reference_infile_path, target_infile_path):
+            sample_video_windows(
+                infile_path, start_times=start_times, frame_cache=frame_cache, **kwargs
+            )
+        print(f"{'one pass per file':>24} {perf_counter() - started:>8.2f}")
+
+        started = perf_counter()
+        result = get_video_offset(
+            reference_infile_path=reference_infile_path,
+            target_infile_path=target_infile_path,
+            duration=args.duration,
+            frame_cache=frame_cache,
+        )
+        print(f"{'cached offset search':>24} {perf_counter() - started:>8.2f}")
+        print(f"Offset: {result.offset:+.3f} s ({result.confidence} confidence)")
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--reference-infile", type=Path, help="reference video")
+    parser.add_argument("--target-infile", type=Path, help="target video")
+    parser.add_argument(
+        "--length", type=float, default=600.0, help="length of synthetic videos"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="duration of each window"
+    )
+    return parser.parse_args(argv)
+
+
+def _write_synthetic_video(path: Path, length: float, delay: float):
+    """Render a synthetic video of moving noise.
+
+    Arguments:
+        path: video outfile path
+        length: video length in seconds
+        delay: seconds of black video preceding the content
+    """
+    content = ffmpeg.input(
+        f"cellauto=s=640x360:r=24:rule=110:d={length}", f="lavfi"
+    ).filter("tpad", start_duration=delay)
+    content.output(
+        str(path), vcodec="libx264", preset="ultrafast", t=length
+    ).overwrite_output().run(capture_stdout=True, capture_stderr=True)
+
+
+if __name__ == "__main__":
+    main()
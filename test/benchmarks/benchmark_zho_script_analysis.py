@@ -0,0 +1,108 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Benchmark Chinese script analysis by character table and by OpenCC per character.
+
+Analyzes each subtitle of the Chinese subtitle files beneath the test data.
+
+Run from the repository root with
+`python -m test.benchmarks.benchmark_zho_script_analysis`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from logging import WARNING, getLogger
+from time import perf_counter
+
+from scinoephile.core.script import OpenCCConfig
+from scinoephile.core.subtitles import Series
+from scinoephile.core.text import RE_HANZI
+from scinoephile.lang.zho.script.analysis import get_zho_script_analysis
+from scinoephile.lang.zho.script.character_table import ZhoCharacterTable
+from scinoephile.lang.zho.script.conversion import get_zho_text_converted
+from test.helpers import test_data_root
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the Chinese script analysis benchmark.
+
+    Arguments:
+        argv: command-line arguments
+    """
+    args = _parse_args(argv)
+    getLogger("scinoephile").setLevel(WARNING)
+    paths = sorted(
+        path
+        for pattern in ("*/output/yue-*/*.srt", "*/output/zho-*/*.srt")
+        for path in test_data_root.glob(pattern)
+    )[: args.files]
+    texts = [event.text for path in paths for event in Series.load(path)]
+
+    start = perf_counter()
+    table = ZhoCharacterTable.from_opencc()
+    print(f"Built {table} in {perf_counter() - start:.3f} s")
+    get_zho_script_analysis("")
+
+    start = perf_counter()
+    expected = [_get_counts_by_opencc(text) for text in texts]
+    opencc_seconds = perf_counter() - start
+    start = perf_counter()
+    analyses = [get_zho_script_analysis(text) for text in texts]
+    table_seconds = perf_counter() - start
+    counts = [
+        (analysis.shared_count, analysis.simplified_count, analysis.traditional_count)
+        for analysis in analyses
+    ]
+    if counts != expected:
+        raise AssertionError("Character table counts differ from OpenCC")
+
+    print(
+        f"{'files':>6} {'subtitles':>10} {'opencc s':>9} {'table s':>8} {'speedup':>8}"
+    )
+    print(
+        f"{len(paths):>6} {len(texts):>10} {opencc_seconds:>9.3f} "
+        f"{table_seconds:>8.3f} {opencc_seconds / table_seconds:>7.1f}x"
+    )
+
+
+def _get_counts_by_opencc(text: str) -> tuple[int, int, int]:
+    """Count shared, simplified-only, and traditional-only Hanzi using OpenCC.
+
+    Arguments:
+        text: text to analyze
+    Returns:
+        numbers of shared, simplified-only, and traditional-only Hanzi
+    """
+    shared_count = simplified_count = traditional_count = 0
+    for character in RE_HANZI.findall(text):
+        if character != get_zho_text_converted(
+            character, OpenCCConfig.t2s, apply_exclusions=False
+        ):
+            traditional_count += 1
+        elif character != get_zho_text_converted(
+            character, OpenCCConfig.s2t, apply_exclusions=False
+        ):
+            simplified_count += 1
+        else:
+            shared_count += 1
+    return shared_count, simplified_count, traditional_count
+
+
+def _parse_args(argv: Sequence[str] | None) -> Namespace:
+    """Parse command-line arguments.
+
+    Arguments:
+        argv: command-line arguments
+    Returns:
+        parsed arguments
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--files", type=int, default=40, help="maximum number of subtitle files"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
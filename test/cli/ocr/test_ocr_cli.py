@@ -267,6 +267,7 @@ def test_ocr_tesseract_cli_converts_image_subtitles_to_srt(
         assert kwargs == {
             "cache_root_path": cache_root_path.resolve(),
             "detect_italics": False,
+            "jobs": 1,
             "language": Language.eng,
             "overwrite_cache": False,
         }
@@ -294,7 +295,7 @@ def test_ocr_tesseract_cli_converts_image_subtitles_to_srt(
 def test_ocr_tesseract_cli_passes_italic_detection_options(
     monkeypatch: MonkeyPatch, tmp_path: Path, tiny_image_series: ImageSeries
 ):
-    """Test Tesseract OCR CLI passes italic detection options.
+    """Test Tesseract OCR CLI passes italic detection and parallelism options.
 
     Arguments:
         monkeypatch: pytest monkeypatch fixture
@@ -319,6 +320,7 @@ def test_ocr_tesseract_cli_passes_italic_detection_options(
         assert kwargs == {
             "cache_root_path": cache_root_path.resolve(),
             "detect_italics": True,
+            "jobs": 4,
             "language": Language.eng,
             "overwrite_cache": False,
         }
@@ -332,7 +334,7 @@ def test_ocr_tesseract_cli_passes_italic_detection_options(
     output_path = tmp_path / "ocr.srt"
     run_cli_with_args(
         OcrTesseractCli,
-        f"--infile {input_path} --detect-italics --outfile {output_path} "
+        f"--infile {input_path} --detect-italics --jobs 4 --outfile {output_path} "
         f"--cache-dir {cache_root_path}",
     )
 
@@ -407,7 +409,12 @@ def test_ocr_tesseract_cli_rejects_italic_detection_for_non_english(
             "scinoephile.cli.ocr.ocr_tesseract_cli.ocr_image_series_with_tesseract",
             "scinoephile.cli.ocr.ocr_tesseract_cli.write_series",
             "--detect-italics",
-            {"detect_italics": True, "language": Language.eng, "overwrite_cache": True},
+            {
+                "detect_italics": True,
+                "jobs": 1,
+                "language": Language.eng,
+                "overwrite_cache": True,
+            },
         ),
     ],
 )
@@ -44,10 +44,18 @@ def test_ocr_process_cli_passes_eng_arguments_to_workflow(tmp_path: Path):
             workflow_calls += 1
             return result
 
-    def get_provider(provider_name: str, *, model: str | None) -> object:
+    def get_provider(
+        provider_name: str,
+        *,
+        model: str | None,
+        requests_per_minute: int | None,
+        tokens_per_minute: int | None,
+    ) -> object:
         """Validate provider options."""
         assert provider_name == "openai"
         assert model is None
+        assert requests_per_minute is None
+        assert tokens_per_minute is None
         return expected_provider
 
     def get_workflow(
@@ -83,7 +91,7 @@ def test_ocr_process_cli_passes_eng_arguments_to_workflow(tmp_path: Path):
         assert overwrite_cache is True
         assert provider is expected_provider
         assert additional_context is None
-        assert fuser_kw == {"no_op": True}
+        assert fuser_kw == {"no_op": True, "concurrency": 2}
         return _Workflow()
 
     with (
@@ -100,7 +108,7 @@ def test_ocr_process_cli_passes_eng_arguments_to_workflow(tmp_path: Path):
             f"--infile {infile_path} --stream-index 3 --language eng "
             f"-o {output_dir_path} --cache-dir {cache_root_path} "
             "--clean --interactive --host 0.0.0.0 --port 5051 --dev "
-            "--overwrite --cache-overwrite --llm-no-op",
+            "--overwrite --cache-overwrite --llm-no-op --concurrency 2",
         )
 
     assert workflow_calls == 1
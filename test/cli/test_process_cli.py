@@ -4,11 +4,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from io import StringIO
+from shutil import copyfile
 from unittest.mock import patch
 
+from pytest import raises
+
 from scinoephile.cli.process_cli import ProcessCli
-from scinoephile.common.file import get_temp_file_path
+from scinoephile.common.file import get_temp_directory_path, get_temp_file_path
 from scinoephile.common.testing import run_cli_with_args
 from scinoephile.core.subtitles import Series
 from test.helpers import assert_series_equal, parametrize, test_data_root
@@ -100,3 +105,132 @@ def test_process_cli_pipe(input_path: str, args: str, expected_path: str):
     expected = Series.load(full_expected_path)
 
     assert_series_equal(output, expected)
+
+
+@parametrize("jobs", [1, 2])
+def test_process_cli_batch(jobs: int, capsys):
+    """Test batch processing matches processing each file individually.
+
+    Arguments:
+        jobs: maximum number of files to process at once
+        capsys: pytest fixture capturing stdout and stderr
+    """
+    input_dir_path = test_data_root / "kob" / "input"
+    input_paths = sorted(input_dir_path.glob("*.srt"))
+
+    with get_temp_directory_path() as output_dir_path:
+        run_cli_with_args(
+            ProcessCli,
+            f"--infile {input_dir_path} --clean --flatten "
+            f"--outdir {output_dir_path} --jobs {jobs}",
+        )
+        reported_paths = capsys.readouterr().out.split()
+        for input_path in input_paths:
+            with get_temp_file_path(".srt") as output_path:
+                run_cli_with_args(
+                    ProcessCli,
+                    f"--infile {input_path} --clean --flatten --outfile {output_path}",
+                )
+                expected = Series.load(output_path)
+            output = Series.load(output_dir_path / input_path.name)
+            assert_series_equal(output, expected)
+
+    assert sorted(reported_paths) == sorted(
+        str(output_dir_path / input_path.name) for input_path in input_paths
+    )
+
+
+def test_process_cli_batch_summarizes_errors(capsys):
+    """Test batch processing continues past failures and summarizes them.
+
+    Arguments:
+        capsys: pytest fixture capturing stdout and stderr
+    """
+    with get_temp_directory_path() as temp_dir_path:
+        input_dir_path = temp_dir_path / "input"
+        input_dir_path.mkdir()
+        copyfile(
+            test_data_root / "kob" / "input" / "eng.srt", input_dir_path / "eng.srt"
+        )
+        (input_dir_path / "broken.srt").write_text("not subtitles", encoding="utf-8")
+        output_dir_path = temp_dir_path / "output"
+
+        with raises(SystemExit) as excinfo:
+            run_cli_with_args(
+                ProcessCli,
+                f"--infile {input_dir_path / '*.srt'} --clean "
+                f"--outdir {output_dir_path}",
+            )
+        captured = capsys.readouterr()
+
+        assert excinfo.value.code == 1
+        assert (output_dir_path / "eng.srt").exists()
+        assert not (output_dir_path / "broken.srt").exists()
+    assert captured.out.split() == [str(output_dir_path / "eng.srt")]
+    assert "Unable to process 1 of 2 infiles" in captured.err
+    assert str(input_dir_path / "broken.srt") in captured.err
+
+
+def test_process_cli_batch_summarizes_broken_workers(capsys):
+    """Test batch processing summarizes files whose worker process died.
+
+    Arguments:
+        capsys: pytest fixture capturing stdout and stderr
+    """
+
+    class BrokenExecutor:
+        """Process pool stand-in whose workers have all died."""
+
+        def __init__(self, **_kwargs: object):
+            """Initialize.
+
+            Arguments:
+                **_kwargs: process pool options
+            """
+
+        def __enter__(self) -> BrokenExecutor:
+            """Enter context.
+
+            Returns:
+                this executor
+            """
+            return self
+
+        def __exit__(self, *_args: object):
+            """Exit context.
+
+            Arguments:
+                *_args: exception information
+            """
+
+        @staticmethod
+        def submit(*_args: object) -> Future[None]:
+            """Submit a call that fails because its worker died.
+
+            Arguments:
+                *_args: callable and its arguments
+            Returns:
+                failed future
+            """
+            future: Future[None] = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    input_dir_path = test_data_root / "kob" / "input"
+    with get_temp_directory_path() as output_dir_path:
+        with (
+            patch("scinoephile.cli.process_cli.ProcessPoolExecutor", BrokenExecutor),
+            raises(SystemExit) as excinfo,
+        ):
+            run_cli_with_args(
+                ProcessCli,
+                f"--infile {input_dir_path / 'eng.srt'} "
+                f"{input_dir_path / 'yue-Hans.srt'} --clean "
+                f"--outdir {output_dir_path} --jobs 2",
+            )
+        captured = capsys.readouterr()
+
+    assert excinfo.value.code == 1
+    assert captured.out == ""
+    assert "Unable to process 2 of 2 infiles" in captured.err
+    assert "worker died" in captured.err
@@ -16,6 +16,7 @@ from scinoephile.cli.scinoephile_cli import ScinoephileCli
 from scinoephile.common.file import get_temp_file_path
 from scinoephile.common.testing import run_cli_with_args
 from scinoephile.core.subtitles import Series
+from scinoephile.llms.providers.registry import get_provider
 from test.helpers import assert_series_equal, parametrize, test_data_root
 
 
@@ -152,6 +153,41 @@ def test_review_cli_no_op_persists_json_without_response_cache(tmp_path: Path):
     assert not cache_root_path.exists()
 
 
+def test_review_cli_passes_rate_limits_to_provider(tmp_path: Path):
+    """Test LLM rate limit arguments reach the provider's shared rate limiter.
+
+    Arguments:
+        tmp_path: temporary directory path
+    """
+    input_path = tmp_path / "input.srt"
+    output_path = tmp_path / "output.srt"
+    input_path.write_text(
+        "1\n00:00:00,000 --> 00:00:01,000\nRate-limited subtitle.\n", encoding="utf-8"
+    )
+    providers = []
+
+    def get_recorded_provider(*args, **kwargs):
+        """Build a real provider and record it."""
+        provider = get_provider(*args, **kwargs)
+        providers.append(provider)
+        return provider
+
+    with patch(
+        "scinoephile.cli.review_cli.get_provider", side_effect=get_recorded_provider
+    ):
+        run_cli_with_args(
+            ReviewCli,
+            f"{input_path} --language eng --llm-no-op "
+            "--llm-requests-per-minute 30 --llm-tokens-per-minute 20000 "
+            f"--cache-dir {tmp_path / 'cache'} --outfile {output_path}",
+        )
+
+    assert len(providers) == 1
+    rate_limiter = providers[0].rate_limiter
+    assert rate_limiter.requests_per_minute == 30
+    assert rate_limiter.tokens_per_minute == 20000
+
+
 @parametrize(
     ("workflow_name", "guide_argument"),
     [("review_series", ""), ("review_series_guided", "--guide-infile")],
@@ -181,7 +217,7 @@ def test_review_cli_passes_block_range(
                 ReviewCli,
                 f"{input_path} {guide_args} --json {json_path} "
                 f"--first-block 2 --last-block 3 --cache-dir {cache_root_path} "
-                "--cache-overwrite --llm-no-op",
+                "--cache-overwrite --llm-no-op --concurrency 3",
             )
 
     assert workflow.call_args.kwargs["current_test_cases_path"] == json_path
@@ -190,6 +226,7 @@ def test_review_cli_passes_block_range(
     assert workflow.call_args.kwargs["cache_root_path"] == cache_root_path.resolve()
     assert workflow.call_args.kwargs["overwrite_cache"] is True
     assert workflow.call_args.kwargs["no_op"] is True
+    assert workflow.call_args.kwargs["concurrency"] == 3
     if guide_argument:
         assert workflow.call_args.kwargs["guide_language"].code == "eng"
 
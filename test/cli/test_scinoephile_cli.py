@@ -0,0 +1,120 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of scinoephile.cli.ScinoephileCli."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from pytest import mark
+
+from scinoephile.cli.scinoephile_cli import SUBCOMMANDS, ScinoephileCli
+from scinoephile.common.cli import LazySubParsersAction
+
+_HELP_IMPORT_MICROSECONDS = 1_000_000
+"""Greatest cumulative import time of the root CLI module when showing help."""
+
+_SUBCOMMAND_HELP_IMPORT_MICROSECONDS = 3_000_000
+"""Greatest total import time when showing the help of one subcommand."""
+
+
+def test_subcommand_metadata_matches_subcommands():
+    """Test lightweight subcommand metadata describes each subcommand class."""
+    for name, subcommand in ScinoephileCli.subcommands().items():
+        assert subcommand.name() == name
+        assert subcommand.help() == SUBCOMMANDS[name][2]
+
+
+@mark.parametrize("lazy", [True, False])
+def test_argparser_constructs_subcommand_parsers_as_requested(lazy: bool):
+    """Test subcommand parsers are deferred only for a lazy argument parser.
+
+    Arguments:
+        lazy: whether to construct subcommand parsers only when selected
+    """
+    parser = ScinoephileCli.argparser(lazy=lazy)
+
+    subparsers = next(
+        action
+        for action in parser._actions  # noqa: SLF001
+        if isinstance(action, LazySubParsersAction)
+    )
+    assert set(subparsers.loaders) == (set(SUBCOMMANDS) if lazy else set())
+    assert set(subparsers.choices) == set(SUBCOMMANDS)
+
+
+@mark.parametrize(
+    ("args", "expected_subcommand_module"),
+    [(["--help"], None), (["process", "--help"], "scinoephile.cli.process_cli")],
+)
+def test_cli_imports_only_selected_subcommand(
+    args: list[str], expected_subcommand_module: str | None
+):
+    """Test a cold start imports only the selected subcommand's module.
+
+    Arguments:
+        args: command-line arguments
+        expected_subcommand_module: module of the selected subcommand, if any
+    """
+    import_times, total_import_time, module_names = _run_cli(args)
+
+    subcommand_modules = {
+        subcommand_module
+        for subcommand_module, _, _ in SUBCOMMANDS.values()
+        if subcommand_module in module_names
+    }
+    if expected_subcommand_module is None:
+        assert subcommand_modules == set()
+        assert (
+            import_times["scinoephile.cli.scinoephile_cli"] < _HELP_IMPORT_MICROSECONDS
+        )
+    else:
+        assert subcommand_modules == {expected_subcommand_module}
+        assert total_import_time < _SUBCOMMAND_HELP_IMPORT_MICROSECONDS
+
+
+def _run_cli(args: list[str]) -> tuple[dict[str, int], int, set[str]]:
+    """Run the CLI in a new interpreter, recording the modules it imports.
+
+    Modules imported using importlib are not timed by -X importtime, so the
+    names of all imported modules are also reported on exit. The imports of such
+    modules are instead timed as separate top-level entries, which are summed.
+
+    Arguments:
+        args: command-line arguments
+    Returns:
+        cumulative import time in microseconds keyed by module name, total
+          import time in microseconds of all top-level imports, and names of all
+          modules imported
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import atexit, sys; "
+            "atexit.register(lambda: print(*sys.modules, sep='\\n', file=sys.stderr)); "
+            "from scinoephile.cli.scinoephile_cli import ScinoephileCli; "
+            "ScinoephileCli.main()",
+            *args,
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stderr
+    import_times: dict[str, int] = {}
+    total_import_time = 0
+    module_names: set[str] = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            module_names.add(line.strip())
+            continue
+        _, cumulative, module_name = line.split("|")
+        if cumulative.strip().isdigit():
+            import_times[module_name.strip()] = int(cumulative)
+            if not module_name.startswith("  "):
+                total_import_time += int(cumulative)
+    return import_times, total_import_time, module_names
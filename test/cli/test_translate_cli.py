@@ -76,7 +76,7 @@ def test_translate_cli_passes_block_range(
                 TranslateCli,
                 f"{input_path} {mode_arguments} --json {json_path} "
                 f"--first-block 2 --last-block 3 --cache-dir {cache_root_path} "
-                "--cache-overwrite --llm-no-op",
+                "--cache-overwrite --llm-no-op --concurrency 3",
             )
 
     assert workflow.call_args.kwargs["current_test_cases_path"] == json_path
@@ -85,6 +85,7 @@ def test_translate_cli_passes_block_range(
     assert workflow.call_args.kwargs["cache_root_path"] == cache_root_path.resolve()
     assert workflow.call_args.kwargs["overwrite_cache"] is True
     assert workflow.call_args.kwargs["no_op"] is True
+    assert workflow.call_args.kwargs["concurrency"] == 3
 
 
 def test_translate_cli_rejects_reversed_block_range():
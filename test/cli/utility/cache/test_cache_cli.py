@@ -7,6 +7,7 @@ from __future__ import annotations
 from scinoephile.cli.scinoephile_cli import ScinoephileCli
 from scinoephile.cli.utility.cache import CacheCli
 from scinoephile.cli.utility.cache.cache_clear_cli import CacheClearCli
+from scinoephile.cli.utility.cache.cache_convert_cli import CacheConvertCli
 from scinoephile.cli.utility.cache.cache_inspect_cli import CacheInspectCli
 from scinoephile.cli.utility.utility_cli import UtilityCli
 from test.helpers import assert_cli_help
@@ -14,5 +15,5 @@ from test.helpers import assert_cli_help
 
 def test_cache_subcommand_help():
     """Test cache subcommand help output."""
-    for cli_class in (CacheClearCli, CacheInspectCli):
+    for cli_class in (CacheClearCli, CacheConvertCli, CacheInspectCli):
         assert_cli_help((ScinoephileCli, UtilityCli, CacheCli, cli_class))
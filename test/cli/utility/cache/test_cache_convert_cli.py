@@ -0,0 +1,39 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of cache convert CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest import CaptureFixture
+
+from scinoephile.cli.utility.cache.cache_convert_cli import CacheConvertCli
+from scinoephile.common.testing import run_cli_with_args
+from scinoephile.core.cache import CacheSqliteStore
+from test.helpers.files import write_cache_file
+
+
+def test_cache_convert_round_trips_llm_responses(
+    tmp_path: Path, capsys: CaptureFixture[str]
+):
+    """Test LLM responses are converted to SQLite and back.
+
+    Arguments:
+        tmp_path: temporary directory
+        capsys: pytest capture fixture
+    """
+    llm_path = write_cache_file(tmp_path / "llms/test/one.json", "one")
+    whisper_path = write_cache_file(tmp_path / "audio/transcription/whisper/two.json")
+
+    run_cli_with_args(CacheConvertCli, f"--cache-dir {tmp_path} --backend sqlite")
+
+    assert "Converted 1 cached LLM responses" in capsys.readouterr().out
+    assert not llm_path.exists()
+    assert whisper_path.exists()
+    assert CacheSqliteStore(tmp_path).get_namespace_names() == ["llms/test"]
+
+    run_cli_with_args(CacheConvertCli, f"--cache-dir {tmp_path} --backend directory")
+
+    assert llm_path.read_text(encoding="utf-8") == "one"
+    assert not (tmp_path / CacheSqliteStore.file_name).exists()
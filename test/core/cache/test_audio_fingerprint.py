@@ -0,0 +1,83 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of memoized audio content hashes."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from os import urandom
+
+from pydub import AudioSegment
+from pytest import MonkeyPatch
+
+from scinoephile.core.cache.audio_fingerprint import get_audio_hash
+
+
+def _get_audio(raw_data: bytes) -> AudioSegment:
+    """Get 16 kHz mono audio with the provided raw data.
+
+    Arguments:
+        raw_data: raw 16-bit audio data
+    Returns:
+        audio segment
+    """
+    return AudioSegment(data=raw_data, sample_width=2, frame_rate=16000, channels=1)
+
+
+def _count_hashes(monkeypatch: MonkeyPatch) -> list[str]:
+    """Record algorithms used to hash raw data.
+
+    Arguments:
+        monkeypatch: pytest monkeypatch fixture
+    Returns:
+        algorithms of hashes computed, appended as they are computed
+    """
+    algorithms: list[str] = []
+    new: Callable = hashlib.new
+
+    def counting_new(algorithm: str, data: bytes = b""):
+        """Record and compute a hash."""
+        algorithms.append(algorithm)
+        return new(algorithm, data)
+
+    monkeypatch.setattr(hashlib, "new", counting_new)
+    return algorithms
+
+
+def test_get_audio_hash_matches_hashlib(monkeypatch: MonkeyPatch):
+    """Test memoized hashes match direct hashes and are computed once.
+
+    Arguments:
+        monkeypatch: pytest monkeypatch fixture
+    """
+    algorithms = _count_hashes(monkeypatch)
+    raw_data = urandom(32000)
+    audio = _get_audio(raw_data)
+    same_audio = _get_audio(bytes(bytearray(raw_data)))
+
+    audio_hash = get_audio_hash(audio)
+    audio_hash.update(b"\0")
+
+    assert audio_hash.hexdigest() == hashlib.sha256(raw_data + b"\0").hexdigest()
+    assert get_audio_hash(audio).hexdigest() == hashlib.sha256(raw_data).hexdigest()
+    assert get_audio_hash(same_audio).hexdigest() == (
+        hashlib.sha256(raw_data).hexdigest()
+    )
+    assert get_audio_hash(audio, "blake2b").hexdigest() == (
+        hashlib.blake2b(raw_data).hexdigest()
+    )
+    assert algorithms == ["sha256", "blake2b"]
+
+
+def test_get_audio_hash_distinguishes_unsampled_differences():
+    """Test audio matching the prefilter but differing in content is rehashed."""
+    raw_data = bytearray(urandom(32000))
+    audio = _get_audio(bytes(raw_data))
+    raw_data[1001] ^= 0xFF
+    other_audio = _get_audio(bytes(raw_data))
+
+    assert get_audio_hash(other_audio).hexdigest() == (
+        hashlib.sha256(raw_data).hexdigest()
+    )
+    assert get_audio_hash(audio).hexdigest() != get_audio_hash(other_audio).hexdigest()
@@ -0,0 +1,109 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of single-file SQLite cache storage."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import time, time_ns
+
+from scinoephile.core.cache import CacheBackend, CacheSqliteStore
+from scinoephile.core.cache.sqlite_store import get_cache_backend
+from test.helpers.files import set_mtime, write_cache_file
+
+
+def test_cache_sqlite_store_round_trips_entries(tmp_path: Path):
+    """Test entries are saved, loaded, replaced, and removed.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    store = CacheSqliteStore(tmp_path)
+    assert store.load("llms/test", "one.json") is None
+
+    store.save("llms/test", "one.json", b"one")
+    store.save("llms/test", "one.json", b"uno")
+    store.save("llms/other", "one.json", b"other")
+
+    assert store.load("llms/test", "one.json") == b"uno"
+    assert store.load_all("llms/test") == {"one.json": b"uno"}
+    assert store.get_namespace_names() == ["llms/other", "llms/test"]
+    assert store.remove("llms/test", "one.json")
+    assert not store.remove("llms/test", "one.json")
+    assert store.get_namespace_names() == ["llms/other"]
+
+
+def test_cache_sqlite_store_uses_write_ahead_logging(tmp_path: Path):
+    """Test the SQLite file is opened in write-ahead logging mode.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    store = CacheSqliteStore(tmp_path)
+    store.create()
+
+    with store._get_engine().connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+    assert journal_mode == "wal"
+    assert get_cache_backend(tmp_path) == CacheBackend.SQLITE
+    store.remove_file()
+    assert get_cache_backend(tmp_path) == CacheBackend.DIRECTORY
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_sqlite_store_aggregates_stats(tmp_path: Path):
+    """Test per-namespace statistics and age filters.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    store = CacheSqliteStore(tmp_path)
+    store.save("llms/test", "one.json", b"one")
+    store.save("llms/test", "three.json", b"three")
+    store.save("llms/other", "two.json", b"two")
+    with store._get_engine().begin() as connection:
+        connection.exec_driver_sql(
+            "UPDATE entries SET modified_at_ns = ? WHERE name = 'one.json'",
+            (time_ns() - 60 * 60 * 24 * 40 * 1_000_000_000,),
+        )
+
+    stats = store.get_stats()
+    old_stats = store.get_stats(
+        ["llms/test"], modified_before=datetime.now() - timedelta(days=30)
+    )
+
+    assert stats["llms/test"].entry_count == 2
+    assert stats["llms/test"].total_bytes == 8
+    assert stats["llms/other"].entry_count == 1
+    assert list(old_stats) == ["llms/test"]
+    assert old_stats["llms/test"].entry_count == 1
+    assert old_stats["llms/test"].total_bytes == 3
+    assert [entry.relative_path for entry in store.get_entries(["llms/test"])] == [
+        Path("llms/test/one.json"),
+        Path("llms/test/three.json"),
+    ]
+    assert store.delete_entries(modified_before=datetime.now() - timedelta(days=30))
+    assert store.get_stats()["llms/test"].entry_count == 1
+
+
+def test_cache_sqlite_store_import_export_is_lossless(tmp_path: Path):
+    """Test directory entries survive a round trip through the SQLite file.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    source_dir_path = tmp_path / "source"
+    one_path = write_cache_file(source_dir_path / "one.json", '{"text":"一"}')
+    two_path = write_cache_file(source_dir_path / "two.json", "two")
+    set_mtime(one_path, time() - 60 * 60 * 24 * 40)
+    store = CacheSqliteStore(tmp_path / "cache")
+
+    assert store.import_dir("llms/test", source_dir_path) == 2
+    assert store.export_dir("llms/test", tmp_path / "exported") == 2
+
+    for source_path in (one_path, two_path):
+        exported_path = tmp_path / "exported" / source_path.name
+        assert exported_path.read_bytes() == source_path.read_bytes()
+        assert exported_path.stat().st_mtime_ns == source_path.stat().st_mtime_ns
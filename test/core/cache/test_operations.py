@@ -18,6 +18,7 @@ from scinoephile.core.cache.operations import (
     get_cache_entries,
     get_cache_stats,
 )
+from scinoephile.core.cache.sqlite_store import CacheSqliteStore
 from test.helpers.files import set_mtime, write_cache_file
 
 
@@ -373,3 +374,72 @@ def test_clear_cache_namespace(tmp_path: Path):
     ]
     assert not (tmp_path / "llms").exists()
     assert whisper_path.exists()
+
+
+def test_cache_operations_include_sqlite_entries(tmp_path: Path):
+    """Test statistics, entries, and clearing include SQLite-stored entries.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    write_cache_file(tmp_path / "llms/test/one.json", "one")
+    whisper_path = write_cache_file(tmp_path / "audio/transcription/whisper/two.json")
+    store = CacheSqliteStore(tmp_path)
+    store.save("llms/test", "three.json", b"three")
+    store.save("llms/other", "four.json", b"four")
+    store.save("unregistered", "five.json", b"five")
+
+    stats = {
+        namespace_stats.namespace: namespace_stats
+        for namespace_stats in get_cache_stats(tmp_path, _CACHE_REGISTRY)
+    }
+    entries = get_cache_entries(tmp_path, _CACHE_REGISTRY, namespace="llms/other")
+    deleted_entries = clear_cache(tmp_path, _CACHE_REGISTRY, namespace="llms/other")
+
+    assert list(stats) == [
+        "audio/transcription/whisper",
+        "llms/other",
+        "llms/test",
+        "total",
+    ]
+    assert stats["llms/test"].entry_count == 2
+    assert stats["llms/test"].total_bytes == 8
+    assert stats["total"].entry_count == 4
+    assert [entry.relative_path for entry in entries] == [Path("llms/other/four.json")]
+    assert deleted_entries == entries
+    assert store.get_namespace_names() == ["llms/test", "unregistered"]
+    assert whisper_path.exists()
+
+
+def test_clear_cache_by_age_includes_sqlite_entries(tmp_path: Path):
+    """Test age-filtered clearing deletes only old SQLite-stored entries.
+
+    Arguments:
+        tmp_path: temporary directory
+    """
+    source_dir_path = tmp_path / "source"
+    old_path = write_cache_file(source_dir_path / "old.json")
+    write_cache_file(source_dir_path / "new.json")
+    set_mtime(old_path, time() - 60 * 60 * 24 * 40)
+    store = CacheSqliteStore(tmp_path / "cache")
+    store.import_dir("llms/test", source_dir_path)
+
+    dry_run_entries = clear_cache(
+        tmp_path / "cache",
+        _CACHE_REGISTRY,
+        namespace="llms/test",
+        older_than=timedelta(days=30),
+        dry_run=True,
+    )
+    deleted_entries = clear_cache(
+        tmp_path / "cache",
+        _CACHE_REGISTRY,
+        namespace="llms/test",
+        older_than=timedelta(days=30),
+    )
+
+    assert dry_run_entries == deleted_entries
+    assert [entry.relative_path for entry in deleted_entries] == [
+        Path("llms/test/old.json")
+    ]
+    assert list(store.load_all("llms/test")) == ["new.json"]
@@ -106,11 +106,49 @@ def test_sqlite_store_preserves_expected_schema(
         "definitions_fts",
         "entries",
         "entries_fts",
+        "entries_trigram",
         "nonchinese_sentences",
         "sentence_links",
         "sources",
     }.issubset(table_names)
-    assert user_version == 3
+    assert user_version == 4
+
+
+def test_sqlite_store_romanization_lookups_match_syllables_and_substrings(
+    database_path: Path,
+    sample_entries: list[DictionaryEntry],
+    sample_source: DictionarySource,
+):
+    """Test romanization lookups by syllable prefix, without tones, and substring."""
+    store = DictionarySqliteStore(database_path=database_path)
+    store.persist((sample_source, sample_entries))
+
+    assert store.lookup_by_pinyin("shan keng", limit=5) == sample_entries
+    assert store.lookup_by_pinyin("keng1 shu", limit=5) == [sample_entries[1]]
+    assert store.lookup_by_jyutping("haang1 seoi2", limit=5) == [sample_entries[1]]
+    assert store.lookup_by_jyutping("aan1 haa", limit=5) == sample_entries
+    assert store.lookup_by_pinyin("shan1 keng1 shui3", limit=5) == [sample_entries[1]]
+    assert store.lookup_by_pinyin("shan1", limit=1) == [sample_entries[0]]
+
+
+def test_sqlite_store_romanization_lookups_scan_older_schemas(
+    database_path: Path,
+    sample_entries: list[DictionaryEntry],
+    sample_source: DictionarySource,
+):
+    """Test romanization lookups of databases without full-text indices."""
+    store = DictionarySqliteStore(database_path=database_path)
+    store.persist((sample_source, sample_entries))
+    with closing(sqlite3.connect(database_path)) as connection:
+        connection.execute("DROP TABLE entries_fts")
+        connection.execute("DROP TABLE entries_trigram")
+        connection.execute("PRAGMA user_version=3")
+        connection.commit()
+    store = DictionarySqliteStore(database_path=database_path, read_only=True)
+
+    assert store.lookup_by_pinyin("keng1 shui3", limit=5) == [sample_entries[1]]
+    assert store.lookup_by_jyutping("saan1 haang1", limit=5) == sample_entries
+    store.close()
 
 
 def test_sqlite_store_literal_like_lookups(
@@ -151,6 +189,29 @@ def test_sqlite_store_literal_like_lookups(
     assert store.lookup_by_jyutping("\\", limit=5) == [entries[2]]
 
 
+def test_sqlite_store_persists_streamed_entries_in_batches(
+    database_path: Path,
+    sample_entries: list[DictionaryEntry],
+    sample_source: DictionarySource,
+):
+    """Test entries may be streamed from an iterator across insertion batches."""
+    entries = [*sample_entries, sample_entries[0]]
+    store = DictionarySqliteStore(database_path=database_path)
+
+    with patch("scinoephile.core.dictionaries.sqlite_store._INSERT_BATCH_SIZE", 1):
+        store.persist((sample_source, iter(entries)))
+
+    with closing(sqlite3.connect(database_path)) as connection:
+        entry_ids = connection.execute(
+            "SELECT entry_id FROM entries ORDER BY entry_id"
+        ).fetchall()
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert entry_ids == [(1,), (2,)]
+    assert journal_mode == "delete"
+    assert store.lookup_by_traditional("山坑", limit=5) == [sample_entries[0]]
+    assert store.lookup_by_traditional("山坑水", limit=5) == [sample_entries[1]]
+
+
 def test_sqlite_store_preserves_existing_database_when_rebuild_fails(
     database_path: Path,
     sample_entries: list[DictionaryEntry],
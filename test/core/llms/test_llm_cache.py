@@ -9,8 +9,9 @@ from time import time
 
 from pytest import MonkeyPatch, raises
 
+from scinoephile.core.cache import CacheBackend, CacheSqliteStore
 from scinoephile.core.cache.identity import CacheIdentity
-from scinoephile.core.llms.cache import LlmCache
+from scinoephile.core.llms.cache import LlmCache, convert_llm_cache
 from test.helpers import parametrize
 from test.helpers.files import set_mtime
 
@@ -144,3 +145,63 @@ def test_llm_cache_discards_wrong_filesystem_type(tmp_path: Path, artifact_type:
     assert not cache_path.is_symlink()
     if artifact_type == "symlink":
         assert target_path.read_text(encoding="utf-8") == "target"
+
+
+def test_llm_cache_sqlite_backend_round_trips_responses(tmp_path: Path):
+    """Test the SQLite backend saves, loads, and removes responses."""
+    cache = LlmCache(tmp_path, "translation", backend=CacheBackend.SQLITE)
+    cache_path = cache.get_path(*_CACHE_INPUTS)
+
+    assert cache.load(*_CACHE_INPUTS) is None
+    assert cache.save(*_CACHE_INPUTS, "response") == cache_path
+
+    assert not cache.cache_dir_path.exists()
+    assert LlmCache(tmp_path, "translation").backend == CacheBackend.SQLITE
+    assert LlmCache(tmp_path, "translation").load(*_CACHE_INPUTS) == "response"
+    assert cache.remove(*_CACHE_INPUTS) == cache_path
+    assert cache.remove(*_CACHE_INPUTS) is None
+    assert cache.load(*_CACHE_INPUTS) is None
+
+
+def test_llm_cache_sqlite_backend_overwrites_matching_entry_once(tmp_path: Path):
+    """Test overwrite refreshes a SQLite-stored response once per instance."""
+    LlmCache(tmp_path, "translation", backend=CacheBackend.SQLITE).save(
+        *_CACHE_INPUTS, "stale"
+    )
+    overwrite_cache = LlmCache(tmp_path, "translation", True)
+
+    assert overwrite_cache.load(*_CACHE_INPUTS) is None
+    overwrite_cache.save(*_CACHE_INPUTS, "fresh")
+
+    assert overwrite_cache.load(*_CACHE_INPUTS) == "fresh"
+
+
+def test_llm_cache_sqlite_backend_prefetches_operation(tmp_path: Path):
+    """Test prefetched responses are loaded without querying each response."""
+    cache = LlmCache(tmp_path, "translation", backend=CacheBackend.SQLITE)
+    cache.save(*_CACHE_INPUTS, "response")
+    prefetching_cache = LlmCache(tmp_path, "translation")
+    prefetching_cache.prefetch()
+    CacheSqliteStore(tmp_path).delete_entries()
+
+    assert prefetching_cache.load(*_CACHE_INPUTS) == "response"
+    assert cache.load(*_CACHE_INPUTS) is None
+
+
+def test_convert_llm_cache_round_trips_directory_layout(tmp_path: Path):
+    """Test converting to SQLite and back reproduces the directory layout."""
+    cache_path = LlmCache(tmp_path, "translation").save(*_CACHE_INPUTS, "response")
+    set_mtime(cache_path, time() - 60 * 60 * 24 * 40)
+    mtime_ns = cache_path.stat().st_mtime_ns
+
+    assert convert_llm_cache(tmp_path, CacheBackend.SQLITE) == 1
+    assert not cache_path.exists()
+    assert [
+        entry.relative_path for entry in CacheSqliteStore(tmp_path).get_entries()
+    ] == [Path("llms/translation", cache_path.name)]
+
+    assert convert_llm_cache(tmp_path, CacheBackend.DIRECTORY) == 1
+    assert cache_path.read_text(encoding="utf-8") == "response"
+    assert cache_path.stat().st_mtime_ns == mtime_ns
+    assert not (tmp_path / CacheSqliteStore.file_name).exists()
+    assert LlmCache(tmp_path, "translation").load(*_CACHE_INPUTS) == "response"
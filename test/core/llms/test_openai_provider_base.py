@@ -8,7 +8,7 @@ import json
 from collections.abc import Callable
 from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 from openai import OpenAI
 from pydantic import ValidationError
@@ -423,10 +423,36 @@ def test_sync_client_is_created_lazily_with_configured_timeout():
         openai.assert_not_called()
         assert provider.sync_client is openai.return_value
         openai.assert_called_once_with(
-            api_key="test-api-key", base_url="https://example.invalid/v1", timeout=45.0
+            api_key="test-api-key",
+            base_url="https://example.invalid/v1",
+            timeout=45.0,
+            max_retries=0,
+            http_client=ANY,
         )
 
 
+def test_sync_clients_share_http_connection_pool():
+    """Test lazily created OpenAI clients share one HTTP connection pool."""
+    with patch("scinoephile.core.llms.openai_provider_base.OpenAI") as openai:
+        _ = _DummyProvider(api_key="one").sync_client
+        _ = _DummyProvider(
+            api_key="two", base_url="https://example.invalid"
+        ).sync_client
+
+    [first_call, second_call] = openai.call_args_list
+    assert first_call.kwargs["http_client"] is second_call.kwargs["http_client"]
+
+
+def test_providers_of_one_endpoint_share_rate_limiter():
+    """Test providers of one endpoint and model share a rate limiter."""
+    first = _DummyProvider(api_key="one", base_url="https://example.invalid/v1")
+    second = _DummyProvider(api_key="two", base_url="https://example.invalid/v1")
+    other = _DummyProvider(api_key="one", base_url="https://other.invalid/v1")
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other.rate_limiter
+
+
 def test_cache_identity_contains_nonsecret_effective_configuration():
     """Test cache identity captures behavior without exposing credentials."""
     provider = _DummyProvider(
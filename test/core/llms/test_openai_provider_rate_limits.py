@@ -0,0 +1,306 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of OpenAIProviderBase against a local OpenAI-compatible stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+
+from pytest import fixture, raises
+
+from scinoephile.core import ScinoephileError
+from scinoephile.core.llms import Answer, OpenAIProviderBase, RateLimiter
+
+
+class _Answer(Answer):
+    """Structured answer fixture."""
+
+    output: str
+    """Answer output."""
+
+
+class _StubProvider(OpenAIProviderBase):
+    """Provider querying the local stub server."""
+
+    model = "stub-model"
+    """Stub model name."""
+
+
+class _StubServer(ThreadingHTTPServer):
+    """OpenAI-compatible chat completion server injecting 429s and latency."""
+
+    daemon_threads = True
+    """Whether request threads are daemons."""
+
+    def __init__(self):
+        """Initialize."""
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = Lock()
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.rate_limits_remaining = 0
+        self.retry_after = "2"
+        self.latency_seconds = 0.0
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the OpenAI-compatible API."""
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Handle one stub chat completion request."""
+
+    server: _StubServer
+
+    def do_POST(self):  # noqa: N802
+        """Respond to a chat completion request."""
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.request_count += 1
+            rate_limited = self.server.rate_limits_remaining > 0
+            if rate_limited:
+                self.server.rate_limits_remaining -= 1
+                self.server.rate_limited_count += 1
+        sleep(self.server.latency_seconds)
+        if rate_limited:
+            self._send_json(
+                429,
+                {
+                    "error": {
+                        "message": "Rate limit reached",
+                        "type": "requests",
+                        "code": "rate_limit_exceeded",
+                    }
+                },
+                {"Retry-After": self.server.retry_after},
+            )
+            return
+        content = json.dumps({"output": body["messages"][-1]["content"]})
+        self._send_json(
+            200,
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 40,
+                    "completion_tokens": 10,
+                    "total_tokens": 50,
+                },
+            },
+        )
+
+    def log_message(self, format: str, *args: object):  # noqa: A002
+        """Suppress request logging."""
+
+    def _send_json(
+        self, status: int, payload: object, headers: dict[str, str] | None = None
+    ):
+        """Send a JSON response.
+
+        Arguments:
+            status: HTTP status code
+            payload: JSON payload
+            headers: additional response headers
+        """
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _Clock:
+    """Fake monotonic clock advanced by sleeping."""
+
+    def __init__(self):
+        """Initialize."""
+        self.lock = Lock()
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds: float):
+        """Advance the clock.
+
+        Arguments:
+            seconds: seconds to advance
+        """
+        with self.lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+@fixture
+def stub_server() -> Generator[_StubServer]:
+    """Serve a local OpenAI-compatible stub API.
+
+    Yields:
+        running stub server
+    """
+    server = _StubServer()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _get_provider(
+    server: _StubServer, rate_limiter: RateLimiter, max_retries: int = 5
+) -> _StubProvider:
+    """Get a provider querying the stub server.
+
+    Arguments:
+        server: stub server
+        rate_limiter: rate limiter for the provider
+        max_retries: maximum retries of each request
+    Returns:
+        provider
+    """
+    return _StubProvider(
+        api_key="test-api-key",
+        base_url=server.base_url,
+        timeout_seconds=10.0,
+        max_retries=max_retries,
+        rate_limiter=rate_limiter,
+    )
+
+
+def test_provider_retries_rate_limits_after_retry_after(stub_server: _StubServer):
+    """Test 429 responses are retried after the server-requested delay.
+
+    Arguments:
+        stub_server: local stub server
+    """
+    stub_server.rate_limits_remaining = 2
+    clock = _Clock()
+    provider = _get_provider(
+        stub_server, RateLimiter(clock=clock, sleep_fn=clock.sleep)
+    )
+
+    result = provider.chat_completion(
+        [{"role": "user", "content": "hello"}], _Answer, operation="test"
+    )
+
+    assert json.loads(result) == {"output": "hello"}
+    assert stub_server.request_count == 3
+    [metrics] = provider.completion_metrics
+    assert metrics.transport_retries == 2
+    assert metrics.total_tokens == 50
+    assert len(clock.sleeps) == 2
+    assert all(2.0 <= seconds <= 3.0 for seconds in clock.sleeps)
+
+
+def test_provider_raises_after_max_retries(stub_server: _StubServer):
+    """Test persistent 429 responses are raised once retries are exhausted.
+
+    Arguments:
+        stub_server: local stub server
+    """
+    stub_server.rate_limits_remaining = 10
+    clock = _Clock()
+    provider = _get_provider(
+        stub_server, RateLimiter(clock=clock, sleep_fn=clock.sleep), max_retries=2
+    )
+
+    with raises(ScinoephileError, match="rate_limit_exceeded"):
+        provider.chat_completion([{"role": "user", "content": "hello"}], _Answer)
+
+    assert stub_server.request_count == 3
+
+
+def test_concurrent_providers_share_rate_limits(stub_server: _StubServer):
+    """Test concurrent requests through one limiter respect its request budget.
+
+    Arguments:
+        stub_server: local stub server
+    """
+    stub_server.latency_seconds = 0.02
+    stub_server.rate_limits_remaining = 1
+    stub_server.retry_after = "0"
+    clock = _Clock()
+    rate_limiter = RateLimiter(requests_per_minute=4, clock=clock, sleep_fn=clock.sleep)
+    providers = [_get_provider(stub_server, rate_limiter) for _ in range(2)]
+
+    def query(idx: int) -> str:
+        """Query one provider.
+
+        Arguments:
+            idx: query index
+        Returns:
+            completion text
+        """
+        return providers[idx % 2].chat_completion(
+            [{"role": "user", "content": f"query {idx}"}], _Answer
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(query, range(8)))
+
+    assert [json.loads(result)["output"] for result in results] == [
+        f"query {idx}" for idx in range(8)
+    ]
+    assert stub_server.rate_limited_count == 1
+    assert stub_server.request_count == 9
+    # The first four requests are a burst; the remaining five refill at 15 s each
+    assert clock.now >= 5 * 15.0
+
+
+def test_async_completion_uses_shared_scheduler(stub_server: _StubServer):
+    """Test async completions run through the provider's rate-limited path.
+
+    Arguments:
+        stub_server: local stub server
+    """
+    stub_server.rate_limits_remaining = 1
+    clock = _Clock()
+    provider = _get_provider(
+        stub_server, RateLimiter(clock=clock, sleep_fn=clock.sleep)
+    )
+
+    async def query_all() -> list[str]:
+        """Query the provider concurrently."""
+        return await asyncio.gather(
+            *(
+                provider.chat_completion_async(
+                    [{"role": "user", "content": f"query {idx}"}], _Answer
+                )
+                for idx in range(3)
+            )
+        )
+
+    results = asyncio.run(query_all())
+
+    assert sorted(json.loads(result)["output"] for result in results) == [
+        "query 0",
+        "query 1",
+        "query 2",
+    ]
+    assert stub_server.request_count == 4
+    assert clock.sleeps
@@ -220,6 +220,45 @@ class _AlternateRecordingProvider(_RecordingProvider):
     """Alternate provider implementation for cache identity tests."""
 
 
+class _EchoProvider(_RecordingProvider):
+    """Recording provider echoing query text as the answer."""
+
+    def __init__(self, fail_texts: set[str] | None = None):
+        """Initialize.
+
+        Arguments:
+            fail_texts: query texts for which completions fail
+        """
+        super().__init__()
+        self.fail_texts = fail_texts or set()
+
+    def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_format: type[Answer],
+        tool_box: ToolBox | None = None,
+        *,
+        operation: str | None = None,
+        query_key_sha256: str | None = None,
+        query_attempt: int = 1,
+        **kwargs: Unpack[ChatCompletionKwargs],
+    ) -> str:
+        """Record messages and return the query text as the answer."""
+        text = json.loads(messages[-1]["content"])["text"]
+        if text in self.fail_texts:
+            raise ScinoephileError(f"Completion failed for {text}")
+        self.response = json.dumps({"output": text})
+        return super().chat_completion(
+            messages,
+            response_format,
+            tool_box,
+            operation=operation,
+            query_key_sha256=query_key_sha256,
+            query_attempt=query_attempt,
+            **kwargs,
+        )
+
+
 class _SequenceRecordingProvider(_RecordingProvider):
     """Recording provider returning a sequence of responses."""
 
@@ -416,6 +455,48 @@ def test_queryers_sharing_provider_retain_only_their_metrics(tmp_path: Path):
     )
 
 
+def test_queryer_query_all_preserves_order(tmp_path: Path):
+    """Test concurrent queries are returned and logged in the order provided.
+
+    Arguments:
+        tmp_path: temporary directory path
+    """
+    provider = _EchoProvider()
+    queryer = Queryer(
+        _TestCase,
+        provider=provider,
+        cache_root_path=tmp_path,
+        concurrency=4,
+        max_attempts=1,
+    )
+    texts = [f"input {idx}" for idx in range(12)] + ["input 3", "input 5"]
+
+    results = queryer.query_all([_TestCase(query=_Query(text=t)) for t in texts])
+
+    assert [result.query.text for result in results] == texts
+    assert [result.answer.output for result in results if result.answer] == texts
+    assert len(provider.calls) == 12
+    assert [key[-1] for key in queryer.encountered_test_cases] == texts[:12]
+
+
+def test_queryer_query_all_raises_first_error_in_order():
+    """Test concurrent query errors are raised in the order provided."""
+    provider = _EchoProvider(fail_texts={"input 2", "input 4"})
+    queryer = Queryer(_TestCase, provider=provider, concurrency=3, max_attempts=1)
+    texts = [f"input {idx}" for idx in range(6)]
+
+    with raises(ScinoephileError, match="input 2"):
+        queryer.query_all([_TestCase(query=_Query(text=t)) for t in texts])
+
+    assert [key[-1] for key in queryer.encountered_test_cases] == texts[:2]
+
+
+def test_queryer_rejects_invalid_concurrency():
+    """Test queryer concurrency must be positive."""
+    with raises(ValueError, match="concurrency"):
+        Queryer(_TestCase, provider=_RecordingProvider(), concurrency=0)
+
+
 def test_queryer_requires_injected_provider():
     """Test queryer no longer constructs concrete providers by default."""
     queryer_type: Any = Queryer
@@ -0,0 +1,187 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests for LLM request rate limiting and retry scheduling."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+from pytest import approx, mark, raises
+
+from scinoephile.core.llms import RateLimiter
+from scinoephile.core.llms.rate_limiter import (
+    get_backoff_seconds,
+    get_retry_after_seconds,
+    get_shared_rate_limiter,
+)
+
+
+class _Clock:
+    """Fake monotonic clock advanced by sleeping."""
+
+    def __init__(self):
+        """Initialize."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def sleep(self, seconds: float):
+        """Advance the clock.
+
+        Arguments:
+            seconds: seconds to advance
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _get_rate_limiter(
+    requests_per_minute: float | None = None, tokens_per_minute: float | None = None
+) -> tuple[RateLimiter, _Clock]:
+    """Get a rate limiter driven by a fake clock.
+
+    Arguments:
+        requests_per_minute: maximum requests per minute
+        tokens_per_minute: maximum tokens per minute
+    Returns:
+        rate limiter and its clock
+    """
+    clock = _Clock()
+    rate_limiter = RateLimiter(
+        requests_per_minute, tokens_per_minute, clock=clock, sleep_fn=clock.sleep
+    )
+    return rate_limiter, clock
+
+
+def test_rate_limiter_without_limits_does_not_wait():
+    """Test unlimited rate limiters admit requests immediately."""
+    rate_limiter, clock = _get_rate_limiter()
+
+    for _ in range(100):
+        assert rate_limiter.acquire(10_000) == 0.0
+
+    assert clock.sleeps == []
+
+
+def test_rate_limiter_limits_requests_per_minute():
+    """Test requests beyond the per-minute burst wait for the bucket to refill."""
+    rate_limiter, clock = _get_rate_limiter(requests_per_minute=60)
+
+    for _ in range(60):
+        rate_limiter.acquire()
+    assert clock.now == 0.0
+
+    rate_limiter.acquire()
+    assert clock.now == approx(1.0)
+    rate_limiter.acquire()
+    assert clock.now == approx(2.0)
+
+
+def test_rate_limiter_limits_tokens_per_minute():
+    """Test requests wait for enough tokens and settle to actual usage."""
+    rate_limiter, clock = _get_rate_limiter(tokens_per_minute=600)
+
+    rate_limiter.acquire(500)
+    rate_limiter.settle(500, 400)
+    assert clock.now == 0.0
+
+    # 200 tokens remain; 300 more are refilled at 10 per second
+    rate_limiter.acquire(500)
+    assert clock.now == approx(30.0)
+
+
+def test_rate_limiter_admits_oversized_requests_after_full_bucket():
+    """Test requests larger than the per-minute token limit do not wait forever."""
+    rate_limiter, clock = _get_rate_limiter(tokens_per_minute=100)
+
+    rate_limiter.acquire(100)
+    rate_limiter.acquire(1_000)
+
+    assert clock.now == approx(60.0)
+
+
+def test_rate_limiter_pause_holds_all_requests():
+    """Test server-requested pauses delay subsequent requests."""
+    rate_limiter, clock = _get_rate_limiter()
+
+    rate_limiter.pause(2.5)
+    rate_limiter.pause(1.0)
+
+    assert rate_limiter.acquire() == approx(2.5)
+    assert rate_limiter.acquire() == 0.0
+
+
+@mark.parametrize("limit_name", ["requests_per_minute", "tokens_per_minute"])
+def test_rate_limiter_rejects_nonpositive_limits(limit_name: str):
+    """Test rate limits must be positive.
+
+    Arguments:
+        limit_name: name of limit to set
+    """
+    with raises(ValueError, match=limit_name):
+        RateLimiter(**{limit_name: 0})
+
+
+def test_get_backoff_seconds_uses_jittered_exponential_backoff():
+    """Test retry delays grow exponentially within jitter bounds."""
+    for retry in range(8):
+        delay = get_backoff_seconds(retry, base_seconds=0.5, max_seconds=10.0)
+        assert 0.0 <= delay <= min(10.0, 0.5 * 2**retry)
+
+
+def test_get_backoff_seconds_honors_retry_after():
+    """Test retry delays wait at least as long as the server requested."""
+    for _ in range(20):
+        delay = get_backoff_seconds(3, 5.0, base_seconds=0.5)
+        assert 5.0 <= delay <= 5.5
+
+
+@mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "7"}, 7.0),
+        ({"retry-after": "1.5"}, 1.5),
+        ({"retry-after-ms": "250", "retry-after": "7"}, 0.25),
+        ({"retry-after-ms": "invalid", "retry-after": "7"}, 7.0),
+        ({"retry-after": "invalid"}, None),
+        ({"retry-after": "-3"}, 0.0),
+    ],
+)
+def test_get_retry_after_seconds(headers: dict[str, str], expected: float | None):
+    """Test retry headers are parsed into delays.
+
+    Arguments:
+        headers: HTTP response headers
+        expected: expected delay in seconds
+    """
+    assert get_retry_after_seconds(headers) == expected
+
+
+def test_get_retry_after_seconds_parses_http_dates():
+    """Test HTTP-date retry headers are converted to delays from now."""
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+    delay = get_retry_after_seconds({"Retry-After": format_datetime(retry_at, True)})
+
+    assert delay is not None
+    assert 28.0 <= delay <= 30.0
+
+
+def test_shared_rate_limiters_are_keyed_by_endpoint_and_limits():
+    """Test providers of one endpoint and limits share a rate limiter."""
+    rate_limiter = get_shared_rate_limiter("https://example.invalid/v1 model", 10, 20)
+
+    assert get_shared_rate_limiter("https://example.invalid/v1 model", 10, 20) is (
+        rate_limiter
+    )
+    assert get_shared_rate_limiter("https://example.invalid/v1 other", 10, 20) is not (
+        rate_limiter
+    )
+    assert get_shared_rate_limiter("https://example.invalid/v1 model", 5, 20) is not (
+        rate_limiter
+    )
@@ -4,11 +4,61 @@
 
 from __future__ import annotations
 
-from pytest import raises
+from random import Random
+
+from pytest import FixtureRequest, raises
 
 from scinoephile.core import ScinoephileError
+from scinoephile.core.pairs import get_block_pairs_by_pause
 from scinoephile.core.subtitles import Series, Subtitle
-from scinoephile.core.synchronization import get_sync_groups
+from scinoephile.core.synchronization import SyncGroup, SyncGroupEngine, get_sync_groups
+from test.helpers import parametrize
+
+
+def _get_sync_groups_or_error(
+    one: Series, two: Series, cutoff: float, engine: SyncGroupEngine
+) -> list[SyncGroup] | str:
+    """Get sync groups, or the error message if they cannot be computed.
+
+    Arguments:
+        one: first series
+        two: second series
+        cutoff: initial overlap cutoff
+        engine: engine used to derive sync groups
+    Returns:
+        sync groups or error message
+    """
+    try:
+        return get_sync_groups(one, two, cutoff=cutoff, engine=engine)
+    except ScinoephileError as exc:
+        return str(exc)
+
+
+def _get_jittered_series(series: Series, seed: int, jitter: int) -> Series:
+    """Get a copy of a series with dropped, split, and jittered subtitles.
+
+    Arguments:
+        series: series to copy
+        seed: random seed
+        jitter: maximum timing jitter in milliseconds
+    Returns:
+        jittered series
+    """
+    random = Random(seed)
+    jittered = Series()
+    for event in series.events:
+        roll = random.random()
+        if roll < 0.05:
+            continue
+        start = event.start + random.randint(-jitter, jitter)
+        end = max(event.end + random.randint(-jitter, jitter), start + 10)
+        if roll < 0.1:
+            middle = (start + end) // 2
+            jittered.events.append(Subtitle(start=start, end=middle, text="1"))
+            jittered.events.append(Subtitle(start=middle, end=end, text="2"))
+            continue
+        jittered.events.append(Subtitle(start=start, end=end, text="1"))
+    return jittered
 
 
 def test_get_sync_groups_preserves_subtitles_when_other_series_is_empty():
@@ -94,3 +144,59 @@ def test_get_sync_groups_sorts_unpaired_groups_by_timing():
     sync_groups = get_sync_groups(one, two)
 
     assert sync_groups == [([0], [0]), ([], [1]), ([1], []), ([2], [2])]
+
+
+@parametrize("cutoff", [0.0, 0.05, 0.16, 0.5])
+def test_get_sync_groups_engines_match_on_synthetic_series(cutoff: float):
+    """Test sparse and dense engines yield identical results on synthetic series.
+
+    Arguments:
+        cutoff: initial overlap cutoff
+    """
+    for seed in range(20):
+        random = Random(seed)
+        one = Series()
+        time = 0
+        for _ in range(random.randint(1, 40)):
+            time += random.randint(200, 3000)
+            duration = random.randint(300, 4000)
+            one.events.append(Subtitle(start=time, end=time + duration, text="A"))
+            time += duration
+        two = _get_jittered_series(one, seed, random.choice([50, 300, 1500, 5000]))
+
+        dense = _get_sync_groups_or_error(one, two, cutoff, SyncGroupEngine.DENSE)
+        sparse = _get_sync_groups_or_error(one, two, cutoff, SyncGroupEngine.SPARSE)
+
+        assert sparse == dense
+
+
+@parametrize(
+    ("one", "two"),
+    [
+        ("kob_eng", "kob_yue_hant"),
+        ("mnt_jpn_eng", "mnt_zho_hant"),
+        ("t_eng", "t_zho_hans"),
+    ],
+)
+def test_get_sync_groups_engines_match_on_title_blocks(
+    request: FixtureRequest, one: str, two: str
+):
+    """Test sparse and dense engines yield identical results on title blocks.
+
+    Arguments:
+        request: pytest request for fixture lookup
+        one: fixture name of first series
+        two: fixture name of second series
+    """
+    block_pairs = get_block_pairs_by_pause(
+        request.getfixturevalue(one), request.getfixturevalue(two)
+    )
+    for one_block, two_block in block_pairs:
+        dense = _get_sync_groups_or_error(
+            one_block, two_block, 0.16, SyncGroupEngine.DENSE
+        )
+        sparse = _get_sync_groups_or_error(
+            one_block, two_block, 0.16, SyncGroupEngine.SPARSE
+        )
+
+        assert sparse == dense
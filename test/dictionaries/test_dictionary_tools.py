@@ -29,6 +29,7 @@ from scinoephile.dictionaries.dictionary_tools import (
     get_dictionary_tools,
     lookup_dictionary,
 )
+from scinoephile.dictionaries.lookup import DictionaryLookupService
 
 
 @dataclass(frozen=True, slots=True)
@@ -213,3 +214,56 @@ def test_lookup_dictionary_returns_compact_error_for_no_available_dictionaries(
     assert "No searchable dictionary databases were found." in response["error"]
     assert "cuhk" in response["error"]
     assert "gzzj" in response["error"]
+
+
+def test_dictionary_lookup_service_memoizes_until_database_changes(
+    dictionary_data_dir_path: Path,
+):
+    """Reuse merged entries until a dictionary database is rebuilt or removed."""
+    gzzj_database_path = dictionary_data_dir_path / "dictionaries/gzzj/gzzj.db"
+    with patch.dict(environ, {"SCINOEPHILE_DATA_DIR": str(dictionary_data_dir_path)}):
+        service = DictionaryLookupService(dictionaries=["cuhk", "gzzj"])
+        try:
+            with patch.object(
+                DictionarySqliteStore,
+                "lookup_by_traditional",
+                autospec=True,
+                side_effect=DictionarySqliteStore.lookup_by_traditional,
+            ) as lookup_by_traditional:
+                first = service.lookup(" 仇 ")
+                second = service.lookup("仇")
+            assert first == second
+            assert [entry.definitions[0].text for entry in first] == ["surname"]
+            assert lookup_by_traditional.call_count == 2
+
+            DictionarySqliteStore(database_path=gzzj_database_path).persist(
+                (
+                    DictionarySource(
+                        name="Test GZZJ",
+                        shortname="gzzj",
+                        version="2026.05",
+                        description="GZZJ source used for dictionary tool tests.",
+                        legal="BSD",
+                        link="https://example.com/gzzj",
+                        update_url="https://example.com/gzzj/update",
+                        other="fixture",
+                    ),
+                    [
+                        DictionaryEntry(
+                            traditional="仇",
+                            simplified="仇",
+                            pinyin="chou2",
+                            jyutping="sau4",
+                            frequency=1.0,
+                            definitions=[DictionaryDefinition(text="enemy")],
+                        )
+                    ],
+                )
+            )
+            rebuilt = service.lookup("仇")
+            assert [entry.definitions[0].text for entry in rebuilt] == ["enemy"]
+
+            gzzj_database_path.unlink()
+            assert service.lookup("仇") == []
+        finally:
+            service.close()
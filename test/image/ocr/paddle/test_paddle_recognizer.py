@@ -74,6 +74,91 @@ def test_paddle_recognizer_caches_results_by_image(tmp_path: Path):
     assert len(list((tmp_path / "image/ocr/paddle").glob("*.json"))) == 1
 
 
+def test_paddle_recognizer_predicts_cache_misses_in_batches(tmp_path: Path):
+    """Test batched recognition keeps input order and predicts only cache misses.
+
+    Arguments:
+        tmp_path: temporary directory path
+    """
+
+    class BatchingPaddleRecognizer(CountingPaddleRecognizer):
+        """PaddleOCR recognizer that records batches and reports image widths."""
+
+        def __init__(self, cache_root_path: Path):
+            """Initialize.
+
+            Arguments:
+                cache_root_path: root directory beneath which to cache OCR results
+            """
+            super().__init__(cache_root_path)
+            self.batch_widths: list[list[int]] = []
+
+        def predict(self, array: np.ndarray | list[np.ndarray]) -> list[dict[str, Any]]:
+            """Run fake PaddleOCR prediction on one image or a batch.
+
+            Arguments:
+                array: RGB image array, or list of arrays
+            Returns:
+                raw PaddleOCR results, one per image
+            """
+            arrays = array if isinstance(array, list) else [array]
+            self.batch_widths.append([array.shape[1] for array in arrays])
+            return [
+                {
+                    "rec_texts": [f"w{array.shape[1]}"],
+                    "rec_scores": [0.95],
+                    "rec_polys": np.array([[[0, 0], [80, 0], [80, 20], [0, 20]]]),
+                }
+                for array in arrays
+            ]
+
+    recognizer = BatchingPaddleRecognizer(tmp_path)
+    images = [
+        Image.new("RGBA", (width, 8), (255, 255, 255, 0))
+        for width in (30, 10, 20, 10, 40)
+    ]
+    assert recognizer.recognize_image(images[4]) == "w40"
+    recognizer.batch_widths.clear()
+
+    texts = recognizer.recognize_images(images, batch_size=2)
+
+    assert texts == ["w30", "w10", "w20", "w10", "w40"]
+    assert recognizer.batch_widths == [[10, 20], [30]]
+    assert [recognizer.recognize_image(image) for image in images] == texts
+    assert recognizer.batch_widths == [[10, 20], [30]]
+
+
+def test_paddle_recognizer_predicts_failed_batches_individually(tmp_path: Path):
+    """Test a failed batch prediction falls back to one prediction per image.
+
+    Arguments:
+        tmp_path: temporary directory path
+    """
+
+    class FailingBatchPaddleRecognizer(CountingPaddleRecognizer):
+        """PaddleOCR recognizer that cannot predict batches."""
+
+        def predict(self, array: np.ndarray) -> list[dict[str, Any]]:
+            """Run fake PaddleOCR prediction, rejecting batches.
+
+            Arguments:
+                array: RGB image array
+            Returns:
+                raw PaddleOCR results
+            Raises:
+                RuntimeError: if a batch is provided
+            """
+            if isinstance(array, list):
+                raise RuntimeError("batch inference unavailable")
+            return super().predict(array)
+
+    recognizer = FailingBatchPaddleRecognizer(tmp_path)
+    images = [Image.new("RGBA", (width, 8)) for width in (10, 20, 30)]
+
+    assert recognizer.recognize_images(images, batch_size=4) == ["cached text"] * 3
+    assert recognizer.predict_count == 3
+
+
 def test_paddle_recognizer_regenerates_invalid_cache(tmp_path: Path):
     """Test invalid PaddleOCR cache data is treated as a miss."""
     recognizer = CountingPaddleRecognizer(cache_root_path=tmp_path)
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Lock
 from time import time
 
 import requests
@@ -83,6 +84,71 @@ def test_tesseract_recognizer_caches_results_by_image(tmp_path: Path):
     assert len(list((tmp_path / "image/ocr/tesseract/results").glob("*.json"))) == 1
 
 
+def test_tesseract_recognizer_recognizes_images_in_parallel(tmp_path: Path):
+    """Test parallel recognition keeps input order, cache entries, and scratch dirs.
+
+    Arguments:
+        tmp_path: temporary directory path
+    """
+    scratch_dir_paths: set[Path] = set()
+    command_count = 0
+    command_count_lock = Lock()
+
+    class ImageSizeRecognizer(TesseractRecognizer):
+        """Recognizer that reports the width of each preprocessed image."""
+
+        def _run_command(self, command: list[str]) -> tuple[int, str, str]:
+            """Write hOCR naming the input image's width.
+
+            Arguments:
+                command: command arguments
+            Returns:
+                fake process result
+            """
+            nonlocal command_count
+            image_path = Path(command[1])
+            output_base_path = Path(command[2])
+            with command_count_lock:
+                command_count += 1
+                scratch_dir_paths.add(image_path.parent)
+            assert sorted(path.name for path in image_path.parent.iterdir()) == [
+                "input.png"
+            ]
+            with Image.open(image_path) as image:
+                width = image.width
+            output_base_path.with_suffix(".hocr").write_text(
+                f"<span class='ocr_line'><span class='ocrx_word'>w{width}</span>"
+                "</span>",
+                encoding="utf-8",
+            )
+            return 0, "", ""
+
+    recognizer = ImageSizeRecognizer(
+        cache_root_path=tmp_path,
+        executable_path=Path("tesseract"),
+        scale=1,
+        skip_executable_validation=True,
+    )
+    images = [
+        Image.new("RGBA", (width, 8), (255, 255, 255, 255))
+        for width in (10, 11, 12, 10, 13, 14, 15, 11)
+    ]
+    cached_image = Image.new("RGBA", (20, 8), (255, 255, 255, 255))
+    assert recognizer.recognize_image(cached_image) == "w20"
+    command_count = 0
+    scratch_dir_paths.clear()
+
+    texts = recognizer.recognize_images([*images, cached_image], jobs=3)
+
+    assert texts == ["w10", "w11", "w12", "w10", "w13", "w14", "w15", "w11", "w20"]
+    assert command_count == 6
+    assert 1 <= len(scratch_dir_paths) <= 3
+    assert not any(path.exists() for path in scratch_dir_paths)
+    assert len(list((tmp_path / "image/ocr/tesseract/results").glob("*.json"))) == 7
+    assert [recognizer.recognize_image(image) for image in images] == texts[:-1]
+    assert command_count == 6
+
+
 def test_tesseract_recognizer_regenerates_invalid_cache(tmp_path: Path):
     """Test invalid Tesseract OCR cache data is treated as a miss."""
     recognizer = CountingTesseractRecognizer(cache_root_path=tmp_path)
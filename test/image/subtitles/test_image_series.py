@@ -357,6 +357,26 @@ def test_series_fill_and_outline_colors():
     assert series.outline_color == 0
 
 
+def test_init_bboxes_fills_only_missing_bboxes():
+    """Test bboxes are initialized only for subtitles that lack them."""
+    img = Image.new("LA", (6, 6), (0, 0))
+    img.paste((255, 255), (1, 2, 4, 5))
+    existing_bboxes = [Bbox(0, 1, 0, 1)]
+    series = ImageSeries(
+        events=[
+            ImageSubtitle(start=0, end=1000, img=img),
+            ImageSubtitle(start=1000, end=2000, img=img, bboxes=existing_bboxes),
+            ImageSubtitle(start=2000, end=3000, img=img),
+        ]
+    )
+
+    series.init_bboxes(workers=2)
+
+    assert series.events[0].bboxes == [Bbox(1, 4, 2, 5)]
+    assert series.events[1].bboxes is existing_bboxes
+    assert series.events[2].bboxes == [Bbox(1, 4, 2, 5)]
+
+
 def test_text_font_size_defaults_when_no_bboxes():
     """Test text font size falls back when no bboxes are present."""
     series = ImageSeries(
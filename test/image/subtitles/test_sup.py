@@ -4,10 +4,20 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
-from pytest import raises
+from PIL import Image
+from pytest import mark, raises
 
-from scinoephile.image.subtitles.sup import read_sup_image_array, read_sup_series
+from scinoephile.image.drawing import convert_rgba_img_to_la
+from scinoephile.image.subtitles import ImageSeries
+from scinoephile.image.subtitles.sup import (
+    decode_sup_image,
+    index_sup_series,
+    read_sup_image_array,
+    read_sup_series,
+)
 
 
 def _sup_segment(timestamp: int, kind: int, payload: bytes) -> bytes:
@@ -39,6 +49,109 @@ def _presentation_segment(composition_number: int, object_count: int) -> bytes:
     return bytes(payload)
 
 
+def _sup_display_sets(palette: bytes) -> bytes:
+    """Build SUP data with two subtitles, the second with a fragmented image.
+
+    Arguments:
+        palette: palette entry bytes
+    Returns:
+        SUP data bytes
+    """
+    first_rle = b"\x01\x02\x01\x00\x00\x02\x00\x82\x01"
+    second_rle = b"\x00\x84\x02\x00\x00\x01\x00\x02\x02"
+    return b"".join(
+        [
+            _sup_segment(
+                90000, 0x16, _presentation_segment(composition_number=1, object_count=1)
+            ),
+            _sup_segment(90000, 0x14, b"\x00\x00" + palette),
+            _sup_segment(
+                90000,
+                0x15,
+                b"\x00\x00\x00\xc0"
+                + (4 + len(first_rle)).to_bytes(3, "big")
+                + b"\x00\x03\x00\x02"
+                + first_rle,
+            ),
+            _sup_segment(90000, 0x80, b""),
+            _sup_segment(
+                180000,
+                0x16,
+                _presentation_segment(composition_number=2, object_count=1),
+            ),
+            _sup_segment(
+                180000,
+                0x15,
+                b"\x00\x01\x00\x80"
+                + (4 + len(second_rle)).to_bytes(3, "big")
+                + b"\x00\x04\x00\x02"
+                + second_rle[:4],
+            ),
+            _sup_segment(180000, 0x15, b"\x00\x01\x00\x40" + second_rle[4:]),
+            _sup_segment(180000, 0x80, b""),
+            _sup_segment(
+                270000,
+                0x16,
+                _presentation_segment(composition_number=3, object_count=0),
+            ),
+            _sup_segment(270000, 0x80, b""),
+        ]
+    )
+
+
+@mark.parametrize(
+    ("palette", "mode"),
+    [
+        (b"\x01\xeb\x80\x80\xff\x02\x10\x80\x80\x80", "LA"),
+        (b"\x01\x51\x5a\xf0\xff\x02\x10\x80\x80\x80", "RGBA"),
+    ],
+)
+def test_decode_sup_image_matches_read_sup_series(palette: bytes, mode: str):
+    """Test indexed images decode to the converted images of read_sup_series.
+
+    Arguments:
+        palette: palette entry bytes
+        mode: expected image mode
+    """
+    data = np.frombuffer(_sup_display_sets(palette), dtype=np.uint8)
+    starts, ends, images = read_sup_series(data)
+
+    times, image_fields, pieces = index_sup_series(data)
+
+    assert times.tolist() == [[1.0, 2.0], [2.0, 3.0]]
+    assert times[:, 0].tolist() == starts
+    assert times[:, 1].tolist() == ends
+    for fields, image in zip(image_fields, images, strict=True):
+        expected = convert_rgba_img_to_la(Image.fromarray(image))
+        decoded = Image.fromarray(decode_sup_image(data, fields, pieces))
+        assert decoded.mode == expected.mode == mode
+        assert np.array_equal(np.array(decoded), np.array(expected))
+
+
+@mark.parametrize("workers", [1, 2])
+def test_image_series_iter_sup_yields_subtitles_in_order(tmp_path: Path, workers: int):
+    """Test SUP subtitles are yielded in order whether decoded serially or not.
+
+    Arguments:
+        tmp_path: temporary directory
+        workers: maximum number of images to decode at once
+    """
+    sup_path = tmp_path / "source.sup"
+    sup_path.write_bytes(
+        _sup_display_sets(b"\x01\xeb\x80\x80\xff\x02\x10\x80\x80\x80") * 3
+    )
+
+    subtitles = list(ImageSeries.iter_sup(sup_path, workers=workers))
+
+    assert [(subtitle.start, subtitle.end) for subtitle in subtitles] == [
+        (1000, 2000),
+        (2000, 3000),
+    ] * 3
+    assert [subtitle.img.size for subtitle in subtitles] == [(3, 2), (4, 2)] * 3
+    with raises(ValueError, match="workers must be at least 1"):
+        next(ImageSeries.iter_sup(sup_path, workers=0))
+
+
 def test_read_sup_image_array_rejects_row_overflow():
     """Test SUP image RLE data cannot exceed the declared row width."""
     data = np.array([0x00, 0x02], dtype=np.uint8)
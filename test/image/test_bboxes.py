@@ -7,7 +7,7 @@ from __future__ import annotations
 from PIL import Image, ImageDraw
 
 from scinoephile.image.bbox import Bbox
-from scinoephile.image.bboxes import get_bboxes
+from scinoephile.image.bboxes import get_bboxes, get_bboxes_of_images
 
 
 def test_get_bboxes_merges_line_components_at_minimum_gap():
@@ -36,6 +36,23 @@ def test_get_bboxes_preserves_chained_small_line_merges():
     assert get_bboxes(img) == [Bbox(x1=2, x2=8, y1=0, y2=55)]
 
 
+def test_get_bboxes_of_images_matches_get_bboxes():
+    """Test batch bbox extraction matches per-image extraction in input order."""
+    imgs = [
+        _make_mask_img(size=(20, 70), rects=[(2, 0, 7, 29), (11, 35, 17, 64)]),
+        _make_mask_img(size=(10, 70), rects=[]),
+        _make_mask_img(size=(30, 40), rects=[(1, 3, 4, 30), (8, 3, 9, 20)]),
+    ]
+    imgs.append(imgs[0].convert("RGBA"))
+
+    expected = [get_bboxes(img) for img in imgs]
+
+    assert expected[1] == []
+    assert expected[3] == expected[0]
+    assert get_bboxes_of_images(imgs) == expected
+    assert get_bboxes_of_images(imgs, workers=3) == expected
+
+
 def _make_mask_img(
     size: tuple[int, int], rects: list[tuple[int, int, int, int]]
 ) -> Image.Image:
@@ -4,10 +4,17 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from pytest import FixtureRequest, param
 
 from scinoephile.core import Language
-from scinoephile.lang.id import get_series_language
+from scinoephile.core.subtitles import Series, Subtitle
+from scinoephile.lang.id import (
+    SERIES_LANGUAGE_SAMPLE_SIZE,
+    LanguageId,
+    get_series_language,
+)
 from test.helpers import parametrize
 
 
@@ -126,7 +133,7 @@ from test.helpers import parametrize
 def test_get_series_language(
     request: FixtureRequest, series_fixture: str, expected: Language | None
 ):
-    """Detect language of subtitle series.
+    """Detect language of subtitle series, by sampling and by full scan.
 
     Arguments:
         request: pytest request for fixture lookup
@@ -136,3 +143,22 @@ def test_get_series_language(
     series = request.getfixturevalue(series_fixture)
 
     assert get_series_language(series) is expected
+    assert get_series_language(series, sample=False) is expected
+
+
+def test_get_series_language_samples_and_memoizes():
+    """Test detection stops once decisive and is memoized by series text."""
+    series = Series(
+        events=[
+            Subtitle(start=i * 1000, end=i * 1000 + 500, text=f"Hello there {i}")
+            for i in range(1000)
+        ]
+    )
+
+    with patch(
+        "scinoephile.lang.id.LanguageId.from_text", wraps=LanguageId.from_text
+    ) as from_text:
+        assert get_series_language(series) is Language.eng
+        assert from_text.call_count == SERIES_LANGUAGE_SAMPLE_SIZE
+        assert get_series_language(series) is Language.eng
+        assert from_text.call_count == SERIES_LANGUAGE_SAMPLE_SIZE
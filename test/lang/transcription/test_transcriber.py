@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from logging import INFO, WARNING
 from typing import cast
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, Mock, PropertyMock, patch
 
 from pydub import AudioSegment
 from pydub.generators import Sine
@@ -412,6 +412,37 @@ def test_overwrite_cache_is_owned_by_transcriber_caches():
     transcriber.transcriber.assert_called_once_with(audio, is_usable=ANY)
 
 
+def test_process_shares_series_audio_without_materializing_it():
+    """Test the concatenated series views the input audio rather than copying it."""
+    transcriber, aligner = _get_transcriber()
+    audio_series = AudioSeries(
+        audio=AudioSegment.silent(duration=2000),
+        events=[AudioSubtitle(start=500, end=1500, text="reference")],
+    )
+    audio_series.blocks = [audio_series]
+    reference_series = Series(events=[Subtitle(start=500, end=1500, text="参考")])
+    reference_series.blocks = [reference_series]
+    block_output = AudioSeries(
+        audio=AudioSegment.silent(duration=1000),
+        events=[AudioSubtitle(start=500, end=1500, text="hello")],
+    )
+
+    with (
+        patch.object(transcriber, "process_block", return_value=block_output),
+        patch.object(
+            AudioSeries,
+            "audio",
+            new_callable=PropertyMock,
+            side_effect=AssertionError("audio should not be materialized"),
+        ),
+    ):
+        output = transcriber.process(audio_series, reference_series)
+
+    assert output.audio_view is audio_series.audio_view
+    assert [event.text for event in output] == ["hello"]
+    aligner.update_all_test_cases.assert_called_once_with()
+
+
 def test_process_block_preserves_raw_segments_and_uses_buffered_offset():
     """Test generic processing preserves segments and anchors buffered audio."""
     transcriber, aligner = _get_transcriber()
@@ -0,0 +1,56 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of the Chinese character script table."""
+
+from __future__ import annotations
+
+from scinoephile.core.script import OpenCCConfig
+from scinoephile.core.text import RE_HANZI
+from scinoephile.lang.zho.script.character_table import (
+    ZhoCharacterScript,
+    get_zho_character_table,
+)
+from scinoephile.lang.zho.script.conversion import get_zho_text_converted
+from test.helpers import parametrize
+
+
+@parametrize(
+    ("text", "expected"),
+    [
+        ("简体", (0, 0, 2, 0)),
+        ("繁體", (0, 1, 0, 1)),
+        ("中文", (0, 2, 0, 0)),
+        ("汉字 and 漢字！", (6, 2, 1, 1)),
+        ("𠮶", (0, 0, 1, 0)),
+        ("", (0, 0, 0, 0)),
+    ],
+)
+def test_get_script_counts(text: str, expected: tuple[int, int, int, int]):
+    """Test counting the characters of text specific to each script.
+
+    Arguments:
+        text: text to classify
+        expected: expected counts, indexed by ZhoCharacterScript
+    """
+    assert get_zho_character_table().get_script_counts(text) == expected
+
+
+def test_scripts_match_character_conversion():
+    """Test each Hanzi's script matches converting it alone with OpenCC."""
+    table = get_zho_character_table()
+    text = "".join(chr(code_point) for code_point in range(0x3400, 0xA000, 7))
+
+    for character in text:
+        if RE_HANZI.fullmatch(character) is None:
+            expected = ZhoCharacterScript.NON_HANZI
+        elif character != get_zho_text_converted(
+            character, OpenCCConfig.t2s, apply_exclusions=False
+        ):
+            expected = ZhoCharacterScript.TRADITIONAL
+        elif character != get_zho_text_converted(
+            character, OpenCCConfig.s2t, apply_exclusions=False
+        ):
+            expected = ZhoCharacterScript.SIMPLIFIED
+        else:
+            expected = ZhoCharacterScript.SHARED
+        assert table.get_script(character) is expected, character
@@ -0,0 +1,284 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of audio offset detection operations."""
+
+from __future__ import annotations
+
+import sys
+from io import BytesIO
+from logging import WARNING
+from pathlib import Path
+from unittest.mock import patch
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+from pytest import LogCaptureFixture, approx, raises
+
+from scinoephile.common.subprocess import run_command
+from scinoephile.core import ScinoephileError
+from scinoephile.media.offset.audio.detection import (
+    get_audio_offset,
+    get_envelope_offset,
+    sample_audio_envelope,
+)
+
+
+def test_get_audio_offset_finds_known_shift():
+    """Test audio offset search finds a known shift between envelopes."""
+    event_times = _get_event_times(duration=600.0)
+    sampler = _EnvelopeSampler(
+        reference=_get_envelope(event_times, duration=600.0),
+        target=_get_envelope(event_times + 1.374, duration=600.0),
+    )
+
+    with patch(
+        "scinoephile.media.offset.audio.detection.sample_audio_envelope", new=sampler
+    ):
+        result = get_audio_offset(
+            reference_infile_path=Path("reference.mkv"),
+            target_infile_path=Path("target.mkv"),
+            max_offset=5.0,
+        )
+
+    assert result.offset == approx(1.374, abs=0.01)
+    assert result.confidence == "high"
+    assert result.drift == 0.0
+    assert result.second_best is not None
+    assert abs(result.second_best.offset - result.offset) >= 0.5
+
+
+def test_get_audio_offset_estimates_drift():
+    """Test audio offset search fits drift across windows."""
+    event_times = _get_event_times(duration=3600.0)
+    sampler = _EnvelopeSampler(
+        reference=_get_envelope(event_times, duration=3600.0),
+        target=_get_envelope(-0.5 + event_times * 1.0002, duration=3600.0),
+    )
+
+    with patch(
+        "scinoephile.media.offset.audio.detection.sample_audio_envelope", new=sampler
+    ):
+        result = get_audio_offset(
+            reference_infile_path=Path("reference.mkv"),
+            target_infile_path=Path("target.mkv"),
+            max_offset=3.0,
+            estimate_drift=True,
+            duration=120.0,
+            sample_windows=4,
+        )
+
+    assert len(result.windows) == 4
+    assert result.drift == approx(0.0002, rel=0.05)
+    assert result.offset == approx(-0.5, abs=0.02)
+    assert result.get_offset_at(3000.0) == approx(0.1, abs=0.02)
+    assert result.confidence == "high"
+
+
+def test_get_envelope_offset_omits_drift_for_envelopes_shorter_than_windows(
+    caplog: LogCaptureFixture,
+):
+    """Test envelopes too short for distinct windows yield a constant offset.
+
+    Arguments:
+        caplog: pytest fixture capturing log records
+    """
+    event_times = _get_event_times(duration=30.0)
+    reference = _get_envelope(event_times, duration=30.0)
+    target = _get_envelope(event_times + 0.5, duration=30.0)
+
+    with caplog.at_level(WARNING), catch_warnings():
+        simplefilter("error")
+        result = get_envelope_offset(
+            reference, target, max_offset=3.0, estimate_drift=True
+        )
+
+    assert result.offset == approx(0.5, abs=0.01)
+    assert result.drift == 0.0
+    assert result.windows == ()
+    assert "estimating a constant offset without drift" in caplog.text
+
+
+def test_get_audio_offset_rejects_single_drift_window():
+    """Test drift estimation requires more than one window."""
+    with raises(ValueError, match="1 is less than minimum value of 2"):
+        get_audio_offset(
+            reference_infile_path=Path("reference.mkv"),
+            target_infile_path=Path("target.mkv"),
+            estimate_drift=True,
+            sample_windows=1,
+        )
+
+
+def test_sample_audio_envelope_streams_blocks():
+    """Test audio envelopes are accumulated across arbitrary pipe reads."""
+    audio = np.concatenate(
+        (np.full(80, 0.01), np.full(80, 0.5), np.full(84, 0.5))
+    ).astype(np.float32)
+    process = _FakeProcess(audio.tobytes())
+
+    with (
+        patch(
+            "scinoephile.media.offset.audio.detection.ffmpeg.input",
+            return_value=_FakeFfmpegInput(process),
+        ),
+        patch("scinoephile.media.offset.audio.detection._READ_SIZE", 44),
+    ):
+        envelope = sample_audio_envelope(Path("audio.mkv"), envelope_rate=1000.0)
+
+    assert len(envelope) == 30
+    assert np.argmax(envelope) == 10
+    assert envelope[10] == approx(np.log(2500.0), rel=1e-4)
+    assert np.count_nonzero(envelope) == 1
+
+
+def test_sample_audio_envelope_propagates_ffmpeg_failures():
+    """Test ffmpeg failures are propagated as Scinoephile errors."""
+    process = _FakeProcess(b"", returncode=1)
+
+    with patch(
+        "scinoephile.media.offset.audio.detection.ffmpeg.input",
+        return_value=_FakeFfmpegInput(process),
+    ):
+        with raises(ScinoephileError, match="Could not sample audio"):
+            sample_audio_envelope(Path("audio.mkv"))
+
+
+def test_audio_offset_package_imports_detection_only_when_needed():
+    """Test importing audio offset result types does not import detection."""
+    exitcode, _, _ = run_command(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys;"
+                "import scinoephile.media.offset.audio;"
+                "raise SystemExit("
+                "'scinoephile.media.offset.audio.detection' in sys.modules)"
+            ),
+        ]
+    )
+
+    assert exitcode == 0
+
+
+class _EnvelopeSampler:
+    """Fake envelope sampler returning fixed envelopes by infile name."""
+
+    def __init__(self, reference: np.ndarray, target: np.ndarray):
+        """Initialize.
+
+        Arguments:
+            reference: envelope returned for the reference infile
+            target: envelope returned for the target infile
+        """
+        self.envelopes = {"reference.mkv": reference, "target.mkv": target}
+
+    def __call__(
+        self, infile_path: Path, *, envelope_rate: float, stream_index: int | None
+    ) -> np.ndarray:
+        """Return the envelope of an infile.
+
+        Arguments:
+            infile_path: media input path
+            envelope_rate: envelope rate in samples per second
+            stream_index: absolute audio stream index
+        Returns:
+            configured envelope
+        """
+        return self.envelopes[infile_path.name]
+
+
+class _FakeFfmpegInput:
+    """Fake ffmpeg input chain starting a fake process."""
+
+    def __init__(self, process: _FakeProcess):
+        """Initialize.
+
+        Arguments:
+            process: fake ffmpeg process
+        """
+        self.process = process
+
+    def output(self, *args: object, **kwargs: object) -> _FakeFfmpegInput:
+        """Return self for chained ffmpeg output configuration.
+
+        Arguments:
+            args: positional output arguments
+            kwargs: keyword output arguments
+        Returns:
+            self
+        """
+        return self
+
+    def global_args(self, *args: object) -> _FakeFfmpegInput:
+        """Return self for chained ffmpeg global arguments.
+
+        Arguments:
+            args: global arguments
+        Returns:
+            self
+        """
+        return self
+
+    def run_async(self, **kwargs: object) -> _FakeProcess:
+        """Return the fake process.
+
+        Arguments:
+            kwargs: ffmpeg run options
+        Returns:
+            fake process
+        """
+        return self.process
+
+
+class _FakeProcess:
+    """Fake ffmpeg process piping fixed raw audio bytes."""
+
+    def __init__(self, output: bytes, returncode: int = 0):
+        """Initialize.
+
+        Arguments:
+            output: raw audio output bytes
+            returncode: process exit code
+        """
+        self.stdout = BytesIO(output)
+        self.returncode = returncode
+
+    def communicate(self) -> tuple[bytes, bytes]:
+        """Return remaining stdout and empty stderr.
+
+        Returns:
+            remaining stdout and stderr
+        """
+        return self.stdout.read(), b""
+
+
+def _get_envelope(event_times: np.ndarray, *, duration: float) -> np.ndarray:
+    """Render onset times into a 100 Hz envelope with slightly spread onsets.
+
+    Arguments:
+        event_times: onset times in seconds
+        duration: envelope duration in seconds
+    Returns:
+        envelope
+    """
+    envelope = np.zeros(int(duration * 100), dtype=np.float32)
+    positions = event_times * 100
+    indexes = np.floor(positions).astype(int)
+    fractions = positions - indexes
+    keep = (indexes >= 0) & (indexes < len(envelope) - 1)
+    np.add.at(envelope, indexes[keep], 1 - fractions[keep])
+    np.add.at(envelope, indexes[keep] + 1, fractions[keep])
+    return envelope
+
+
+def _get_event_times(*, duration: float) -> np.ndarray:
+    """Return random onset times averaging two per second.
+
+    Arguments:
+        duration: duration in seconds
+    Returns:
+        sorted onset times in seconds
+    """
+    random = np.random.default_rng(0)
+    return np.sort(random.uniform(0.0, duration, int(duration * 2)))
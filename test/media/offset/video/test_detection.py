@@ -20,7 +20,9 @@ from scinoephile.media.offset.video.detection import (
     get_offsets,
     get_video_offset,
     sample_video_frames,
+    sample_video_windows,
 )
+from scinoephile.media.offset.video.video_frame_cache import VideoFrameCache
 from test.helpers import parametrize
 
 
@@ -57,8 +59,8 @@ def test_get_video_offset_prefers_known_shift():
             side_effect=[_get_probe(), _get_probe()],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
-            side_effect=[reference_samples, target_samples],
+            "scinoephile.media.offset.video.detection.sample_video_windows",
+            new=_RecordingVideoSampler([reference_samples], [target_samples]),
         ),
     ):
         result = get_video_offset(
@@ -94,8 +96,8 @@ def test_get_video_offset_uses_reference_frame_grid_for_fine_search():
             ],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
-            side_effect=[reference_samples, target_samples],
+            "scinoephile.media.offset.video.detection.sample_video_windows",
+            new=_RecordingVideoSampler([reference_samples], [target_samples]),
         ),
     ):
         result = get_video_offset(
@@ -130,8 +132,8 @@ def test_get_video_offset_tolerates_brightness_shift():
             side_effect=[_get_probe(), _get_probe()],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
-            side_effect=[reference_samples, target_samples],
+            "scinoephile.media.offset.video.detection.sample_video_windows",
+            new=_RecordingVideoSampler([reference_samples], [target_samples]),
         ),
     ):
         result = get_video_offset(
@@ -160,8 +162,8 @@ def test_get_video_offset_rejects_insufficient_matches():
                 side_effect=[_get_probe(), _get_probe()],
             ),
             patch(
-                "scinoephile.media.offset.video.detection.sample_video_frames",
-                side_effect=[reference_samples, target_samples],
+                "scinoephile.media.offset.video.detection.sample_video_windows",
+                new=_RecordingVideoSampler([reference_samples], [target_samples]),
             ),
         ):
             get_video_offset(
@@ -190,8 +192,8 @@ def test_get_video_offset_rejects_missing_reference_frame_rate():
                 ],
             ),
             patch(
-                "scinoephile.media.offset.video.detection.sample_video_frames",
-                side_effect=[reference_samples, target_samples],
+                "scinoephile.media.offset.video.detection.sample_video_windows",
+                new=_RecordingVideoSampler([reference_samples], [target_samples]),
             ),
         ):
             get_video_offset(
@@ -206,14 +208,16 @@ def test_get_video_offset_rejects_missing_reference_frame_rate():
 def test_get_video_offset_samples_multiple_windows_and_aggregates_frames():
     """Test automatic windows aggregate video offsets in reference frames."""
     frame_duration = 1 / 24
-    side_effect = []
+    reference_windows = []
+    target_windows = []
     for offset_frames in [-20, -20, -21]:
         reference_samples, target_samples = _get_shifted_sample_pair(
             offset_frames=offset_frames, frame_duration=frame_duration
         )
-        side_effect.extend([reference_samples, target_samples])
+        reference_windows.append(reference_samples)
+        target_windows.append(target_samples)
 
-    sampler = _RecordingVideoSampler(side_effect)
+    sampler = _RecordingVideoSampler(reference_windows, target_windows)
     with (
         patch(
             "scinoephile.media.offset.video.detection.ffmpeg.probe",
@@ -223,7 +227,7 @@ def test_get_video_offset_samples_multiple_windows_and_aggregates_frames():
             ],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames", new=sampler
+            "scinoephile.media.offset.video.detection.sample_video_windows", new=sampler
         ),
     ):
         result = get_video_offset(
@@ -236,13 +240,13 @@ def test_get_video_offset_samples_multiple_windows_and_aggregates_frames():
             sample_windows=3,
         )
 
-    assert [call["start_time"] for call in sampler.calls] == [
-        9.0,
-        9.0,
-        45.0,
-        45.0,
-        81.0,
-        81.0,
+    assert sorted(call["infile_path"].name for call in sampler.calls) == [
+        "reference.mkv",
+        "target.mkv",
+    ]
+    assert [call["start_times"] for call in sampler.calls] == [
+        [9.0, 45.0, 81.0],
+        [9.0, 45.0, 81.0],
     ]
     assert [window.offset_frames for window in result.windows] == [-20, -20, -21]
     assert result.aggregate is not None
@@ -260,14 +264,14 @@ def test_get_video_offset_clamps_duration_to_shared_runtime():
     reference_samples = _get_samples([0.0, 1.0, 2.0, 3.0], [10, 20, 30, 40])
     target_samples = _get_samples([0.0, 1.0, 2.0, 3.0], [10, 20, 30, 40])
 
-    sampler = _RecordingVideoSampler([reference_samples, target_samples])
+    sampler = _RecordingVideoSampler([reference_samples], [target_samples])
     with (
         patch(
             "scinoephile.media.offset.video.detection.ffmpeg.probe",
             side_effect=[_get_probe(duration=20.0), _get_probe(duration=20.0)],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames", new=sampler
+            "scinoephile.media.offset.video.detection.sample_video_windows", new=sampler
         ),
     ):
         result = get_video_offset(
@@ -278,19 +282,21 @@ def test_get_video_offset_clamps_duration_to_shared_runtime():
         )
 
     assert result.offset_frames == 0
-    assert [call["start_time"] for call in sampler.calls] == [0.0, 0.0]
+    assert [call["start_times"] for call in sampler.calls] == [[0.0], [0.0]]
     assert [call["duration"] for call in sampler.calls] == [20.0, 20.0]
 
 
 def test_get_video_offset_handles_aggregate_without_exact_window_match():
     """Test aggregate output handles median offsets no window reported."""
     frame_duration = 1 / 24
-    side_effect = []
+    reference_windows = []
+    target_windows = []
     for offset_frames in [0, 1, 3, 4]:
         reference_samples, target_samples = _get_shifted_sample_pair(
             offset_frames=offset_frames, frame_duration=frame_duration
         )
-        side_effect.extend([reference_samples, target_samples])
+        reference_windows.append(reference_samples)
+        target_windows.append(target_samples)
 
     with (
         patch(
@@ -301,8 +307,8 @@ def test_get_video_offset_handles_aggregate_without_exact_window_match():
             ],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
-            side_effect=side_effect,
+            "scinoephile.media.offset.video.detection.sample_video_windows",
+            new=_RecordingVideoSampler(reference_windows, target_windows),
         ),
     ):
         result = get_video_offset(
@@ -334,8 +340,8 @@ def test_get_video_offset_uses_separate_second_best_for_confidence():
             side_effect=[_get_probe(), _get_probe()],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
-            side_effect=[reference_samples, target_samples],
+            "scinoephile.media.offset.video.detection.sample_video_windows",
+            new=_RecordingVideoSampler([reference_samples], [target_samples]),
         ),
     ):
         result = get_video_offset(
@@ -397,6 +403,59 @@ def test_sample_video_frames_normalizes_brightness():
     assert samples[1].frame.std() == approx(1.0)
 
 
+def test_sample_video_windows_decodes_uncached_windows_once(tmp_path: Path):
+    """Test sampled video windows share one decode and are reused from cache.
+
+    Arguments:
+        tmp_path: temporary directory provided by pytest
+    """
+    infile_path = tmp_path / "video.mkv"
+    infile_path.write_bytes(b"video")
+    output = np.array(
+        [[[0, 1], [2, 3]], [[10, 12], [14, 16]]], dtype=np.uint8
+    ).tobytes()
+    frame_cache = VideoFrameCache(tmp_path / "cache")
+    kwargs = {"sample_rate": 1.0, "duration": 2.0, "width": 2, "height": 2}
+
+    with (
+        patch(
+            "scinoephile.media.offset.video.detection.ffmpeg.input",
+            side_effect=lambda *args, **kwargs: _FakeFfmpegInput(output),
+        ),
+        patch(
+            "scinoephile.media.offset.video.detection.ffmpeg.merge_outputs",
+            side_effect=_FakeFfmpegMergedOutputs,
+        ) as merge_outputs,
+    ):
+        first_windows = sample_video_windows(
+            infile_path, start_times=[0.0, 10.0], frame_cache=frame_cache, **kwargs
+        )
+        assert merge_outputs.call_count == 1
+        assert len(merge_outputs.call_args.args) == 2
+
+        sample_video_windows(
+            infile_path,
+            start_times=[0.0, 10.0, 20.0],
+            frame_cache=frame_cache,
+            **kwargs,
+        )
+        assert merge_outputs.call_count == 2
+        assert len(merge_outputs.call_args.args) == 1
+
+        cached_windows = sample_video_windows(
+            infile_path, start_times=[0.0, 10.0], frame_cache=frame_cache, **kwargs
+        )
+        assert merge_outputs.call_count == 2
+
+    assert len(first_windows) == 2
+    assert [sample.time for sample in first_windows[1]] == [0.0, 1.0]
+    assert first_windows[1][1].frame.mean() == approx(0.0)
+    assert first_windows[1][1].frame.std() == approx(1.0)
+    for first_window, cached_window in zip(first_windows, cached_windows):
+        for first_sample, cached_sample in zip(first_window, cached_window):
+            np.testing.assert_array_equal(first_sample.frame, cached_sample.frame)
+
+
 @parametrize(
     ("kwargs", "message"),
     [
@@ -433,7 +492,7 @@ def test_get_video_offset_propagates_sampling_failures():
             side_effect=[_get_probe(), _get_probe()],
         ),
         patch(
-            "scinoephile.media.offset.video.detection.sample_video_frames",
+            "scinoephile.media.offset.video.detection.sample_video_windows",
             side_effect=ScinoephileError("Could not sample frames"),
         ),
     ):
@@ -489,6 +548,7 @@ class _FakeFfmpegInput:
             output: raw video output bytes
         """
         self.output_bytes = output
+        self.outfile = "pipe:"
 
     def filter(self, *args: object, **kwargs: object) -> _FakeFfmpegInput:
         """Return self for chained ffmpeg filters.
@@ -502,7 +562,7 @@ class _FakeFfmpegInput:
         return self
 
     def output(self, *args: object, **kwargs: object) -> _FakeFfmpegInput:
-        """Return self for chained ffmpeg output configuration.
+        """Record the output target and return self for chained configuration.
 
         Arguments:
             args: positional output arguments
@@ -510,6 +570,7 @@ class _FakeFfmpegInput:
         Returns:
             self
         """
+        self.outfile = str(args[0])
         return self
 
     def run(self, **kwargs: object) -> tuple[bytes, bytes]:
@@ -523,6 +584,30 @@ class _FakeFfmpegInput:
         return self.output_bytes, b""
 
 
+class _FakeFfmpegMergedOutputs:
+    """Fake merged ffmpeg outputs writing fixed raw video bytes to each target."""
+
+    def __init__(self, *outputs: _FakeFfmpegInput):
+        """Initialize.
+
+        Arguments:
+            outputs: fake ffmpeg output chains
+        """
+        self.outputs = outputs
+
+    def run(self, **kwargs: object) -> tuple[bytes, bytes]:
+        """Write fixed raw video bytes to each output target.
+
+        Arguments:
+            kwargs: ffmpeg run options
+        Returns:
+            empty stdout and stderr
+        """
+        for output in self.outputs:
+            Path(output.outfile).write_bytes(output.output_bytes)
+        return b"", b""
+
+
 def _get_probe(
     *, duration: float = 100.0, frame_rate: str = "1/1"
 ) -> dict[str, object]:
@@ -547,50 +632,60 @@ def _get_probe(
 
 
 class _RecordingVideoSampler:
-    """Recording fake for sampled video frames."""
+    """Recording fake for sampled video frame windows."""
 
-    def __init__(self, outputs: list[list[SimpleNamespace]]):
+    def __init__(
+        self,
+        reference_windows: list[list[SimpleNamespace]],
+        target_windows: list[list[SimpleNamespace]],
+    ):
         """Initialize.
 
         Arguments:
-            outputs: sampled frame outputs to return in call order
+            reference_windows: sampled frames of each reference window
+            target_windows: sampled frames of each target window
         """
         self.calls: list[dict[str, Any]] = []
-        self.outputs = list(outputs)
+        self.outputs = {
+            "reference.mkv": reference_windows,
+            "target.mkv": target_windows,
+        }
 
     def __call__(
         self,
         infile_path: Path,
         *,
         sample_rate: float,
-        start_time: float,
+        start_times: list[float],
         duration: float,
         width: int,
         height: int,
-    ) -> list[SimpleNamespace]:
-        """Record a sampling call and return the next configured output.
+        frame_cache: object,
+    ) -> list[list[SimpleNamespace]]:
+        """Record a sampling call and return the configured windows of its infile.
 
         Arguments:
             infile_path: media input path
             sample_rate: samples per second
-            start_time: sample start timestamp
+            start_times: sample window start timestamps
             duration: sample duration
             width: sampled frame width
             height: sampled frame height
+            frame_cache: sampled video frame cache
         Returns:
-            configured sampled frames
+            configured sampled frames of each window
         """
         self.calls.append(
             {
                 "infile_path": infile_path,
                 "sample_rate": sample_rate,
-                "start_time": start_time,
+                "start_times": start_times,
                 "duration": duration,
                 "width": width,
                 "height": height,
             }
         )
-        return self.outputs.pop(0)
+        return self.outputs[infile_path.name]
 
 
 def _get_samples(times: list[float], values: list[int]) -> list[SimpleNamespace]:
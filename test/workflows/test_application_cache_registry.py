@@ -26,5 +26,6 @@ def test_cache_registry_matches_owned_layout():
         "image/ocr/tesseract/results",
         "lang/zho/subtitles/analysis",
         "llms/<operation>",
+        "media/offset/video",
         "media/subtitles",
     }
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import Any
 from unittest.mock import Mock, patch
 
 from pydub import AudioSegment
@@ -50,6 +51,17 @@ def _get_answer(*texts: str) -> TranscriptionAnswer:
     return TranscriptionAnswer(text="".join(f"{text}｜" for text in texts))
 
 
+def _get_ctc_aligner(**kwargs: Any) -> Mock:
+    """Get a mocked CTC aligner.
+
+    Arguments:
+        **kwargs: mock configuration, such as return values or side effects
+    Returns:
+        mocked CTC aligner memoizing emissions of 32 audio segments by default
+    """
+    return Mock(spec=CtcAligner, **{"emission_cache_size": 32, **kwargs})
+
+
 def _get_segment(
     text: str,
     start: float,
@@ -101,7 +113,7 @@ def _get_transcriber(
     if processor is None:
         processor = Mock(spec=TranscriptionProcessor)
     if ctc_aligner is None:
-        ctc_aligner = Mock(spec=CtcAligner)
+        ctc_aligner = _get_ctc_aligner()
     if sources is None:
         sources = {"whisper": Mock(spec=Transcriber), "mimo": Mock(spec=Transcriber)}
     for source in sources.values():
@@ -123,7 +135,7 @@ def test_merge_aligns_sources_and_preserves_consensus_subtitle_splits():
     processor.process_requests.return_value = (
         TranscriptionRequestResult(0, 2, answer, "0" * 64),
     )
-    ctc_aligner = Mock(spec=CtcAligner, return_value=[_get_segment("甲乙", 0.5, 2.5)])
+    ctc_aligner = _get_ctc_aligner(return_value=[_get_segment("甲乙", 0.5, 2.5)])
     transcriber = _get_transcriber(processor=processor, ctc_aligner=ctc_aligner)
 
     output = transcriber.merge(
@@ -156,9 +168,8 @@ def test_merge_uses_long_pause_boundaries_as_separate_ctc_windows():
         TranscriptionRequestResult(0, 1, _get_answer("甲"), "0" * 64),
         TranscriptionRequestResult(5, 6, _get_answer("乙"), "0" * 64),
     )
-    ctc_aligner = Mock(
-        spec=CtcAligner,
-        side_effect=[[_get_segment("甲", 0.1, 0.4)], [_get_segment("乙", 0.2, 0.7)]],
+    ctc_aligner = _get_ctc_aligner(
+        side_effect=[[_get_segment("甲", 0.1, 0.4)], [_get_segment("乙", 0.2, 0.7)]]
     )
     transcriber = _get_transcriber(processor=processor, ctc_aligner=ctc_aligner)
 
@@ -186,9 +197,8 @@ def test_merge_infers_pauses_when_explicit_evidence_is_unavailable():
         TranscriptionRequestResult(0, 1, _get_answer("甲"), "0" * 64),
         TranscriptionRequestResult(6, 7, _get_answer("乙"), "0" * 64),
     )
-    ctc_aligner = Mock(
-        spec=CtcAligner,
-        side_effect=[[_get_segment("甲", 0.1, 0.3)], [_get_segment("乙", 0.1, 0.3)]],
+    ctc_aligner = _get_ctc_aligner(
+        side_effect=[[_get_segment("甲", 0.1, 0.3)], [_get_segment("乙", 0.1, 0.3)]]
     )
     transcriber = _get_transcriber(processor=processor, ctc_aligner=ctc_aligner)
 
@@ -208,7 +218,7 @@ def test_merge_infers_pauses_when_explicit_evidence_is_unavailable():
 def test_timing_omits_empty_request_and_retains_later_consensus():
     """Test CTC timing skips empty request answers without losing later output."""
     audio = AudioSegment.silent(duration=3_000)
-    ctc_aligner = Mock(spec=CtcAligner, return_value=[_get_segment("乙", 0.2, 0.7)])
+    ctc_aligner = _get_ctc_aligner(return_value=[_get_segment("乙", 0.2, 0.7)])
     alignment = Alignment(
         source_names=("whisper", "mimo"),
         columns=(
@@ -238,6 +248,52 @@ def test_timing_omits_empty_request_and_retains_later_consensus():
     ctc_aligner.assert_called_once()
 
 
+def test_timing_prefetches_no_more_emissions_than_are_memoized():
+    """Test emissions are prefetched in windows no larger than the memo."""
+    audio = AudioSegment.silent(duration=3_000)
+    ctc_aligner = _get_ctc_aligner(
+        emission_cache_size=2,
+        side_effect=[
+            [_get_segment("甲", 0.1, 0.3)],
+            [_get_segment("乙", 0.1, 0.3)],
+            [_get_segment("丙", 0.1, 0.2)],
+        ],
+    )
+    alignment = Alignment(
+        source_names=("whisper", "mimo"),
+        columns=(
+            Column((Token("甲", 0.1, 0.4), Token("甲", 0.1, 0.4))),
+            Column((None, None), pause_interval_seconds=(0.5, 1.0)),
+            Column((Token("乙", 1.1, 1.4), Token("乙", 1.1, 1.4))),
+            Column((None, None), pause_interval_seconds=(1.5, 2.0)),
+            Column((Token("丙", 2.1, 2.4), Token("丙", 2.1, 2.4))),
+        ),
+    )
+
+    output, _ = get_timed_request_segments(
+        audio,
+        alignment,
+        (
+            TranscriptionRequestResult(0, 1, _get_answer("甲"), "0" * 64),
+            TranscriptionRequestResult(2, 3, _get_answer("乙"), "0" * 64),
+            TranscriptionRequestResult(4, 5, _get_answer("丙"), "0" * 64),
+        ),
+        ctc_aligner,
+    )
+
+    assert [segment.text for segment in output] == ["甲", "乙", "丙"]
+    assert [name for name, _, _ in ctc_aligner.mock_calls] == [
+        "load_emissions",
+        "",
+        "",
+        "load_emissions",
+        "",
+    ]
+    assert [
+        len(call.args[0]) for call in ctc_aligner.load_emissions.call_args_list
+    ] == [2, 1]
+
+
 def test_request_interval_falls_back_to_in_audio_lexical_timing():
     """Test invalid pause bounds fall back to usable lexical evidence."""
     alignment = Alignment(
@@ -257,14 +313,13 @@ def test_request_interval_falls_back_to_in_audio_lexical_timing():
 def test_timing_retries_incomplete_request_against_unconsumed_block():
     """Test incomplete request timing retries against unconsumed block audio."""
     audio = AudioSegment.silent(duration=3_000)
-    ctc_aligner = Mock(
-        spec=CtcAligner,
+    ctc_aligner = _get_ctc_aligner(
         side_effect=[
             [_get_segment("甲", 0.1, 0.4)],
             TranscriptionAlignmentIncompleteError("incomplete"),
             [_get_segment("乙", 1.4, 2.0)],
             [_get_segment("丙", 0.1, 0.3)],
-        ],
+        ]
     )
     alignment = Alignment(
         source_names=("whisper", "mimo"),
@@ -344,7 +399,7 @@ def test_transcribe_block_falls_back_to_only_successful_source():
     whisper = Mock(spec=Transcriber, return_value=segments)
     mimo = Mock(spec=Transcriber, side_effect=TranscriptionEmptyError("empty"))
     processor = Mock(spec=TranscriptionProcessor)
-    ctc_aligner = Mock(spec=CtcAligner)
+    ctc_aligner = _get_ctc_aligner()
     transcriber = _get_transcriber(
         processor=processor,
         ctc_aligner=ctc_aligner,
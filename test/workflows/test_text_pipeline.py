@@ -0,0 +1,58 @@
+#  Copyright 2017-2026 Karl T Debiec. All rights reserved. This software may be modified
+#  and distributed under the terms of the BSD license. See the LICENSE file for details.
+"""Tests of TextPipeline."""
+
+from __future__ import annotations
+
+from scinoephile.core import Language
+from scinoephile.core.subtitles import Series, Subtitle
+from scinoephile.workflows.clean import clean_series, get_clean_operation
+from scinoephile.workflows.flatten import flatten_series, get_flatten_operation
+from scinoephile.workflows.romanize import get_romanize_operation, romanize_series
+from scinoephile.workflows.text_pipeline import TextPipeline
+from test.helpers import assert_series_equal, test_data_root
+
+
+def test_text_pipeline_matches_chained_workflows():
+    """Test a pipeline of operations matches applying each workflow in turn."""
+    series = Series.load(test_data_root / "kob" / "input" / "yue-Hans.srt")
+    language = Language.yue_hans
+    original = series.to_string("srt")
+
+    expected = clean_series(series, language=language)
+    expected = flatten_series(expected, language=language)
+    expected = romanize_series(expected, language=language)
+    pipeline = TextPipeline([get_clean_operation(language)])
+    pipeline = pipeline.then(get_flatten_operation(language))
+    pipeline = pipeline.then(get_romanize_operation(language))
+    output = pipeline(series)
+
+    assert len(pipeline) == 3
+    assert_series_equal(output, expected)
+    assert series.to_string("srt") == original
+
+
+def test_text_pipeline_numbers_exclusions_after_removals():
+    """Test exclusions index subtitles as numbered after earlier removals."""
+    series = Series(
+        events=[
+            Subtitle(start=0, end=1000, text="One\\Nline"),
+            Subtitle(start=1000, end=2000, text=" "),
+            Subtitle(start=2000, end=3000, text="Two\\Nlines"),
+            Subtitle(start=3000, end=4000, text="Three\\Nlines"),
+        ]
+    )
+    pipeline = TextPipeline(
+        [
+            get_clean_operation(Language.eng),
+            get_flatten_operation(Language.eng, exclusions=[2]),
+        ]
+    )
+
+    output = pipeline(series)
+
+    assert [event.text for event in output] == [
+        "One line",
+        "Two\\Nlines",
+        "Three lines",
+    ]